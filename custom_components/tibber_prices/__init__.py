@@ -30,6 +30,7 @@ from .const import (
     CONF_VIRTUAL_TIME_OFFSET_MINUTES,
     CONF_VIRTUAL_TIME_OFFSET_MODE,
     CONF_VIRTUAL_TIME_OFFSET_YEARS,
+    DATA_ATTRIBUTE_BYTE_BUDGET,
     DATA_CHART_CONFIG,
     DATA_CHART_METADATA_CONFIG,
     DISPLAY_MODE_SUBUNIT,
@@ -41,6 +42,7 @@ from .const import (
     async_load_translations,
 )
 from .coordinator import STORAGE_VERSION, TibberPricesDataUpdateCoordinator
+from .coordinator.period_pipeline import PERIOD_SIDE_WORKER
 from .data import TibberPricesData, TibberPricesSubentryData
 from .interval_pool import (
     TibberPricesIntervalPool,
@@ -95,6 +97,9 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Optional("data_key"): str,
                     }
                 ),
+                # Compact mode: heavy attribute payloads larger than this many bytes
+                # (serialized) are left out of the state and served by the actions only
+                vol.Optional("attribute_byte_budget"): vol.All(int, vol.Range(min=1024)),
             }
         ),
     },
@@ -176,6 +181,9 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
         LOGGER.debug("No chart_metadata configuration found in configuration.yaml")
         hass.data[DOMAIN][DATA_CHART_METADATA_CONFIG] = {}
 
+    # Compact attribute mode (None = heavy attributes are always written)
+    hass.data[DOMAIN][DATA_ATTRIBUTE_BYTE_BUDGET] = domain_config.get("attribute_byte_budget")
+
     # Blueprints are kept in the repo but not distributed yet.
     # await hass.async_add_executor_job(_install_blueprints, hass.config.config_dir)
 
@@ -577,6 +585,14 @@ async def async_unload_entry(
             for view in entry.runtime_data.subentries.values():
                 await view.coordinator.clear_cache()
 
+    # Stop the shared period worker process once no entry is loaded anymore
+    if unload_ok and not any(
+        other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        PERIOD_SIDE_WORKER.shutdown()
+
     # Unregister services if this was the last config entry
     if not hass.config_entries.async_entries(DOMAIN):
         for service in [
@@ -13,6 +13,7 @@ from zoneinfo import ZoneInfo
 
 import aiohttp
 
+from custom_components.tibber_prices.stage_timing import timed_stage
 from homeassistant.util import dt as dt_util
 
 from .exceptions import (
@@ -26,6 +27,7 @@ from .queries import TibberPricesQueryType
 
 if TYPE_CHECKING:
     from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+    from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_API_DETAILS = logging.getLogger(__name__ + ".details")
@@ -46,6 +48,8 @@ class TibberPricesApiClient:
         self._version = version
         self._request_semaphore = asyncio.Semaphore(2)  # Max 2 concurrent requests
         self.time: TibberPricesTimeService | None = None  # Set externally by coordinator (optional during config flow)
+        # Set externally by the live coordinator; records _api_wrapper round trips
+        self.stage_timings: TibberPricesStageTimings | None = None
         self._last_request_time = None  # Set on first request
         self._min_request_interval = timedelta(seconds=1)  # Min 1 second between requests
         self._max_retries = 5
@@ -892,6 +896,7 @@ class TibberPricesApiClient:
         base_delay = self._retry_delay * (2**retry)
         return min(base_delay, 120)  # Cap at 2 minutes for rate limits
 
+    @timed_stage("api_request")
     async def _api_wrapper(
         self,
         data: dict | None = None,
@@ -915,6 +920,9 @@ class TibberPricesApiClient:
         - Base delay: 2 seconds (exponential backoff: 2s, 4s, 8s, 16s, 32s)
         - Rate limit delay: Uses Retry-After header or falls back to exponential
         - Caps: 30s for network errors, 120s for rate limits, 300s for Retry-After
+
+        The whole round trip, including retries and their delays, is recorded
+        as the "api_request" stage (see stage_timing.py).
         """
         headers = headers or prepare_headers(self._access_token, self._version)
         last_error: Exception | None = None
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 from custom_components.tibber_prices.const import get_display_unit_factor
 from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
+from custom_components.tibber_prices.coordinator.tick_context import find_current_or_next_period
 from custom_components.tibber_prices.entity_utils import add_icon_color_attribute
 from custom_components.tibber_prices.sensor.attributes.metadata import _find_current_segment_in_data
 
@@ -185,23 +186,7 @@ def get_price_intervals_attributes(
     ]
 
     # Find current or next period based on current time
-    current_period = None
-
-    # First pass: find currently active period
-    for period in filtered_periods:
-        start = period.get("start")
-        end = period.get("end")
-        if start and end and time.is_current_interval(start, end):
-            current_period = period
-            break
-
-    # Second pass: find next future period if none is active
-    if not current_period:
-        for period in filtered_periods:
-            start = period.get("start")
-            if start and time.is_in_future(start):
-                current_period = period
-                break
+    current_period = find_current_or_next_period(filtered_periods, time=time)
 
     # Extract calculation metadata for diagnostic attributes
     period_metadata = period_data.get("metadata", {})
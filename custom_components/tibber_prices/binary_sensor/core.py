@@ -92,6 +92,8 @@ class TibberPricesBinarySensor(TibberPricesEntity, BinarySensorEntity, RestoreEn
         self._time_sensitive_remove_listener: Callable | None = None
         # State change detection for call-avoidance optimization (see sensor/core.py for rationale)
         self._last_written_state: bool | None | object = _SENTINEL
+        # State evaluated by _handle_time_sensitive_update(), returned by is_on while it is written
+        self._evaluated_state: bool | None | object = _SENTINEL
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -131,10 +133,22 @@ class TibberPricesBinarySensor(TibberPricesEntity, BinarySensorEntity, RestoreEn
 
         # Call-avoidance: period binary sensors only change at period boundaries,
         # not every 15 minutes. Skip expensive async_write_ha_state() when unchanged.
-        current_state = self.is_on
-        if current_state != self._last_written_state:
-            self._last_written_state = current_state
+        # The write is batched by the coordinator and reuses the evaluated state.
+        current_state = self._compute_is_on()
+        if current_state == self._last_written_state:
+            self.coordinator.async_submit_state_write(None)
+            return
+        self._last_written_state = current_state
+        self.coordinator.async_submit_state_write(lambda: self._write_evaluated_state(current_state))
+
+    @callback
+    def _write_evaluated_state(self, state: bool | None) -> None:
+        """Write the state with is_on fixed to the already evaluated state."""
+        self._evaluated_state = state
+        try:
             self.async_write_ha_state()
+        finally:
+            self._evaluated_state = _SENTINEL
 
     def _get_value_getter(self) -> Callable | None:
         """Return the appropriate value getter method based on the sensor type."""
@@ -158,18 +172,11 @@ class TibberPricesBinarySensor(TibberPricesEntity, BinarySensorEntity, RestoreEn
         """Return True if the current time is within a best price period."""
         if not self.coordinator.data:
             return None
-        attrs = get_price_intervals_attributes(
-            self.coordinator.data,
-            reverse_sort=False,
-            time=self.coordinator.time,
-            config_entry=self.coordinator.config_entry,
-        )
-        if not attrs:
-            return False  # Should not happen, but safety fallback
-        start = attrs.get("start")
-        end = attrs.get("end")
-        if not start or not end:
+        # Same current/next period as the attributes, selected once per update cycle
+        bounds = self.coordinator.get_tick_context().period_bounds(reverse_sort=False)
+        if not bounds:
             return False  # No period found = sensor is off
+        start, end = bounds
         time = self.coordinator.time
         return time.is_time_in_period(start, end)
 
@@ -177,18 +184,11 @@ class TibberPricesBinarySensor(TibberPricesEntity, BinarySensorEntity, RestoreEn
         """Return True if the current time is within a peak price period."""
         if not self.coordinator.data:
             return None
-        attrs = get_price_intervals_attributes(
-            self.coordinator.data,
-            reverse_sort=True,
-            time=self.coordinator.time,
-            config_entry=self.coordinator.config_entry,
-        )
-        if not attrs:
-            return False  # Should not happen, but safety fallback
-        start = attrs.get("start")
-        end = attrs.get("end")
-        if not start or not end:
+        # Same current/next period as the attributes, selected once per update cycle
+        bounds = self.coordinator.get_tick_context().period_bounds(reverse_sort=True)
+        if not bounds:
             return False  # No period found = sensor is off
+        start, end = bounds
         time = self.coordinator.time
         return time.is_time_in_period(start, end)
 
@@ -355,6 +355,13 @@ class TibberPricesBinarySensor(TibberPricesEntity, BinarySensorEntity, RestoreEn
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary_sensor is on."""
+        # A batched state write reuses the state evaluated by _handle_time_sensitive_update()
+        if self._evaluated_state is not _SENTINEL:
+            return self._evaluated_state  # type: ignore[return-value]
+        return self._compute_is_on()
+
+    def _compute_is_on(self) -> bool | None:
+        """Calculate the binary sensor state."""
         try:
             if not self.coordinator.data or not self._state_getter:
                 return None
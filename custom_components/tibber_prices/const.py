@@ -26,6 +26,7 @@ INTEGRATION_VERSION: str = json.loads((Path(__file__).parent / "manifest.json").
 # Data storage keys
 DATA_CHART_CONFIG = "chart_config"  # Key for chart export config in hass.data
 DATA_CHART_METADATA_CONFIG = "chart_metadata_config"  # Key for chart metadata config in hass.data
+DATA_ATTRIBUTE_BYTE_BUDGET = "attribute_byte_budget"  # Key for the compact attribute byte budget in hass.data
 
 # Config entry data flag: set when user switches currency display mode.
 # Configuration keys
@@ -720,6 +721,62 @@ _TRANSLATIONS_CACHE: dict[str, dict] = {}
 # Cache for standard translations (config flow, home_types, etc.)
 _STANDARD_TRANSLATIONS_CACHE: dict[str, dict] = {}
 
+# Flattened lookup index per loaded language: {language: {path tuple: value}}.
+# Every node of both caches is indexed (leaves and sub-dicts), with the lookup
+# order of get_translation already applied: standard before custom translations,
+# the language itself before its English fallback.
+_TRANSLATION_INDEX: dict[str, dict[tuple[str, ...], Any]] = {}
+
+
+def _flatten_translations(
+    translations: dict,
+    index: dict[tuple[str, ...], Any],
+    prefix: tuple[str, ...] = (),
+) -> None:
+    """Add every node below translations to index, keeping values already present."""
+    for key, value in translations.items():
+        path = (*prefix, key)
+        if value is None:
+            continue
+        index.setdefault(path, value)
+        if isinstance(value, dict):
+            _flatten_translations(value, index, path)
+
+
+def _build_translation_index(language: str) -> None:
+    """
+    Rebuild the lookup index of a language from the translation caches.
+
+    English is the fallback of every language, so reloading English rebuilds
+    the index of all loaded languages.
+
+    Args:
+        language: The language code whose translations changed
+
+    """
+    languages = set(_STANDARD_TRANSLATIONS_CACHE) | set(_TRANSLATIONS_CACHE) if language == "en" else {language}
+    for lang in languages:
+        index: dict[tuple[str, ...], Any] = {}
+        for cache in (_STANDARD_TRANSLATIONS_CACHE, _TRANSLATIONS_CACHE):
+            for source in (lang, "en") if lang != "en" else ("en",):
+                if source in cache:
+                    _flatten_translations(cache[source], index)
+        _TRANSLATION_INDEX[lang] = index
+
+
+def _store_translations(
+    hass: HomeAssistant,
+    cache: dict[str, dict],
+    cache_key: str,
+    language: str,
+    translations: dict,
+) -> dict:
+    """Store loaded translations in the module and hass.data caches and index them."""
+    cache[language] = translations
+    hass.data[cache_key] = translations
+    _build_translation_index(language)
+    return translations
+
 
 async def async_load_translations(hass: HomeAssistant, language: str) -> dict:
     """
@@ -751,10 +808,7 @@ async def async_load_translations(hass: HomeAssistant, language: str) -> dict:
         file_path = CUSTOM_TRANSLATIONS_DIR / "en.json"
         if not file_path.exists():
             LOGGER.debug("No custom translations found at %s", file_path)
-            empty_cache = {}
-            _TRANSLATIONS_CACHE[language] = empty_cache
-            hass.data[cache_key] = empty_cache
-            return empty_cache
+            return _store_translations(hass, _TRANSLATIONS_CACHE, cache_key, language, {})
 
     try:
         # Read the file asynchronously
@@ -763,24 +817,15 @@ async def async_load_translations(hass: HomeAssistant, language: str) -> dict:
             translations = json.loads(content)
 
             # Store in both caches for future calls
-            _TRANSLATIONS_CACHE[language] = translations
-            hass.data[cache_key] = translations
-
-            return translations
+            return _store_translations(hass, _TRANSLATIONS_CACHE, cache_key, language, translations)
 
     except (OSError, json.JSONDecodeError) as err:
         LOGGER.warning("Error loading custom translations file: %s", err)
-        empty_cache = {}
-        _TRANSLATIONS_CACHE[language] = empty_cache
-        hass.data[cache_key] = empty_cache
-        return empty_cache
+        return _store_translations(hass, _TRANSLATIONS_CACHE, cache_key, language, {})
 
     except Exception:  # pylint: disable=broad-except
         LOGGER.exception("Unexpected error loading custom translations")
-        empty_cache = {}
-        _TRANSLATIONS_CACHE[language] = empty_cache
-        hass.data[cache_key] = empty_cache
-        return empty_cache
+        return _store_translations(hass, _TRANSLATIONS_CACHE, cache_key, language, {})
 
 
 async def async_load_standard_translations(hass: HomeAssistant, language: str) -> dict:
@@ -814,10 +859,7 @@ async def async_load_standard_translations(hass: HomeAssistant, language: str) -
         file_path = TRANSLATIONS_DIR / "en.json"
         if not file_path.exists():
             LOGGER.debug("No standard translations found at %s", file_path)
-            empty_cache = {}
-            _STANDARD_TRANSLATIONS_CACHE[language] = empty_cache
-            hass.data[cache_key] = empty_cache
-            return empty_cache
+            return _store_translations(hass, _STANDARD_TRANSLATIONS_CACHE, cache_key, language, {})
 
     try:
         # Read the file asynchronously
@@ -825,23 +867,15 @@ async def async_load_standard_translations(hass: HomeAssistant, language: str) -
             content = await f.read()
             translations = json.loads(content)
             # Store in both caches for future calls
-            _STANDARD_TRANSLATIONS_CACHE[language] = translations
-            hass.data[cache_key] = translations
-            return translations
+            return _store_translations(hass, _STANDARD_TRANSLATIONS_CACHE, cache_key, language, translations)
 
     except (OSError, json.JSONDecodeError) as err:
         LOGGER.warning("Error loading standard translations file: %s", err)
-        empty_cache = {}
-        _STANDARD_TRANSLATIONS_CACHE[language] = empty_cache
-        hass.data[cache_key] = empty_cache
-        return empty_cache
+        return _store_translations(hass, _STANDARD_TRANSLATIONS_CACHE, cache_key, language, {})
 
     except Exception:  # pylint: disable=broad-except
         LOGGER.exception("Unexpected error loading standard translations")
-        empty_cache = {}
-        _STANDARD_TRANSLATIONS_CACHE[language] = empty_cache
-        hass.data[cache_key] = empty_cache
-        return empty_cache
+        return _store_translations(hass, _STANDARD_TRANSLATIONS_CACHE, cache_key, language, {})
 
 
 async def async_get_translation(
@@ -897,7 +931,9 @@ def get_translation(
     Get a translation value by path synchronously from the cache.
 
     This function only accesses the cached translations to avoid blocking I/O.
-    Checks standard translations first, then custom translations.
+    Checks standard translations first, then custom translations. Lookups go
+    through the flattened index, so they cost one dict access regardless of
+    the path length. Languages that were not loaded fall back to English.
 
     Args:
         path: A sequence of keys defining the path to the translation value
@@ -907,36 +943,8 @@ def get_translation(
         The translation value if found in cache, None otherwise
 
     """
-
-    def _navigate_dict(d: dict, keys: Sequence[str]) -> Any:
-        """Navigate through nested dict following the keys path."""
-        current = d
-        for key in keys:
-            if not isinstance(current, dict) or key not in current:
-                return None
-            current = current[key]
-        return current
-
-    def _get_from_cache(cache: dict[str, dict], lang: str) -> Any:
-        """Get translation from cache with fallback to English."""
-        if lang in cache:
-            result = _navigate_dict(cache[lang], path)
-            if result is not None:
-                return result
-        # Fallback to English if not found in requested language
-        if lang != "en" and "en" in cache:
-            result = _navigate_dict(cache["en"], path)
-            if result is not None:
-                return result
-        return None
-
-    # Try standard translations first
-    result = _get_from_cache(_STANDARD_TRANSLATIONS_CACHE, language)
-    if result is not None:
-        return result
-
-    # Fall back to custom translations
-    result = _get_from_cache(_TRANSLATIONS_CACHE, language)
+    index = _TRANSLATION_INDEX.get(language) or _TRANSLATION_INDEX.get("en")
+    result = index.get(tuple(path)) if index else None
     if result is not None:
         return result
 
@@ -13,6 +13,17 @@ STORAGE_VERSION = 1
 # - No cached data exists
 UPDATE_INTERVAL = timedelta(minutes=15)
 
+# Coalescing window for runtime config overrides (number/switch entities)
+# An automation setting several overrides in a row (or the entities restoring
+# their values on startup) triggers one recalculation instead of one per entity
+CONFIG_OVERRIDE_DEBOUNCE_SECONDS = 0.5
+
+# Response cache of read-only services (see response_cache.py)
+# Entries are dropped on every coordinator update and quarter-hour tick anyway;
+# the TTL only bounds how long a response can be served within one quarter-hour
+RESPONSE_CACHE_TTL_SECONDS = 60
+RESPONSE_CACHE_MAX_ENTRIES = 64
+
 # Quarter-hour boundaries for entity state updates (minutes: 00, 15, 30, 45)
 QUARTER_HOUR_BOUNDARIES = (0, 15, 30, 45)
 
@@ -7,15 +7,18 @@ import logging
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from datetime import date, datetime
 
+    from custom_components.tibber_prices.sensor.calculators import TibberPricesSharedCalculators
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
 
-    from .listeners import TimeServiceCallback
+    from .listeners import NextUpdateCallback, TimeServiceCallback
 
 from custom_components.tibber_prices.api import (
     TibberPricesApiClient,
@@ -24,6 +27,7 @@ from custom_components.tibber_prices.api import (
     TibberPricesApiClientError,
 )
 from custom_components.tibber_prices.const import DOMAIN
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
 from custom_components.tibber_prices.time_travel import (
     QUARTER_HOURLY_SINCE,
     TimeShift,
@@ -32,20 +36,23 @@ from custom_components.tibber_prices.time_travel import (
     tomorrow_arrival_hour,
     uses_realistic_tomorrow,
 )
-from custom_components.tibber_prices.utils.price import find_price_data_for_interval
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from . import helpers
-from .constants import STORAGE_VERSION, UPDATE_INTERVAL
+from .constants import CONFIG_OVERRIDE_DEBOUNCE_SECONDS, STORAGE_VERSION, UPDATE_INTERVAL
 from .data_transformation import TibberPricesDataTransformer
 from .listeners import TibberPricesListenerManager
 from .midnight_handler import TibberPricesMidnightHandler
+from .period_pipeline import PERIOD_SIDE_WORKER
 from .periods import TibberPricesPeriodCalculator
 from .price_data_manager import TibberPricesPriceDataManager
 from .repairs import TibberPricesRepairManager
+from .response_cache import TibberPricesResponseCache
+from .tick_context import TibberPricesTickContext
 from .time_service import TibberPricesTimeService
+from .transform_stages import PERIOD_STAGES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -122,11 +129,12 @@ def get_connection_state(coordinator: TibberPricesDataUpdateCoordinator) -> bool
 #     * Whoever runs first does turnover, the other skips
 #     * No race condition possible (date comparison is atomic)
 #
-# Timer #3: Minute Refresh (every minute)
+# Timer #3: Minute Refresh (event-driven, at most every 30 seconds)
 #   - Purpose: Update countdown/progress sensors
-#   - Trigger: _handle_minute_refresh()
+#   - Trigger: _handle_minute_refresh() at the earliest entity deadline (wakeup.py)
 #   - What it does:
-#     * Notifies minute-update entities (remaining_minutes, progress)
+#     * Notifies the due minute-update entities (remaining_minutes, progress)
+#     * Re-arms itself for the next deadline; idle entities only wake at quarter-hours
 #     * Does NOT fetch data or transform - uses existing cache
 #     * No midnight handling (not relevant for timing sensors)
 #
@@ -223,6 +231,12 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # applied consistently everywhere.
         self.time = self._create_time_service()
 
+        # Facts about "now" shared by all entities of one update cycle (see tick_context.py)
+        self._tick_context: TibberPricesTickContext | None = None
+
+        # Responses of read-only services for the current data and quarter-hour
+        self.response_cache = TibberPricesResponseCache()
+
         # Initialize helper modules
         self._listener_manager = TibberPricesListenerManager(hass, self._log_prefix)
         self._midnight_handler = TibberPricesMidnightHandler()
@@ -241,12 +255,14 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             config_entry=config_entry,
             log_prefix=self._log_prefix,
             get_config_override_fn=self.get_config_override,
+            side_worker=PERIOD_SIDE_WORKER,
         )
         self._data_transformer = TibberPricesDataTransformer(
             config_entry=config_entry,
             log_prefix=self._log_prefix,
             calculate_periods_fn=self._period_calculator.calculate_periods_for_price_info,
             time=self.time,
+            get_active_overrides_fn=self.get_active_overrides,
         )
         self._repair_manager = TibberPricesRepairManager(
             hass=hass,
@@ -258,6 +274,20 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Push the initial TimeService into every helper (API rate limiting, pool, ...)
         self._propagate_time_service(self.time)
 
+        # Durations of the update pipeline stages, shared with every helper that runs one.
+        # The API client is shared with the time-travel views, so its round trips are
+        # recorded by the live coordinator only (like its TimeService).
+        self.stage_timings = TibberPricesStageTimings()
+        self._listener_manager.stage_timings = self.stage_timings
+        self._data_transformer.stage_timings = self.stage_timings
+        self._period_calculator.stage_timings = self.stage_timings
+        self.interval_pool.stage_timings = self.stage_timings
+        if not self.is_time_travel:
+            self.api.stage_timings = self.stage_timings
+
+        # Stateless sensor calculators shared by all sensors of this coordinator (created on first use)
+        self.sensor_calculators: TibberPricesSharedCalculators | None = None
+
         # Register options update listener to invalidate config caches
         config_entry.async_on_unload(config_entry.add_update_listener(self._handle_options_update))
 
@@ -290,6 +320,18 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # When set, these override the corresponding options from config_entry.options
         self._config_overrides: dict[str, dict[str, Any]] = {}
 
+        # Override changes are coalesced: every change within the debounce
+        # window is applied by one recalculation (see async_handle_config_override_update)
+        self._override_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=CONFIG_OVERRIDE_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._async_apply_config_overrides,
+        )
+        self._override_update_pending = False
+        self.override_recomputes_saved: int = 0  # Override updates folded into an already pending one
+
         # Start timers
         self._listener_manager.schedule_quarter_hour_refresh(self._handle_quarter_hour_refresh)
         self._listener_manager.schedule_minute_refresh(self._handle_minute_refresh)
@@ -402,27 +444,51 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         return self._last_price_update
 
     async def _handle_options_update(self, _hass: HomeAssistant, _config_entry: ConfigEntry) -> None:
-        """Handle options update by invalidating config caches and re-transforming data."""
+        """Handle options update by re-running the transformation stages it affects."""
         self._log("debug", "Options update triggered, re-transforming data")
-        self._data_transformer.invalidate_config_cache()
-        self._period_calculator.invalidate_config_cache()
+        self._retransform_after_config_change()
 
-        # Re-transform existing data with new configuration
-        # This updates rating_levels, volatility, and period calculations
-        # without needing to fetch new data from the API
-        if self.data and "priceInfo" in self.data:
-            # Extract raw price_info and re-transform.
-            # CRITICAL: Preserve currency and home_id so non-EUR users don't see
-            # wrong units (e.g. EUR instead of NOK/SEK) until the next API poll.
-            raw_data = {
-                "price_info": self.data["priceInfo"],
-                "currency": self.data.get("currency", "EUR"),
-                "home_id": self._home_id,
-            }
-            self.data = self._transform_data(raw_data)
-            self.async_update_listeners()
-        else:
+    def _retransform_after_config_change(self) -> None:
+        """
+        Re-transform existing data after an options or override change.
+
+        Updates rating_levels, volatility and period calculations without
+        fetching new data from the API. The stage graph (transform_stages.py)
+        limits the work to the stages whose config keys changed: a peak-only
+        setting recalculates only the peak price periods.
+        """
+        if not self.data or "priceInfo" not in self.data:
+            self._data_transformer.invalidate_config_cache()
+            self._period_calculator.invalidate_config_cache()
             self._log("debug", "No data to re-transform")
+            return
+
+        stages = self._data_transformer.get_config_change_stages()
+        if not stages:
+            self._log("debug", "No transformation-relevant config change")
+            return
+
+        if stages <= PERIOD_STAGES:
+            self._data_transformer.invalidate_config_cache(keep_results=True)
+            self._period_calculator.invalidate_config_cache(keep_periods=True)
+            partial_data = self._data_transformer.rerun_period_stages(stages)
+            if partial_data is not None:
+                self.data = partial_data
+                self.async_update_listeners()
+                return
+
+        self._data_transformer.invalidate_config_cache()
+        self._period_calculator.invalidate_config_cache()
+        # Extract raw price_info and re-transform.
+        # CRITICAL: Preserve currency and home_id so non-EUR users don't see
+        # wrong units (e.g. EUR instead of NOK/SEK) until the next API poll.
+        raw_data = {
+            "price_info": self.data["priceInfo"],
+            "currency": self.data.get("currency", "EUR"),
+            "home_id": self._home_id,
+        }
+        self.data = self._transform_data(raw_data)
+        self.async_update_listeners()
 
     # =========================================================================
     # Runtime Config Override Methods (for number/switch entities)
@@ -515,27 +581,26 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def async_handle_config_override_update(self) -> None:
         """
-        Handle config override change by invalidating caches and re-transforming data.
+        Handle config override change by re-running the affected transformation stages.
 
         This is called by number/switch entities when their values change.
-        Uses the same logic as options update to ensure consistent behavior.
+        The recalculation is debounced: changes arriving within
+        CONFIG_OVERRIDE_DEBOUNCE_SECONDS (an automation setting several
+        overrides, entities restoring their values on startup) are applied
+        together by one recalculation. Uses the same logic as options update
+        to ensure consistent behavior.
         """
+        if self._override_update_pending:
+            self.override_recomputes_saved += 1
+            self._log("debug", "Config override update coalesced with pending recalculation")
+        self._override_update_pending = True
+        await self._override_debouncer.async_call()
+
+    async def _async_apply_config_overrides(self) -> None:
+        """Apply all override changes collected during the debounce window."""
+        self._override_update_pending = False
         self._log("debug", "Config override update triggered, re-transforming data")
-        self._data_transformer.invalidate_config_cache()
-        self._period_calculator.invalidate_config_cache()
-
-        # Re-transform existing data with new configuration.
-        # CRITICAL: Preserve currency and home_id (same fix as _handle_options_update).
-        if self.data and "priceInfo" in self.data:
-            raw_data = {
-                "price_info": self.data["priceInfo"],
-                "currency": self.data.get("currency", "EUR"),
-                "home_id": self._home_id,
-            }
-            self.data = self._transform_data(raw_data)
-            self.async_update_listeners()
-        else:
-            self._log("debug", "No data to re-transform")
+        self._retransform_after_config_change()
 
     @callback
     def async_add_time_sensitive_listener(self, update_callback: TimeServiceCallback) -> CALLBACK_TYPE:
@@ -556,30 +621,95 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         Update all time-sensitive entities without triggering a full coordinator update.
 
+        The tick context is built once for this time_service; every listener
+        reaches it through get_tick_context() and shares its results.
+
         Args:
             time_service: TibberPricesTimeService instance with reference time for this update cycle
 
         """
+        self._tick_context = TibberPricesTickContext(self.data, time=time_service)
         self._listener_manager.async_update_time_sensitive_listeners(time_service)
 
+    def get_tick_context(self) -> TibberPricesTickContext:
+        """
+        Return the shared context for the current data and TimeService.
+
+        Entities set coordinator.time to the TimeService of their update cycle,
+        so all entities refreshed by the same timer share one context. A new
+        context is created as soon as the data or the TimeService changes.
+
+        Returns:
+            Tick context valid for self.data and self.time.
+
+        """
+        context = self._tick_context
+        if context is None or not context.is_valid_for(self.data, self.time):
+            context = TibberPricesTickContext(self.data, time=self.time)
+            self._tick_context = context
+        return context
+
     @callback
-    def async_add_minute_update_listener(self, update_callback: TimeServiceCallback) -> CALLBACK_TYPE:
+    def async_add_minute_update_listener(
+        self,
+        update_callback: TimeServiceCallback,
+        next_update_fn: NextUpdateCallback | None = None,
+    ) -> CALLBACK_TYPE:
         """
         Listen for minute-by-minute updates for timing sensors.
 
         Timing sensors (like best_price_remaining_minutes, peak_price_progress, etc.) should use this
-        method to receive updates every minute for accurate countdown/progress tracking.
+        method to receive updates for accurate countdown/progress tracking. With next_update_fn the
+        listener is only woken when its value can change (see wakeup.py).
 
         Returns:
             Callback that can be used to remove the listener
 
         """
-        return self._listener_manager.async_add_minute_update_listener(update_callback)
+        return self._listener_manager.async_add_minute_update_listener(update_callback, next_update_fn)
+
+    @callback
+    def async_submit_state_write(self, write_state: Callable[[], None] | None) -> None:
+        """
+        Submit one evaluated entity state from a timer listener.
+
+        Timer ticks write all changed entities in one pass after every listener
+        has been evaluated (see TibberPricesListenerManager.async_submit_state_write).
+
+        Args:
+            write_state: Writes the evaluated state, or None if it is unchanged.
+
+        """
+        self._listener_manager.async_submit_state_write(write_state)
+
+    @property
+    def tick_write_stats(self) -> dict[str, Any]:
+        """Return evaluated vs. written entity counts of the timer ticks."""
+        manager = self._listener_manager
+        last = manager.last_tick_writes
+        return {
+            "last_tick": last._asdict() if last else None,
+            "evaluated_total": manager.entities_evaluated_total,
+            "written_total": manager.entities_written_total,
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Update all registered listeners and recalculate the Timer #3 wakeups.
+
+        New data or a config change can start, move or remove periods, so the
+        timing sensors' next value changes are calculated again and cached
+        service responses are dropped.
+        """
+        self.response_cache.clear()
+        super().async_update_listeners()
+        self._listener_manager.async_reschedule_minute_listeners(self._create_time_service())
 
     @callback
     def _async_update_minute_listeners(self, time_service: TibberPricesTimeService) -> None:
         """
-        Update all minute-update entities without triggering a full coordinator update.
+        Update the due minute-update entities without triggering a full coordinator update.
 
         Args:
             time_service: TibberPricesTimeService instance with reference time for this update cycle
@@ -616,6 +746,9 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Update helper modules with fresh TimeService instance
         self._propagate_time_service(time_service)
 
+        # Relative search ranges moved on by one interval
+        self.response_cache.clear()
+
         self._log("debug", "[Timer #2] Quarter-hour refresh triggered at %s", now.isoformat())
 
         # Check if midnight has passed since last check
@@ -637,28 +770,29 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @callback
     def _handle_minute_refresh(self, _now: datetime | None = None) -> None:
         """
-        Handle 30-second entity refresh for timing sensors (Timer #3).
+        Handle the event-driven entity refresh for timing sensors (Timer #3).
 
         This is a SYNCHRONOUS callback (decorated with @callback) - it runs in the event loop
         without async/await overhead because it performs only fast, non-blocking operations:
         - Listener notifications for timing sensors (remaining_minutes, progress)
 
         NO I/O operations (no API calls, no file operations), so no need for async def.
-        Runs every 30 seconds to keep sensor values in sync with HA frontend display.
+        Fires at the earliest deadline reported by the timing sensors (on the :00/:30 second
+        grid that keeps sensor values in sync with HA frontend display); only the entities
+        whose value can change are updated, then the timer is re-armed.
 
-        This runs every 30 seconds to update countdown/progress sensors.
         Timing calculations use rounded minutes matching HA's relative time display.
         Does NOT fetch new data - only updates entity states based on existing cached data.
         """
-        # Create LOCAL TimeService with fresh reference time for this 30-second refresh
+        # Create LOCAL TimeService with fresh reference time for this refresh
         # Each timer has its own TimeService instance - no shared state between timers
         # Timer #2 updates 30+ time-sensitive entities (prices, levels, timestamps)
         # Timer #3 updates 6 timing entities (remaining_minutes, progress, next_in_minutes)
         # NO overlap - entities are registered with either Timer #2 OR Timer #3, never both
         time_service = self._create_time_service()
 
-        # Only log at debug level to avoid log spam (this runs every 30 seconds)
-        self._log("debug", "[Timer #3] 30-second refresh for timing sensors")
+        # Only log at debug level to avoid log spam (this runs up to every 30 seconds)
+        self._log("debug", "[Timer #3] Refresh for timing sensors")
 
         # Update only minute-update entities (remaining_minutes, progress, etc.)
         # Pass local time_service to entities (not self.time which could be overwritten)
@@ -776,10 +910,12 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         - Timer #2: Quarter-hour entity updates
         - Timer #3: Minute timing sensor updates
 
+        A pending (debounced) config override recalculation is dropped.
         Also saves cache to persist any unsaved changes and clears all repairs.
         """
         # Cancel all timers first
         self._listener_manager.cancel_timers()
+        self._override_debouncer.async_cancel()
 
         # Clear all repairs when integration is removed or disabled
         await self._repair_manager.clear_all_repairs()
@@ -1140,11 +1276,7 @@ class TibberPricesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if not self.data:
             return None
 
-        if not self.data:
-            return None
-
-        now = self.time.now()
-        return find_price_data_for_interval(self.data, now, time=self.time)
+        return self.get_tick_context().current_interval
 
     async def refresh_user_data(self) -> bool:
         """Force refresh of user data and return True if data was updated."""
@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-import copy
 import logging
 from typing import TYPE_CHECKING, Any
 
 from custom_components.tibber_prices import const as _const
 from custom_components.tibber_prices.coordinator.period_handlers.day_pattern import detect_day_patterns
+from custom_components.tibber_prices.coordinator.transform_stages import (
+    ALL_STAGES,
+    PERIOD_SIDE_BY_STAGE,
+    PERIOD_STAGES,
+    changed_config_keys,
+    flatten_effective_config,
+    stages_affected_by,
+)
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
+from custom_components.tibber_prices.utils.interval_record import TibberPricesIntervalRecord
 from custom_components.tibber_prices.utils.price import enrich_price_info_with_differences
 
 if TYPE_CHECKING:
@@ -23,7 +32,8 @@ _LOGGER = logging.getLogger(__name__)
 
 def _build_period_calculation_intervals(enriched_intervals: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Return enriched intervals with raw Tibber levels restored for period logic."""
-    period_intervals = copy.deepcopy(enriched_intervals)
+    # Interval values are immutable (str, float, datetime, None), so flat copies are enough
+    period_intervals = [dict(interval) for interval in enriched_intervals]
 
     for interval in period_intervals:
         original_level = interval.pop("_original_level", None)
@@ -33,10 +43,14 @@ def _build_period_calculation_intervals(enriched_intervals: list[dict[str, Any]]
     return period_intervals
 
 
-def _strip_internal_enrichment_fields(enriched_intervals: list[dict[str, Any]]) -> None:
-    """Remove internal enrichment helpers before exposing priceInfo."""
+def _build_price_info_records(enriched_intervals: list[dict[str, Any]]) -> list[Any]:
+    """Return the enriched intervals as compact records without internal enrichment helpers."""
+    records = []
     for interval in enriched_intervals:
-        interval.pop("_original_level", None)
+        record = TibberPricesIntervalRecord(interval)
+        record.pop("_original_level", None)
+        records.append(record)
+    return records
 
 
 class TibberPricesDataTransformer:
@@ -46,14 +60,18 @@ class TibberPricesDataTransformer:
         self,
         config_entry: ConfigEntry,
         log_prefix: str,
-        calculate_periods_fn: Callable[[list[dict[str, Any]], dict[str, Any] | None], dict[str, Any]],
+        calculate_periods_fn: Callable[..., dict[str, Any]],
         time: TibberPricesTimeService,
+        get_active_overrides_fn: Callable[[], dict[str, dict[str, Any]]] | None = None,
     ) -> None:
         """Initialize the data transformer."""
         self.config_entry = config_entry
         self._log_prefix = log_prefix
         self._calculate_periods_fn = calculate_periods_fn
+        self._get_active_overrides = get_active_overrides_fn
         self.time: TibberPricesTimeService = time
+        # Replaced by the coordinator's timings so all stages of an entry are reported together
+        self.stage_timings = TibberPricesStageTimings()
 
         # Transformation cache
         self._cached_transformed_data: dict[str, Any] | None = None
@@ -63,6 +81,13 @@ class TibberPricesDataTransformer:
         self._config_cache: dict[str, Any] | None = None
         self._config_cache_valid = False
 
+        # Stage graph state (see transform_stages.py): inputs of the period
+        # stages and the effective config of the last transformation, so a
+        # config change can rerun only the affected stages.
+        self._cached_period_intervals: list[dict[str, Any]] | None = None
+        self._last_stage_config: dict[str, Any] | None = None
+        self.last_run_stages: frozenset[str] = frozenset()
+
     def _log(self, level: str, message: str, *args: object, **kwargs: object) -> None:
         """Log with coordinator-specific prefix."""
         prefixed_message = f"{self._log_prefix} {message}"
@@ -96,7 +121,7 @@ class TibberPricesDataTransformer:
         options = self.config_entry.options or {}
         return options.get(_const.CONF_PRICE_LEVEL_GAP_TOLERANCE, _const.DEFAULT_PRICE_LEVEL_GAP_TOLERANCE)
 
-    def invalidate_config_cache(self) -> None:
+    def invalidate_config_cache(self, *, keep_results: bool = False) -> None:
         """
         Invalidate config cache AND transformation cache when options change.
 
@@ -107,9 +132,14 @@ class TibberPricesDataTransformer:
 
         This ensures that the next call to transform_data() will re-calculate
         rating_levels and apply new gap tolerance settings to existing price data.
+
+        With keep_results=True only the config cache is cleared; used before
+        rerun_period_stages(), which reuses the enrichment results.
         """
         self._config_cache_valid = False
         self._config_cache = None
+        if keep_results:
+            return
         self._cached_transformed_data = None  # Force re-transformation with new config
         self._last_transformation_config = None  # Force config comparison to trigger
 
@@ -242,6 +272,7 @@ class TibberPricesDataTransformer:
 
         if not should_retransform and has_cache:
             self._log("debug", "Using cached transformed data (no transformation needed)")
+            self.last_run_stages = frozenset()
             # has_cache ensures _cached_transformed_data is not None
             return self._cached_transformed_data  # type: ignore[return-value]
 
@@ -249,10 +280,12 @@ class TibberPricesDataTransformer:
 
         # Extract data from single-home structure
         home_id = raw_data.get("home_id", "")
-        # CRITICAL: Make a deep copy of intervals to avoid modifying cached raw data
+        # CRITICAL: Copy the intervals to avoid modifying cached raw data
         # The enrichment function modifies intervals in-place, which would corrupt
-        # the original API data and make re-enrichment with different settings impossible
-        all_intervals = copy.deepcopy(raw_data.get("price_info", []))
+        # the original API data and make re-enrichment with different settings impossible.
+        # Flat copies are enough: all interval values are immutable.
+        with self.stage_timings.measure("copy_price_info"):
+            all_intervals = [dict(interval) for interval in raw_data.get("price_info", [])]
         currency = raw_data.get("currency", "EUR")
 
         if not all_intervals:
@@ -273,36 +306,42 @@ class TibberPricesDataTransformer:
         thresholds = self.get_threshold_percentages()  # Only for rating_level
         level_gap_tolerance = self.get_level_gap_tolerance()  # Separate: for Tibber's price level
 
-        enriched_intervals = enrich_price_info_with_differences(
-            all_intervals,
-            threshold_low=thresholds["low"],
-            threshold_high=thresholds["high"],
-            hysteresis=float(thresholds["hysteresis"]),
-            gap_tolerance=int(thresholds["gap_tolerance"]),
-            level_gap_tolerance=level_gap_tolerance,
-            time=self.time,
-        )
+        with self.stage_timings.measure("enrich_price_info"):
+            enriched_intervals = enrich_price_info_with_differences(
+                all_intervals,
+                threshold_low=thresholds["low"],
+                threshold_high=thresholds["high"],
+                hysteresis=float(thresholds["hysteresis"]),
+                gap_tolerance=int(thresholds["gap_tolerance"]),
+                level_gap_tolerance=level_gap_tolerance,
+                time=self.time,
+            )
 
-        period_intervals = _build_period_calculation_intervals(enriched_intervals)
-        _strip_internal_enrichment_fields(enriched_intervals)
+        with self.stage_timings.measure("copy_period_intervals"):
+            period_intervals = _build_period_calculation_intervals(enriched_intervals)
+        # priceInfo is kept until the next transformation and read on every tick:
+        # store it as slotted records (about 40% of the memory of the dicts).
+        with self.stage_timings.measure("build_price_info_records"):
+            price_info = _build_price_info_records(enriched_intervals)
 
-        # Store enriched intervals directly as priceInfo (flat list).
+        # Store enriched intervals as priceInfo (flat list).
         # referenceTime carries this coordinator's notion of "now" (shifted for
         # time-travel subentries) so day-offset filtering downstream resolves
         # against the same clock - see coordinator/helpers.py.
         transformed_data = {
             "home_id": home_id,
-            "priceInfo": enriched_intervals,
+            "priceInfo": price_info,
             "currency": currency,
             "referenceTime": current_time,
         }
 
         # Detect day patterns (yesterday / today / tomorrow)
         # IMPORTANT: Must be computed BEFORE pricePeriods so geometric flex can use pattern data
-        transformed_data["dayPatterns"] = detect_day_patterns(
-            transformed_data["priceInfo"],
-            time=self.time,
-        )
+        with self.stage_timings.measure("detect_day_patterns"):
+            transformed_data["dayPatterns"] = detect_day_patterns(
+                transformed_data["priceInfo"],
+                time=self.time,
+            )
 
         # Calculate periods (best price and peak price)
         if "priceInfo" in transformed_data:
@@ -312,15 +351,75 @@ class TibberPricesDataTransformer:
 
         # Cache the transformed data
         self._cached_transformed_data = transformed_data
+        self._cached_period_intervals = period_intervals
         self._last_transformation_config = self._get_current_transformation_config()
+        self._last_stage_config = self._get_effective_config()
         self._last_midnight_check = current_time
         self._last_source_data_timestamp = source_data_timestamp
+        self.last_run_stages = ALL_STAGES
+
+        return transformed_data
+
+    def _get_effective_config(self) -> dict[str, Any]:
+        """Return options merged with runtime overrides, flattened to config keys."""
+        overrides = self._get_active_overrides() if self._get_active_overrides is not None else None
+        return flatten_effective_config(self.config_entry.options or {}, overrides)
+
+    def get_config_change_stages(self) -> frozenset[str]:
+        """
+        Return the stages affected by config changes since the last transformation.
+
+        All stages if there is no complete cached transformation to build on
+        (nothing cached yet, or a midnight turnover happened since).
+        """
+        if (
+            self._cached_transformed_data is None
+            or self._cached_period_intervals is None
+            or self._last_stage_config is None
+            or self._last_midnight_check is None
+            or self.time.as_local(self._last_midnight_check).date() != self.time.as_local(self.time.now()).date()
+        ):
+            return ALL_STAGES
+        return stages_affected_by(changed_config_keys(self._last_stage_config, self._get_effective_config()))
+
+    def rerun_period_stages(self, stages: frozenset[str]) -> dict[str, Any] | None:
+        """
+        Recalculate period stages on the cached enrichment and day patterns.
+
+        Args:
+            stages: Stages from get_config_change_stages(); must only contain
+                period stages.
+
+        Returns:
+            The updated transformed data, or None if the stages need the full
+            pipeline (caller falls back to transform_data()).
+
+        """
+        cached = self._cached_transformed_data
+        if not stages or not stages <= PERIOD_STAGES or cached is None or self._cached_period_intervals is None:
+            return None
+
+        self._log("debug", "Recalculating period stages only: %s", ", ".join(sorted(stages)))
+        transformed_data = {
+            **cached,
+            "pricePeriods": self._calculate_periods_fn(
+                self._cached_period_intervals,
+                cached.get("dayPatterns"),
+                rerun_sides={PERIOD_SIDE_BY_STAGE[stage] for stage in stages},
+            ),
+        }
+
+        self._cached_transformed_data = transformed_data
+        self._last_transformation_config = self._get_current_transformation_config()
+        self._last_stage_config = self._get_effective_config()
+        self.last_run_stages = stages
 
         return transformed_data
 
     def invalidate_cache(self) -> None:
         """Invalidate transformation cache."""
         self._cached_transformed_data = None
+        self._cached_period_intervals = None
 
     @property
     def last_midnight_check(self) -> datetime | None:
@@ -161,7 +161,8 @@ def parse_all_timestamps(price_data: dict[str, Any], *, time: TibberPricesTimeSe
     This is the SINGLE place where we convert API strings to datetime objects.
     After this, all code works with datetime objects, not strings.
 
-    Performance: ~200 timestamps parsed ONCE instead of multiple times per update cycle.
+    Performance: the strings were already parsed when their intervals entered the
+    interval pool (see utils/interval_time.py); here they are only localized.
 
     Args:
         price_data: Raw API data with string timestamps (single-home structure)
@@ -181,11 +182,18 @@ def parse_all_timestamps(price_data: dict[str, Any], *, time: TibberPricesTimeSe
     if not isinstance(price_info, list):
         return price_data
 
+    # Local import: the utils package imports this module
+    from custom_components.tibber_prices.utils.interval_time import parse_starts_at  # noqa: PLC0415
+
     # Parse timestamps in flat interval list
     for interval in price_info:
         if (starts_at_str := interval.get("startsAt")) and isinstance(starts_at_str, str):
-            # Parse once, convert to local timezone, store as datetime object
-            interval["startsAt"] = time.parse_and_localize(starts_at_str)
+            # Reuse the parse done when the interval entered the pool, store as local datetime
+            try:
+                interval["startsAt"] = time.as_local(parse_starts_at(starts_at_str))
+            except ValueError:
+                # Malformed timestamp: leave only this interval unparsed, like dt_util.parse_datetime
+                interval["startsAt"] = None
             # If already datetime (e.g., from cache), skip parsing
 
     return price_data
@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
 from homeassistant.core import CALLBACK_TYPE, callback
-from homeassistant.helpers.event import async_track_utc_time_change
+from homeassistant.helpers.event import async_call_later, async_track_utc_time_change
 
 from .constants import QUARTER_HOUR_BOUNDARIES
+from .wakeup import TIMING_REFRESH_SECONDS, TibberPricesWakeupScheduler, next_grid_time
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from datetime import datetime
 
     from homeassistant.core import HomeAssistant
 
@@ -20,10 +22,19 @@ if TYPE_CHECKING:
 
     # Callback type that accepts TibberPricesTimeService parameter
     TimeServiceCallback = Callable[[TibberPricesTimeService], None]
+    # Returns the next instant a listener's value can change (see wakeup.py)
+    NextUpdateCallback = Callable[[TibberPricesTimeService], datetime]
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class TibberPricesTickWriteStats(NamedTuple):
+    """Entities evaluated and written by one timer tick."""
+
+    evaluated: int
+    written: int
+
+
 class TibberPricesListenerManager:
     """Manages listeners and scheduling for coordinator updates."""
 
@@ -34,7 +45,11 @@ class TibberPricesListenerManager:
 
         # Listener lists
         self._time_sensitive_listeners: list[TimeServiceCallback] = []
-        self._minute_update_listeners: list[TimeServiceCallback] = []
+        self._minute_update_listeners: dict[TimeServiceCallback, NextUpdateCallback | None] = {}
+
+        # Timer #3 wakeups: one pending deadline per minute-update listener
+        self._minute_wakeups: TibberPricesWakeupScheduler[TimeServiceCallback] = TibberPricesWakeupScheduler()
+        self._minute_handler: Callable[[datetime], None] | None = None
 
         # Timer cancellation callbacks
         self._quarter_hour_timer_cancel: CALLBACK_TYPE | None = None
@@ -43,6 +58,16 @@ class TibberPricesListenerManager:
         # Midnight turnover tracking
         self._last_midnight_check: datetime | None = None
 
+        # State write batch of the running timer tick (None outside of a tick)
+        self._pending_writes: list[Callable[[], None]] | None = None
+        self._batch_evaluated = 0
+        self.last_tick_writes: TibberPricesTickWriteStats | None = None
+        self.entities_evaluated_total = 0
+        self.entities_written_total = 0
+
+        # Replaced by the coordinator's timings; records the listener fan-out per tick
+        self.stage_timings = TibberPricesStageTimings()
+
     def _log(self, level: str, message: str, *args: object, **kwargs: object) -> None:
         """Log with coordinator-specific prefix."""
         prefixed_message = f"{self._log_prefix} {message}"
@@ -78,54 +103,178 @@ class TibberPricesListenerManager:
             time_service: TibberPricesTimeService instance with reference time for this update cycle
 
         """
-        for update_callback in self._time_sensitive_listeners:
-            update_callback(time_service)
+        with self.stage_timings.measure("quarter_hour_fanout"):
+            self._begin_write_batch()
+            try:
+                for update_callback in self._time_sensitive_listeners:
+                    update_callback(time_service)
+            finally:
+                stats = self._flush_write_batch()
 
         self._log(
             "debug",
-            "Updated %d time-sensitive entities at quarter-hour boundary",
+            "Updated %d time-sensitive entities at quarter-hour boundary (%d evaluated, %d written)",
             len(self._time_sensitive_listeners),
+            stats.evaluated,
+            stats.written,
         )
 
     @callback
-    def async_add_minute_update_listener(self, update_callback: TimeServiceCallback) -> CALLBACK_TYPE:
+    def async_add_minute_update_listener(
+        self,
+        update_callback: TimeServiceCallback,
+        next_update_fn: NextUpdateCallback | None = None,
+    ) -> CALLBACK_TYPE:
         """
         Listen for minute-by-minute updates for timing sensors.
 
         Timing sensors (like best_price_remaining_minutes, peak_price_progress, etc.) should use this
-        method to receive updates every minute for accurate countdown/progress tracking.
+        method to receive updates for accurate countdown/progress tracking.
+
+        Args:
+            update_callback: Called with the TimeService of the update cycle.
+            next_update_fn: Returns the next instant the listener's value can
+                change; called after every update. Without it the listener is
+                refreshed every 30 seconds.
 
         Returns:
             Callback that can be used to remove the listener
 
         """
-        self._minute_update_listeners.append(update_callback)
+        self._minute_update_listeners[update_callback] = next_update_fn
+        # Due right away: the first wakeup calculates the real deadline
+        self._minute_wakeups.schedule(update_callback, datetime.min.replace(tzinfo=UTC))
+        self._arm_minute_timer(None)
 
         def remove_listener() -> None:
             """Remove update listener."""
-            if update_callback in self._minute_update_listeners:
-                self._minute_update_listeners.remove(update_callback)
+            self._minute_update_listeners.pop(update_callback, None)
+            self._minute_wakeups.remove(update_callback)
 
         return remove_listener
 
     @callback
     def async_update_minute_listeners(self, time_service: TibberPricesTimeService) -> None:
         """
-        Update all minute-update entities without triggering a full coordinator update.
+        Update the minute-update entities whose wakeup is due.
+
+        Each updated listener is rescheduled for the next instant its value
+        can change, then the timer is armed for the earliest pending deadline.
 
         Args:
             time_service: TibberPricesTimeService instance with reference time for this update cycle
 
         """
-        for update_callback in self._minute_update_listeners:
-            update_callback(time_service)
+        now = time_service.now()
+        due = self._minute_wakeups.pop_due(now)
+        with self.stage_timings.measure("minute_fanout"):
+            self._begin_write_batch()
+            try:
+                for update_callback in due:
+                    update_callback(time_service)
+                    self._schedule_minute_listener(update_callback, time_service)
+            finally:
+                self._flush_write_batch()
+        self._arm_minute_timer(now)
 
         self._log(
             "debug",
-            "Updated %d timing entities (30-second update)",
+            "Updated %d of %d timing entities",
+            len(due),
             len(self._minute_update_listeners),
         )
 
+    @callback
+    def async_submit_state_write(self, write_state: Callable[[], None] | None) -> None:
+        """
+        Hand over the result of one entity evaluation.
+
+        During a timer tick all listeners are evaluated first and the state
+        writes run afterwards in one pass, so the tick's shared computations
+        are done before the first state is written. Outside of a tick the
+        write runs immediately.
+
+        Args:
+            write_state: Writes the already evaluated state, or None if the
+                state did not change and nothing needs to be written.
+
+        """
+        pending = self._pending_writes
+        if pending is None:
+            if write_state is not None:
+                write_state()
+            return
+
+        self._batch_evaluated += 1
+        if write_state is not None:
+            pending.append(write_state)
+
+    def _begin_write_batch(self) -> None:
+        """Start collecting state writes for the running tick."""
+        self._pending_writes = []
+        self._batch_evaluated = 0
+
+    def _flush_write_batch(self) -> TibberPricesTickWriteStats:
+        """Write all collected states and record the tick's metrics."""
+        pending = self._pending_writes or []
+        self._pending_writes = None
+        try:
+            for write_state in pending:
+                write_state()
+        finally:
+            stats = TibberPricesTickWriteStats(self._batch_evaluated, len(pending))
+            self.last_tick_writes = stats
+            self.entities_evaluated_total += stats.evaluated
+            self.entities_written_total += stats.written
+        return stats
+
+    @callback
+    def async_reschedule_minute_listeners(self, time_service: TibberPricesTimeService) -> None:
+        """
+        Recalculate all Timer #3 deadlines (new data can start or end periods).
+
+        Args:
+            time_service: TibberPricesTimeService instance with reference time for this update cycle
+
+        """
+        for update_callback in self._minute_update_listeners:
+            self._schedule_minute_listener(update_callback, time_service)
+        self._arm_minute_timer(time_service.now())
+
+    def _schedule_minute_listener(
+        self, update_callback: TimeServiceCallback, time_service: TibberPricesTimeService
+    ) -> None:
+        """Queue the next wakeup of one minute-update listener."""
+        if update_callback not in self._minute_update_listeners:
+            return  # Removed during its own update
+        next_update_fn = self._minute_update_listeners[update_callback]
+        if next_update_fn is not None:
+            deadline = next_update_fn(time_service)
+        else:
+            deadline = next_grid_time(time_service.now(), TIMING_REFRESH_SECONDS)
+        self._minute_wakeups.schedule(update_callback, deadline)
+
+    def _arm_minute_timer(self, now: datetime | None) -> None:
+        """
+        Arm Timer #3 for the earliest pending wakeup.
+
+        Args:
+            now: Reference time of the current cycle; None fires right away.
+
+        """
+        if self._minute_timer_cancel:
+            self._minute_timer_cancel()
+            self._minute_timer_cancel = None
+        if self._minute_handler is None:
+            return
+        deadline = self._minute_wakeups.next_deadline()
+        if deadline is None:
+            return
+        # Effective and real clocks advance at the same rate, so a delay also
+        # works for time-travel coordinators
+        delay = 0.0 if now is None else max(0.0, (deadline - now).total_seconds())
+        self._minute_timer_cancel = async_call_later(self.hass, delay, self._minute_handler)
+
     def schedule_quarter_hour_refresh(
         self,
         handler_callback: Callable[[datetime], None],
@@ -158,35 +307,24 @@ class TibberPricesListenerManager:
         handler_callback: Callable[[datetime], None],
     ) -> None:
         """
-        Schedule 30-second entity refresh for timing sensors (Timer #3).
-
-        This is Timer #3 in the integration's timer architecture. It MUST trigger
-        at exact 30-second boundaries (0, 30 seconds) to keep timing sensors
-        (countdown, time-to) accurate.
-
-        Home Assistant may introduce small scheduling delays (jitter), which are
-        corrected using _BOUNDARY_TOLERANCE_SECONDS in time_service.py.
-
-        Runs independently of Timer #1 (API polling), which operates at random offsets.
+        Schedule the event-driven entity refresh for timing sensors (Timer #3).
+
+        This is Timer #3 in the integration's timer architecture. Instead of a
+        fixed 30-second tick, each listener reports when its value can change
+        next (see wakeup.py) and a single timer is armed for the earliest of
+        these deadlines. Deadlines lie on the :00/:30 second grid that keeps
+        sensor values in sync with Home Assistant's frontend relative time
+        display ("in X minutes"); while nothing counts down, timing sensors
+        only wake at quarter-hour boundaries.
+
+        The handler must call async_update_minute_listeners(), which re-arms
+        the timer. Runs independently of Timer #1 (API polling), which operates
+        at random offsets.
         """
-        # Cancel any existing timer
-        if self._minute_timer_cancel:
-            self._minute_timer_cancel()
-            self._minute_timer_cancel = None
+        self._minute_handler = handler_callback
+        self._arm_minute_timer(None)
 
-        # Trigger every 30 seconds (:00 and :30) to keep sensor values in sync with
-        # Home Assistant's frontend relative time display ("in X minutes").
-        # The timing calculator uses rounded minute values that match HA's rounding behavior.
-        self._minute_timer_cancel = async_track_utc_time_change(
-            self.hass,
-            handler_callback,
-            second=[0, 30],  # Trigger at :XX:00 and :XX:30
-        )
-
-        self._log(
-            "debug",
-            "Scheduled 30-second refresh for timing sensors (second=[0, 30])",
-        )
+        self._log("debug", "Scheduled event-driven refresh for timing sensors")
 
     def check_midnight_crossed(self, now: datetime) -> bool:
         """
@@ -230,3 +368,5 @@ class TibberPricesListenerManager:
         if self._minute_timer_cancel:
             self._minute_timer_cancel()
             self._minute_timer_cancel = None
+        # Listeners added or updated after shutdown must not re-arm Timer #3
+        self._minute_handler = None
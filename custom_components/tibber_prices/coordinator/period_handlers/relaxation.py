@@ -562,7 +562,7 @@ def calculate_periods_with_relaxation(
     max_relaxation_attempts: int,
     should_show_callback: Callable[[str | None], bool],
     time: TibberPricesTimeService,
-    config_entry: Any,  # ConfigEntry type
+    config_entry: Any = None,  # ConfigEntry type
     day_patterns_by_date: dict | None = None,
     time_range: tuple[datetime, datetime] | None = None,
 ) -> dict[str, Any]:
@@ -599,7 +599,8 @@ def calculate_periods_with_relaxation(
             Returns True if periods should be shown with given filter overrides. Pass None
             to use original configured filter values.
         time: TibberPricesTimeService instance (required).
-        config_entry: Config entry to get display unit configuration.
+        config_entry: Not read by the calculation. Optional, so a job can run
+            without a ConfigEntry (e.g. in a worker process).
         day_patterns_by_date: Optional dict mapping date → day pattern dict. Used for
             geometric flex bonus in period detection. Passed through to calculate_periods().
         time_range: Optional (start_inclusive, end_exclusive) datetime window. When set,
@@ -917,7 +918,7 @@ def relax_all_prices(
     should_show_callback: Callable[[str | None], bool],
     baseline_periods: list[dict],
     time: TibberPricesTimeService,
-    config_entry: Any,  # ConfigEntry type
+    config_entry: Any = None,  # ConfigEntry type
     day_patterns_by_date: dict | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """
@@ -937,7 +938,8 @@ def relax_all_prices(
         should_show_callback: Callback to check if a flex level should be shown.
         baseline_periods: Baseline periods (before relaxation).
         time: TibberPricesTimeService instance.
-        config_entry: Config entry to get display unit configuration.
+        config_entry: Not read by the calculation. Optional, so a job can run
+            without a ConfigEntry (e.g. in a worker process).
         day_patterns_by_date: Optional dict mapping date → day pattern dict. Used for
             geometric flex bonus in period detection. Passed through to calculate_periods().
 
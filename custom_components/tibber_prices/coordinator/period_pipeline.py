@@ -0,0 +1,244 @@
+"""
+Execution of the best/peak period calculation sides.
+
+Best price and peak price periods are computed from the same enriched
+intervals and day patterns, but neither side reads the other's result. The
+period calculator resolves each side's configuration into a job
+(`TibberPricesPeriodSideJob`) and hands both jobs to `run_period_side_jobs()`.
+
+A job holds plain data only (interval dicts, the period config NamedTuple,
+the TimeService and the outcome of the level filter check), so it pickles.
+With a `TibberPricesPeriodSideWorker`, the peak side runs in a worker process
+while the calling thread calculates the best side; the caller waits for
+whichever finishes last. Without a worker (tests, benchmarks, the debug
+profiler) or while the worker is starting, both sides run one after the other
+on the calling thread. Period calculation is pure Python, so a thread would
+not run in parallel under the GIL - it takes a second process.
+
+A side whose job is None (filtered out) gets the empty result without running
+the calculation. The calculation functions only read the shared interval dicts
+and build their own output structures, so the sides do not affect each other,
+and a result computed in the worker equals the one computed in-process.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import logging
+import os
+import time as _time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.util import dt as dt_util
+
+from .period_handlers import calculate_periods_with_relaxation
+
+if TYPE_CHECKING:
+    from datetime import date, tzinfo
+
+    from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
+
+    from .period_handlers import TibberPricesPeriodConfig
+    from .time_service import TibberPricesTimeService
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TibberPricesPeriodSideJob(NamedTuple):
+    """Fully resolved, picklable input for one calculate_periods_with_relaxation() call."""
+
+    all_prices: list[dict[str, Any]]
+    config: TibberPricesPeriodConfig
+    enable_relaxation: bool
+    min_periods: int
+    max_relaxation_attempts: int
+    # Outcome of the configured level filter check (no override). Relaxation
+    # only asks for that and for "any", which always passes.
+    level_filter_passed: bool
+    time: TibberPricesTimeService
+    day_patterns_by_date: dict[date, dict[str, Any]] | None
+
+
+def empty_period_result() -> dict[str, Any]:
+    """Return the result structure used when a period side is filtered out."""
+    return {
+        "periods": [],
+        "intervals": [],
+        "metadata": {
+            "total_intervals": 0,
+            "total_periods": 0,
+            "config": {},
+            "relaxation": {"relaxation_active": False, "relaxation_attempted": False},
+        },
+    }
+
+
+def run_period_side_job(job: TibberPricesPeriodSideJob | None) -> dict[str, Any]:
+    """Calculate periods for one side, or return the empty result if filtered out."""
+    if job is None:
+        return empty_period_result()
+
+    return calculate_periods_with_relaxation(
+        job.all_prices,
+        config=job.config,
+        enable_relaxation=job.enable_relaxation,
+        min_periods=job.min_periods,
+        max_relaxation_attempts=job.max_relaxation_attempts,
+        should_show_callback=lambda level_override: level_override == "any" or job.level_filter_passed,
+        time=job.time,
+        day_patterns_by_date=job.day_patterns_by_date,
+    )
+
+
+def _run_side_job_in_worker(job: TibberPricesPeriodSideJob, time_zone: tzinfo) -> tuple[dict[str, Any], float]:
+    """Run one side in the worker process and return the result with its duration in seconds."""
+    # A started worker does not inherit Home Assistant's configured time zone,
+    # which the TimeService's local-day helpers read from dt_util
+    if dt_util.get_default_time_zone() != time_zone:
+        dt_util.set_default_time_zone(time_zone)
+    started = _time.perf_counter()
+    result = run_period_side_job(job)
+    return result, _time.perf_counter() - started
+
+
+def _worker_ready() -> bool:
+    """Return True once the worker process has imported this module."""
+    return True
+
+
+class TibberPricesPeriodSideWorker:
+    """
+    One worker process that calculates the peak side, shared by all config entries.
+
+    The process starts on first use. Starting it (a fresh interpreter importing
+    Home Assistant and this integration) takes longer than both sides together,
+    so calculations keep running in-process until a warm-up call has returned.
+    A worker that dies later is dropped and the next calculation starts a new
+    one; on a single CPU core, or if the process cannot start at all,
+    everything stays in-process. Log
+    records of the worker process do not reach Home Assistant's log.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without a running process."""
+        self._pool: ProcessPoolExecutor | None = None
+        self._warm_up: Future[bool] | None = None
+        # Set when the process could not be started, so it is not retried every update
+        self._unavailable = False
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if the worker has finished starting and accepts jobs."""
+        warm_up = self._warm_up
+        return warm_up is not None and warm_up.done() and not warm_up.cancelled() and warm_up.exception() is None
+
+    def submit(self, job: TibberPricesPeriodSideJob) -> Future[tuple[dict[str, Any], float]] | None:
+        """
+        Hand one side to the worker process.
+
+        Args:
+            job: Resolved job of the side to calculate
+
+        Returns:
+            Future of (result, duration in seconds), or None if the worker is not
+            ready yet (the caller then calculates the side itself).
+
+        """
+        if self._unavailable:
+            return None
+        if self._pool is None:
+            self._start()
+            return None
+        if not self.is_ready:
+            if self._warm_up is not None and self._warm_up.done():
+                # Warm-up failed: the process could not start or import the integration
+                self._mark_unavailable(self._warm_up.exception())
+            return None
+        try:
+            return self._pool.submit(_run_side_job_in_worker, job, dt_util.get_default_time_zone())
+        except BrokenProcessPool, RuntimeError:
+            self.shutdown()
+            return None
+
+    def _start(self) -> None:
+        """Start the worker process and its warm-up call without waiting for either."""
+        if (os.cpu_count() or 1) < 2:
+            # On a single core the sides would only take turns, plus the pickling
+            self._mark_unavailable(None)
+            return
+        try:
+            self._pool = ProcessPoolExecutor(max_workers=1)
+            self._warm_up = self._pool.submit(_worker_ready)
+        except (OSError, RuntimeError) as err:
+            self._mark_unavailable(err)
+
+    def _mark_unavailable(self, err: BaseException | None) -> None:
+        """Give up on the worker process for the lifetime of Home Assistant."""
+        _LOGGER.debug("Period worker process unavailable, calculating in-process: %s", err or "single CPU core")
+        self.shutdown()
+        self._unavailable = True
+
+    def shutdown(self) -> None:
+        """Stop the worker process without waiting for it; the next submit starts a new one."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._warm_up = None
+
+
+# Shared by the coordinators of all config entries and time-travel views. The
+# event loop runs one period calculation at a time, so one process is enough.
+PERIOD_SIDE_WORKER = TibberPricesPeriodSideWorker()
+
+
+def _run_timed_side_job(
+    job: TibberPricesPeriodSideJob | None,
+    timings: TibberPricesStageTimings | None,
+    stage: str,
+) -> dict[str, Any]:
+    """Run one side and record its duration, unless it is filtered out."""
+    if job is None or timings is None:
+        return run_period_side_job(job)
+    with timings.measure(stage):
+        return run_period_side_job(job)
+
+
+def run_period_side_jobs(
+    best_job: TibberPricesPeriodSideJob | None,
+    peak_job: TibberPricesPeriodSideJob | None,
+    *,
+    timings: TibberPricesStageTimings | None = None,
+    worker: TibberPricesPeriodSideWorker | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Run the best and peak price period calculations.
+
+    Args:
+        best_job: Resolved best price job (None if filtered out)
+        peak_job: Resolved peak price job (None if filtered out)
+        timings: Records each side as "periods_best_price"/"periods_peak_price".
+            A side calculated in the worker records its time there, not the wait.
+        worker: Calculates the peak side in parallel when both sides have a job.
+
+    Returns:
+        Tuple of (best_price result, peak_price result).
+
+    """
+    peak_future = None
+    if worker is not None and best_job is not None and peak_job is not None:
+        peak_future = worker.submit(peak_job)
+    best_result = _run_timed_side_job(best_job, timings, "periods_best_price")
+    if worker is None or peak_future is None:
+        return best_result, _run_timed_side_job(peak_job, timings, "periods_peak_price")
+
+    try:
+        peak_result, peak_seconds = peak_future.result()
+    except BrokenProcessPool:
+        # The worker died (killed, out of memory): calculate here and restart it next time
+        _LOGGER.warning("Period worker process stopped unexpectedly, calculating peak price periods in-process")
+        worker.shutdown()
+        return best_result, _run_timed_side_job(peak_job, timings, "periods_peak_price")
+    if timings is not None:
+        timings.record("periods_peak_price", peak_seconds)
+    return best_result, peak_result
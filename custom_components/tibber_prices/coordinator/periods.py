@@ -9,22 +9,33 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from custom_components.tibber_prices import const as _const
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Collection
 
     from homeassistant.config_entries import ConfigEntry
 
 from .helpers import get_intervals_for_day_offsets
-from .period_handlers import TibberPricesPeriodConfig, calculate_periods_with_relaxation
+from .period_handlers import TibberPricesPeriodConfig
+from .period_pipeline import TibberPricesPeriodSideJob, TibberPricesPeriodSideWorker, run_period_side_jobs
 from .time_service import TibberPricesTimeService
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class TibberPricesPeriodSideSettings(NamedTuple):
+    """Effective configuration of one period side (options merged with runtime overrides)."""
+
+    enable_relaxation: Any
+    min_periods: int
+    max_relaxation_attempts: int
+    config: TibberPricesPeriodConfig
+
+
 class TibberPricesPeriodCalculator:
     """Handles period calculations with level filtering and gap tolerance."""
 
@@ -33,13 +44,18 @@ class TibberPricesPeriodCalculator:
         config_entry: ConfigEntry,
         log_prefix: str,
         get_config_override_fn: Callable[[str, str], Any | None] | None = None,
+        side_worker: TibberPricesPeriodSideWorker | None = None,
     ) -> None:
         """Initialize the period calculator."""
         self.config_entry = config_entry
+        # Calculates the peak side in a worker process; None runs both sides in-process
+        self.side_worker = side_worker
         self._log_prefix = log_prefix
         # Replaced by the coordinator with a fresh (possibly time-shifted) service
         # each update cycle; the default keeps the calculator usable standalone.
         self.time: TibberPricesTimeService = TibberPricesTimeService()
+        # Replaced by the coordinator's timings, like time
+        self.stage_timings = TibberPricesStageTimings()
         self._config_cache: dict[str, dict[str, Any]] | None = None
         self._config_cache_valid = False
         self._get_config_override = get_config_override_fn
@@ -129,23 +145,43 @@ class TibberPricesPeriodCalculator:
         prefixed_message = f"{self._log_prefix} {message}"
         getattr(_LOGGER, level)(prefixed_message, *args, **kwargs)
 
-    def invalidate_config_cache(self) -> None:
-        """Invalidate config cache when options change."""
+    def invalidate_config_cache(self, *, keep_periods: bool = False) -> None:
+        """
+        Invalidate config cache when options change.
+
+        Args:
+            keep_periods: Keep the last period results so that a partial
+                recalculation (rerun_sides) can reuse the unaffected side.
+
+        """
         self._config_cache_valid = False
         self._config_cache = None
+        if keep_periods:
+            self._log("debug", "Period config cache invalidated (period results kept)")
+            return
         # Also invalidate period calculation cache when config changes
         self._cached_periods = None
         self._last_periods_hash = None
         self._log("debug", "Period config cache and calculation cache invalidated")
 
-    def _compute_periods_hash(self, price_info: list[dict[str, Any]]) -> str:
+    def _compute_periods_hash(
+        self,
+        price_info: list[dict[str, Any]],
+        side_settings: tuple[TibberPricesPeriodSideSettings, TibberPricesPeriodSideSettings] | None = None,
+    ) -> str:
         """
         Compute hash of price data and config for period calculation caching.
 
         Only includes data that affects period calculation:
         - Today/tomorrow interval content (timestamps, totals, levels, ratings, differences)
-        - Period calculation config (flex, min_distance, min_period_length)
-        - Level filter overrides
+        - Effective settings of both sides (options merged with runtime overrides):
+          relaxation switch, min periods, relaxation attempts and the full
+          TibberPricesPeriodConfig (flex, distance, length, level filter, gap count,
+          extension, geometric flex, segment forcing, rating/volatility thresholds)
+
+        Args:
+            price_info: Enriched price intervals.
+            side_settings: Resolved (best, peak) settings; resolved here if None.
 
         Returns:
             Hash string for cache key comparison.
@@ -190,25 +226,15 @@ class TibberPricesPeriodCalculator:
         today_signature = _build_interval_signature(today_intervals)
         tomorrow_signature = _build_interval_signature(tomorrow_intervals)
 
-        # Get period configs (both best and peak)
-        best_config = self.get_period_config(reverse_sort=False)
-        peak_config = self.get_period_config(reverse_sort=True)
-
-        # Get level filter overrides from options
-        options = self.config_entry.options
-        period_settings = options.get("period_settings", {})
-        best_level_filter = period_settings.get(_const.CONF_BEST_PRICE_MAX_LEVEL, _const.DEFAULT_BEST_PRICE_MAX_LEVEL)
-        peak_level_filter = period_settings.get(_const.CONF_PEAK_PRICE_MIN_LEVEL, _const.DEFAULT_PEAK_PRICE_MIN_LEVEL)
+        if side_settings is None:
+            thresholds = self._get_rating_thresholds()
+            side_settings = (
+                self._get_side_settings(thresholds, reverse_sort=False),
+                self._get_side_settings(thresholds, reverse_sort=True),
+            )
 
         # Compute hash from all relevant data
-        hash_data = (
-            today_signature,
-            tomorrow_signature,
-            tuple(best_config.items()),
-            tuple(peak_config.items()),
-            best_level_filter,
-            peak_level_filter,
-        )
+        hash_data = (today_signature, tomorrow_signature, side_settings)
         return str(hash(hash_data))
 
     def get_period_config(self, *, reverse_sort: bool) -> dict[str, Any]:
@@ -820,6 +846,8 @@ class TibberPricesPeriodCalculator:
         self,
         price_info: list[dict[str, Any]],
         day_patterns: dict[str, Any] | None = None,
+        *,
+        rerun_sides: Collection[str] | None = None,
     ) -> dict[str, Any]:
         """
         Calculate periods (best price and peak price) for the given price info.
@@ -829,10 +857,25 @@ class TibberPricesPeriodCalculator:
 
         Uses hash-based caching to avoid recalculating periods when price data
         and configuration haven't changed (~70% performance improvement).
+
+        Args:
+            price_info: Enriched price intervals.
+            day_patterns: Day patterns for geometric flex.
+            rerun_sides: Sides to recalculate ("best_price", "peak_price").
+                The other side is taken from the last result. Only valid when
+                price_info and day_patterns are unchanged since that result.
+                None recalculates both sides.
+
         """
-        # Check if we can use cached periods
-        current_hash = self._compute_periods_hash(price_info)
-        if self._cached_periods is not None and self._last_periods_hash == current_hash:
+        # Resolve the effective settings of both sides once; they are part of the cache key
+        thresholds = self._get_rating_thresholds()
+        best_settings = self._get_side_settings(thresholds, reverse_sort=False)
+        peak_settings = self._get_side_settings(thresholds, reverse_sort=True)
+
+        # Check if we can use cached periods. A partial rerun always recalculates
+        # its sides: the caller already knows their config changed.
+        current_hash = self._compute_periods_hash(price_info, (best_settings, peak_settings))
+        if rerun_sides is None and self._cached_periods is not None and self._last_periods_hash == current_hash:
             self._log("debug", "Using cached period calculation results (hash match)")
             return self._cached_periods
 
@@ -859,6 +902,49 @@ class TibberPricesPeriodCalculator:
             else None
         )
 
+        # Sides outside rerun_sides keep their last result
+        kept: dict[str, Any] = {}
+        if rerun_sides is not None and self._cached_periods is not None:
+            kept = {side: periods for side, periods in self._cached_periods.items() if side not in rerun_sides}
+
+        # Both sides only read the shared interval list, so they are independent jobs
+        best_job = (
+            None
+            if "best_price" in kept
+            else self._build_period_side_job(
+                price_info, all_prices, best_settings, day_patterns_by_date, reverse_sort=False
+            )
+        )
+        peak_job = (
+            None
+            if "peak_price" in kept
+            else self._build_period_side_job(
+                price_info, all_prices, peak_settings, day_patterns_by_date, reverse_sort=True
+            )
+        )
+        best_periods, peak_periods = run_period_side_jobs(
+            best_job, peak_job, timings=self.stage_timings, worker=self.side_worker
+        )
+
+        result = {
+            "best_price": kept.get("best_price", best_periods),
+            "peak_price": kept.get("peak_price", peak_periods),
+        }
+
+        # Cache the result
+        self._cached_periods = result
+        self._last_periods_hash = current_hash
+
+        return result
+
+    def _get_rating_thresholds(self) -> dict[str, float]:
+        """
+        Get the rating and volatility thresholds shared by both period sides.
+
+        Returns:
+            Threshold keyword arguments for TibberPricesPeriodConfig.
+
+        """
         # Get rating thresholds from config (flat in options, not in sections)
         # CRITICAL: Price rating thresholds are stored FLAT in options (no sections)
         threshold_low = self._normalize_float_option(
@@ -905,219 +991,151 @@ class TibberPricesPeriodCalculator:
             option_name=_const.CONF_VOLATILITY_THRESHOLD_VERY_HIGH,
         )
 
-        # Get relaxation configuration for best price
+        return {
+            "threshold_low": threshold_low,
+            "threshold_high": threshold_high,
+            "threshold_volatility_moderate": threshold_volatility_moderate,
+            "threshold_volatility_high": threshold_volatility_high,
+            "threshold_volatility_very_high": threshold_volatility_very_high,
+        }
+
+    def _get_side_settings(
+        self,
+        thresholds: dict[str, float],
+        *,
+        reverse_sort: bool,
+    ) -> TibberPricesPeriodSideSettings:
+        """
+        Resolve all config for one period side (best or peak).
+
+        Options are merged with runtime overrides here, so the result is the
+        complete, hashable input of the side's calculation besides the intervals.
+
+        Args:
+            thresholds: Rating and volatility thresholds shared by both sides
+            reverse_sort: True for peak price, False for best price
+
+        Returns:
+            Effective settings of the side.
+
+        """
+        # Get relaxation configuration
         # CRITICAL: Relaxation settings are stored in nested section 'relaxation_and_target_periods'
         # Override entities can override any of these values at runtime
-        enable_relaxation_best = self._get_option(
-            _const.CONF_ENABLE_MIN_PERIODS_BEST,
-            "relaxation_and_target_periods",
-            _const.DEFAULT_ENABLE_MIN_PERIODS_BEST,
-        )
-
-        # Check if best price periods should be shown
-        # If relaxation is enabled, always calculate (relaxation tries configured level filter
-        # first, then falls back to "any" per flex step if still insufficient)
-        # If relaxation is disabled, apply level filter check upfront
-        if enable_relaxation_best:
-            show_best_price = bool(all_prices)
+        if reverse_sort:
+            enable_key, enable_default = _const.CONF_ENABLE_MIN_PERIODS_PEAK, _const.DEFAULT_ENABLE_MIN_PERIODS_PEAK
+            min_periods_key, min_periods_default = _const.CONF_MIN_PERIODS_PEAK, _const.DEFAULT_MIN_PERIODS_PEAK
+            attempts_key, attempts_default = (
+                _const.CONF_RELAXATION_ATTEMPTS_PEAK,
+                _const.DEFAULT_RELAXATION_ATTEMPTS_PEAK,
+            )
+            level_key, level_default = _const.CONF_PEAK_PRICE_MIN_LEVEL, _const.DEFAULT_PEAK_PRICE_MIN_LEVEL
+            gap_key, gap_default = (
+                _const.CONF_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
+                _const.DEFAULT_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
+            )
         else:
-            show_best_price = self.should_show_periods(price_info, reverse_sort=False) if all_prices else False
-        min_periods_best = self._normalize_int_option(
-            self._get_option(
-                _const.CONF_MIN_PERIODS_BEST,
-                "relaxation_and_target_periods",
-                _const.DEFAULT_MIN_PERIODS_BEST,
-            ),
-            _const.DEFAULT_MIN_PERIODS_BEST,
-            option_name=_const.CONF_MIN_PERIODS_BEST,
-            minimum=1,
-        )
-        relaxation_attempts_best = self._normalize_int_option(
-            self._get_option(
+            enable_key, enable_default = _const.CONF_ENABLE_MIN_PERIODS_BEST, _const.DEFAULT_ENABLE_MIN_PERIODS_BEST
+            min_periods_key, min_periods_default = _const.CONF_MIN_PERIODS_BEST, _const.DEFAULT_MIN_PERIODS_BEST
+            attempts_key, attempts_default = (
                 _const.CONF_RELAXATION_ATTEMPTS_BEST,
-                "relaxation_and_target_periods",
                 _const.DEFAULT_RELAXATION_ATTEMPTS_BEST,
-            ),
-            _const.DEFAULT_RELAXATION_ATTEMPTS_BEST,
-            option_name=_const.CONF_RELAXATION_ATTEMPTS_BEST,
-            minimum=1,
-        )
-
-        # Calculate best price periods (or return empty if filtered)
-        if show_best_price:
-            best_config = self.get_period_config(reverse_sort=False)
-            # Get level filter configuration from period_settings section
-            # CRITICAL: max_level and gap_count are stored in nested section 'period_settings'
-            max_level_best = self._get_option(
-                _const.CONF_BEST_PRICE_MAX_LEVEL,
-                "period_settings",
-                _const.DEFAULT_BEST_PRICE_MAX_LEVEL,
             )
-            gap_count_best = self._normalize_int_option(
-                self._get_option(
-                    _const.CONF_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
-                    "period_settings",
-                    _const.DEFAULT_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
-                ),
+            level_key, level_default = _const.CONF_BEST_PRICE_MAX_LEVEL, _const.DEFAULT_BEST_PRICE_MAX_LEVEL
+            gap_key, gap_default = (
+                _const.CONF_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
                 _const.DEFAULT_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
-                option_name=_const.CONF_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
-                minimum=0,
-            )
-            best_period_config = TibberPricesPeriodConfig(
-                reverse_sort=False,
-                flex=best_config["flex"],
-                min_distance_from_avg=best_config["min_distance_from_avg"],
-                min_period_length=best_config["min_period_length"],
-                threshold_low=threshold_low,
-                threshold_high=threshold_high,
-                threshold_volatility_moderate=threshold_volatility_moderate,
-                threshold_volatility_high=threshold_volatility_high,
-                threshold_volatility_very_high=threshold_volatility_very_high,
-                level_filter=max_level_best,
-                gap_count=gap_count_best,
-                extend_to_extreme=best_config["extend_to_extreme"],
-                max_extension_intervals=best_config["max_extension_intervals"],
-                geometric_extra_flex=best_config["geometric_extra_flex"],
-                segment_forcing=best_config["segment_forcing"],
-                segment_min_periods=best_config["segment_min_periods"],
-            )
-            best_periods = calculate_periods_with_relaxation(
-                all_prices,
-                config=best_period_config,
-                enable_relaxation=enable_relaxation_best,
-                min_periods=min_periods_best,
-                max_relaxation_attempts=relaxation_attempts_best,
-                should_show_callback=lambda lvl: self.should_show_periods(
-                    price_info,
-                    reverse_sort=False,
-                    level_override=lvl,
-                ),
-                time=self.time,
-                config_entry=self.config_entry,
-                day_patterns_by_date=day_patterns_by_date,
             )
-        else:
-            best_periods = {
-                "periods": [],
-                "intervals": [],
-                "metadata": {
-                    "total_intervals": 0,
-                    "total_periods": 0,
-                    "config": {},
-                    "relaxation": {"relaxation_active": False, "relaxation_attempted": False},
-                },
-            }
 
-        # Get relaxation configuration for peak price
-        # CRITICAL: Relaxation settings are stored in nested section 'relaxation_and_target_periods'
-        # Override entities can override any of these values at runtime
-        enable_relaxation_peak = self._get_option(
-            _const.CONF_ENABLE_MIN_PERIODS_PEAK,
-            "relaxation_and_target_periods",
-            _const.DEFAULT_ENABLE_MIN_PERIODS_PEAK,
-        )
+        enable_relaxation = self._get_option(enable_key, "relaxation_and_target_periods", enable_default)
 
-        # Check if peak price periods should be shown
-        # If relaxation is enabled, always calculate (relaxation tries configured level filter
-        # first, then falls back to "any" per flex step if still insufficient)
-        # If relaxation is disabled, apply level filter check upfront
-        if enable_relaxation_peak:
-            show_peak_price = bool(all_prices)
-        else:
-            show_peak_price = self.should_show_periods(price_info, reverse_sort=True) if all_prices else False
-        min_periods_peak = self._normalize_int_option(
-            self._get_option(
-                _const.CONF_MIN_PERIODS_PEAK,
-                "relaxation_and_target_periods",
-                _const.DEFAULT_MIN_PERIODS_PEAK,
-            ),
-            _const.DEFAULT_MIN_PERIODS_PEAK,
-            option_name=_const.CONF_MIN_PERIODS_PEAK,
+        min_periods = self._normalize_int_option(
+            self._get_option(min_periods_key, "relaxation_and_target_periods", min_periods_default),
+            min_periods_default,
+            option_name=min_periods_key,
             minimum=1,
         )
-        relaxation_attempts_peak = self._normalize_int_option(
-            self._get_option(
-                _const.CONF_RELAXATION_ATTEMPTS_PEAK,
-                "relaxation_and_target_periods",
-                _const.DEFAULT_RELAXATION_ATTEMPTS_PEAK,
-            ),
-            _const.DEFAULT_RELAXATION_ATTEMPTS_PEAK,
-            option_name=_const.CONF_RELAXATION_ATTEMPTS_PEAK,
+        relaxation_attempts = self._normalize_int_option(
+            self._get_option(attempts_key, "relaxation_and_target_periods", attempts_default),
+            attempts_default,
+            option_name=attempts_key,
             minimum=1,
         )
 
-        # Calculate peak price periods (or return empty if filtered)
-        if show_peak_price:
-            peak_config = self.get_period_config(reverse_sort=True)
-            # Get level filter configuration from period_settings section
-            # CRITICAL: min_level and gap_count are stored in nested section 'period_settings'
-            min_level_peak = self._get_option(
-                _const.CONF_PEAK_PRICE_MIN_LEVEL,
-                "period_settings",
-                _const.DEFAULT_PEAK_PRICE_MIN_LEVEL,
-            )
-            gap_count_peak = self._normalize_int_option(
-                self._get_option(
-                    _const.CONF_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
-                    "period_settings",
-                    _const.DEFAULT_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
-                ),
-                _const.DEFAULT_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
-                option_name=_const.CONF_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
-                minimum=0,
-            )
-            peak_period_config = TibberPricesPeriodConfig(
-                reverse_sort=True,
-                flex=peak_config["flex"],
-                min_distance_from_avg=peak_config["min_distance_from_avg"],
-                min_period_length=peak_config["min_period_length"],
-                threshold_low=threshold_low,
-                threshold_high=threshold_high,
-                threshold_volatility_moderate=threshold_volatility_moderate,
-                threshold_volatility_high=threshold_volatility_high,
-                threshold_volatility_very_high=threshold_volatility_very_high,
-                level_filter=min_level_peak,
-                gap_count=gap_count_peak,
-                extend_to_extreme=peak_config["extend_to_extreme"],
-                max_extension_intervals=peak_config["max_extension_intervals"],
-                geometric_extra_flex=peak_config["geometric_extra_flex"],
-                segment_forcing=peak_config["segment_forcing"],
-                segment_min_periods=peak_config["segment_min_periods"],
-            )
-            peak_periods = calculate_periods_with_relaxation(
-                all_prices,
-                config=peak_period_config,
-                enable_relaxation=enable_relaxation_peak,
-                min_periods=min_periods_peak,
-                max_relaxation_attempts=relaxation_attempts_peak,
-                should_show_callback=lambda lvl: self.should_show_periods(
-                    price_info,
-                    reverse_sort=True,
-                    level_override=lvl,
-                ),
-                time=self.time,
-                config_entry=self.config_entry,
-                day_patterns_by_date=day_patterns_by_date,
-            )
-        else:
-            peak_periods = {
-                "periods": [],
-                "intervals": [],
-                "metadata": {
-                    "total_intervals": 0,
-                    "total_periods": 0,
-                    "config": {},
-                    "relaxation": {"relaxation_active": False, "relaxation_attempted": False},
-                },
-            }
+        side_config = self.get_period_config(reverse_sort=reverse_sort)
+        # Get level filter configuration from period_settings section
+        # CRITICAL: max_level/min_level and gap_count are stored in nested section 'period_settings'
+        level_filter = self._get_option(level_key, "period_settings", level_default)
+        gap_count = self._normalize_int_option(
+            self._get_option(gap_key, "period_settings", gap_default),
+            gap_default,
+            option_name=gap_key,
+            minimum=0,
+        )
+        period_config = TibberPricesPeriodConfig(
+            reverse_sort=reverse_sort,
+            flex=side_config["flex"],
+            min_distance_from_avg=side_config["min_distance_from_avg"],
+            min_period_length=side_config["min_period_length"],
+            level_filter=level_filter,
+            gap_count=gap_count,
+            extend_to_extreme=side_config["extend_to_extreme"],
+            max_extension_intervals=side_config["max_extension_intervals"],
+            geometric_extra_flex=side_config["geometric_extra_flex"],
+            segment_forcing=side_config["segment_forcing"],
+            segment_min_periods=side_config["segment_min_periods"],
+            **thresholds,
+        )
 
-        result = {
-            "best_price": best_periods,
-            "peak_price": peak_periods,
-        }
+        return TibberPricesPeriodSideSettings(
+            enable_relaxation=enable_relaxation,
+            min_periods=min_periods,
+            max_relaxation_attempts=relaxation_attempts,
+            config=period_config,
+        )
 
-        # Cache the result
-        self._cached_periods = result
-        self._last_periods_hash = current_hash
+    def _build_period_side_job(
+        self,
+        price_info: list[dict[str, Any]],
+        all_prices: list[dict[str, Any]],
+        settings: TibberPricesPeriodSideSettings,
+        day_patterns_by_date: dict[date, dict[str, Any]] | None,
+        *,
+        reverse_sort: bool,
+    ) -> TibberPricesPeriodSideJob | None:
+        """
+        Build the calculation job for one period side (best or peak).
 
-        return result
+        Args:
+            price_info: Flat list of price intervals (for the level filter check)
+            all_prices: Intervals of the 4-day calculation window
+            settings: Effective settings of the side (see _get_side_settings())
+            day_patterns_by_date: Date-keyed day patterns for geometric flex
+            reverse_sort: True for peak price, False for best price
+
+        Returns:
+            Job for run_period_side_jobs(), or None if this side is filtered out.
+
+        """
+        # Check if periods should be shown
+        # If relaxation is enabled, always calculate (relaxation tries configured level filter
+        # first, then falls back to "any" per flex step if still insufficient)
+        # If relaxation is disabled, apply level filter check upfront
+        # The job carries the outcome of the check instead of a callback bound to
+        # this calculator, so it can be pickled for the worker process
+        if not all_prices:
+            return None
+        level_filter_passed = self.should_show_periods(price_info, reverse_sort=reverse_sort)
+        if not settings.enable_relaxation and not level_filter_passed:
+            return None
+
+        return TibberPricesPeriodSideJob(
+            all_prices=all_prices,
+            config=settings.config,
+            enable_relaxation=settings.enable_relaxation,
+            min_periods=settings.min_periods,
+            max_relaxation_attempts=settings.max_relaxation_attempts,
+            level_filter_passed=level_filter_passed,
+            time=self.time,
+            day_patterns_by_date=day_patterns_by_date,
+        )
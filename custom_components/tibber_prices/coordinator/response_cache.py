@@ -0,0 +1,108 @@
+"""
+Short-lived cache for the responses of read-only services.
+
+Dashboards and automations call get_price, get_chartdata and the find_*
+services over and over with identical arguments, and the chart_data_export
+sensor calls get_chartdata through the service registry. Between two
+coordinator updates, and within one quarter-hour, the answer to the same call
+does not change, so the response is kept and returned again.
+
+An entry is only returned while:
+- the coordinator data is the dict it was computed from (coordinator data is
+  replaced, never mutated in place - see tick_context.py),
+- "now" is still in the same quarter-hour (day-relative answers and default
+  search ranges snap to the quarter-hour grid; the find_* services also key on
+  their resolved search range, see services/response_cache.py), and
+- it is younger than RESPONSE_CACHE_TTL_SECONDS.
+
+The coordinator additionally clears the cache on every listener update and
+quarter-hour tick, so outdated responses do not stay in memory.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import time
+from typing import TYPE_CHECKING, Any
+
+from .constants import RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from datetime import datetime
+
+
+class TibberPricesResponseCache:
+    """Service responses of one coordinator, keyed on the normalized call data."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize an empty cache."""
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        # Coordinator data and quarter-hour the stored entries were computed for
+        self._data: Any = None
+        self._bucket: datetime | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, *, data: Any, bucket: datetime) -> Any | None:
+        """
+        Return the stored response for key, or None on a miss.
+
+        Args:
+            key: Normalized service name and call data.
+            data: Current coordinator data.
+            bucket: Start of the current quarter-hour.
+
+        Returns:
+            The stored response, or None.
+
+        """
+        if data is not self._data or bucket != self._bucket:
+            self.clear()
+            self._data = data
+            self._bucket = bucket
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self._ttl_seconds:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, response: Any, *, data: Any, bucket: datetime) -> None:
+        """
+        Store a response computed for data and bucket.
+
+        Nothing is stored if the data or the quarter-hour changed while the
+        response was being computed.
+        """
+        if data is not self._data or bucket != self._bucket:
+            return
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all stored responses."""
+        self._entries.clear()
+        self._data = None
+        self._bucket = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "entries": len(self._entries),
+        }
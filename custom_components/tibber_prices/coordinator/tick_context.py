@@ -0,0 +1,215 @@
+"""
+Per-tick computation context shared by all time-sensitive entities.
+
+At every quarter-hour boundary ~45 entities refresh. Each of them used to
+re-derive the same facts from coordinator data through its own calculator:
+the interval list of yesterday/today/tomorrow, the current interval and its
+neighbours, the active best/peak period, the rolling-hour windows and the
+trailing/leading 24h windows. Each derivation is a linear scan over ~288
+intervals.
+
+A TibberPricesTickContext binds one TimeService (one "now") to one coordinator
+data dict. Everything is derived lazily on first access and then shared by all
+entities of the same update cycle, so each fact is computed at most once per
+tick - and not at all if no enabled entity needs it.
+
+The context is only valid while both the TimeService and the data dict are
+the ones it was built for. Coordinator data is always replaced, never mutated
+in place, so an identity check on both is enough to detect staleness (see
+TibberPricesDataUpdateCoordinator.get_tick_context).
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from custom_components.tibber_prices.utils.average import calculate_mean, calculate_median
+
+from .helpers import get_intervals_for_day_offsets
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .time_service import TibberPricesTimeService
+
+# Rolling hour: 2 intervals before + center + 2 after (60 minutes)
+_ROLLING_HOUR_HALF_WIDTH = 2
+_INTERVALS_PER_HOUR = 4
+_WINDOW_24H = timedelta(hours=24)
+
+
+class TibberPricesWindowStats(NamedTuple):
+    """Statistics of the prices in a 24h window (base currency)."""
+
+    mean: float
+    median: float | None
+    min: float
+    max: float
+
+
+def find_current_or_next_period(periods: list[dict], *, time: TibberPricesTimeService) -> dict | None:
+    """
+    Return the active period, or the next future one if none is active.
+
+    Args:
+        periods: Period summaries in chronological order.
+        time: TibberPricesTimeService providing "now".
+
+    Returns:
+        The selected period summary, or None if no period is active or ahead.
+
+    """
+    for period in periods:
+        start = period.get("start")
+        end = period.get("end")
+        if start and end and time.is_current_interval(start, end):
+            return period
+
+    for period in periods:
+        start = period.get("start")
+        if start and time.is_in_future(start):
+            return period
+
+    return None
+
+
+class TibberPricesTickContext:
+    """Lazily computed facts about "now" shared by all entities of one update cycle."""
+
+    def __init__(self, coordinator_data: dict[str, Any] | None, *, time: TibberPricesTimeService) -> None:
+        """
+        Initialize the context.
+
+        Args:
+            coordinator_data: Coordinator data dict the context is derived from.
+            time: TibberPricesTimeService of the update cycle.
+
+        """
+        self.data = coordinator_data
+        self.time = time
+        self._rolling_hour_windows: dict[int, list[dict] | None] = {}
+        self._period_bounds: dict[bool, tuple[datetime, datetime] | None] = {}
+
+    def is_valid_for(self, coordinator_data: dict[str, Any] | None, time: TibberPricesTimeService) -> bool:
+        """Return True if the context was built for exactly this data and TimeService."""
+        return self.data is coordinator_data and self.time is time
+
+    @cached_property
+    def all_intervals(self) -> list[dict]:
+        """Intervals of yesterday, today and tomorrow in chronological order."""
+        return get_intervals_for_day_offsets(self.data, [-1, 0, 1])
+
+    @cached_property
+    def _index_by_start(self) -> dict[datetime, int]:
+        """Map interval start → index in all_intervals (first occurrence wins, like a linear search)."""
+        index: dict[datetime, int] = {}
+        for idx, interval in enumerate(self.all_intervals):
+            starts_at = self.time.get_interval_time(interval)
+            if starts_at is not None:
+                index.setdefault(starts_at, idx)
+        return index
+
+    @cached_property
+    def current_index(self) -> int | None:
+        """Index of the current interval in all_intervals, or None if not covered."""
+        return self._index_by_start.get(self.time.round_to_nearest_quarter(self.time.now()))
+
+    def interval_at(self, offset: int) -> dict | None:
+        """
+        Return the interval at an offset from the current one.
+
+        Args:
+            offset: 0 = current, 1 = next, -1 = previous, etc.
+
+        Returns:
+            Interval dict, or None if not available.
+
+        """
+        target = self.time.round_to_nearest_quarter(self.time.get_interval_offset_time(offset))
+        idx = self._index_by_start.get(target)
+        return None if idx is None else self.all_intervals[idx]
+
+    @cached_property
+    def current_interval(self) -> dict | None:
+        """The current interval, or None if not available."""
+        return self.interval_at(0)
+
+    def rolling_hour_window(self, hour_offset: int) -> list[dict] | None:
+        """
+        Return the 5-interval rolling window centered hour_offset hours from now.
+
+        Args:
+            hour_offset: 0 (current hour), 1 (next hour), etc.
+
+        Returns:
+            Intervals of the window (clipped at the data edges), or None if empty.
+
+        """
+        if hour_offset not in self._rolling_hour_windows:
+            window = None
+            if self.current_index is not None:
+                center = self.current_index + hour_offset * _INTERVALS_PER_HOUR
+                start = max(center - _ROLLING_HOUR_HALF_WIDTH, 0)
+                window = self.all_intervals[start : max(center + _ROLLING_HOUR_HALF_WIDTH + 1, 0)] or None
+            self._rolling_hour_windows[hour_offset] = window
+        return self._rolling_hour_windows[hour_offset]
+
+    @cached_property
+    def trailing_24h_stats(self) -> TibberPricesWindowStats | None:
+        """Statistics of the 24 hours before now, or None if the window has no data."""
+        now = self.time.now()
+        return self._window_stats(now - _WINDOW_24H, now)
+
+    @cached_property
+    def leading_24h_stats(self) -> TibberPricesWindowStats | None:
+        """Statistics of the 24 hours from now, or None if the window has no data."""
+        now = self.time.now()
+        return self._window_stats(now, now + _WINDOW_24H)
+
+    def _window_stats(self, window_start: datetime, window_end: datetime) -> TibberPricesWindowStats | None:
+        """Return statistics of all intervals starting in [window_start, window_end)."""
+        prices = []
+        for interval in self.all_intervals:
+            starts_at = self.time.get_interval_time(interval)
+            if starts_at is not None and window_start <= starts_at < window_end:
+                prices.append(float(interval["total"]))
+        if not prices:
+            return None
+        return TibberPricesWindowStats(calculate_mean(prices), calculate_median(prices), min(prices), max(prices))
+
+    def period_bounds(self, *, reverse_sort: bool) -> tuple[datetime, datetime] | None:
+        """
+        Return start and end of the active (or next) best/peak price period.
+
+        Selects the same period as the period binary sensor attributes: periods
+        of today and tomorrow, the active one first, otherwise the next one.
+
+        Args:
+            reverse_sort: True for peak price periods, False for best price periods.
+
+        Returns:
+            (start, end) of the selected period, or None if there is none.
+
+        """
+        if reverse_sort not in self._period_bounds:
+            self._period_bounds[reverse_sort] = self._find_period_bounds(reverse_sort=reverse_sort)
+        return self._period_bounds[reverse_sort]
+
+    def _find_period_bounds(self, *, reverse_sort: bool) -> tuple[datetime, datetime] | None:
+        """Select the period for period_bounds()."""
+        if not self.data:
+            return None
+        period_data = self.data.get("pricePeriods", {}).get("peak_price" if reverse_sort else "best_price")
+        if not period_data:
+            return None
+
+        today_start = self.time.start_of_local_day(self.time.now())
+        periods = [
+            period for period in period_data.get("periods", []) if period.get("end") and period["end"] >= today_start
+        ]
+        period = find_current_or_next_period(periods, time=self.time)
+        if not period or not period.get("start") or not period.get("end"):
+            return None
+        return period["start"], period["end"]
@@ -0,0 +1,165 @@
+"""
+Stage graph of the data transformation pipeline.
+
+The transformation of raw price data runs in four stages:
+
+    enrichment → day patterns → best price periods
+                              → peak price periods
+
+Each stage declares the config keys it reads. When options or runtime
+overrides (number/switch entities) change, the changed keys select the stages
+that must run again; every stage depending on a rerun stage runs as well.
+Changing a peak-only setting therefore recalculates only the peak price
+periods and keeps enrichment, day patterns and best price periods.
+
+Keys not claimed by any stage conservatively rerun the whole pipeline.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from custom_components.tibber_prices import const as _const
+
+STAGE_ENRICHMENT = "enrichment"
+STAGE_DAY_PATTERNS = "day_patterns"
+STAGE_BEST_PERIODS = "best_periods"
+STAGE_PEAK_PERIODS = "peak_periods"
+
+# Volatility thresholds feed both period sides. Rating thresholds are read by
+# the period calculator too, but they are enrichment keys: periods depend on
+# enrichment and rerun anyway.
+_SHARED_PERIOD_KEYS = frozenset(
+    {
+        _const.CONF_VOLATILITY_THRESHOLD_MODERATE,
+        _const.CONF_VOLATILITY_THRESHOLD_HIGH,
+        _const.CONF_VOLATILITY_THRESHOLD_VERY_HIGH,
+    }
+)
+
+
+class TibberPricesTransformStage(NamedTuple):
+    """One stage of the transformation pipeline."""
+
+    name: str
+    depends_on: tuple[str, ...]
+    config_keys: frozenset[str]
+
+
+# Topological order: every stage is listed after the stages it depends on
+TRANSFORM_STAGES: tuple[TibberPricesTransformStage, ...] = (
+    TibberPricesTransformStage(
+        STAGE_ENRICHMENT,
+        (),
+        frozenset(
+            {
+                _const.CONF_PRICE_RATING_THRESHOLD_LOW,
+                _const.CONF_PRICE_RATING_THRESHOLD_HIGH,
+                _const.CONF_PRICE_RATING_HYSTERESIS,
+                _const.CONF_PRICE_RATING_GAP_TOLERANCE,
+                _const.CONF_PRICE_LEVEL_GAP_TOLERANCE,
+            }
+        ),
+    ),
+    TibberPricesTransformStage(STAGE_DAY_PATTERNS, (STAGE_ENRICHMENT,), frozenset()),
+    TibberPricesTransformStage(
+        STAGE_BEST_PERIODS,
+        (STAGE_ENRICHMENT, STAGE_DAY_PATTERNS),
+        _SHARED_PERIOD_KEYS
+        | {
+            _const.CONF_BEST_PRICE_FLEX,
+            _const.CONF_BEST_PRICE_MIN_DISTANCE_FROM_AVG,
+            _const.CONF_BEST_PRICE_MIN_PERIOD_LENGTH,
+            _const.CONF_BEST_PRICE_MAX_LEVEL,
+            _const.CONF_BEST_PRICE_MAX_LEVEL_GAP_COUNT,
+            _const.CONF_BEST_PRICE_EXTEND_TO_VERY_CHEAP,
+            _const.CONF_BEST_PRICE_MAX_EXTENSION_INTERVALS,
+            _const.CONF_BEST_PRICE_GEOMETRIC_FLEX,
+            _const.CONF_BEST_PRICE_SEGMENT_FORCING,
+            _const.CONF_BEST_PRICE_SEGMENT_MIN_PERIODS,
+            _const.CONF_ENABLE_MIN_PERIODS_BEST,
+            _const.CONF_MIN_PERIODS_BEST,
+            _const.CONF_RELAXATION_ATTEMPTS_BEST,
+        },
+    ),
+    TibberPricesTransformStage(
+        STAGE_PEAK_PERIODS,
+        (STAGE_ENRICHMENT, STAGE_DAY_PATTERNS),
+        _SHARED_PERIOD_KEYS
+        | {
+            _const.CONF_PEAK_PRICE_FLEX,
+            _const.CONF_PEAK_PRICE_MIN_DISTANCE_FROM_AVG,
+            _const.CONF_PEAK_PRICE_MIN_PERIOD_LENGTH,
+            _const.CONF_PEAK_PRICE_MIN_LEVEL,
+            _const.CONF_PEAK_PRICE_MAX_LEVEL_GAP_COUNT,
+            _const.CONF_PEAK_PRICE_EXTEND_TO_VERY_EXPENSIVE,
+            _const.CONF_PEAK_PRICE_MAX_EXTENSION_INTERVALS,
+            _const.CONF_PEAK_PRICE_GEOMETRIC_FLEX,
+            _const.CONF_PEAK_PRICE_SEGMENT_FORCING,
+            _const.CONF_PEAK_PRICE_SEGMENT_MIN_PERIODS,
+            _const.CONF_ENABLE_MIN_PERIODS_PEAK,
+            _const.CONF_MIN_PERIODS_PEAK,
+            _const.CONF_RELAXATION_ATTEMPTS_PEAK,
+        },
+    ),
+)
+
+ALL_STAGES = frozenset(stage.name for stage in TRANSFORM_STAGES)
+PERIOD_STAGES = frozenset({STAGE_BEST_PERIODS, STAGE_PEAK_PERIODS})
+
+# Period stage → key of its result in pricePeriods
+PERIOD_SIDE_BY_STAGE = {STAGE_BEST_PERIODS: "best_price", STAGE_PEAK_PERIODS: "peak_price"}
+
+_CLAIMED_KEYS = frozenset().union(*(stage.config_keys for stage in TRANSFORM_STAGES))
+
+
+def flatten_effective_config(
+    options: Mapping[str, Any],
+    overrides: Mapping[str, Mapping[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """
+    Return every effective config value keyed by its config key.
+
+    Options are stored partly flat and partly in nested sections; both are
+    merged into one level. Runtime overrides take precedence, as in the period
+    calculator.
+    """
+    flat: dict[str, Any] = {}
+    for key, value in options.items():
+        if isinstance(value, Mapping):
+            flat.update(value)
+        else:
+            flat[key] = value
+    for section in (overrides or {}).values():
+        flat.update(section)
+    return flat
+
+
+def changed_config_keys(previous: Mapping[str, Any], current: Mapping[str, Any]) -> set[str]:
+    """Return keys that were added, removed or changed between two flattened configs."""
+    return {key for key in previous.keys() | current.keys() if previous.get(key) != current.get(key)}
+
+
+def stages_affected_by(changed_keys: set[str]) -> frozenset[str]:
+    """
+    Return the stages to rerun for a set of changed config keys.
+
+    Args:
+        changed_keys: Keys from changed_config_keys().
+
+    Returns:
+        Names of the stages reading one of the keys plus all stages depending
+        on them. All stages if a key is not claimed by any stage.
+
+    """
+    if not changed_keys:
+        return frozenset()
+    if not changed_keys <= _CLAIMED_KEYS:
+        return ALL_STAGES
+
+    affected: set[str] = set()
+    for stage in TRANSFORM_STAGES:
+        if stage.config_keys & changed_keys or affected.intersection(stage.depends_on):
+            affected.add(stage.name)
+    return frozenset(affected)
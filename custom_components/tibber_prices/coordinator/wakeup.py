@@ -0,0 +1,129 @@
+"""
+Event-driven wakeups for timing sensors (Timer #3).
+
+Timing sensors (countdowns, progress) used to be refreshed on a fixed
+30-second grid: 120 callbacks per hour per entity, even when no period is
+active and their value cannot change. Instead, every entity now reports the
+next instant its value can change and the listener manager arms ONE timer
+for the earliest of these deadlines (heap-ordered).
+
+When a value can change:
+
+- Everything the timing sensors count towards (period starts/ends, price
+  phase segments, trend changes) lies on the quarter-hour interval grid, so
+  the set of targets and active periods only changes at quarter-hour
+  boundaries.
+- A countdown rounded to minutes (TimeService.minutes_until_rounded) to a
+  target on the minute grid changes exactly once per minute, at :30 seconds.
+- Progress is continuous while a period runs and keeps the 30-second cadence.
+
+Deadlines always lie on the old 30-second grid, so entities show exactly the
+values the fixed timer produced; only refreshes that cannot change anything
+are skipped.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+import heapq
+import itertools
+import math
+
+# Fallback cadence (the previous fixed Timer #3 grid) and value-change grids
+TIMING_REFRESH_SECONDS = 30
+_MINUTE_SECONDS = 60
+_ROUNDING_OFFSET_SECONDS = 30  # minutes_until_rounded() changes at :30 seconds
+_QUARTER_HOUR_SECONDS = 15 * 60
+
+
+def next_grid_time(now: datetime, step_seconds: int, offset_seconds: int = 0) -> datetime:
+    """
+    Return the first instant strictly after now on a UTC grid.
+
+    Args:
+        now: Timezone-aware reference time.
+        step_seconds: Grid spacing.
+        offset_seconds: Grid offset from the full step (30 for :30 seconds).
+
+    Returns:
+        Grid instant in UTC.
+
+    """
+    timestamp = now.timestamp()
+    steps = math.floor((timestamp - offset_seconds) / step_seconds) + 1
+    return datetime.fromtimestamp(steps * step_seconds + offset_seconds, tz=UTC)
+
+
+def next_timing_value_change(value: object, now: datetime, *, continuous: bool) -> datetime:
+    """
+    Return the next instant a timing sensor value can change.
+
+    Args:
+        value: Current sensor value (minutes, percent or None).
+        now: Reference time the value was calculated for.
+        continuous: True for progress sensors, whose value changes with every
+            refresh while a period is running.
+
+    Returns:
+        Next wakeup instant in UTC.
+
+    """
+    next_boundary = next_grid_time(now, _QUARTER_HOUR_SECONDS)
+    if not value:
+        # Idle (0 or no period): only a new period or phase can change it
+        return next_boundary
+    if continuous:
+        return next_grid_time(now, TIMING_REFRESH_SECONDS)
+    return min(next_grid_time(now, _MINUTE_SECONDS, _ROUNDING_OFFSET_SECONDS), next_boundary)
+
+
+class TibberPricesWakeupScheduler[T]:
+    """
+    Deadline heap with one pending wakeup per item.
+
+    Rescheduling an item leaves its old heap entry behind; stale entries are
+    skipped when they reach the top.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty scheduler."""
+        self._heap: list[tuple[datetime, int, T]] = []
+        self._pending: dict[T, tuple[datetime, int]] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of items with a pending wakeup."""
+        return len(self._pending)
+
+    def schedule(self, item: T, deadline: datetime) -> None:
+        """Set (or replace) the wakeup of an item."""
+        entry = (deadline, next(self._sequence))
+        self._pending[item] = entry
+        heapq.heappush(self._heap, (*entry, item))
+
+    def remove(self, item: T) -> None:
+        """Drop the pending wakeup of an item."""
+        self._pending.pop(item, None)
+
+    def clear(self) -> None:
+        """Drop all pending wakeups."""
+        self._heap.clear()
+        self._pending.clear()
+
+    def next_deadline(self) -> datetime | None:
+        """Return the earliest pending deadline, or None if nothing is scheduled."""
+        heap = self._heap
+        while heap and self._pending.get(heap[0][2]) != heap[0][:2]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: datetime) -> list[T]:
+        """Remove and return all items whose deadline is at or before now (earliest first)."""
+        heap = self._heap
+        due: list[T] = []
+        while heap and heap[0][0] <= now:
+            deadline, sequence, item = heapq.heappop(heap)
+            if self._pending.get(item) == (deadline, sequence):
+                del self._pending[item]
+                due.append(item)
+        return due
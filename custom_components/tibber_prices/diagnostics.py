@@ -58,6 +58,8 @@ def _view_diagnostics(subentry_id: str, view: TibberPricesSubentryData) -> dict[
         "interval_count": len(price_info),
         "last_update_success": coordinator.last_update_success,
         "last_exception": str(coordinator.last_exception) if coordinator.last_exception else None,
+        "response_cache": coordinator.response_cache.stats,
+        "stage_timings": coordinator.stage_timings.stats,
     }
 
 
@@ -121,6 +123,8 @@ async def async_get_config_entry_diagnostics(
         },
         "config": {
             "options": dict(entry.options),
+            "active_overrides": coordinator.get_active_overrides(),
+            "override_recomputes_saved": coordinator.override_recomputes_saved,
         },
         "time_travel_views": [
             _view_diagnostics(subentry_id, view) for subentry_id, view in entry.runtime_data.subentries.items()
@@ -131,6 +135,10 @@ async def async_get_config_entry_diagnostics(
             "transformer_cache_valid": coordinator._data_transformer._cached_transformed_data is not None,  # noqa: SLF001
             "period_calculator_cache_valid": coordinator._period_calculator._cached_periods is not None,  # noqa: SLF001
         },
+        "entity_writes": coordinator.tick_write_stats,
+        "response_cache": coordinator.response_cache.stats,
+        # Rolling p50/p95/max per update pipeline stage (see stage_timing.py)
+        "stage_timings": coordinator.stage_timings.stats,
         "error": {
             "last_exception": str(coordinator.last_exception) if coordinator.last_exception else None,
         },
@@ -6,6 +6,7 @@ from datetime import UTC, datetime, timedelta
 import logging
 from typing import TYPE_CHECKING, Any
 
+from custom_components.tibber_prices.utils.interval_time import parse_starts_at, starts_at_epoch
 from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
@@ -106,7 +107,8 @@ class TibberPricesIntervalPoolFetcher:
         in_range_intervals = [
             interval for interval in cached_intervals if start_time_iso <= interval["startsAt"] < end_time_iso
         ]
-        sorted_intervals = sorted(in_range_intervals, key=lambda x: x["startsAt"])
+        # Sort by instant: on a fall-back day 02:00+01:00 sorts before 02:00+02:00 as a string
+        sorted_intervals = sorted(in_range_intervals, key=lambda x: starts_at_epoch(x["startsAt"]))
 
         if not sorted_intervals:
             # All cached intervals are outside requested range
@@ -114,13 +116,15 @@ class TibberPricesIntervalPoolFetcher:
 
         missing_ranges = []
 
-        # Parse start/end times once
-        start_time_dt = datetime.fromisoformat(start_time_iso)
-        end_time_dt = datetime.fromisoformat(end_time_iso)
+        # Compare epoch seconds: interval timestamps were parsed once when they entered the pool.
+        # The requested bounds may carry fractions of a second, so keep them exact.
+        start_time_ts = parse_starts_at(start_time_iso).timestamp()
+        end_time_ts = parse_starts_at(end_time_iso).timestamp()
+        epochs = [starts_at_epoch(interval["startsAt"]) for interval in sorted_intervals]
 
-        # Get first cached interval datetime for resolution logic
-        first_cached_dt = datetime.fromisoformat(sorted_intervals[0]["startsAt"])
-        resolution_change_dt = RESOLUTION_CHANGE_DATETIME.replace(tzinfo=first_cached_dt.tzinfo)
+        # Resolution change at midnight in the UTC offset of the first cached interval
+        first_cached_dt = parse_starts_at(sorted_intervals[0]["startsAt"])
+        resolution_change_epoch = int(RESOLUTION_CHANGE_DATETIME.replace(tzinfo=first_cached_dt.tzinfo).timestamp())
 
         # Check gap before first cached interval.
         #
@@ -130,8 +134,8 @@ class TibberPricesIntervalPoolFetcher:
         # the 15:00 interval, yet no interval begins in between. Reporting that as
         # missing would request a range the API cannot fill, so the gap would survive
         # every fetch and the same range would be requested again on every call.
-        min_leading_gap_seconds = MIN_GAP_QUARTER_HOURLY if first_cached_dt >= resolution_change_dt else MIN_GAP_HOURLY
-        time_diff_before_first = (first_cached_dt - start_time_dt).total_seconds()
+        min_leading_gap_seconds = MIN_GAP_QUARTER_HOURLY if epochs[0] >= resolution_change_epoch else MIN_GAP_HOURLY
+        time_diff_before_first = epochs[0] - start_time_ts
         if time_diff_before_first >= min_leading_gap_seconds:
             missing_ranges.append((start_time_iso, sorted_intervals[0]["startsAt"]))
             _LOGGER_DETAILS.debug(
@@ -144,29 +148,22 @@ class TibberPricesIntervalPoolFetcher:
 
         # Check gaps between consecutive cached intervals
         for i in range(len(sorted_intervals) - 1):
-            current_interval = sorted_intervals[i]
-            next_interval = sorted_intervals[i + 1]
-
-            current_start = current_interval["startsAt"]
-            next_start = next_interval["startsAt"]
-
-            # Parse to datetime for accurate time difference
-            current_dt = datetime.fromisoformat(current_start)
-            next_dt = datetime.fromisoformat(next_start)
+            current_start = sorted_intervals[i]["startsAt"]
+            next_start = sorted_intervals[i + 1]["startsAt"]
 
             # Calculate time difference in minutes
-            time_diff_minutes = (next_dt - current_dt).total_seconds() / 60
+            time_diff_minutes = (epochs[i + 1] - epochs[i]) / 60
 
             # Determine expected interval length based on date
             expected_interval_minutes = (
-                INTERVAL_HOURLY if current_dt < resolution_change_dt else INTERVAL_QUARTER_HOURLY
+                INTERVAL_HOURLY if epochs[i] < resolution_change_epoch else INTERVAL_QUARTER_HOURLY
             )
 
             # Only create gap if intervals are NOT consecutive
             if time_diff_minutes > expected_interval_minutes + TIME_TOLERANCE_MINUTES:
                 # Gap exists - missing intervals between them
                 # Missing range starts AFTER current interval ends
-                current_interval_end = current_dt + timedelta(minutes=expected_interval_minutes)
+                current_interval_end = parse_starts_at(current_start) + timedelta(minutes=expected_interval_minutes)
                 missing_ranges.append((current_interval_end.isoformat(), next_start))
                 _LOGGER_DETAILS.debug(
                     "Missing range between cached intervals: %s (ends at %s) to %s (%.1f min, expected %d min)",
@@ -181,19 +178,21 @@ class TibberPricesIntervalPoolFetcher:
         # An interval's startsAt time represents the START of that interval.
         # The interval covers [startsAt, startsAt + interval_length).
         # So the last interval ENDS at (startsAt + interval_length), not at startsAt!
-        last_cached_dt = datetime.fromisoformat(sorted_intervals[-1]["startsAt"])
+        last_cached_epoch = epochs[-1]
 
         # Calculate when the last interval ENDS
-        interval_minutes = INTERVAL_QUARTER_HOURLY if last_cached_dt >= resolution_change_dt else INTERVAL_HOURLY
-        last_interval_end_dt = last_cached_dt + timedelta(minutes=interval_minutes)
+        interval_minutes = INTERVAL_QUARTER_HOURLY if last_cached_epoch >= resolution_change_epoch else INTERVAL_HOURLY
 
         # Only create gap if there's uncovered time AFTER the last interval ends
-        time_diff_after_last = (end_time_dt - last_interval_end_dt).total_seconds()
+        time_diff_after_last = end_time_ts - (last_cached_epoch + interval_minutes * 60)
 
         # Need at least one full interval of gap
-        min_gap_seconds = MIN_GAP_QUARTER_HOURLY if last_cached_dt >= resolution_change_dt else MIN_GAP_HOURLY
+        min_gap_seconds = MIN_GAP_QUARTER_HOURLY if last_cached_epoch >= resolution_change_epoch else MIN_GAP_HOURLY
         if time_diff_after_last >= min_gap_seconds:
             # Missing range starts AFTER the last cached interval ends
+            last_interval_end_dt = parse_starts_at(sorted_intervals[-1]["startsAt"]) + timedelta(
+                minutes=interval_minutes
+            )
             missing_ranges.append((last_interval_end_dt.isoformat(), end_time_iso))
             _LOGGER_DETAILS.debug(
                 "Missing range after last cached interval: %s (ends at %s) to %s (%.1f seconds, need >= %d)",
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from datetime import UTC, datetime, timedelta
+from itertools import pairwise
 import logging
 from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
@@ -13,6 +14,8 @@ from custom_components.tibber_prices.api.exceptions import (
     TibberPricesApiClientAuthenticationError,
     TibberPricesApiClientError,
 )
+from custom_components.tibber_prices.stage_timing import timed_stage
+from custom_components.tibber_prices.utils.interval_time import intern_starts_at, starts_at_epoch
 from homeassistant.util import dt as dt_util
 
 from .cache import TibberPricesIntervalPoolFetchGroupCache
@@ -24,6 +27,7 @@ from .storage import async_save_pool_state
 if TYPE_CHECKING:
     from custom_components.tibber_prices.api.client import TibberPricesApiClient
     from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+    from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER_DETAILS = logging.getLogger(__name__ + ".details")
@@ -41,6 +45,11 @@ DEBOUNCE_DELAY_SECONDS = 3.0
 _DST_COLLISION_MAX_SAME_UTC_S = 60
 
 
+def _is_dst_collision(existing: dict[str, Any], new: dict[str, Any]) -> bool:
+    """Return True if two intervals with the same naive local key are an hour apart (DST fall-back)."""
+    return abs(starts_at_epoch(new["startsAt"]) - starts_at_epoch(existing["startsAt"])) > _DST_COLLISION_MAX_SAME_UTC_S
+
+
 def _normalize_starts_at(starts_at: datetime | str) -> str:
     """Normalize startsAt to consistent format (YYYY-MM-DDTHH:MM:SS)."""
     if isinstance(starts_at, datetime):
@@ -125,6 +134,9 @@ class TibberPricesIntervalPool:
         self._last_fetch_degraded = False
         self._last_fetch_error: str | None = None
 
+        # Set by the coordinator; get_intervals/get_sensor_data are recorded there
+        self.stage_timings: TibberPricesStageTimings | None = None
+
         # DST fall-back extra intervals.
         # On DST fall-back nights (e.g. last Sunday October in EU), wall-clock
         # 02:00-02:45 occurs twice: once in CEST (+02:00) and once in CET (+01:00).
@@ -161,6 +173,7 @@ class TibberPricesIntervalPool:
         """Return the error message of the most recent degraded fetch, if any."""
         return self._last_fetch_error
 
+    @timed_stage("pool_get_intervals")
     async def get_intervals(
         self,
         api_client: TibberPricesApiClient,
@@ -340,6 +353,7 @@ class TibberPricesIntervalPool:
 
         return final_result, api_called
 
+    @timed_stage("pool_get_sensor_data")
     async def get_sensor_data(
         self,
         api_client: TibberPricesApiClient,
@@ -574,15 +588,13 @@ class TibberPricesIntervalPool:
         if not cached_intervals:
             return True
 
-        resolution_change_utc = datetime(2025, 10, 1, tzinfo=UTC)
+        resolution_change_epoch = int(datetime(2025, 10, 1, tzinfo=UTC).timestamp())
         # 1-minute tolerance for scheduling jitter / minor timestamp variations
         tolerance_s = 60
 
-        # Sort by actual UTC time so ordering is correct across DST boundaries
-        sorted_intervals = sorted(
-            cached_intervals,
-            key=lambda x: datetime.fromisoformat(x["startsAt"]),
-        )
+        # Sort by epoch seconds (actual UTC time) so ordering is correct across DST boundaries
+        sorted_intervals = sorted(cached_intervals, key=lambda x: starts_at_epoch(x["startsAt"]))
+        epochs = [starts_at_epoch(interval["startsAt"]) for interval in sorted_intervals]
 
         # --- Boundary check: gap before first interval ---
         # Compare naive local times so we don't confuse a legitimate +01:00/+02:00
@@ -597,12 +609,9 @@ class TibberPricesIntervalPool:
             return True
 
         # --- Interior check: gap between consecutive intervals (UTC-based) ---
-        for i in range(len(sorted_intervals) - 1):
-            current_dt = datetime.fromisoformat(sorted_intervals[i]["startsAt"])
-            next_dt = datetime.fromisoformat(sorted_intervals[i + 1]["startsAt"])
-            diff_s = (next_dt - current_dt).total_seconds()
-            expected_s = 900 if current_dt.astimezone(UTC) >= resolution_change_utc else 3600
-            if diff_s > expected_s + tolerance_s:
+        for current_epoch, next_epoch in pairwise(epochs):
+            expected_s = 900 if current_epoch >= resolution_change_epoch else 3600
+            if next_epoch - current_epoch > expected_s + tolerance_s:
                 return True  # Real gap between consecutive intervals
 
         # --- Boundary check: gap after last interval ---
@@ -611,8 +620,7 @@ class TibberPricesIntervalPool:
         end_naive_str = end_iso[:19]
         last_naive_dt = datetime.fromisoformat(last_naive_str)
         end_naive_dt = datetime.fromisoformat(end_naive_str)
-        last_dt_utc = datetime.fromisoformat(sorted_intervals[-1]["startsAt"])
-        expected_last_s = 900 if last_dt_utc.astimezone(UTC) >= resolution_change_utc else 3600
+        expected_last_s = 900 if epochs[-1] >= resolution_change_epoch else 3600
         last_end_naive_dt = last_naive_dt + timedelta(seconds=expected_last_s)
         return (end_naive_dt - last_end_naive_dt).total_seconds() >= expected_last_s
 
@@ -662,34 +670,27 @@ class TibberPricesIntervalPool:
         if not intervals:
             return False
 
-        now = self._time_service.now() if self._time_service else dt_util.now()
+        now = (self._time_service.now() if self._time_service else dt_util.now()).timestamp()
 
-        # Collect interval start datetimes (startsAt may be ISO string or datetime)
-        starts: list[datetime] = []
-        for interval in intervals:
-            starts_at = interval.get("startsAt")
-            if starts_at is None:
-                continue
-            start_dt = starts_at if isinstance(starts_at, datetime) else dt_util.parse_datetime(starts_at)
-            if start_dt is not None:
-                starts.append(start_dt)
+        # Interval starts in epoch seconds (startsAt may be ISO string or datetime)
+        starts = sorted(
+            starts_at_epoch(starts_at) for interval in intervals if (starts_at := interval.get("startsAt")) is not None
+        )
 
         if not starts:
             return False
 
-        starts.sort()
-
         # An interval covers "now" if start <= now < start + length. The length is
         # derived from the gap to the next interval, capped at one hour so a large
         # gap (missing data) cannot falsely report coverage. This handles both
         # quarter-hourly (15 min) and hourly (60 min) resolutions.
-        max_length = timedelta(minutes=INTERVAL_HOURLY)
-        for index, start_dt in enumerate(starts):
+        max_length = INTERVAL_HOURLY * 60
+        for index, start in enumerate(starts):
             if index + 1 < len(starts):
-                length = min(starts[index + 1] - start_dt, max_length)
+                length = min(starts[index + 1] - start, max_length)
             else:
                 length = max_length
-            if start_dt <= now < start_dt + length:
+            if start <= now < start + length:
                 return True
 
         return False
@@ -785,9 +786,7 @@ class TibberPricesIntervalPool:
             return False
         fetch_groups = self._cache.get_fetch_groups()
         existing_interval = fetch_groups[location["fetch_group_index"]]["intervals"][location["interval_index"]]
-        existing_dt = datetime.fromisoformat(existing_interval["startsAt"])
-        new_dt = datetime.fromisoformat(interval["startsAt"])
-        if abs((new_dt - existing_dt).total_seconds()) > _DST_COLLISION_MAX_SAME_UTC_S:
+        if _is_dst_collision(existing_interval, interval):
             # Different UTC time → DST fall-back collision: preserve both
             self._dst_extras.setdefault(starts_at_normalized, []).append(dict(interval))
             _LOGGER.debug(
@@ -825,14 +824,25 @@ class TibberPricesIntervalPool:
 
         fetch_time_dt = datetime.fromisoformat(fetch_time_iso)
 
+        # Parse each timestamp once on entry; gap and coverage checks reuse it
+        intern_starts_at(intervals)
+
         # Classify intervals: new vs already cached
         new_intervals = []
         intervals_to_touch = []
+        # New intervals by naive key, to catch both halves of a fall-back day in one response
+        batch_new: dict[str, dict[str, Any]] = {}
 
         for interval in intervals:
             starts_at_normalized = _normalize_starts_at(interval["startsAt"])
             if not self._index.contains(starts_at_normalized):
-                new_intervals.append(interval)
+                first = batch_new.get(starts_at_normalized)
+                if first is None:
+                    batch_new[starts_at_normalized] = interval
+                    new_intervals.append(interval)
+                elif _is_dst_collision(first, interval):
+                    # Repeated hour (CET) of a fall-back day: the index only holds one entry per key
+                    self._dst_extras.setdefault(starts_at_normalized, []).append(dict(interval))
             elif self._handle_index_collision(starts_at_normalized, interval):
                 # DST fall-back: extra stored inside _handle_index_collision, skip touch
                 pass
@@ -1115,6 +1125,7 @@ class TibberPricesIntervalPool:
         for serialized_group in data.get("fetch_groups", []):
             fetched_at_dt = datetime.fromisoformat(serialized_group["fetched_at"])
             intervals = serialized_group["intervals"]
+            intern_starts_at(intervals)
             fetch_group_index = manager._cache.add_fetch_group(intervals, fetched_at_dt)
 
             # Rebuild index for this fetch group
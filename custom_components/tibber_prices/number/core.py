@@ -146,6 +146,10 @@ class TibberPricesConfigNumber(RestoreNumber, NumberEntity):
                 self.entity_description.config_section,
             )
 
+        # Apply the change; debounced, so all entities restoring their values
+        # on startup cost a single recalculation
+        await self.coordinator.async_handle_config_override_update()
+
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value and trigger recalculation."""
         self._attr_native_value = value
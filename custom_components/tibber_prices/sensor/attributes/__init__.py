@@ -38,7 +38,7 @@ if TYPE_CHECKING:
 from .daily_stat import add_statistics_attributes
 from .future import add_next_avg_attributes, get_future_prices
 from .interval import add_current_interval_price_attributes
-from .lifecycle import build_lifecycle_attributes
+from .lifecycle import build_lifecycle_attributes, build_processing_time_attributes
 from .metadata import get_current_price_phase_attributes, get_day_pattern_attributes, get_next_price_phase_attributes
 from .timing import _is_timing_or_volatility_sensor
 from .trend import _add_cached_trend_attributes, _add_timing_or_volatility_attributes
@@ -183,6 +183,8 @@ def build_sensor_attributes(
             if lifecycle_calculator:
                 lifecycle_attrs = build_lifecycle_attributes(coordinator, lifecycle_calculator)
                 attributes.update(lifecycle_attrs)
+        elif key == "processing_time":
+            attributes.update(build_processing_time_attributes(coordinator))
         elif _is_timing_or_volatility_sensor(key):
             _add_timing_or_volatility_attributes(attributes, key, cached_data, native_value, time=time)
 
@@ -77,3 +77,23 @@ def build_lifecycle_attributes(
         attributes["last_error"] = str(coordinator.last_exception)
 
     return attributes
+
+
+def build_processing_time_attributes(coordinator: TibberPricesDataUpdateCoordinator) -> dict[str, Any]:
+    """
+    Build attributes for processing_time sensor.
+
+    The state is the p95 of the slowest stage; the attributes list the rolling
+    statistics of every stage (same data as in diagnostics).
+
+    Returns:
+        Dict with slowest_stage and stages
+
+    """
+    stats = coordinator.stage_timings.stats
+    if not stats:
+        return {}
+    return {
+        "slowest_stage": max(stats, key=lambda stage: stats[stage]["p95_ms"]),
+        "stages": stats,
+    }
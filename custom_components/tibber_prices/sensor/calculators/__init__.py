@@ -6,11 +6,13 @@ of sensor value calculations. Each calculator focuses on one calculation pattern
 (interval-based, rolling hour, daily statistics, etc.).
 
 All calculators inherit from BaseCalculator and have access to coordinator data.
+Sensors get theirs through TibberPricesCalculatorSet, which creates them on first use.
 """
 
 from __future__ import annotations
 
 from .base import TibberPricesBaseCalculator
+from .calculator_set import TibberPricesCalculatorSet, TibberPricesSharedCalculators, get_shared_calculators
 from .daily_stat import TibberPricesDailyStatCalculator
 from .interval import TibberPricesIntervalCalculator
 from .lifecycle import TibberPricesLifecycleCalculator
@@ -24,14 +26,17 @@ from .window_24h import TibberPricesWindow24hCalculator
 
 __all__ = [
     "TibberPricesBaseCalculator",
+    "TibberPricesCalculatorSet",
     "TibberPricesDailyStatCalculator",
     "TibberPricesIntervalCalculator",
     "TibberPricesLifecycleCalculator",
     "TibberPricesMetadataCalculator",
     "TibberPricesRollingHourCalculator",
+    "TibberPricesSharedCalculators",
     "TibberPricesTimeTravelCalculator",
     "TibberPricesTimingCalculator",
     "TibberPricesTrendCalculator",
     "TibberPricesVolatilityCalculator",
     "TibberPricesWindow24hCalculator",
+    "get_shared_calculators",
 ]
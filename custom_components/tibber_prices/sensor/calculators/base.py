@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
     from custom_components.tibber_prices.coordinator import TibberPricesDataUpdateCoordinator
+    from custom_components.tibber_prices.coordinator.tick_context import TibberPricesTickContext
     from custom_components.tibber_prices.data import TibberPricesConfigEntry
     from homeassistant.core import HomeAssistant
 
+_T = TypeVar("_T")
+
 
 class TibberPricesBaseCalculator:
     """
@@ -55,6 +60,31 @@ class TibberPricesBaseCalculator:
         """Get full coordinator data."""
         return self._coordinator.data
 
+    @property
+    def tick_context(self) -> TibberPricesTickContext:
+        """Get the context shared by all entities of the current update cycle."""
+        return self._coordinator.get_tick_context()
+
+    def get_tick_result(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """
+        Return a result shared by all sensors of the coordinator for the current data and tick.
+
+        Falls back to computing the result directly for calculators used
+        without a calculator set (see calculator_set.py).
+
+        Args:
+            key: Identifies the result, including all its parameters.
+            compute: Computes the result on the first request of this tick.
+
+        Returns:
+            The result of compute() for the current data and tick.
+
+        """
+        shared = self._coordinator.sensor_calculators
+        if shared is None:
+            return compute()
+        return shared.get_tick_result(key, compute)
+
     @property
     def price_info(self) -> list[dict[str, Any]]:
         """Get price info (intervals list) from coordinator data."""
@@ -118,13 +148,7 @@ class TibberPricesBaseCalculator:
         if not self.coordinator_data:
             return None
 
-        from custom_components.tibber_prices.utils.price import (  # noqa: PLC0415 - avoid circular import
-            find_price_data_for_interval,
-        )
-
-        time = self.coordinator.time
-        target_time = time.get_interval_offset_time(offset)
-        return find_price_data_for_interval(self.coordinator.data, target_time, time=time)
+        return self.tick_context.interval_at(offset)
 
     def safe_get_from_interval(
         self,
@@ -0,0 +1,196 @@
+"""
+Lazily created sensor calculators.
+
+A coordinator serves about 125 sensor descriptions, and every home and every
+time-travel view has its own coordinator. Creating all ten calculators for
+every sensor made setup scale with descriptions x calculators, although a
+sensor only ever uses one or two of them.
+
+Calculators are now created on first use:
+- Stateless calculators (metadata, windows, timing, lifecycle, time travel)
+  are shared by all sensors of a coordinator (TibberPricesSharedCalculators).
+- Calculators that keep their last result for the attribute builders
+  (interval, daily statistics, trend, volatility) stay per sensor. State
+  writes of a timer tick run after all sensors were evaluated, so a shared
+  instance would hand one sensor's attributes to another.
+
+The expensive intermediate results of the per-sensor calculators (trend
+scan, day price lists, reference prices, N-hour means) are shared instead:
+TibberPricesSharedCalculators.get_tick_result() computes each of them once
+per coordinator data and tick, keyed on the coordinator's tick context, so
+three trend sensors no longer run the same trend scan three times.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .daily_stat import TibberPricesDailyStatCalculator
+from .interval import TibberPricesIntervalCalculator
+from .lifecycle import TibberPricesLifecycleCalculator
+from .metadata import TibberPricesMetadataCalculator
+from .rolling_hour import TibberPricesRollingHourCalculator
+from .time_travel import TibberPricesTimeTravelCalculator
+from .timing import TibberPricesTimingCalculator
+from .trend import TibberPricesTrendCalculator
+from .volatility import TibberPricesVolatilityCalculator
+from .window_24h import TibberPricesWindow24hCalculator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from custom_components.tibber_prices.coordinator import TibberPricesDataUpdateCoordinator
+    from custom_components.tibber_prices.coordinator.tick_context import TibberPricesTickContext
+
+_T = TypeVar("_T")
+
+
+class TibberPricesSharedCalculators:
+    """Stateless calculators of one coordinator (created on first access) and its per-tick results."""
+
+    def __init__(self, coordinator: TibberPricesDataUpdateCoordinator) -> None:
+        """Initialize without creating any calculator."""
+        self._coordinator = coordinator
+        # Results of the current tick context (one coordinator data dict + one TimeService)
+        self._tick_context: TibberPricesTickContext | None = None
+        self._tick_results: dict[Hashable, Any] = {}
+
+    def get_tick_result(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """
+        Return a result shared by all sensors for the current data and tick.
+
+        The results are dropped as soon as the coordinator's tick context
+        changes (new data or new TimeService). Callers must not mutate them.
+
+        Args:
+            key: Identifies the result, including all its parameters.
+            compute: Computes the result on the first request of this tick.
+
+        Returns:
+            The result of compute() for the current data and tick.
+
+        """
+        context = self._coordinator.get_tick_context()
+        if context is not self._tick_context:
+            self._tick_context = context
+            self._tick_results = {}
+        if key not in self._tick_results:
+            self._tick_results[key] = compute()
+        return self._tick_results[key]
+
+    @cached_property
+    def metadata(self) -> TibberPricesMetadataCalculator:
+        """Home, metering point and price phase values."""
+        return TibberPricesMetadataCalculator(self._coordinator)
+
+    @cached_property
+    def window_24h(self) -> TibberPricesWindow24hCalculator:
+        """Trailing and leading 24h window values."""
+        return TibberPricesWindow24hCalculator(self._coordinator)
+
+    @cached_property
+    def rolling_hour(self) -> TibberPricesRollingHourCalculator:
+        """Rolling hour (5-interval window) values."""
+        return TibberPricesRollingHourCalculator(self._coordinator)
+
+    @cached_property
+    def timing(self) -> TibberPricesTimingCalculator:
+        """Best and peak price period timing values."""
+        return TibberPricesTimingCalculator(self._coordinator)
+
+    @cached_property
+    def lifecycle(self) -> TibberPricesLifecycleCalculator:
+        """Data lifecycle and processing time values."""
+        return TibberPricesLifecycleCalculator(self._coordinator)
+
+    @cached_property
+    def time_travel(self) -> TibberPricesTimeTravelCalculator:
+        """Time-travel mode and offset values."""
+        return TibberPricesTimeTravelCalculator(self._coordinator)
+
+
+def get_shared_calculators(coordinator: TibberPricesDataUpdateCoordinator) -> TibberPricesSharedCalculators:
+    """
+    Return the shared calculators of a coordinator, creating them on first use.
+
+    Args:
+        coordinator: The coordinator whose sensors share the calculators.
+
+    Returns:
+        The coordinator's shared calculators.
+
+    """
+    shared = coordinator.sensor_calculators
+    if shared is None:
+        shared = coordinator.sensor_calculators = TibberPricesSharedCalculators(coordinator)
+    return shared
+
+
+class TibberPricesCalculatorSet:
+    """Calculators of one sensor: shared stateless ones plus its own stateful ones, created on first access."""
+
+    def __init__(self, coordinator: TibberPricesDataUpdateCoordinator) -> None:
+        """
+        Initialize the set without creating any calculator.
+
+        Args:
+            coordinator: The coordinator all calculators of this set read from.
+
+        """
+        self._coordinator = coordinator
+        self._shared = get_shared_calculators(coordinator)
+
+    def get_tick_result(self, key: Hashable, compute: Callable[[], _T]) -> _T:
+        """Return a result shared by all sensors of the coordinator for the current data and tick."""
+        return self._shared.get_tick_result(key, compute)
+
+    @property
+    def metadata(self) -> TibberPricesMetadataCalculator:
+        """Home, metering point and price phase values (shared)."""
+        return self._shared.metadata
+
+    @property
+    def window_24h(self) -> TibberPricesWindow24hCalculator:
+        """Trailing and leading 24h window values (shared)."""
+        return self._shared.window_24h
+
+    @property
+    def rolling_hour(self) -> TibberPricesRollingHourCalculator:
+        """Rolling hour (5-interval window) values (shared)."""
+        return self._shared.rolling_hour
+
+    @property
+    def timing(self) -> TibberPricesTimingCalculator:
+        """Best and peak price period timing values (shared)."""
+        return self._shared.timing
+
+    @property
+    def lifecycle(self) -> TibberPricesLifecycleCalculator:
+        """Data lifecycle and processing time values (shared)."""
+        return self._shared.lifecycle
+
+    @property
+    def time_travel(self) -> TibberPricesTimeTravelCalculator:
+        """Time-travel mode and offset values (shared)."""
+        return self._shared.time_travel
+
+    @cached_property
+    def interval(self) -> TibberPricesIntervalCalculator:
+        """Current, next and previous interval values (keeps the last level and rating)."""
+        return TibberPricesIntervalCalculator(self._coordinator)
+
+    @cached_property
+    def daily_stat(self) -> TibberPricesDailyStatCalculator:
+        """Daily min/max/average values (keeps the last extreme interval and energy/tax averages)."""
+        return TibberPricesDailyStatCalculator(self._coordinator)
+
+    @cached_property
+    def trend(self) -> TibberPricesTrendCalculator:
+        """Price outlook, trajectory and trend change values (keeps the last trend attributes)."""
+        return TibberPricesTrendCalculator(self._coordinator)
+
+    @cached_property
+    def volatility(self) -> TibberPricesVolatilityCalculator:
+        """Volatility and price rank values (keeps the last volatility attributes)."""
+        return TibberPricesVolatilityCalculator(self._coordinator)
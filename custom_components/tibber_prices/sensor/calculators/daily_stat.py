@@ -71,29 +71,8 @@ class TibberPricesDailyStatCalculator(TibberPricesBaseCalculator):
         if not self.has_data():
             return None
 
-        # Get local midnight boundaries based on the requested day using TimeService
-        time = self.coordinator.time
-        local_midnight, local_midnight_next_day = time.get_day_boundaries(day)
-
-        # Collect all prices and their intervals from both today and tomorrow data
-        # that fall within the target day's local date boundaries
-        price_intervals = []
-        for day_offset in [0, 1]:  # today=0, tomorrow=1
-            for price_data in self.get_intervals(day_offset):
-                starts_at = price_data.get("startsAt")  # Already datetime in local timezone
-                if not starts_at:
-                    continue
-
-                # Include price if it starts within the target day's local date boundaries
-                if local_midnight <= starts_at < local_midnight_next_day:
-                    total_price = price_data.get("total")
-                    if total_price is not None:
-                        price_intervals.append(
-                            {
-                                "price": float(total_price),
-                                "interval": price_data,
-                            }
-                        )
+        # Shared by the lowest/highest/average sensors of the same day
+        price_intervals = self.get_tick_result(("day_price_intervals", day), lambda: self._collect_price_intervals(day))
 
         if not price_intervals:
             return None
@@ -134,6 +113,42 @@ class TibberPricesDailyStatCalculator(TibberPricesBaseCalculator):
         result = get_price_value(value, config_entry=self.coordinator.config_entry)
         return round(result, precision)
 
+    def _collect_price_intervals(self, day: str) -> list[dict]:
+        """
+        Collect the prices of a calendar day with their intervals.
+
+        Args:
+            day: "today" or "tomorrow" - which calendar day to collect.
+
+        Returns:
+            List of {"price": float, "interval": dict} in chronological order.
+
+        """
+        # Get local midnight boundaries based on the requested day using TimeService
+        time = self.coordinator.time
+        local_midnight, local_midnight_next_day = time.get_day_boundaries(day)
+
+        # Collect all prices and their intervals from both today and tomorrow data
+        # that fall within the target day's local date boundaries
+        price_intervals = []
+        for day_offset in [0, 1]:  # today=0, tomorrow=1
+            for price_data in self.get_intervals(day_offset):
+                starts_at = price_data.get("startsAt")  # Already datetime in local timezone
+                if not starts_at:
+                    continue
+
+                # Include price if it starts within the target day's local date boundaries
+                if local_midnight <= starts_at < local_midnight_next_day:
+                    total_price = price_data.get("total")
+                    if total_price is not None:
+                        price_intervals.append(
+                            {
+                                "price": float(total_price),
+                                "interval": price_data,
+                            }
+                        )
+        return price_intervals
+
     def get_daily_aggregated_value(
         self,
         *,
@@ -157,22 +172,8 @@ class TibberPricesDailyStatCalculator(TibberPricesBaseCalculator):
         if not self.has_data():
             return None
 
-        # Get local midnight boundaries based on the requested day using TimeService
-        time = self.coordinator.time
-        local_midnight, local_midnight_next_day = time.get_day_boundaries(day)
-
-        # Collect all intervals from both today and tomorrow data
-        # that fall within the target day's local date boundaries
-        day_intervals = []
-        for day_offset in [-1, 0, 1]:  # yesterday=-1, today=0, tomorrow=1
-            for price_data in self.get_intervals(day_offset):
-                starts_at = price_data.get("startsAt")  # Already datetime in local timezone
-                if not starts_at:
-                    continue
-
-                # Include interval if it starts within the target day's local date boundaries
-                if local_midnight <= starts_at < local_midnight_next_day:
-                    day_intervals.append(price_data)
+        # Shared by the level and rating sensors of the same day
+        day_intervals = self.get_tick_result(("day_intervals", day), lambda: self._collect_day_intervals(day))
 
         if not day_intervals:
             return None
@@ -194,6 +195,35 @@ class TibberPricesDailyStatCalculator(TibberPricesBaseCalculator):
 
         return None
 
+    def _collect_day_intervals(self, day: str) -> list[dict]:
+        """
+        Collect the intervals of a calendar day.
+
+        Args:
+            day: "yesterday", "today", or "tomorrow" - which calendar day to collect.
+
+        Returns:
+            Intervals starting within the day's local date boundaries.
+
+        """
+        # Get local midnight boundaries based on the requested day using TimeService
+        time = self.coordinator.time
+        local_midnight, local_midnight_next_day = time.get_day_boundaries(day)
+
+        # Collect all intervals from yesterday, today and tomorrow data
+        # that fall within the target day's local date boundaries
+        day_intervals = []
+        for day_offset in [-1, 0, 1]:  # yesterday=-1, today=0, tomorrow=1
+            for price_data in self.get_intervals(day_offset):
+                starts_at = price_data.get("startsAt")  # Already datetime in local timezone
+                if not starts_at:
+                    continue
+
+                # Include interval if it starts within the target day's local date boundaries
+                if local_midnight <= starts_at < local_midnight_next_day:
+                    day_intervals.append(price_data)
+        return day_intervals
+
     def get_last_extreme_interval(self) -> dict | None:
         """
         Get the last stored extreme interval (from min/max calculation).
@@ -182,3 +182,16 @@ class TibberPricesLifecycleCalculator(TibberPricesBaseCalculator):
 
         """
         return not self.coordinator._needs_tomorrow_data()  # noqa: SLF001
+
+    def get_processing_time(self) -> float | None:
+        """
+        Get the p95 duration of the slowest update pipeline stage.
+
+        Returns:
+            Duration in milliseconds, or None before the first stage ran.
+
+        """
+        stats = self.coordinator.stage_timings.stats
+        if not stats:
+            return None
+        return max(stage["p95_ms"] for stage in stats.values())
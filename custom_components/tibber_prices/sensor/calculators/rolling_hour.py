@@ -8,8 +8,6 @@ from custom_components.tibber_prices.const import (
     DEFAULT_PRICE_RATING_THRESHOLD_HIGH,
     DEFAULT_PRICE_RATING_THRESHOLD_LOW,
 )
-from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
-from custom_components.tibber_prices.entity_utils import find_rolling_hour_center_index
 from custom_components.tibber_prices.sensor.helpers import (
     aggregate_average_data,
     aggregate_level_data,
@@ -52,26 +50,8 @@ class TibberPricesRollingHourCalculator(TibberPricesBaseCalculator):
         if not self.has_data():
             return None
 
-        # Get all available price data (yesterday, today, tomorrow)
-        all_prices = get_intervals_for_day_offsets(self.coordinator_data, [-1, 0, 1])
-
-        if not all_prices:
-            return None
-
-        # Find center index for the rolling window
-        time = self.coordinator.time
-        now = time.now()
-        center_idx = find_rolling_hour_center_index(all_prices, now, hour_offset, time=time)
-        if center_idx is None:
-            return None
-
-        # Collect data from 5-interval window (-2, -1, 0, +1, +2)
-        window_data = []
-        for offset in range(-2, 3):
-            idx = center_idx + offset
-            if 0 <= idx < len(all_prices):
-                window_data.append(all_prices[idx])
-
+        # Window (-2, -1, 0, +1, +2 around the center) is shared by all rolling hour sensors
+        window_data = self.tick_context.rolling_hour_window(hour_offset)
         if not window_data:
             return None
 
@@ -10,16 +10,16 @@ This module handles all trend-related calculations:
 
 Caching strategy:
 - Outlook/Trajectory: Cached per sensor update to ensure consistency between state and attributes
-- Current trend + next change: Cached centrally for 60s to avoid duplicate calculations
+- Current trend + next change, N-hour means and half-window averages: Computed once per
+  coordinator data and tick and shared by all sensors (get_tick_result, see calculator_set.py)
 """
 
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from custom_components.tibber_prices.const import get_display_precision, get_display_unit_factor
-from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
 from custom_components.tibber_prices.entity_utils.colors import get_icon_color
 from custom_components.tibber_prices.utils.average import calculate_mean, calculate_next_n_hours_mean
-from custom_components.tibber_prices.utils.price import calculate_price_trend, find_price_data_for_interval
+from custom_components.tibber_prices.utils.price import calculate_price_trend
 
 from .base import TibberPricesBaseCalculator
 
@@ -44,7 +44,7 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
 
     Caching:
     - Simple trends: Per-sensor cache (_cached_trend_value, _trend_attributes)
-    - Current/Next: Centralized cache (_trend_calculation_cache) with 60s TTL
+    - Current/Next: One trend scan per coordinator data and tick, shared by all sensors
     """
 
     # Direction groups for trend change detection.
@@ -65,9 +65,6 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
         self._cached_trend_value: str | None = None
         self._trend_attributes: dict[str, Any] = {}
         self._trajectory_attributes: dict[str, Any] = {}
-        # Centralized trend calculation cache (for current_price_trend + next_price_trend_change)
-        self._trend_calculation_cache: dict[str, Any] | None = None
-        self._trend_calculation_timestamp: datetime | None = None
         # Separate attribute storage for current_price_trend and next_price_trend_change
         self._current_trend_attributes: dict[str, Any] | None = None
         self._trend_change_attributes: dict[str, Any] | None = None
@@ -110,7 +107,10 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
         next_interval_start = time.get_next_interval_start()
 
         # Get future mean price (ignore median for trend calculation)
-        future_mean, _ = calculate_next_n_hours_mean(self.coordinator.data, hours, time=self.coordinator.time)
+        future_mean, _ = self.get_tick_result(
+            ("next_n_hours_mean", hours),
+            lambda: calculate_next_n_hours_mean(self.coordinator.data, hours, time=self.coordinator.time),
+        )
         if future_mean is None:
             return None
 
@@ -191,7 +191,11 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
         # Calculate additional attributes for better granularity
         if hours > MIN_HOURS_FOR_LATER_HALF:
             # Get second half average for longer periods
-            later_half_avg = self._calculate_later_half_average(hours, next_interval_start)
+            # Shared with price_trajectory_Xh of the same window
+            later_half_avg = self.get_tick_result(
+                ("later_half_average", hours, next_interval_start),
+                lambda: self._calculate_later_half_average(hours, next_interval_start),
+            )
             if later_half_avg is not None:
                 self._trend_attributes[f"second_half_{hours}h_avg"] = round(later_half_avg * factor, precision)
 
@@ -320,7 +324,10 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
 
         # Get first-half and second-half averages
         first_half_avg = self._calculate_first_half_average(hours, next_interval_start)
-        second_half_avg = self._calculate_later_half_average(hours, next_interval_start)
+        second_half_avg = self.get_tick_result(
+            ("later_half_average", hours, next_interval_start),
+            lambda: self._calculate_later_half_average(hours, next_interval_start),
+        )
 
         if first_half_avg is None or second_half_avg is None:
             return None
@@ -422,11 +429,6 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
         self._trend_attributes = {}
         self._trajectory_attributes = {}
 
-    def clear_calculation_cache(self) -> None:
-        """Clear centralized trend calculation cache (called on coordinator update)."""
-        self._trend_calculation_cache = None
-        self._trend_calculation_timestamp = None
-
     # ========================================================================
     # PRIVATE HELPER METHODS
     # ========================================================================
@@ -534,30 +536,26 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
         Centralized trend calculation for current_price_trend and next_price_trend_change sensors.
 
         This method calculates all trend-related information in one place to avoid duplication
-        and ensure consistency between the two sensors. Results are cached per coordinator update.
+        and ensure consistency between the sensors. The result is computed once per coordinator
+        data and tick and shared by all trend sensors of the coordinator.
 
         Returns:
             Dictionary with trend information for both sensors.
 
         """
-        trend_cache_duration_seconds = 60  # Cache for 1 minute
+        return self.get_tick_result("trend_info", self._compute_trend_info)
 
-        # Check if we have a valid cache
+    def _compute_trend_info(self) -> dict[str, Any] | None:
+        """Run the trend scan behind _calculate_trend_info()."""
         time = self.coordinator.time
         now = time.now()
-        if (
-            self._trend_calculation_cache is not None
-            and self._trend_calculation_timestamp is not None
-            and (now - self._trend_calculation_timestamp).total_seconds() < trend_cache_duration_seconds
-        ):
-            return self._trend_calculation_cache
 
         # Validate coordinator data
         if not self.has_data():
             return None
 
-        all_intervals = get_intervals_for_day_offsets(self.coordinator_data, [-1, 0, 1])
-        current_interval = find_price_data_for_interval(self.coordinator.data, now, time=time)
+        all_intervals = self.tick_context.all_intervals
+        current_interval = self.tick_context.current_interval
 
         if not all_intervals or not current_interval:
             return None
@@ -609,7 +607,7 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
             time = self.coordinator.time
             minutes_until_change = time.minutes_until_rounded(next_change_time)
 
-        result = {
+        return {
             "current_trend_state": current_trend_state,
             "next_change_time": next_change_time,
             "trend_change_attributes": self._trend_change_attributes,
@@ -619,12 +617,6 @@ class TibberPricesTrendCalculator(TibberPricesBaseCalculator):
             "minutes_until_change": minutes_until_change,
         }
 
-        # Cache the result
-        self._trend_calculation_cache = result
-        self._trend_calculation_timestamp = now
-
-        return result
-
     def _get_thresholds_config(self) -> dict[str, float]:
         """Get configured thresholds for trend calculation."""
         return {
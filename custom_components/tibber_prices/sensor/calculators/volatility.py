@@ -15,8 +15,7 @@ from custom_components.tibber_prices.const import (
     get_display_precision,
     get_display_unit_factor,
 )
-from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
-from custom_components.tibber_prices.entity_utils import add_icon_color_attribute, find_rolling_hour_center_index
+from custom_components.tibber_prices.entity_utils import add_icon_color_attribute
 from custom_components.tibber_prices.sensor.attributes import add_volatility_type_attributes, get_prices_for_volatility
 from custom_components.tibber_prices.utils.average import calculate_mean
 from custom_components.tibber_prices.utils.price import (
@@ -82,12 +81,8 @@ class TibberPricesVolatilityCalculator(TibberPricesBaseCalculator):
             ),
         }
 
-        # Get prices based on volatility type
-        prices_to_analyze = get_prices_for_volatility(
-            volatility_type,
-            self.coordinator.data,
-            time=self.coordinator.time,
-        )
+        # Get prices based on volatility type (shared with the price rank sensors)
+        prices_to_analyze = self._get_reference_prices(volatility_type)
 
         if not prices_to_analyze:
             return None
@@ -192,11 +187,7 @@ class TibberPricesVolatilityCalculator(TibberPricesBaseCalculator):
             return None
 
         # Get reference prices for this type (reuse volatility helper)
-        reference_prices = get_prices_for_volatility(
-            percentile_type,
-            self.coordinator.data,
-            time=self.coordinator.time,
-        )
+        reference_prices = self._get_reference_prices(percentile_type)
         if not reference_prices:
             return None
 
@@ -212,7 +203,10 @@ class TibberPricesVolatilityCalculator(TibberPricesBaseCalculator):
 
         self._last_percentile_rank_attributes = {
             price_attr_key: round(subject_price * factor, precision),
-            "prices_below_count": bisect.bisect_left(sorted(reference_prices), subject_price),
+            "prices_below_count": bisect.bisect_left(
+                self.get_tick_result(("sorted_reference_prices", percentile_type), lambda: sorted(reference_prices)),
+                subject_price,
+            ),
             "interval_count": len(reference_prices),
             "reference_min": round(min(reference_prices) * factor, precision),
             "reference_max": round(max(reference_prices) * factor, precision),
@@ -221,6 +215,22 @@ class TibberPricesVolatilityCalculator(TibberPricesBaseCalculator):
 
         return rank
 
+    def _get_reference_prices(self, reference_type: str) -> list[float]:
+        """
+        Get the prices of a reference window, computed once per tick for all sensors.
+
+        Args:
+            reference_type: One of "today", "tomorrow", "next_24h", "today_tomorrow".
+
+        Returns:
+            Prices of the window (must not be mutated).
+
+        """
+        return self.get_tick_result(
+            ("reference_prices", reference_type),
+            lambda: get_prices_for_volatility(reference_type, self.coordinator.data, time=self.coordinator.time),
+        )
+
     def _get_subject_price(self, subject: str) -> float | None:
         """
         Get the price of the subject to rank.
@@ -273,23 +283,11 @@ class TibberPricesVolatilityCalculator(TibberPricesBaseCalculator):
             Average price as float or None if unavailable.
 
         """
-        all_prices = get_intervals_for_day_offsets(self.coordinator_data, [-1, 0, 1])
-        if not all_prices:
-            return None
-
-        time = self.coordinator.time
-        now = time.now()
-        center_idx = find_rolling_hour_center_index(all_prices, now, hour_offset, time=time)
-        if center_idx is None:
-            return None
-
         window: list[float] = []
-        for offset in range(-2, 3):
-            idx = center_idx + offset
-            if 0 <= idx < len(all_prices):
-                raw = all_prices[idx].get("total")
-                if raw is not None:
-                    window.append(float(raw))
+        for interval in self.tick_context.rolling_hour_window(hour_offset) or []:
+            raw = interval.get("total")
+            if raw is not None:
+                window.append(float(raw))
 
         return calculate_mean(window) if window else None
 
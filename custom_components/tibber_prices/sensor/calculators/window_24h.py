@@ -6,12 +6,30 @@ from typing import TYPE_CHECKING
 
 from custom_components.tibber_prices.const import get_display_precision
 from custom_components.tibber_prices.entity_utils import get_price_value
+from custom_components.tibber_prices.utils.average import (
+    calculate_current_leading_max,
+    calculate_current_leading_mean,
+    calculate_current_leading_min,
+    calculate_current_trailing_max,
+    calculate_current_trailing_mean,
+    calculate_current_trailing_min,
+)
 
 from .base import TibberPricesBaseCalculator
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+# Stat functions answered from the shared tick context: stat_func → (leading?, statistic)
+_TICK_CONTEXT_STATS: dict[Callable, tuple[bool, str]] = {
+    calculate_current_trailing_mean: (False, "mean"),
+    calculate_current_trailing_min: (False, "min"),
+    calculate_current_trailing_max: (False, "max"),
+    calculate_current_leading_mean: (True, "mean"),
+    calculate_current_leading_min: (True, "min"),
+    calculate_current_leading_max: (True, "max"),
+}
+
 
 class TibberPricesWindow24hCalculator(TibberPricesBaseCalculator):
     """
@@ -45,7 +63,7 @@ class TibberPricesWindow24hCalculator(TibberPricesBaseCalculator):
         if not self.has_data():
             return None
 
-        result = stat_func(self.coordinator_data, time=self.coordinator.time)
+        result = self._get_window_stat(stat_func)
 
         # Check if result is a tuple (mean, median) from mean functions
         if isinstance(result, tuple):
@@ -71,3 +89,28 @@ class TibberPricesWindow24hCalculator(TibberPricesBaseCalculator):
         precision = get_display_precision(self.coordinator.config_entry)
         result = get_price_value(value, config_entry=self.coordinator.config_entry)
         return round(result, precision)
+
+    def _get_window_stat(self, stat_func: Callable) -> float | tuple[float | None, float | None] | None:
+        """
+        Return the result of stat_func for the current time.
+
+        The six trailing/leading statistics are read from the tick context, which
+        scans each 24h window once per update cycle for all window sensors.
+
+        Args:
+            stat_func: Function from average_utils (e.g., calculate_current_trailing_mean).
+
+        Returns:
+            Same value stat_func would return.
+
+        """
+        tick_stat = _TICK_CONTEXT_STATS.get(stat_func)
+        if tick_stat is None:
+            return stat_func(self.coordinator_data, time=self.coordinator.time)
+
+        leading, statistic = tick_stat
+        context = self.tick_context
+        stats = context.leading_24h_stats if leading else context.trailing_24h_stats
+        if statistic == "mean":
+            return (stats.mean, stats.median) if stats else (None, None)
+        return getattr(stats, statistic) if stats else None
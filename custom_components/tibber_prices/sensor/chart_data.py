@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from custom_components.tibber_prices.const import DATA_CHART_CONFIG, DOMAIN
+from custom_components.tibber_prices.const import DATA_ATTRIBUTE_BYTE_BUDGET, DATA_CHART_CONFIG, DOMAIN
+from homeassistant.helpers.json import json_bytes
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -57,6 +58,29 @@ async def call_chartdata_service_async(
         return response, None
 
 
+def get_chart_data_key(hass: HomeAssistant) -> str:
+    """Return the attribute name a single-key get_chartdata response is written to."""
+    chart_config = hass.data.get(DOMAIN, {}).get(DATA_CHART_CONFIG, {})
+    return chart_config.get("data_key", "data")
+
+
+def get_payload_size(payload: object) -> int:
+    """Return the size of a payload serialized as JSON, as the state machine writes it."""
+    return len(json_bytes(payload))
+
+
+def get_budgeted_response_size(hass: HomeAssistant, response: dict | None) -> int | None:
+    """
+    Return the serialized size of a chart data response if compact mode needs it.
+
+    Serializing the whole response costs about as much as writing the state,
+    so it is skipped unless attribute_byte_budget is configured.
+    """
+    if not response or hass.data.get(DOMAIN, {}).get(DATA_ATTRIBUTE_BYTE_BUDGET) is None:
+        return None
+    return get_payload_size(response)
+
+
 def get_chart_data_state(
     chart_data_response: dict | None,
     chart_data_error: str | None,
@@ -85,16 +109,25 @@ def build_chart_data_attributes(
     chart_data_response: dict | None,
     chart_data_last_update: datetime | None,
     chart_data_error: str | None,
+    *,
+    byte_budget: int | None = None,
+    response_bytes: int | None = None,
 ) -> dict[str, object] | None:
     """
     Return chart data from last service call as attributes with metadata.
 
     Attribute order: timestamp, error (if any), service data (at the end).
 
+    In compact mode (byte_budget set), a response larger than the budget is
+    left out. The attributes then only say so (data_omitted, data_bytes), and
+    charts fetch the data with the get_chartdata action instead.
+
     Args:
         chart_data_response: Last service response
         chart_data_last_update: Timestamp of last update
         chart_data_error: Error message if service call failed
+        byte_budget: Maximum serialized size of the response in the attributes (None = no limit)
+        response_bytes: Serialized size of the response (see get_budgeted_response_size)
 
     Returns:
         Dict with timestamp, optional error, and service response data.
@@ -113,6 +146,11 @@ def build_chart_data_attributes(
         # No data - only metadata (timestamp, error)
         return attributes
 
+    if byte_budget is not None and response_bytes is not None and response_bytes > byte_budget:
+        attributes["data_omitted"] = True
+        attributes["data_bytes"] = response_bytes
+        return attributes
+
     # Service data goes LAST - after metadata
     if isinstance(chart_data_response, dict):
         if len(chart_data_response) > 1:
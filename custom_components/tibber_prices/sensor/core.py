@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
-from custom_components.tibber_prices.binary_sensor.attributes import get_price_intervals_attributes
 from custom_components.tibber_prices.const import (
     CONF_AVERAGE_SENSOR_DISPLAY,
     CONF_PRICE_RATING_THRESHOLD_HIGH,
     CONF_PRICE_RATING_THRESHOLD_LOW,
+    DATA_ATTRIBUTE_BYTE_BUDGET,
     DEFAULT_AVERAGE_SENSOR_DISPLAY,
     DEFAULT_PRICE_RATING_THRESHOLD_HIGH,
     DEFAULT_PRICE_RATING_THRESHOLD_LOW,
@@ -18,16 +19,14 @@ from custom_components.tibber_prices.const import (
     get_display_precision,
     get_display_unit_factor,
     get_display_unit_string,
+    get_translation,
 )
 from custom_components.tibber_prices.coordinator import MINUTE_UPDATE_ENTITY_KEYS, TIME_SENSITIVE_ENTITY_KEYS
 from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
+from custom_components.tibber_prices.coordinator.wakeup import next_timing_value_change
 from custom_components.tibber_prices.device import entity_unique_id
 from custom_components.tibber_prices.entity import TibberPricesEntity
-from custom_components.tibber_prices.entity_utils import (
-    add_icon_color_attribute,
-    find_rolling_hour_center_index,
-    get_price_value,
-)
+from custom_components.tibber_prices.entity_utils import add_icon_color_attribute, get_price_value
 from custom_components.tibber_prices.entity_utils.icons import TibberPricesIconContext, get_dynamic_icon
 from custom_components.tibber_prices.utils.average import calculate_next_n_hours_mean
 from custom_components.tibber_prices.utils.price import calculate_volatility_level
@@ -41,19 +40,14 @@ from .attributes import (
     build_sensor_attributes,
     get_prices_for_volatility,
 )
-from .calculators import (
-    TibberPricesDailyStatCalculator,
-    TibberPricesIntervalCalculator,
-    TibberPricesLifecycleCalculator,
-    TibberPricesMetadataCalculator,
-    TibberPricesRollingHourCalculator,
-    TibberPricesTimeTravelCalculator,
-    TibberPricesTimingCalculator,
-    TibberPricesTrendCalculator,
-    TibberPricesVolatilityCalculator,
-    TibberPricesWindow24hCalculator,
+from .calculators import TibberPricesCalculatorSet
+from .chart_data import (
+    build_chart_data_attributes,
+    call_chartdata_service_async,
+    get_budgeted_response_size,
+    get_chart_data_key,
+    get_chart_data_state,
 )
-from .chart_data import build_chart_data_attributes, call_chartdata_service_async, get_chart_data_state
 from .chart_metadata import (
     build_chart_metadata_attributes,
     call_chartdata_service_for_metadata_async,
@@ -111,6 +105,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             "trend_change_attributes",
             "volatility_attributes",
             "data",  # chart_data_export large nested data
+            "stages",  # processing_time per-stage statistics
+            # (chart_data_export with a custom data_key: see _configure_chart_data_exclusions)
             # Frequently Changing Diagnostics
             "icon_color",
             "cache_age",
@@ -123,6 +119,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             "threshold_falling_strongly_%",
             "volatility_factor",
             "interval_count",
+            "data_bytes",
+            "data_omitted",
             "price_direction_since",
             "price_now",
             "trend_diff_%",
@@ -149,6 +147,10 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             "resolution",
             "yaxis_min",
             "yaxis_max",
+            "yaxis_min_energy",
+            "yaxis_max_energy",
+            "yaxis_min_tax",
+            "yaxis_max_tax",
             # Temporary/Time-Bound
             "next_api_poll",
             "next_midnight_turnover",
@@ -184,18 +186,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         self._attr_has_entity_name = True
         # Cached data for attributes (e.g., median values)
         self.cached_data: dict[str, Any] = {}
-        # Instantiate calculators
-        self._metadata_calculator = TibberPricesMetadataCalculator(coordinator)
-        self._volatility_calculator = TibberPricesVolatilityCalculator(coordinator)
-        self._window_24h_calculator = TibberPricesWindow24hCalculator(coordinator)
-        self._rolling_hour_calculator = TibberPricesRollingHourCalculator(coordinator)
-        self._daily_stat_calculator = TibberPricesDailyStatCalculator(coordinator)
-        self._interval_calculator = TibberPricesIntervalCalculator(coordinator)
-        self._timing_calculator = TibberPricesTimingCalculator(coordinator)
-        self._trend_calculator = TibberPricesTrendCalculator(coordinator)
-        self._lifecycle_calculator = TibberPricesLifecycleCalculator(coordinator)
-        self._time_travel_calculator = TibberPricesTimeTravelCalculator(coordinator)
-        self._value_getter: Callable | None = self._get_value_getter()
+        # Calculators are created on first use (stateless ones are shared per coordinator)
+        self._calculators = TibberPricesCalculatorSet(coordinator)
         self._time_sensitive_remove_listener: Callable | None = None
         self._minute_update_remove_listener: Callable | None = None
         # State change detection for call-avoidance optimization.
@@ -204,10 +196,13 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         # but it only runs AFTER all properties and attributes are evaluated.
         # Store as Any because native_value can be str/float/datetime depending on sensor type.
         self._last_written_value: Any = _SENTINEL
+        # Value evaluated by _write_if_changed(), returned by native_value while it is written
+        self._evaluated_value: Any = _SENTINEL
         # Chart data export (for chart_data_export sensor) - from binary_sensor
         self._chart_data_last_update = None  # Track last service call timestamp
         self._chart_data_error = None  # Track last service call error
         self._chart_data_response = None  # Store service response for attributes
+        self._chart_data_response_bytes: int | None = None  # Serialized size of the response (compact mode)
         # Chart metadata (for chart_metadata sensor)
         self._chart_metadata_last_update = None  # Track last service call timestamp
         self._chart_metadata_error = None  # Track last service call error
@@ -219,6 +214,7 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
 
         # Configure dynamic attribute exclusion for average sensors
         self._configure_average_sensor_exclusions()
+        self._configure_chart_data_exclusions()
 
         # Restore last state if available
         await self._restore_last_state()
@@ -257,6 +253,20 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             else:
                 self._state_info["unrecorded_attributes"] = current_unrecorded | {"price_mean"}
 
+    def _configure_chart_data_exclusions(self) -> None:
+        """Exclude the chart_data_export payload from the recorder under a custom data_key as well."""
+        if self.entity_description.key != "chart_data_export":
+            return
+        # A single-key response is merged into the attributes under its data_key;
+        # "data" is excluded statically, custom names are only known at runtime
+        data_key = get_chart_data_key(self.hass)
+        if data_key == "data":
+            return
+        if self._state_info is None:
+            self._state_info = {"unrecorded_attributes": frozenset()}
+        current_unrecorded = self._state_info.get("unrecorded_attributes", frozenset())
+        self._state_info["unrecorded_attributes"] = current_unrecorded | {data_key}
+
     async def _restore_last_state(self) -> None:
         """Restore last state if available."""
         if (
@@ -270,6 +280,7 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             # For chart sensors, restore response data from attributes
             if self.entity_description.key == "chart_data_export":
                 self._chart_data_response = last_state.attributes.get("data")
+                self._chart_data_response_bytes = get_budgeted_response_size(self.hass, self._chart_data_response)
                 self._chart_data_last_update = last_state.attributes.get("last_update")
             elif self.entity_description.key == "chart_metadata":
                 # Restore metadata response from attributes
@@ -292,7 +303,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         # Register with coordinator for minute-by-minute updates if applicable
         if self.entity_description.key in MINUTE_UPDATE_ENTITY_KEYS:
             self._minute_update_remove_listener = self.coordinator.async_add_minute_update_listener(
-                self._handle_minute_update
+                self._handle_minute_update,
+                self._next_minute_update,
             )
 
     def _trigger_chart_data_loads(self) -> None:
@@ -334,15 +346,9 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         self.coordinator.time = time_service
 
         # Clear cached trend values on time-sensitive updates
+        # (the shared trend scan of the other trend sensors is keyed on the tick already)
         if self.entity_description.key.startswith(("price_outlook_", "price_trajectory_")):
-            self._trend_calculator.clear_trend_cache()
-        # Clear trend calculation cache for trend sensors
-        elif self.entity_description.key in (
-            "current_price_trend",
-            "next_price_trend_change",
-            "next_price_trend_change_in",
-        ):
-            self._trend_calculator.clear_calculation_cache()
+            self._calculators.trend.clear_trend_cache()
 
         # Call-avoidance: Skip expensive async_write_ha_state() when value unchanged.
         # This runs 4x/hour for ~45 entities. Many (enum levels, ratings, trends) stay
@@ -362,11 +368,25 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         self.coordinator.time = time_service
 
         # Call-avoidance: Skip expensive async_write_ha_state() when value unchanged.
-        # This runs 120x/hour for 7 countdown/progress entities. Many calls are redundant:
-        # - Progress (precision=0) changes only every ~72s for a 2h period
-        # - When no period is active, remaining_minutes/progress stay at 0 indefinitely
+        # Timer #3 only wakes this entity when its value can change (_next_minute_update),
+        # but a countdown can still land on the same value (e.g. 0 at a period boundary).
         self._write_if_changed()
 
+    def _next_minute_update(self, time_service: TibberPricesTimeService) -> datetime:
+        """
+        Return the next instant this timing sensor's value can change (Timer #3 deadline).
+
+        Args:
+            time_service: TibberPricesTimeService instance with reference time for this update cycle
+
+        """
+        value = self._last_written_value if self._last_written_value is not _SENTINEL else self.native_value
+        return next_timing_value_change(
+            value,
+            time_service.now(),
+            continuous=self.entity_description.key.endswith("_progress"),
+        )
+
     @callback
     def _write_if_changed(self) -> None:
         """
@@ -378,20 +398,33 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         (native_value, extra_state_attributes, icon, available, etc.) and
         builds the full attribute dict every time — even when HA's own
         state machine would ultimately discard the identical update.
+
+        The write itself is submitted to the coordinator: during a timer tick
+        it runs after all entities have been evaluated, and it reuses the
+        evaluated value instead of calculating native_value a second time.
         """
-        current_value = self.native_value
-        if current_value != self._last_written_value:
-            self._last_written_value = current_value
+        current_value = self._compute_native_value()
+        if current_value == self._last_written_value:
+            self.coordinator.async_submit_state_write(None)
+            return
+        self._last_written_value = current_value
+        self.coordinator.async_submit_state_write(lambda: self._write_evaluated_state(current_value))
+
+    @callback
+    def _write_evaluated_state(self, value: Any) -> None:
+        """Write the state with native_value fixed to the already evaluated value."""
+        self._evaluated_value = value
+        try:
             self.async_write_ha_state()
+        finally:
+            self._evaluated_value = _SENTINEL
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # Clear cached trend values when coordinator data changes
         if self.entity_description.key.startswith(("price_outlook_", "price_trajectory_")):
-            self._trend_calculator.clear_trend_cache()
-            # Also clear calculation cache (e.g., when threshold config changes)
-            self._trend_calculator.clear_calculation_cache()
+            self._calculators.trend.clear_trend_cache()
 
         # Refresh chart data when coordinator updates (new price data or user data)
         if self.entity_description.key == "chart_data_export":
@@ -417,20 +450,12 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
 
         super()._handle_coordinator_update()
 
-    def _get_value_getter(self) -> Callable | None:
-        """Return the appropriate value getter method based on the sensor type."""
+    @cached_property
+    def _value_getter(self) -> Callable | None:
+        """Return the value getter of this sensor type (resolved on first evaluation)."""
         # Use centralized mapping from value_getters module
         handlers = get_value_getter_mapping(
-            interval_calculator=self._interval_calculator,
-            rolling_hour_calculator=self._rolling_hour_calculator,
-            daily_stat_calculator=self._daily_stat_calculator,
-            window_24h_calculator=self._window_24h_calculator,
-            trend_calculator=self._trend_calculator,
-            timing_calculator=self._timing_calculator,
-            volatility_calculator=self._volatility_calculator,
-            metadata_calculator=self._metadata_calculator,
-            lifecycle_calculator=self._lifecycle_calculator,
-            time_travel_calculator=self._time_travel_calculator,
+            calculators=self._calculators,
             get_next_avg_n_hours_value=self._get_next_avg_n_hours_value,
             get_data_timestamp=self._get_data_timestamp,
             get_chart_data_export_value=self._get_chart_data_export_value,
@@ -475,30 +500,12 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         if not self.coordinator.data:
             return None
 
-        # Get all available price data (yesterday, today, tomorrow) via helper
-        all_prices = get_intervals_for_day_offsets(self.coordinator.data, [-1, 0, 1])
-
-        if not all_prices:
-            return None
-
-        # Find center index for the rolling window
-        time = self.coordinator.time
-        now = time.now()
-        center_idx = find_rolling_hour_center_index(all_prices, now, hour_offset, time=time)
-        if center_idx is None:
-            return None
-
-        # Collect data from 5-interval window (-2, -1, 0, +1, +2)
-        window_data = []
-        for offset in range(-2, 3):
-            idx = center_idx + offset
-            if 0 <= idx < len(all_prices):
-                window_data.append(all_prices[idx])
-
+        # Window (-2, -1, 0, +1, +2 around the center) is shared by all rolling hour sensors
+        window_data = self.coordinator.get_tick_context().rolling_hour_window(hour_offset)
         if not window_data:
             return None
 
-        result = self._rolling_hour_calculator.aggregate_window_data(window_data, value_type)
+        result = self._calculators.rolling_hour.aggregate_window_data(window_data, value_type)
         # For price type, aggregate_window_data returns (avg, median)
         if isinstance(result, tuple):
             avg, median = result
@@ -660,29 +667,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         if not self.hass or not level:
             return level
         language = self.hass.config.language or "en"
-        cache_key = f"{DOMAIN}_translations_{language}"
-        translations = self.hass.data.get(cache_key)
-        if (
-            translations
-            and "sensor" in translations
-            and "current_interval_price_rating" in translations["sensor"]
-            and "price_levels" in translations["sensor"]["current_interval_price_rating"]
-            and level in translations["sensor"]["current_interval_price_rating"]["price_levels"]
-        ):
-            return translations["sensor"]["current_interval_price_rating"]["price_levels"][level]
-        # Fallback to English if not found
-        if language != "en":
-            en_cache_key = f"{DOMAIN}_translations_en"
-            en_translations = self.hass.data.get(en_cache_key)
-            if (
-                en_translations
-                and "sensor" in en_translations
-                and "current_interval_price_rating" in en_translations
-                and "price_levels" in en_translations["sensor"]["current_interval_price_rating"]
-                and level in en_translations["sensor"]["current_interval_price_rating"]["price_levels"]
-            ):
-                return en_translations["sensor"]["current_interval_price_rating"]["price_levels"][level]
-        return level
+        translated = get_translation(["sensor", "current_interval_price_rating", "price_levels", level], language)
+        return translated if isinstance(translated, str) else level
 
     def _get_next_avg_n_hours_value(self, hours: int) -> float | None:
         """
@@ -696,7 +682,11 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             or None if unavailable
 
         """
-        mean_price, median_price = calculate_next_n_hours_mean(self.coordinator.data, hours, time=self.coordinator.time)
+        # Shared with the price_outlook_Xh sensor of the same window
+        mean_price, median_price = self._calculators.get_tick_result(
+            ("next_n_hours_mean", hours),
+            lambda: calculate_next_n_hours_mean(self.coordinator.data, hours, time=self.coordinator.time),
+        )
         if mean_price is None:
             return None
 
@@ -911,12 +901,19 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
     @property
     def native_value(self) -> float | str | datetime | None:
         """Return the native value of the sensor."""
+        # A batched state write reuses the value evaluated by _write_if_changed()
+        if self._evaluated_value is not _SENTINEL:
+            return self._evaluated_value
+        return self._compute_native_value()
+
+    def _compute_native_value(self) -> float | str | datetime | None:
+        """Calculate the native value (and cache mean/median for the attributes)."""
         try:
             if not self.coordinator.data or not self._value_getter:
                 return None
             # For price_level, ensure we return the translated value as state
             if self.entity_description.key == "current_interval_price_level":
-                return self._interval_calculator.get_price_level_value()
+                return self._calculators.interval.get_price_level_value()
 
             result = self._value_getter()
         except (KeyError, ValueError, TypeError) as ex:
@@ -995,18 +992,10 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         """Check if the current time is within a best price period."""
         if not self.coordinator.data:
             return False
-        attrs = get_price_intervals_attributes(
-            self.coordinator.data,
-            reverse_sort=False,
-            time=self.coordinator.time,
-            config_entry=self.coordinator.config_entry,
-        )
-        if not attrs:
-            return False
-        start = attrs.get("start")
-        end = attrs.get("end")
-        if not start or not end:
+        bounds = self.coordinator.get_tick_context().period_bounds(reverse_sort=False)
+        if not bounds:
             return False
+        start, end = bounds
         time = self.coordinator.time
         now = time.now()
         return start <= now < end
@@ -1015,18 +1004,10 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         """Check if the current time is within a peak price period."""
         if not self.coordinator.data:
             return False
-        attrs = get_price_intervals_attributes(
-            self.coordinator.data,
-            reverse_sort=True,
-            time=self.coordinator.time,
-            config_entry=self.coordinator.config_entry,
-        )
-        if not attrs:
-            return False
-        start = attrs.get("start")
-        end = attrs.get("end")
-        if not start or not end:
+        bounds = self.coordinator.get_tick_context().period_bounds(reverse_sort=True)
+        if not bounds:
             return False
+        start, end = bounds
         time = self.coordinator.time
         return time.is_current_interval(start, end)
 
@@ -1046,7 +1027,7 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         # For next_price_trend_change, pass direction from cached attributes via context
         trend_change_direction = None
         if key == "next_price_trend_change":
-            trend_change_attrs = self._trend_calculator.get_trend_change_attributes()
+            trend_change_attrs = self._calculators.trend.get_trend_change_attributes()
             if trend_change_attrs:
                 trend_change_direction = trend_change_attrs.get("direction")
 
@@ -1159,22 +1140,22 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         # Add special calculator results
         cached_data.update(
             {
-                "trend_attributes": self._trend_calculator.get_trend_attributes(),
-                "trajectory_attributes": self._trend_calculator.get_trajectory_attributes(),
-                "current_trend_attributes": self._trend_calculator.get_current_trend_attributes(),
-                "trend_change_attributes": self._trend_calculator.get_trend_change_attributes(),
-                "volatility_attributes": self._volatility_calculator.get_volatility_attributes(),
-                "percentile_rank_attributes": self._volatility_calculator.get_percentile_rank_attributes(),
+                "trend_attributes": self._calculators.trend.get_trend_attributes(),
+                "trajectory_attributes": self._calculators.trend.get_trajectory_attributes(),
+                "current_trend_attributes": self._calculators.trend.get_current_trend_attributes(),
+                "trend_change_attributes": self._calculators.trend.get_trend_change_attributes(),
+                "volatility_attributes": self._calculators.volatility.get_volatility_attributes(),
+                "percentile_rank_attributes": self._calculators.volatility.get_percentile_rank_attributes(),
                 "percentile_rank_type": _extract_percentile_rank_type(key),
                 "coordinator_data": self.coordinator.data,
-                "last_extreme_interval": self._daily_stat_calculator.get_last_extreme_interval(),
-                "last_energy_tax_averages": self._daily_stat_calculator.get_last_energy_tax_averages(),
-                "last_price_level": self._interval_calculator.get_last_price_level(),
-                "last_rating_difference": self._interval_calculator.get_last_rating_difference(),
-                "last_rating_level": self._interval_calculator.get_last_rating_level(),
+                "last_extreme_interval": self._calculators.daily_stat.get_last_extreme_interval(),
+                "last_energy_tax_averages": self._calculators.daily_stat.get_last_energy_tax_averages(),
+                "last_price_level": self._calculators.interval.get_last_price_level(),
+                "last_rating_difference": self._calculators.interval.get_last_rating_difference(),
+                "last_rating_level": self._calculators.interval.get_last_rating_level(),
                 "data_timestamp": getattr(self, "_data_timestamp", None),
                 "rolling_hour_level": self._get_rolling_hour_level_for_cached_data(key),
-                "lifecycle_calculator": self._lifecycle_calculator,  # For lifecycle sensor attributes
+                "lifecycle_calculator": self._calculators.lifecycle,  # For lifecycle sensor attributes
             }
         )
 
@@ -1191,7 +1172,7 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
         """Get rolling hour level for cached data if needed for icon color."""
         if key in ["current_hour_average_price", "next_hour_average_price"]:
             hour_offset = 0 if key == "current_hour_average_price" else 1
-            result = self._rolling_hour_calculator.get_rolling_hour_value(hour_offset=hour_offset, value_type="level")
+            result = self._calculators.rolling_hour.get_rolling_hour_value(hour_offset=hour_offset, value_type="level")
             return result if isinstance(result, str) else None
         return None
 
@@ -1222,6 +1203,7 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             config_entry=self.coordinator.config_entry,
         )
         self._chart_data_response = response
+        self._chart_data_response_bytes = get_budgeted_response_size(self.hass, response)
         time = self.coordinator.time
         self._chart_data_last_update = time.now()
         self._chart_data_error = error
@@ -1238,6 +1220,8 @@ class TibberPricesSensor(TibberPricesEntity, RestoreSensor):
             chart_data_response=self._chart_data_response,
             chart_data_last_update=self._chart_data_last_update,
             chart_data_error=self._chart_data_error,
+            byte_budget=self.hass.data.get(DOMAIN, {}).get(DATA_ATTRIBUTE_BYTE_BUDGET),
+            response_bytes=self._chart_data_response_bytes,
         )
 
     def _get_chart_metadata_value(self) -> str | None:
@@ -1351,6 +1351,17 @@ DIAGNOSTIC_SENSORS = (
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=True,  # Critical for chart features
     ),
+    SensorEntityDescription(
+        key="processing_time",
+        translation_key="processing_time",
+        icon="mdi:timer-cog-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,  # Opt-in, for performance analysis
+    ),
 )
 
 # 10. TIME-TRAVEL SENSORS (what a device is actually showing)
@@ -228,6 +228,8 @@ class LifecycleAttributes(BaseAttributes, total=False):
     updates_today: int  # Number of API updates today
     last_turnover: str  # ISO 8601 timestamp of last midnight turnover
     last_error: str  # Last error message if any
+    slowest_stage: str  # Stage with the highest p95 duration (processing_time sensor)
+    stages: dict[str, dict[str, float | int]]  # p50/p95/max per pipeline stage (processing_time sensor)
 
 
 class MetadataAttributes(BaseAttributes, total=False):
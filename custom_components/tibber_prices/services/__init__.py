@@ -5,6 +5,7 @@ This package provides service endpoints for external integrations and data expor
 - Chart data export (get_chartdata)
 - ApexCharts YAML generation (get_apexcharts_yaml)
 - User data refresh (refresh_user_data)
+- Debug: Profile transformation and timer ticks (debug_profile) - admin only
 - Debug: Clear tomorrow data (debug_clear_tomorrow) - DevContainer only
 
 Architecture:
@@ -13,55 +14,33 @@ Architecture:
 - chartdata.py: Main data export service handler
 - apexcharts.py: ApexCharts card YAML generator
 - refresh_user_data.py: User data refresh handler
+- debug_profile.py: cProfile/tracemalloc run on a live instance (admin only)
 - debug_clear_tomorrow.py: Debug tool for testing tomorrow refresh (dev only)
 
+Handler modules are imported on the first call of their service, not at setup:
+together they are about 10,000 lines and most installations call only one or
+two services. Every service is registered with a proxy that imports its module,
+validates the call data against the module's schema and dispatches to the handler.
+
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from custom_components.tibber_prices.const import DOMAIN
-from homeassistant.core import SupportsResponse, callback
-
-from .find_cheapest_block import (
-    FIND_CHEAPEST_BLOCK_SERVICE_NAME,
-    FIND_CHEAPEST_BLOCK_SERVICE_SCHEMA,
-    handle_find_cheapest_block,
-)
-from .find_cheapest_hours import (
-    FIND_CHEAPEST_HOURS_SERVICE_NAME,
-    FIND_CHEAPEST_HOURS_SERVICE_SCHEMA,
-    handle_find_cheapest_hours,
-)
-from .find_cheapest_schedule import (
-    FIND_CHEAPEST_SCHEDULE_SERVICE_NAME,
-    FIND_CHEAPEST_SCHEDULE_SERVICE_SCHEMA,
-    handle_find_cheapest_schedule,
-)
-from .find_most_expensive_block import (
-    FIND_MOST_EXPENSIVE_BLOCK_SERVICE_NAME,
-    FIND_MOST_EXPENSIVE_BLOCK_SERVICE_SCHEMA,
-    handle_find_most_expensive_block,
-)
-from .find_most_expensive_hours import (
-    FIND_MOST_EXPENSIVE_HOURS_SERVICE_NAME,
-    FIND_MOST_EXPENSIVE_HOURS_SERVICE_SCHEMA,
-    handle_find_most_expensive_hours,
-)
-from .get_apexcharts_yaml import APEXCHARTS_SERVICE_SCHEMA, APEXCHARTS_YAML_SERVICE_NAME, handle_apexcharts_yaml
-from .get_chartdata import CHARTDATA_SERVICE_NAME, CHARTDATA_SERVICE_SCHEMA, handle_chartdata
-from .get_price import GET_PRICE_SERVICE_NAME, GET_PRICE_SERVICE_SCHEMA, handle_get_price
-from .plan_charging import PLAN_CHARGING_SERVICE_NAME, PLAN_CHARGING_SERVICE_SCHEMA, handle_plan_charging
-from .refresh_user_data import (
-    REFRESH_USER_DATA_SERVICE_NAME,
-    REFRESH_USER_DATA_SERVICE_SCHEMA,
-    handle_refresh_user_data,
-)
+from homeassistant.core import ServiceCall, SupportsResponse, callback
+from homeassistant.helpers.importlib import async_import_module
+
+from .response_cache import cache_service_response, refresh_block_countdown, refresh_hours_countdown
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Awaitable, Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant, ServiceResponse
 
 __all__ = [
     "async_setup_services",
@@ -71,92 +50,155 @@ __all__ = [
 _IS_DEV_MODE = os.environ.get("TIBBER_PRICES_DEV") == "1"
 
 
-@callback
-def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up services for Tibber Prices integration."""
-    hass.services.async_register(
-        DOMAIN,
-        APEXCHARTS_YAML_SERVICE_NAME,
-        handle_apexcharts_yaml,
-        schema=APEXCHARTS_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        CHARTDATA_SERVICE_NAME,
-        handle_chartdata,
-        schema=CHARTDATA_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        GET_PRICE_SERVICE_NAME,
-        handle_get_price,
-        schema=GET_PRICE_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        FIND_CHEAPEST_BLOCK_SERVICE_NAME,
-        handle_find_cheapest_block,
-        schema=FIND_CHEAPEST_BLOCK_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        FIND_CHEAPEST_HOURS_SERVICE_NAME,
-        handle_find_cheapest_hours,
-        schema=FIND_CHEAPEST_HOURS_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        FIND_CHEAPEST_SCHEDULE_SERVICE_NAME,
-        handle_find_cheapest_schedule,
-        schema=FIND_CHEAPEST_SCHEDULE_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        FIND_MOST_EXPENSIVE_BLOCK_SERVICE_NAME,
-        handle_find_most_expensive_block,
-        schema=FIND_MOST_EXPENSIVE_BLOCK_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        FIND_MOST_EXPENSIVE_HOURS_SERVICE_NAME,
-        handle_find_most_expensive_hours,
-        schema=FIND_MOST_EXPENSIVE_HOURS_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        PLAN_CHARGING_SERVICE_NAME,
-        handle_plan_charging,
-        schema=PLAN_CHARGING_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-    hass.services.async_register(
-        DOMAIN,
-        REFRESH_USER_DATA_SERVICE_NAME,
-        handle_refresh_user_data,
-        schema=REFRESH_USER_DATA_SERVICE_SCHEMA,
-        supports_response=SupportsResponse.ONLY,
-    )
-
-    # Debug services - only available in DevContainer (TIBBER_PRICES_DEV=1)
-    if _IS_DEV_MODE:
-        from .debug_clear_tomorrow import (  # noqa: PLC0415 - Conditional import for dev-only service
-            DEBUG_CLEAR_TOMORROW_SERVICE_NAME,
-            DEBUG_CLEAR_TOMORROW_SERVICE_SCHEMA,
-            handle_debug_clear_tomorrow,
+@dataclass(frozen=True)
+class _ServiceSpec:
+    """Where a service handler lives; resolved on the first call of the service."""
+
+    module: str
+    handler: str
+    schema: str
+    # (module, attribute) of the entity reference parameters - set for read-only services
+    # whose responses are cached (see response_cache.py)
+    cached_entity_params: tuple[str, str] | None = None
+    refresh: Callable[[dict[str, Any], datetime], dict[str, Any]] | None = None
+    # Key cached responses on the resolved search range (services taking search_* offsets)
+    key_on_search_range: bool = False
+
+
+_SERVICES: dict[str, _ServiceSpec] = {
+    "get_apexcharts_yaml": _ServiceSpec("get_apexcharts_yaml", "handle_apexcharts_yaml", "APEXCHARTS_SERVICE_SCHEMA"),
+    "get_chartdata": _ServiceSpec(
+        "get_chartdata",
+        "handle_chartdata",
+        "CHARTDATA_SERVICE_SCHEMA",
+        cached_entity_params=("get_chartdata", "CHARTDATA_ENTITY_PARAMS"),
+    ),
+    "get_price": _ServiceSpec(
+        "get_price",
+        "handle_get_price",
+        "GET_PRICE_SERVICE_SCHEMA",
+        cached_entity_params=("get_price", "PRICE_ENTITY_PARAMS"),
+    ),
+    "find_cheapest_block": _ServiceSpec(
+        "find_cheapest_block",
+        "handle_find_cheapest_block",
+        "FIND_CHEAPEST_BLOCK_SERVICE_SCHEMA",
+        cached_entity_params=("find_cheapest_block", "COMMON_BLOCK_ENTITY_PARAMS"),
+        refresh=refresh_block_countdown,
+        key_on_search_range=True,
+    ),
+    "find_cheapest_block_batch": _ServiceSpec(
+        "find_cheapest_block", "handle_find_cheapest_block_batch", "FIND_CHEAPEST_BLOCK_BATCH_SERVICE_SCHEMA"
+    ),
+    "find_cheapest_hours": _ServiceSpec(
+        "find_cheapest_hours",
+        "handle_find_cheapest_hours",
+        "FIND_CHEAPEST_HOURS_SERVICE_SCHEMA",
+        cached_entity_params=("find_cheapest_hours", "HOURS_ENTITY_PARAMS"),
+        refresh=refresh_hours_countdown,
+        key_on_search_range=True,
+    ),
+    "find_cheapest_schedule": _ServiceSpec(
+        "find_cheapest_schedule", "handle_find_cheapest_schedule", "FIND_CHEAPEST_SCHEDULE_SERVICE_SCHEMA"
+    ),
+    "find_most_expensive_block": _ServiceSpec(
+        "find_most_expensive_block",
+        "handle_find_most_expensive_block",
+        "FIND_MOST_EXPENSIVE_BLOCK_SERVICE_SCHEMA",
+        cached_entity_params=("find_cheapest_block", "COMMON_BLOCK_ENTITY_PARAMS"),
+        refresh=refresh_block_countdown,
+        key_on_search_range=True,
+    ),
+    "find_most_expensive_hours": _ServiceSpec(
+        "find_most_expensive_hours",
+        "handle_find_most_expensive_hours",
+        "FIND_MOST_EXPENSIVE_HOURS_SERVICE_SCHEMA",
+        cached_entity_params=("find_cheapest_hours", "HOURS_ENTITY_PARAMS"),
+        refresh=refresh_hours_countdown,
+        key_on_search_range=True,
+    ),
+    "plan_arbitrage": _ServiceSpec("plan_arbitrage", "handle_plan_arbitrage", "PLAN_ARBITRAGE_SERVICE_SCHEMA"),
+    "plan_charging": _ServiceSpec("plan_charging", "handle_plan_charging", "PLAN_CHARGING_SERVICE_SCHEMA"),
+    "plan_charging_batch": _ServiceSpec(
+        "plan_charging", "handle_plan_charging_batch", "PLAN_CHARGING_BATCH_SERVICE_SCHEMA"
+    ),
+    "refresh_user_data": _ServiceSpec(
+        "refresh_user_data", "handle_refresh_user_data", "REFRESH_USER_DATA_SERVICE_SCHEMA"
+    ),
+    # Admin-only (checked in the handler), available in production for user reports
+    "debug_profile": _ServiceSpec("debug_profile", "handle_debug_profile", "DEBUG_PROFILE_SERVICE_SCHEMA"),
+}
+
+# Debug services - only available in DevContainer (TIBBER_PRICES_DEV=1)
+_DEV_SERVICES: dict[str, _ServiceSpec] = {
+    "debug_clear_tomorrow": _ServiceSpec(
+        "debug_clear_tomorrow", "handle_debug_clear_tomorrow", "DEBUG_CLEAR_TOMORROW_SERVICE_SCHEMA"
+    ),
+}
+
+
+def _lazy_service_handler(
+    hass: HomeAssistant, service: str, spec: _ServiceSpec
+) -> Callable[[ServiceCall], Awaitable[ServiceResponse]]:
+    """
+    Return a service handler that imports the real handler on its first call.
+
+    The service is registered without a schema (the module defining it is not
+    imported yet), so the proxy validates the call data itself before dispatching.
+
+    Args:
+        hass: Home Assistant instance (for the executor-safe module import).
+        service: Service name (part of the response cache key).
+        spec: Where the handler, its schema and its cache parameters live.
+
+    Returns:
+        Coroutine function handling the service calls.
+
+    """
+    resolved: tuple[Callable[[ServiceCall], Awaitable[ServiceResponse]], Callable[[Any], Any]] | None = None
+
+    async def _resolve() -> tuple[Callable[[ServiceCall], Awaitable[ServiceResponse]], Callable[[Any], Any]]:
+        module = await async_import_module(hass, f"{__package__}.{spec.module}")
+        handler = getattr(module, spec.handler)
+        if spec.cached_entity_params is not None:
+            params_module, params_name = spec.cached_entity_params
+            entity_params = getattr(await async_import_module(hass, f"{__package__}.{params_module}"), params_name)
+            handler = cache_service_response(
+                handler,
+                service_name=service,
+                entity_params=entity_params,
+                refresh=spec.refresh,
+                key_on_search_range=spec.key_on_search_range,
+            )
+        return handler, getattr(module, spec.schema)
+
+    async def _handle(call: ServiceCall) -> ServiceResponse:
+        nonlocal resolved
+        if resolved is None:
+            resolved = await _resolve()
+        handler, schema = resolved
+        return await handler(
+            ServiceCall(
+                call.hass,
+                call.domain,
+                call.service,
+                schema(dict(call.data)),
+                call.context,
+                call.return_response,
+            )
         )
 
+    return _handle
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up services for Tibber Prices integration (handler modules are imported on first call)."""
+    services = {**_SERVICES, **_DEV_SERVICES} if _IS_DEV_MODE else _SERVICES
+    for service, spec in services.items():
         hass.services.async_register(
             DOMAIN,
-            DEBUG_CLEAR_TOMORROW_SERVICE_NAME,
-            handle_debug_clear_tomorrow,
-            schema=DEBUG_CLEAR_TOMORROW_SERVICE_SCHEMA,
+            service,
+            _lazy_service_handler(hass, service, spec),
             supports_response=SupportsResponse.ONLY,
         )
@@ -1,21 +1,27 @@
 """
-Charging-specific calculation modules for the plan_charging service.
+Charging-specific calculation modules for the plan_charging and plan_arbitrage services.
 
 Packages:
     energy_calculator: Pure SoC/energy math (Phase 1)
     power_scheduler:   Variable power distribution (Phase 2)
     deadline_solver:   Deadline constraint solving (Phase 3)
+    charge_solver:     Joint optimization of segment constraints (DP)
     economics:         Round-trip economic analysis (Phase 4)
+    arbitrage_solver:  Joint charge/discharge planning (DP)
 """
 
 from __future__ import annotations
 
+from .arbitrage_solver import solve_arbitrage_schedule
+from .charge_solver import CHARGE_SOLVER_TIME_BUDGET_SECONDS, schedule_cost, solve_charge_schedule
 from .deadline_solver import build_deadline_schedule, get_deadline_events, resolve_deadline
 from .economics import (
+    build_economics_filter_metadata,
     calculate_break_even_price,
     calculate_plan_economics,
     calculate_round_trip_efficiency,
     filter_intervals_by_profitability,
+    profitability_exclusions,
 )
 from .energy_calculator import (
     build_soc_progression,
@@ -27,8 +33,10 @@ from .energy_calculator import (
 from .power_scheduler import apply_segment_constraints, build_power_schedule, determine_power_mode, energy_for_power
 
 __all__ = [
+    "CHARGE_SOLVER_TIME_BUDGET_SECONDS",
     "apply_segment_constraints",
     "build_deadline_schedule",
+    "build_economics_filter_metadata",
     "build_power_schedule",
     "build_soc_progression",
     "build_soc_progression_from_schedule",
@@ -41,6 +49,10 @@ __all__ = [
     "energy_for_power",
     "filter_intervals_by_profitability",
     "get_deadline_events",
+    "profitability_exclusions",
     "resolve_deadline",
+    "schedule_cost",
     "soc_percent_to_kwh",
+    "solve_arbitrage_schedule",
+    "solve_charge_schedule",
 ]
@@ -0,0 +1,381 @@
+"""Joint charge/discharge planning for the plan_arbitrage service.
+
+plan_charging buys a requested amount of energy as cheaply as possible and
+judges it against a single expected_discharge_price. plan_arbitrage decides
+both directions: in which intervals of the search range the battery charges
+and in which it discharges, so that the value of the discharged energy minus
+the cost of the charged energy is maximal.
+
+The planner is a dynamic program over the intervals in time order. The state
+after each interval is:
+
+- soc: the state of charge on a grid of equal steps around the current SoC,
+  limited to [min SoC, max SoC],
+- cycles: charging runs started on the current day (only with
+  max_cycles_per_day; the count restarts at midnight),
+- charging: whether the interval charged, so a charging run that continues
+  into the next interval does not start a new cycle.
+
+Charging k steps costs price * k * step / charging_efficiency, discharging k
+steps is worth price * k * step * discharging_efficiency. Both are linear in k,
+so the best predecessor of every SoC is a sliding-window maximum over the SoC
+grid (monotonic deque). Each interval costs O(SoC steps) per cycle count, so
+the runtime grows linearly with the horizon.
+
+The step size is chosen so that the weaker direction (charge or discharge)
+moves a whole number of steps at full power; the other direction is rounded
+down to whole steps. The number of steps shrinks for long horizons and high
+cycle limits so that a 48h plan stays well within
+ARBITRAGE_TIME_BUDGET_SECONDS. The budget is also checked while solving;
+solve_arbitrage_schedule() returns None when it runs out.
+
+The plan has to end at min_final_soc_kwh or above (by default the current
+SoC), otherwise emptying the battery would count as profit. When that SoC
+cannot be reached, the plan ends as high as possible and final_soc_met is
+False.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.tibber_prices.utils.interval_time import parse_starts_at, starts_at_epoch
+from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange, group_intervals_into_segments
+
+#: Wall-clock budget for one solve (the service runs in the event loop)
+ARBITRAGE_TIME_BUDGET_SECONDS = 0.5
+
+#: Finest SoC grid the planner uses
+MAX_SOC_STEPS = 200
+
+#: Upper bound for intervals x SoC steps x state layers (~0.15s in pure Python)
+_MAX_STATE_WORK = 120_000
+
+_NEG_INF = float("-inf")
+_TOLERANCE = 1e-9
+
+# Values per SoC step and the flattened predecessor state (layer * size + soc) they come from
+_Row = tuple[list[float], list[int]]
+
+if TYPE_CHECKING:
+    from datetime import date
+
+
+def _window_max(values: list[float], width: int) -> tuple[list[float], list[int]]:
+    """Return, for every index i, the maximum of values[i - width : i] and its index.
+
+    Empty windows yield -inf and -1. On ties the nearest index wins, i.e. the smallest move.
+    """
+    best = [_NEG_INF] * len(values)
+    best_index = [-1] * len(values)
+    window: deque[int] = deque()
+    for index in range(1, len(values)):
+        value = values[index - 1]
+        if value != _NEG_INF:
+            while window and values[window[-1]] <= value:
+                window.pop()
+            window.append(index - 1)
+        while window and window[0] < index - width:
+            window.popleft()
+        if window:
+            best[index] = values[window[0]]
+            best_index[index] = window[0]
+    return best, best_index
+
+
+def _merge(first: _Row, second: _Row) -> _Row:
+    """Elementwise maximum of two rows; the first row wins ties."""
+    values, origins = list(first[0]), list(first[1])
+    for soc, value in enumerate(second[0]):
+        if value > values[soc]:
+            values[soc] = value
+            origins[soc] = second[1][soc]
+    return values, origins
+
+
+def _empty_row(size: int) -> _Row:
+    return [_NEG_INF] * size, [-1] * size
+
+
+def _charge_row(source: _Row, gain_per_step: float, max_steps: int) -> _Row:
+    """Best value per SoC after charging 1..max_steps steps from the source row.
+
+    Charging from s to t > s adds (t - s) * gain, so t takes the maximum of
+    source[s] - gain * s over s in [t - max_steps, t).
+    """
+    source_values, source_origins = source
+    size = len(source_values)
+    shifted = [
+        value - gain_per_step * soc if value != _NEG_INF else _NEG_INF for soc, value in enumerate(source_values)
+    ]
+    best, best_index = _window_max(shifted, max_steps)
+    values, origins = _empty_row(size)
+    for target, from_soc in enumerate(best_index):
+        if from_soc >= 0:
+            values[target] = best[target] + gain_per_step * target
+            origins[target] = source_origins[from_soc]
+    return values, origins
+
+
+def _discharge_into(row: _Row, source: _Row, gain_per_step: float, max_steps: int) -> None:
+    """Improve row in place by discharging 1..max_steps steps from the source row.
+
+    Discharging from s to t < s adds (s - t) * gain, so t takes the maximum of
+    source[s] + gain * s over s in (t, t + max_steps]: a window over the
+    reversed row.
+    """
+    source_values, source_origins = source
+    size = len(source_values)
+    reversed_shifted = [
+        source_values[soc] + gain_per_step * soc if source_values[soc] != _NEG_INF else _NEG_INF
+        for soc in range(size - 1, -1, -1)
+    ]
+    best, best_index = _window_max(reversed_shifted, max_steps)
+    values, origins = row
+    for reversed_target, reversed_from in enumerate(best_index):
+        if reversed_from < 0:
+            continue
+        target = size - 1 - reversed_target
+        value = best[reversed_target] - gain_per_step * target
+        if value > values[target] + _TOLERANCE:
+            values[target] = value
+            origins[target] = source_origins[size - 1 - reversed_from]
+
+
+def _soc_grid(
+    *,
+    current_soc_kwh: float,
+    min_soc_kwh: float,
+    max_soc_kwh: float,
+    charge_step_kwh: float,
+    discharge_step_kwh: float,
+    target_steps: int,
+) -> tuple[float, int, int]:
+    """Return (step size, steps below current SoC, steps above current SoC)."""
+    usable_kwh = max(max_soc_kwh - min_soc_kwh, _TOLERANCE)
+    weaker_kwh = min(charge_step_kwh, discharge_step_kwh)
+    step_kwh = weaker_kwh / max(1, round(weaker_kwh / (usable_kwh / target_steps)))
+    steps_down = max(0, math.floor((current_soc_kwh - min_soc_kwh) / step_kwh + _TOLERANCE))
+    steps_up = max(0, math.floor((max_soc_kwh - current_soc_kwh) / step_kwh + _TOLERANCE))
+    return step_kwh, steps_down, steps_up
+
+
+def solve_arbitrage_schedule(
+    intervals: list[dict[str, Any]],
+    *,
+    current_soc_kwh: float,
+    min_soc_kwh: float,
+    max_soc_kwh: float,
+    max_charge_power_w: int,
+    max_discharge_power_w: int,
+    charging_efficiency: float,
+    discharging_efficiency: float,
+    min_final_soc_kwh: float | None = None,
+    max_cycles_per_day: int | None = None,
+    interval_minutes: int = 15,
+    max_soc_steps: int = MAX_SOC_STEPS,
+    time_budget: float = ARBITRAGE_TIME_BUDGET_SECONDS,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> dict[str, Any] | None:
+    """
+    Plan charge and discharge intervals for maximum arbitrage profit.
+
+    Args:
+        intervals: Price intervals of the search range in time order ('total' in base currency).
+        current_soc_kwh: Current state of charge.
+        min_soc_kwh: Lowest SoC discharging may reach.
+        max_soc_kwh: Highest SoC charging may reach.
+        max_charge_power_w: Maximum grid power while charging.
+        max_discharge_power_w: Maximum delivered power while discharging.
+        charging_efficiency: Fraction of grid energy that is stored.
+        discharging_efficiency: Fraction of stored energy that is delivered.
+        min_final_soc_kwh: SoC the plan must end at or above (default: current SoC).
+        max_cycles_per_day: Maximum charging runs started per calendar day.
+        interval_minutes: Interval length in minutes.
+        max_soc_steps: Finest SoC grid (fewer steps for long horizons and cycle limits).
+        time_budget: Wall-clock budget in seconds.
+        prepared: Prepared search range for contiguity lookups.
+
+    Returns:
+        Plan with the active intervals ('action', 'power_w', 'energy_kwh',
+        'battery_energy_kwh', 'soc_after_kwh'), their segments and totals in
+        base currency, or None if the time budget ran out.
+
+    """
+    deadline_at = time.monotonic() + time_budget
+    hours = interval_minutes / 60.0
+    charge_step_kwh = max_charge_power_w / 1000.0 * hours * charging_efficiency
+    discharge_step_kwh = max_discharge_power_w / 1000.0 * hours / discharging_efficiency
+    layer_count = 2 * (max_cycles_per_day + 1) if max_cycles_per_day else 1
+    target_steps = max(4, min(max_soc_steps, _MAX_STATE_WORK // max(1, len(intervals) * layer_count)))
+    step_kwh, steps_down, steps_up = _soc_grid(
+        current_soc_kwh=current_soc_kwh,
+        min_soc_kwh=min_soc_kwh,
+        max_soc_kwh=max_soc_kwh,
+        charge_step_kwh=charge_step_kwh,
+        discharge_step_kwh=discharge_step_kwh,
+        target_steps=target_steps,
+    )
+    charge_steps = math.floor(charge_step_kwh / step_kwh + _TOLERANCE)
+    discharge_steps = math.floor(discharge_step_kwh / step_kwh + _TOLERANCE)
+    size = steps_down + steps_up + 1
+    final_soc_kwh = current_soc_kwh if min_final_soc_kwh is None else min_final_soc_kwh
+    final_step = min(
+        size - 1, max(0, steps_down + math.ceil((final_soc_kwh - current_soc_kwh) / step_kwh - _TOLERANCE))
+    )
+
+    contiguous = (prepared or TibberPricesPreparedRange(intervals)).contiguity_of(intervals)
+    days: list[date] = [parse_starts_at(interval["startsAt"]).date() for interval in intervals]
+
+    # Layer index: 2 * cycles today + (1 if the interval charged); without a cycle limit one layer
+    layers: list[list[float]] = [[_NEG_INF] * size for _ in range(layer_count)]
+    layers[0][steps_down] = 0.0
+    back: list[list[list[int]]] = []
+
+    for index, interval in enumerate(intervals):
+        if time.monotonic() > deadline_at:
+            return None
+        price = float(interval["total"])
+        charge_gain = -price * step_kwh / charging_efficiency
+        discharge_gain = price * step_kwh * discharging_efficiency
+        rows: list[_Row] = [
+            (values, list(range(layer * size, (layer + 1) * size))) for layer, values in enumerate(layers)
+        ]
+
+        if not max_cycles_per_day:
+            stay = rows[0]
+            next_rows = [_merge(stay, _charge_row(stay, charge_gain, charge_steps))]
+            _discharge_into(next_rows[0], stay, discharge_gain, discharge_steps)
+        else:
+            if index > 0 and days[index] != days[index - 1]:
+                # New day: the cycle count restarts, a charging run may continue
+                rows = [
+                    _merge_all(rows[0::2]),
+                    _merge_all(rows[1::2]),
+                    *(_empty_row(size) for _ in range(layer_count - 2)),
+                ]
+            if not contiguous[index]:
+                # A gap in the data ends every charging run
+                rows = [
+                    row
+                    for cycles in range(0, layer_count, 2)
+                    for row in (_merge(rows[cycles], rows[cycles + 1]), _empty_row(size))
+                ]
+            next_rows = []
+            for cycles in range(0, layer_count, 2):
+                stay = _merge(rows[cycles], rows[cycles + 1])
+                idle = (list(stay[0]), list(stay[1]))
+                _discharge_into(idle, stay, discharge_gain, discharge_steps)
+                charge_source = _merge(rows[cycles + 1], rows[cycles - 2]) if cycles else rows[cycles + 1]
+                next_rows.extend((idle, _charge_row(charge_source, charge_gain, charge_steps)))
+
+        back.append([origins for _values, origins in next_rows])
+        layers = [values for values, _origins in next_rows]
+
+    # Best final state at or above the final SoC (or as high as reachable); more SoC wins ties
+    finals = [
+        (value, soc, layer * size + soc)
+        for layer, values in enumerate(layers)
+        for soc, value in enumerate(values)
+        if value != _NEG_INF
+    ]
+    required_step = min(final_step, max(soc for _value, soc, _flat in finals))
+    _profit, end_step, state = max(final for final in finals if final[1] >= required_step)
+    # final_step is capped at the top of the grid, so compare the SoC itself
+    end_soc_kwh = current_soc_kwh + (end_step - steps_down) * step_kwh
+
+    socs = [0] * len(intervals)
+    for index in range(len(intervals) - 1, -1, -1):
+        socs[index] = state % size
+        state = back[index][state // size][state % size]
+
+    return _build_plan(
+        intervals,
+        socs,
+        steps_down=steps_down,
+        step_kwh=step_kwh,
+        current_soc_kwh=current_soc_kwh,
+        charging_efficiency=charging_efficiency,
+        discharging_efficiency=discharging_efficiency,
+        hours=hours,
+        final_soc_met=end_soc_kwh >= final_soc_kwh - 1e-6,
+        prepared=prepared,
+    )
+
+
+def _merge_all(rows: list[_Row]) -> _Row:
+    """Elementwise maximum of several rows."""
+    merged = rows[0]
+    for row in rows[1:]:
+        merged = _merge(merged, row)
+    return merged
+
+
+def _build_plan(
+    intervals: list[dict[str, Any]],
+    socs: list[int],
+    *,
+    steps_down: int,
+    step_kwh: float,
+    current_soc_kwh: float,
+    charging_efficiency: float,
+    discharging_efficiency: float,
+    hours: float,
+    final_soc_met: bool,
+    prepared: TibberPricesPreparedRange | None,
+) -> dict[str, Any]:
+    """Turn the SoC path into active intervals, segments and totals."""
+    active: list[dict[str, Any]] = []
+    charge_cost = 0.0
+    discharge_value = 0.0
+    charged_kwh = 0.0
+    discharged_kwh = 0.0
+    previous = steps_down
+    for interval, soc in zip(intervals, socs, strict=True):
+        moved = soc - previous
+        previous = soc
+        if moved == 0:
+            continue
+        battery_energy_kwh = moved * step_kwh
+        price = float(interval["total"])
+        if moved > 0:
+            energy_kwh = battery_energy_kwh / charging_efficiency
+            charge_cost += price * energy_kwh
+            charged_kwh += energy_kwh
+        else:
+            energy_kwh = -battery_energy_kwh * discharging_efficiency
+            discharge_value += price * energy_kwh
+            discharged_kwh += energy_kwh
+        entry = dict(interval)
+        entry["action"] = "charge" if moved > 0 else "discharge"
+        entry["power_w"] = round(energy_kwh / hours * 1000.0)
+        entry["energy_kwh"] = round(energy_kwh, 6)
+        entry["battery_energy_kwh"] = round(battery_energy_kwh, 6)
+        entry["soc_after_kwh"] = round(current_soc_kwh + (soc - steps_down) * step_kwh, 6)
+        active.append(entry)
+
+    segments = [
+        {**segment, "action": action}
+        for action in ("charge", "discharge")
+        for segment in group_intervals_into_segments(
+            [entry for entry in active if entry["action"] == action], prepared=prepared
+        )
+    ]
+    # By instant: ISO strings with different UTC offsets (DST change) do not sort by time
+    segments.sort(key=lambda segment: starts_at_epoch(segment["start"]))
+
+    return {
+        "intervals": active,
+        "segments": segments,
+        "soc_step_kwh": round(step_kwh, 6),
+        "final_soc_kwh": round(current_soc_kwh + (previous - steps_down) * step_kwh, 6),
+        "final_soc_met": final_soc_met,
+        "charged_energy_kwh": round(charged_kwh, 6),
+        "discharged_energy_kwh": round(discharged_kwh, 6),
+        "charge_cost": charge_cost,
+        "discharge_value": discharge_value,
+        "profit": discharge_value - charge_cost,
+    }
@@ -0,0 +1,414 @@
+"""Optimal charge planning for the plan_charging service.
+
+build_power_schedule() fills the cheapest intervals first, and
+apply_segment_constraints() repairs the result afterwards: short segments are
+extended into their neighbours, segments are bridged until the cycle limit
+holds, and surplus energy is trimmed from the edges. Each repair step is
+local, so the final plan can cost far more than necessary. For example, a
+lone very cheap interval is extended into its expensive neighbours even though
+a cheap contiguous block elsewhere would have satisfied the minimum duration.
+
+This module plans energy, power level, minimum charge duration, cycle limit
+and deadline in one pass. It runs a dynamic program over the candidate
+intervals in time order. The state after each interval is:
+
+- energy: charged grid energy in buckets, saturating at the target,
+- cycles: charging segments started so far (only with max_cycles_per_day),
+- run: length of the current charging run, capped at the minimum duration.
+
+At every interval the plan either idles, which is only allowed once the
+current run is long enough, or charges at one of the power levels of the
+power mode. A gap between candidates (filtered-out or missing intervals) ends
+the current run. States below the deadline energy are dropped at the first
+interval after the deadline.
+
+Energy is counted in buckets. The largest power level is an exact number of
+buckets, smaller levels are credited with the whole buckets they deliver
+(possibly none), so every plan the DP finds can reach the targets. The target
+needs at most MAX_ENERGY_BUCKETS buckets; the count shrinks for long horizons
+and many cycle/run layers so that the DP stays within _MAX_STATE_WORK. Levels
+that credit the same number of buckets only differ in cost, so the DP keeps
+the cheapest of them per interval. Continuous mode plans with minimum and
+maximum power only. The DP therefore decides which intervals charge; the
+exact power per interval is assigned afterwards (_fit_powers): the most
+expensive intervals are lowered as far as the targets allow, then missing
+energy is added to the cheapest intervals, pre-deadline intervals first until
+the deadline energy is met.
+
+The solver runs under a time budget, checked every _DEADLINE_CHECK_STATES
+states. solve_charge_schedule() returns None when the budget is exceeded or
+no plan satisfies every constraint. plan_charging also keeps the greedy plan
+when it satisfies every constraint at a lower cost (possible with coarse energy
+buckets), so the solver never makes a plan worse.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.tibber_prices.utils.price_window import find_contiguous_runs, group_intervals_into_segments
+
+from .power_scheduler import (
+    _build_assignment,
+    _interval_epoch,
+    _sort_price,
+    determine_power_mode,
+    energy_for_power,
+    minimum_operating_power_w,
+)
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange
+
+#: Wall-clock budget for one solve (the service runs in the event loop)
+CHARGE_SOLVER_TIME_BUDGET_SECONDS = 0.25
+
+#: Maximum size of the energy dimension of the state space
+MAX_ENERGY_BUCKETS = 32
+
+#: Upper bound for candidates x energy buckets x cycle/run layers x options (~0.1s in pure Python)
+_MAX_STATE_WORK = 120_000
+
+#: States expanded between two time budget checks
+_DEADLINE_CHECK_STATES = 256
+
+_TOLERANCE = 1e-9
+
+
+def _plan_powers(
+    *,
+    mode: str,
+    effective_max_power_w: int,
+    minimum_power_w: int,
+    allowed_steps: list[int] | None,
+) -> list[int]:
+    """Return the power levels the DP chooses from, ascending."""
+    if mode == "stepped":
+        return list(allowed_steps or [effective_max_power_w])
+    if mode == "continuous":
+        return sorted({minimum_power_w, effective_max_power_w})
+    return [effective_max_power_w]
+
+
+def _bucket_energy_kwh(plan_energies: list[float], energy_needed_grid_kwh: float, max_buckets: int) -> float:
+    """Return the energy of one bucket.
+
+    The largest power level is split into as many buckets as possible while
+    the target stays within max_buckets buckets (at least one bucket per
+    largest level).
+    """
+    largest = plan_energies[-1]
+    return largest / max(1, math.floor(largest * max_buckets / energy_needed_grid_kwh))
+
+
+def _max_energy_buckets(candidate_count: int, *, level_count: int, max_cycles: int, required_run: int) -> int:
+    """Return the bucket count that keeps the DP within _MAX_STATE_WORK (at most MAX_ENERGY_BUCKETS)."""
+    layers = (max_cycles + 1) * (required_run + 1) * (level_count + 1)
+    return max(1, min(MAX_ENERGY_BUCKETS, _MAX_STATE_WORK // max(1, candidate_count * layers)))
+
+
+def _solve_powers(
+    prices: list[float],
+    starts_run: list[bool],
+    *,
+    levels: list[tuple[int, float, int]],
+    target: int,
+    deadline_index: int,
+    deadline_target: int,
+    required_run: int,
+    max_cycles: int,
+    deadline_at: float,
+) -> list[int] | None:
+    """Run the DP over (power_w, energy_kwh, buckets) levels and return the power per candidate (0 = idle)."""
+    minimum_level = levels[0]
+    count = len(prices)
+    # Levels crediting the same buckets differ only in cost: the lowest power is
+    # cheapest at positive prices, the highest at negative prices
+    lowest_per_credit = list({level[2]: level for level in reversed(levels)}.values())
+    highest_per_credit = list({level[2]: level for level in levels}.values())
+
+    # State: (energy buckets, cycles started, current run length)
+    # layer: state -> cost; back[i]: state after candidate i -> (state before, power)
+    layer: dict[tuple[int, int, int], float] = {(0, 0, 0): 0.0}
+    back: list[dict[tuple[int, int, int], tuple[tuple[int, int, int], int]]] = []
+
+    for index in range(count + 1):
+        if index == deadline_index:
+            layer = {state: cost for state, cost in layer.items() if state[0] >= deadline_target}
+        if index == count:
+            break
+
+        price = prices[index]
+        gap_before = starts_run[index]
+        charges = [
+            (power_w, price * level_energy, buckets)
+            for power_w, level_energy, buckets in (lowest_per_credit if price >= 0 else highest_per_credit)
+        ]
+        minimum_charge = [(minimum_level[0], price * minimum_level[1], minimum_level[2])]
+        next_layer: dict[tuple[int, int, int], float] = {}
+        step_back: dict[tuple[int, int, int], tuple[tuple[int, int, int], int]] = {}
+        best_cost = next_layer.get
+
+        for expanded, (state, cost) in enumerate(layer.items()):
+            if not expanded % _DEADLINE_CHECK_STATES and time.monotonic() > deadline_at:
+                return None
+            energy, cycles, run = state
+            if gap_before and run:
+                # A gap ends the run; too short runs are dead ends
+                if run < required_run:
+                    continue
+                run = 0
+            run_complete = run == 0 or run >= required_run
+
+            if run_complete:
+                idle = (energy, cycles, 0)
+                if cost < best_cost(idle, math.inf):
+                    next_layer[idle] = cost
+                    step_back[idle] = (state, 0)
+                # Nothing left to charge, or no cycle left to start
+                if energy >= target or (run == 0 and max_cycles and cycles >= max_cycles):
+                    continue
+
+            next_cycles = cycles + 1 if run == 0 and max_cycles else cycles
+            next_run = min(run + 1, required_run)
+            # Past the target, only a too short run continues (at minimum power)
+            for power_w, charge_cost, buckets in minimum_charge if energy >= target else charges:
+                charged = (min(energy + buckets, target), next_cycles, next_run)
+                charged_cost = cost + charge_cost
+                if charged_cost < best_cost(charged, math.inf):
+                    next_layer[charged] = charged_cost
+                    step_back[charged] = (state, power_w)
+
+        layer = next_layer
+        back.append(step_back)
+
+    finals = [(cost, state) for state, cost in layer.items() if state[0] >= target and state[2] in (0, required_run)]
+    if not finals:
+        return None
+    _cost, state = min(finals, key=lambda final: final[0])
+
+    powers = [0] * count
+    for index in range(count - 1, -1, -1):
+        state, powers[index] = back[index][state]
+    return powers
+
+
+def _fit_powers(
+    prices: list[float],
+    powers: list[int],
+    before_deadline: list[bool],
+    *,
+    allowed_steps: list[int] | None,
+    energy_needed_grid_kwh: float,
+    energy_needed_by_deadline_grid_kwh: float,
+    minimum_power_w: int,
+    effective_max_power_w: int,
+    interval_minutes: int,
+) -> list[int] | None:
+    """Assign the exact power of every selected interval.
+
+    Lowers the most expensive intervals as far as the total and deadline
+    energy allow, then raises the cheapest intervals while energy is missing.
+    In continuous mode this is optimal for the selected intervals.
+
+    Returns:
+        Power per candidate (0 = idle), or None if the selected intervals
+        cannot reach the targets.
+
+    """
+    interval_hours = interval_minutes / 60.0
+    steps = allowed_steps or []
+    selected = [index for index, power_w in enumerate(powers) if power_w]
+    pre_deadline = [index for index in selected if before_deadline[index]]
+    fitted = list(powers)
+
+    def energy_of(indices: list[int]) -> float:
+        return sum(energy_for_power(fitted[index], interval_minutes) for index in indices)
+
+    def power_for(energy_kwh: float) -> int:
+        """Smallest allowed power delivering at least energy_kwh (capped at the maximum)."""
+        needed_w = math.ceil(energy_kwh / interval_hours * 1000.0 - _TOLERANCE)
+        if steps:
+            return next((step for step in steps if step >= needed_w), steps[-1])
+        return max(minimum_power_w, min(needed_w, effective_max_power_w))
+
+    # Lower: most expensive first, keeping both targets
+    surplus = energy_of(selected) - energy_needed_grid_kwh
+    pre_surplus = energy_of(pre_deadline) - energy_needed_by_deadline_grid_kwh
+    for index in sorted(selected, key=lambda index: (-prices[index], index)):
+        current = energy_for_power(fitted[index], interval_minutes)
+        allowed = min(surplus, pre_surplus) if before_deadline[index] else surplus
+        lowered = power_for(max(0.0, current - allowed))
+        if lowered < fitted[index]:
+            saved = current - energy_for_power(lowered, interval_minutes)
+            fitted[index] = lowered
+            surplus -= saved
+            if before_deadline[index]:
+                pre_surplus -= saved
+
+    # Raise: cheapest first, deadline energy before the total
+    for indices, target in ((pre_deadline, energy_needed_by_deadline_grid_kwh), (selected, energy_needed_grid_kwh)):
+        for index in sorted(indices, key=lambda index: (prices[index], index)):
+            missing = target - energy_of(indices)
+            if missing <= _TOLERANCE:
+                break
+            fitted[index] = max(fitted[index], power_for(energy_for_power(fitted[index], interval_minutes) + missing))
+        if energy_of(indices) < target - _TOLERANCE:
+            return None
+
+    return fitted
+
+
+def schedule_cost(schedule: dict[str, Any]) -> float:
+    """Return the cost of a schedule at the prices the planners rank by (smoothed if available)."""
+    return sum(_sort_price(interval) * float(interval["grid_energy_kwh"]) for interval in schedule["intervals"])
+
+
+def solve_charge_schedule(
+    candidate_intervals: list[dict[str, Any]],
+    energy_needed_grid_kwh: float,
+    *,
+    max_charge_power_w: int,
+    charging_efficiency: float,
+    min_charge_power_w: int | None = None,
+    charge_power_steps_w: list[int] | None = None,
+    grid_import_limit_w: int | None = None,
+    min_charge_duration_minutes: int | None = None,
+    max_cycles_per_day: int | None = None,
+    deadline: datetime | None = None,
+    energy_needed_by_deadline_grid_kwh: float = 0.0,
+    interval_minutes: int = 15,
+    time_budget: float = CHARGE_SOLVER_TIME_BUDGET_SECONDS,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> dict[str, Any] | None:
+    """Find the cheapest charging plan that satisfies all constraints at once.
+
+    Args:
+        candidate_intervals: Intervals that may be used for charging.
+        energy_needed_grid_kwh: Grid energy to draw in total.
+        max_charge_power_w: Charger power limit.
+        charging_efficiency: Grid-to-battery efficiency.
+        min_charge_power_w: Minimum power (continuous mode).
+        charge_power_steps_w: Allowed power steps (stepped mode).
+        grid_import_limit_w: Optional grid import limit.
+        min_charge_duration_minutes: Minimum length of every charging segment.
+        max_cycles_per_day: Maximum number of charging segments.
+        deadline: Optional deadline for energy_needed_by_deadline_grid_kwh.
+        energy_needed_by_deadline_grid_kwh: Grid energy to draw before the deadline.
+        interval_minutes: Interval length in minutes.
+        time_budget: Wall-clock budget in seconds.
+        prepared: Optional prepared search range the candidates belong to.
+
+    Returns:
+        Schedule dict in the format of build_power_schedule(), or None if the
+        budget was exceeded or no plan satisfies every constraint.
+
+    Raises:
+        ValueError: If power settings are mutually exclusive or impossible.
+
+    """
+    deadline_at = time.monotonic() + time_budget
+    mode, effective_max_power_w, allowed_steps = determine_power_mode(
+        max_charge_power_w=max_charge_power_w,
+        min_charge_power_w=min_charge_power_w,
+        charge_power_steps_w=charge_power_steps_w,
+        grid_import_limit_w=grid_import_limit_w,
+    )
+    minimum_power_w = minimum_operating_power_w(
+        mode=mode,
+        effective_max_power_w=effective_max_power_w,
+        min_charge_power_w=min_charge_power_w,
+        allowed_steps=allowed_steps,
+    )
+
+    candidates = sorted(candidate_intervals, key=_interval_epoch)
+    energy_needed = max(0.0, energy_needed_grid_kwh)
+    if not candidates or energy_needed <= _TOLERANCE:
+        return None
+
+    plan_powers = _plan_powers(
+        mode=mode,
+        effective_max_power_w=effective_max_power_w,
+        minimum_power_w=minimum_power_w,
+        allowed_steps=allowed_steps,
+    )
+    plan_energies = [energy_for_power(power_w, interval_minutes) for power_w in plan_powers]
+    required_run = (
+        max(1, math.ceil(min_charge_duration_minutes / interval_minutes)) if min_charge_duration_minutes else 1
+    )
+    max_cycles = max_cycles_per_day or 0
+    bucket_kwh = _bucket_energy_kwh(
+        plan_energies,
+        energy_needed,
+        _max_energy_buckets(
+            len(candidates), level_count=len(plan_powers), max_cycles=max_cycles, required_run=required_run
+        ),
+    )
+    energy_by_deadline = max(0.0, energy_needed_by_deadline_grid_kwh) if deadline is not None else 0.0
+    deadline_target = math.ceil(energy_by_deadline / bucket_kwh - _TOLERANCE)
+    deadline_ts = deadline.timestamp() if deadline is not None else None
+    before_deadline = [deadline_ts is not None and _interval_epoch(interval) < deadline_ts for interval in candidates]
+
+    starts_run = [False] * len(candidates)
+    for run_start, _run_end in find_contiguous_runs(candidates, prepared=prepared):
+        starts_run[run_start] = True
+
+    prices = [_sort_price(interval) for interval in candidates]
+    powers = _solve_powers(
+        prices,
+        starts_run,
+        levels=[
+            (power_w, energy, math.floor(energy / bucket_kwh + _TOLERANCE))
+            for power_w, energy in zip(plan_powers, plan_energies, strict=True)
+        ],
+        target=math.ceil(energy_needed / bucket_kwh - _TOLERANCE),
+        deadline_index=before_deadline.count(True) if deadline_target else -1,
+        deadline_target=deadline_target,
+        required_run=required_run,
+        max_cycles=max_cycles,
+        deadline_at=deadline_at,
+    )
+    if powers is not None and mode != "fixed":
+        powers = _fit_powers(
+            prices,
+            powers,
+            before_deadline,
+            allowed_steps=allowed_steps,
+            energy_needed_grid_kwh=energy_needed,
+            energy_needed_by_deadline_grid_kwh=energy_by_deadline,
+            minimum_power_w=minimum_power_w,
+            effective_max_power_w=effective_max_power_w,
+            interval_minutes=interval_minutes,
+        )
+    if powers is None:
+        return None
+
+    assignments = [
+        _build_assignment(
+            interval,
+            power_w=power_w,
+            charging_efficiency=charging_efficiency,
+            interval_minutes=interval_minutes,
+        )
+        for interval, power_w in zip(candidates, powers, strict=True)
+        if power_w
+    ]
+    total_grid_energy_kwh = round(sum(interval["grid_energy_kwh"] for interval in assignments), 6)
+    total_stored_energy_kwh = round(sum(interval["stored_energy_kwh"] for interval in assignments), 6)
+
+    return {
+        "mode": mode,
+        "effective_max_power_w": effective_max_power_w,
+        "allowed_steps": allowed_steps,
+        "intervals": assignments,
+        "segments": group_intervals_into_segments(assignments, prepared=prepared),
+        "total_grid_energy_kwh": total_grid_energy_kwh,
+        "total_stored_energy_kwh": total_stored_energy_kwh,
+        "unallocated_grid_energy_kwh": round(max(0.0, energy_needed - total_grid_energy_kwh), 6),
+        "minimum_power_w": minimum_power_w,
+        "constraint_warnings": [],
+    }
@@ -8,11 +8,13 @@ from typing import TYPE_CHECKING, Any
 from custom_components.tibber_prices.services.helpers import localize_to_home_tz
 from custom_components.tibber_prices.utils.price_window import group_intervals_into_segments
 
-from .power_scheduler import build_power_schedule
+from .power_scheduler import _interval_epoch, build_power_schedule
 
 if TYPE_CHECKING:
     from zoneinfo import ZoneInfo
 
+    from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange
+
 _DEADLINE_EVENTS = frozenset({"next_peak_period", "next_best_period_end", "midnight"})
 
 
@@ -75,9 +77,16 @@ def build_deadline_schedule(
     charge_power_steps_w: list[int] | None = None,
     grid_import_limit_w: int | None = None,
     interval_minutes: int = 15,
+    prepared: TibberPricesPreparedRange | None = None,
+    presorted: bool = False,
 ) -> dict[str, Any]:
-    """Build a two-pass schedule that satisfies a minimum SoC by a deadline."""
-    deadline_intervals = [interval for interval in candidate_intervals if _interval_start(interval) < deadline]
+    """Build a two-pass schedule that satisfies a minimum SoC by a deadline.
+
+    Both passes filter candidate_intervals without reordering them, so presorted
+    candidates (see build_power_schedule()) stay sorted.
+    """
+    deadline_ts = deadline.timestamp()
+    deadline_intervals = [interval for interval in candidate_intervals if _interval_epoch(interval) < deadline_ts]
     pre_deadline = build_power_schedule(
         deadline_intervals,
         energy_needed_by_deadline_grid_kwh,
@@ -87,6 +96,8 @@ def build_deadline_schedule(
         charge_power_steps_w=charge_power_steps_w,
         grid_import_limit_w=grid_import_limit_w,
         interval_minutes=interval_minutes,
+        prepared=prepared,
+        presorted=presorted,
     )
 
     used_timestamps = {interval["startsAt"] for interval in pre_deadline["intervals"]}
@@ -102,16 +113,18 @@ def build_deadline_schedule(
         charge_power_steps_w=charge_power_steps_w,
         grid_import_limit_w=grid_import_limit_w,
         interval_minutes=interval_minutes,
+        prepared=prepared,
+        presorted=presorted,
     )
 
     combined_intervals = sorted(
         [*pre_deadline["intervals"], *post_deadline["intervals"]],
-        key=_interval_start,
+        key=_interval_epoch,
     )
 
     return {
         "intervals": combined_intervals,
-        "segments": group_intervals_into_segments(combined_intervals),
+        "segments": group_intervals_into_segments(combined_intervals, prepared=prepared),
         "deadline": deadline,
         "pre_deadline": pre_deadline,
         "post_deadline": post_deadline,
@@ -128,8 +141,3 @@ def build_deadline_schedule(
         "allowed_steps": pre_deadline["allowed_steps"],
         "minimum_power_w": pre_deadline["minimum_power_w"],
     }
-
-
-def _interval_start(interval: dict[str, Any]) -> datetime:
-    starts_at = interval["startsAt"]
-    return datetime.fromisoformat(starts_at) if isinstance(starts_at, str) else starts_at
@@ -15,7 +15,7 @@ def calculate_break_even_price(expected_discharge_price: float, round_trip_effic
     return round(expected_discharge_price * round_trip_efficiency, 6)
 
 
-def filter_intervals_by_profitability(
+def profitability_exclusions(
     intervals: list[dict[str, Any]],
     *,
     charging_efficiency: float,
@@ -23,32 +23,77 @@ def filter_intervals_by_profitability(
     expected_discharge_price: float | None = None,
     reserve_for_discharge: bool = False,
     max_cost_per_kwh: float | None = None,
-) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Filter candidate intervals by hard ceiling and optional profitability."""
-    filtered = list(intervals)
-    metadata: dict[str, Any] = {
+) -> tuple[list[str | None], float | None]:
+    """Return per interval why the economic filter drops it, plus the break-even price.
+
+    Reasons are "cost" (above max_cost_per_kwh) and "profitability" (above the
+    break-even price with reserve_for_discharge); None keeps the interval.
+    Each interval is judged on its own, so the result for a subset is the
+    matching subset of the result for the whole range.
+    """
+    break_even_price = None
+    if expected_discharge_price is not None:
+        round_trip_efficiency = calculate_round_trip_efficiency(charging_efficiency, discharging_efficiency)
+        break_even_price = calculate_break_even_price(expected_discharge_price, round_trip_efficiency)
+    profit_ceiling = break_even_price if reserve_for_discharge else None
+
+    exclusions: list[str | None] = []
+    for interval in intervals:
+        price = float(interval["total"])
+        if max_cost_per_kwh is not None and price > max_cost_per_kwh:
+            exclusions.append("cost")
+        elif profit_ceiling is not None and price > profit_ceiling:
+            exclusions.append("profitability")
+        else:
+            exclusions.append(None)
+    return exclusions, break_even_price
+
+
+def build_economics_filter_metadata(
+    exclusions: list[str | None],
+    *,
+    break_even_price: float | None,
+    expected_discharge_price: float | None,
+    reserve_for_discharge: bool,
+    max_cost_per_kwh: float | None,
+) -> dict[str, Any]:
+    """Summarize the exclusions of a candidate set as economics_filter metadata."""
+    return {
         "reserve_for_discharge": reserve_for_discharge,
         "expected_discharge_price": expected_discharge_price,
         "max_cost_per_kwh": max_cost_per_kwh,
-        "break_even_price": None,
-        "filtered_out_by_cost": 0,
-        "filtered_out_by_profitability": 0,
+        "break_even_price": break_even_price,
+        "filtered_out_by_cost": exclusions.count("cost"),
+        "filtered_out_by_profitability": exclusions.count("profitability"),
     }
 
-    if max_cost_per_kwh is not None:
-        before = len(filtered)
-        filtered = [interval for interval in filtered if float(interval["total"]) <= max_cost_per_kwh]
-        metadata["filtered_out_by_cost"] = before - len(filtered)
-
-    if expected_discharge_price is not None:
-        round_trip_efficiency = calculate_round_trip_efficiency(charging_efficiency, discharging_efficiency)
-        break_even_price = calculate_break_even_price(expected_discharge_price, round_trip_efficiency)
-        metadata["break_even_price"] = break_even_price
-        if reserve_for_discharge:
-            before = len(filtered)
-            filtered = [interval for interval in filtered if float(interval["total"]) <= break_even_price]
-            metadata["filtered_out_by_profitability"] = before - len(filtered)
 
+def filter_intervals_by_profitability(
+    intervals: list[dict[str, Any]],
+    *,
+    charging_efficiency: float,
+    discharging_efficiency: float,
+    expected_discharge_price: float | None = None,
+    reserve_for_discharge: bool = False,
+    max_cost_per_kwh: float | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Filter candidate intervals by hard ceiling and optional profitability."""
+    exclusions, break_even_price = profitability_exclusions(
+        intervals,
+        charging_efficiency=charging_efficiency,
+        discharging_efficiency=discharging_efficiency,
+        expected_discharge_price=expected_discharge_price,
+        reserve_for_discharge=reserve_for_discharge,
+        max_cost_per_kwh=max_cost_per_kwh,
+    )
+    filtered = [interval for interval, excluded in zip(intervals, exclusions, strict=True) if excluded is None]
+    metadata = build_economics_filter_metadata(
+        exclusions,
+        break_even_price=break_even_price,
+        expected_discharge_price=expected_discharge_price,
+        reserve_for_discharge=reserve_for_discharge,
+        max_cost_per_kwh=max_cost_per_kwh,
+    )
     return filtered, metadata
 
 
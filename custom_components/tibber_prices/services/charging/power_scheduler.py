@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from itertools import pairwise
 import math
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from custom_components.tibber_prices.utils.interval_time import parse_starts_at, starts_at_epoch
 from custom_components.tibber_prices.utils.price_window import group_intervals_into_segments
 
+if TYPE_CHECKING:
+    from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange
+
 _INTERVAL_TOLERANCE = 1e-9
 
 
@@ -69,8 +73,11 @@ def minimum_operating_power_w(
 
 
 def _interval_start(interval: dict[str, Any]) -> datetime:
-    starts_at = interval["startsAt"]
-    return datetime.fromisoformat(starts_at) if isinstance(starts_at, str) else starts_at
+    return parse_starts_at(interval["startsAt"])
+
+
+def _interval_epoch(interval: dict[str, Any]) -> int:
+    return starts_at_epoch(interval["startsAt"])
 
 
 def _sort_price(interval: dict[str, Any]) -> float:
@@ -136,8 +143,14 @@ def build_power_schedule(
     charge_power_steps_w: list[int] | None = None,
     grid_import_limit_w: int | None = None,
     interval_minutes: int = 15,
+    prepared: TibberPricesPreparedRange | None = None,
+    presorted: bool = False,
 ) -> dict[str, Any]:
-    """Allocate required grid energy across the cheapest candidate intervals."""
+    """Allocate required grid energy across the cheapest candidate intervals.
+
+    With presorted=True the candidates are already ordered by (sort price, start),
+    e.g. by plan_charging, which sorts them once for all relaxation attempts.
+    """
     mode, effective_max_power_w, allowed_steps = determine_power_mode(
         max_charge_power_w=max_charge_power_w,
         min_charge_power_w=min_charge_power_w,
@@ -145,8 +158,10 @@ def build_power_schedule(
         grid_import_limit_w=grid_import_limit_w,
     )
 
-    sorted_candidates = sorted(
-        candidate_intervals, key=lambda interval: (_sort_price(interval), _interval_start(interval))
+    sorted_candidates = (
+        candidate_intervals
+        if presorted
+        else sorted(candidate_intervals, key=lambda interval: (_sort_price(interval), _interval_epoch(interval)))
     )
 
     assignments: list[dict[str, Any]] = []
@@ -173,8 +188,8 @@ def build_power_schedule(
         assignments.append(assignment)
         remaining_grid_energy_kwh = max(0.0, remaining_grid_energy_kwh - assignment["grid_energy_kwh"])
 
-    assignments.sort(key=_interval_start)
-    segments = group_intervals_into_segments(assignments)
+    assignments.sort(key=_interval_epoch)
+    segments = group_intervals_into_segments(assignments, prepared=prepared)
 
     total_grid_energy_kwh = round(sum(interval["grid_energy_kwh"] for interval in assignments), 6)
     total_stored_energy_kwh = round(sum(interval["stored_energy_kwh"] for interval in assignments), 6)
@@ -224,9 +239,10 @@ def _constraints_satisfied(
     max_cycles_per_day: int | None,
     min_charge_duration_minutes: int | None,
     interval_minutes: int,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> bool:
     """Check whether current interval selection satisfies active constraints."""
-    grouped_segments = group_intervals_into_segments(intervals)
+    grouped_segments = group_intervals_into_segments(intervals, prepared=prepared)
 
     if max_cycles_per_day and len(grouped_segments) > max_cycles_per_day:
         return False
@@ -250,15 +266,17 @@ def _extend_for_min_duration(
     interval_minutes: int,
     min_charge_duration_minutes: int,
     warnings: list[str],
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> None:
     """Extend short segments by adding contiguous neighbor intervals."""
     required_intervals = max(1, math.ceil(min_charge_duration_minutes / interval_minutes))
+    interval_seconds = interval_minutes * 60
     progress = True
 
     while progress:
         progress = False
-        selected_intervals = sorted(selected_map.values(), key=_interval_start)
-        segments = group_intervals_into_segments(selected_intervals)
+        selected_intervals = sorted(selected_map.values(), key=_interval_epoch)
+        segments = group_intervals_into_segments(selected_intervals, prepared=prepared)
 
         for segment in segments:
             if segment["interval_count"] >= required_intervals:
@@ -276,16 +294,14 @@ def _extend_for_min_duration(
                 options: list[dict[str, Any]] = []
                 if (
                     prev_interval is not None
-                    and _interval_start(candidate_map[first]) - _interval_start(prev_interval)
-                    == timedelta(minutes=interval_minutes)
+                    and _interval_epoch(candidate_map[first]) - _interval_epoch(prev_interval) == interval_seconds
                     and prev_interval["startsAt"] not in selected_map
                 ):
                     options.append(prev_interval)
 
                 if (
                     next_interval is not None
-                    and _interval_start(next_interval) - _interval_start(candidate_map[last])
-                    == timedelta(minutes=interval_minutes)
+                    and _interval_epoch(next_interval) - _interval_epoch(candidate_map[last]) == interval_seconds
                     and next_interval["startsAt"] not in selected_map
                 ):
                     options.append(next_interval)
@@ -294,7 +310,7 @@ def _extend_for_min_duration(
                     warnings.append("min_charge_duration_unreachable")
                     break
 
-                cheapest = min(options, key=lambda interval: (_sort_price(interval), _interval_start(interval)))
+                cheapest = min(options, key=lambda interval: (_sort_price(interval), _interval_epoch(interval)))
                 added = _add_interval_if_available(
                     selected_map,
                     candidate_map,
@@ -307,10 +323,10 @@ def _extend_for_min_duration(
                     break
 
                 progress = True
-                selected_intervals = sorted(selected_map.values(), key=_interval_start)
+                selected_intervals = sorted(selected_map.values(), key=_interval_epoch)
                 segment = next(
                     seg
-                    for seg in group_intervals_into_segments(selected_intervals)
+                    for seg in group_intervals_into_segments(selected_intervals, prepared=prepared)
                     if first in {iv["startsAt"] for iv in seg["intervals"]}
                 )
 
@@ -326,11 +342,12 @@ def _merge_for_max_cycles(
     interval_minutes: int,
     max_cycles_per_day: int,
     warnings: list[str],
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> None:
     """Bridge cheapest gaps until the cycle limit is satisfied."""
     while True:
-        selected_intervals = sorted(selected_map.values(), key=_interval_start)
-        segments = group_intervals_into_segments(selected_intervals)
+        selected_intervals = sorted(selected_map.values(), key=_interval_epoch)
+        segments = group_intervals_into_segments(selected_intervals, prepared=prepared)
         if len(segments) <= max_cycles_per_day:
             break
 
@@ -345,7 +362,7 @@ def _merge_for_max_cycles(
             if any(interval["startsAt"] in selected_map for interval in gap):
                 continue
             if any(
-                _interval_start(gap[index + 1]) - _interval_start(gap[index]) != timedelta(minutes=interval_minutes)
+                _interval_epoch(gap[index + 1]) - _interval_epoch(gap[index]) != interval_minutes * 60
                 for index in range(len(gap) - 1)
             ):
                 continue
@@ -378,10 +395,11 @@ def _collect_removable_edge_indices(
     min_charge_duration_minutes: int | None,
     interval_minutes: int,
     protected_starts: frozenset[str] | None,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> list[int]:
     """Return edge interval indices that can be removed while keeping constraints valid."""
     removable_indices: list[int] = []
-    segments = group_intervals_into_segments(selected_intervals)
+    segments = group_intervals_into_segments(selected_intervals, prepared=prepared)
 
     for segment in segments:
         first_start = segment["intervals"][0]["startsAt"]
@@ -411,6 +429,7 @@ def _collect_removable_edge_indices(
                 max_cycles_per_day=max_cycles_per_day,
                 min_charge_duration_minutes=min_charge_duration_minutes,
                 interval_minutes=interval_minutes,
+                prepared=prepared,
             ):
                 continue
 
@@ -427,6 +446,7 @@ def _trim_to_target_energy(
     min_charge_duration_minutes: int | None,
     interval_minutes: int,
     protected_starts: frozenset[str] | None = None,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> dict[str, dict[str, Any]]:
     """Trim excess energy from selection by removing expensive edge intervals first.
 
@@ -434,7 +454,7 @@ def _trim_to_target_energy(
     required to satisfy a ``must_reach_by`` deadline) are never removed, even if that means
     the target energy cannot be fully reached through trimming alone.
     """
-    selected_intervals = sorted(selected_map.values(), key=_interval_start)
+    selected_intervals = sorted(selected_map.values(), key=_interval_epoch)
     total_grid_energy = sum(float(interval["grid_energy_kwh"]) for interval in selected_intervals)
 
     while selected_intervals and total_grid_energy > target_grid_energy_kwh + _INTERVAL_TOLERANCE:
@@ -446,6 +466,7 @@ def _trim_to_target_energy(
             min_charge_duration_minutes=min_charge_duration_minutes,
             interval_minutes=interval_minutes,
             protected_starts=protected_starts,
+            prepared=prepared,
         )
         if not removable_indices:
             break
@@ -467,16 +488,19 @@ def apply_segment_constraints(
     target_grid_energy_kwh: float | None = None,
     protected_starts: frozenset[str] | None = None,
     interval_minutes: int = 15,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> tuple[dict[str, Any], list[str]]:
     """Extend/bridge selected intervals to satisfy segment duration and cycle constraints.
 
     ``protected_starts`` marks intervals (by ``startsAt``) that must never be removed while
     trimming to ``target_grid_energy_kwh``, e.g. intervals required to meet a deadline.
+    ``prepared`` is the prepared search range; segment grouping in the repair loops
+    then looks timestamps up instead of parsing them.
     """
     warnings: list[str] = []
     selected_map = {interval["startsAt"]: dict(interval) for interval in schedule["intervals"]}
     candidate_map = {interval["startsAt"]: interval for interval in candidate_intervals}
-    candidates_sorted = sorted(candidate_intervals, key=_interval_start)
+    candidates_sorted = sorted(candidate_intervals, key=_interval_epoch)
     candidate_index = {interval["startsAt"]: index for index, interval in enumerate(candidates_sorted)}
     minimum_power_w = int(schedule["minimum_power_w"])
 
@@ -491,6 +515,7 @@ def apply_segment_constraints(
             interval_minutes=interval_minutes,
             min_charge_duration_minutes=min_charge_duration_minutes,
             warnings=warnings,
+            prepared=prepared,
         )
 
     if max_cycles_per_day:
@@ -504,6 +529,7 @@ def apply_segment_constraints(
             interval_minutes=interval_minutes,
             max_cycles_per_day=max_cycles_per_day,
             warnings=warnings,
+            prepared=prepared,
         )
 
     if target_grid_energy_kwh is not None:
@@ -514,10 +540,11 @@ def apply_segment_constraints(
             min_charge_duration_minutes=min_charge_duration_minutes,
             interval_minutes=interval_minutes,
             protected_starts=protected_starts,
+            prepared=prepared,
         )
 
-    selected_intervals = sorted(selected_map.values(), key=_interval_start)
-    segments = group_intervals_into_segments(selected_intervals)
+    selected_intervals = sorted(selected_map.values(), key=_interval_epoch)
+    segments = group_intervals_into_segments(selected_intervals, prepared=prepared)
     schedule["intervals"] = selected_intervals
     schedule["segments"] = segments
     schedule["total_grid_energy_kwh"] = round(sum(interval["grid_energy_kwh"] for interval in selected_intervals), 6)
@@ -170,8 +170,9 @@ def _clear_intervals_from_coordinator(
         if starts_at_dt < start_dt or starts_at_dt >= end_dt:
             filtered.append(interval)
 
-    # Update coordinator.data in place
-    coordinator.data["priceInfo"] = filtered
+    # Replace coordinator.data instead of mutating it: the tick context and the
+    # response cache detect new data by identity (see coordinator/tick_context.py)
+    coordinator.data = {**coordinator.data, "priceInfo": filtered}
 
     removed_count = original_count - len(filtered)
     _LOGGER.debug(
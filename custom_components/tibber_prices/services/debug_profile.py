@@ -0,0 +1,362 @@
+"""
+Admin service to profile the integration on a live instance.
+
+Runs a number of full transformation cycles (enrichment, day patterns, best/peak
+periods) and timer ticks (Timer #2 quarter-hour and Timer #3 minute fan-out) of
+one config entry under cProfile and tracemalloc, and returns the hottest
+functions and the largest allocation sites as the service response.
+
+Unlike debug_clear_tomorrow this service is registered in production as well,
+so a profile can be taken on the system of a user reporting a sluggish Home
+Assistant. Only admin users may call it.
+
+Usage:
+    service: tibber_prices.debug_profile
+    data:
+      cycles: 5
+      ticks: 20
+      top: 25
+
+Notes:
+- The transformation cycles run in an executor thread, so tracemalloc's
+  overhead does not stall the event loop. They use a separate data transformer
+  and period calculator wired to the same config and overrides, so the
+  coordinator's caches are left alone. Their results are discarded;
+  coordinator data is not replaced. On Python 3.12+ cProfile sees all threads,
+  so work Home Assistant does on the event loop meanwhile can show up too.
+- Ticks are real Timer #2/#3 fan-outs at the current time and run on the event
+  loop afterwards, which they block for their duration: they write entity
+  states like a regular tick would at this moment (unchanged states are not
+  written). The coordinator's TimeService, tick context and tick statistics
+  are restored afterwards. Their number is capped lower than the cycles'.
+- Allocation sites are ranked by the memory allocated during the run that is
+  still alive at its end. peak_kib covers the transient allocations as well.
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import cProfile
+import logging
+from pathlib import PurePath
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from custom_components.tibber_prices.const import DOMAIN
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
+from homeassistant.exceptions import Unauthorized, UnknownUser
+
+if TYPE_CHECKING:
+    from custom_components.tibber_prices.coordinator import TibberPricesDataUpdateCoordinator
+    from homeassistant.core import ServiceCall, ServiceResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+DEBUG_PROFILE_SERVICE_NAME = "debug_profile"
+
+# Upper bounds keep a single call short; only the ticks block the event loop
+MAX_PROFILE_CYCLES = 50
+MAX_PROFILE_TICKS = 100
+MAX_PROFILE_TOP = 100
+
+DEBUG_PROFILE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id"): str,
+        vol.Optional("cycles", default=5): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)),
+        vol.Optional("ticks", default=20): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_PROFILE_TICKS)),
+        vol.Optional("top", default=25): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_TOP)),
+    }
+)
+
+# Frames that only show up because of the measurement itself
+_IGNORED_ALLOCATION_FILES = ("tracemalloc.py", "cProfile.py", "pstats.py", "<frozen importlib._bootstrap>")
+
+
+class _ProfilerBusyError(Exception):
+    """Another profiler (e.g. the profiler integration) is already running."""
+
+
+async def handle_debug_profile(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the debug_profile service call.
+
+    Raises:
+        UnknownUser: If the calling user does not exist.
+        Unauthorized: If the calling user is not an admin.
+
+    Returns:
+        Dict with the run parameters, the top functions by cumulative time and
+        the top allocation sites, or success=False with an error message.
+
+    """
+    hass = call.hass
+
+    # Same check as homeassistant.helpers.service.async_register_admin_service,
+    # which does not support service responses
+    if call.context.user_id:
+        user = await hass.auth.async_get_user(call.context.user_id)
+        if user is None:
+            raise UnknownUser(context=call.context)
+        if not user.is_admin:
+            raise Unauthorized(context=call.context)
+
+    entry_id = call.data.get("entry_id")
+    entries = hass.config_entries.async_entries(DOMAIN)
+    entry = next((e for e in entries if e.entry_id == entry_id), None) if entry_id else next(iter(entries), None)
+
+    if not entry or not hasattr(entry, "runtime_data") or not entry.runtime_data:
+        return {"success": False, "error": "No valid config entry found"}
+
+    coordinator: TibberPricesDataUpdateCoordinator = entry.runtime_data.coordinator
+    if not coordinator.data or not coordinator.data.get("priceInfo"):
+        return {"success": False, "error": "No price data loaded yet"}
+
+    cycles: int = call.data["cycles"]
+    ticks: int = call.data["ticks"]
+    top: int = call.data["top"]
+
+    transformer, calculator = _build_profile_transformer(coordinator)
+    raw_data = coordinator._apply_tomorrow_realism(  # noqa: SLF001
+        {
+            "price_info": coordinator.data["priceInfo"],
+            "currency": coordinator.data.get("currency", "EUR"),
+            "home_id": coordinator.data.get("home_id"),
+        }
+    )
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    profiler = cProfile.Profile()
+
+    started = time.perf_counter()
+    try:
+        await hass.async_add_executor_job(
+            _run_profiled, profiler, _run_cycles, transformer, calculator, raw_data, cycles
+        )
+        _run_profiled(profiler, _run_ticks, coordinator, ticks)
+    except _ProfilerBusyError as err:
+        return {"success": False, "error": str(err)}
+    finally:
+        duration_ms = (time.perf_counter() - started) * 1000
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if started_tracing:
+            tracemalloc.stop()
+
+    result: dict[str, Any] = {
+        "success": True,
+        "entry_id": entry.entry_id,
+        "cycles": cycles,
+        "ticks": ticks,
+        "duration_ms": round(duration_ms, 1),
+        "top_functions": _top_functions(profiler, top),
+        "memory": {
+            "retained_kib": round((current - baseline) / 1024, 1),
+            "peak_kib": round((peak - baseline) / 1024, 1),
+            "top_allocations": _top_allocations(before, after, top),
+        },
+    }
+
+    _LOGGER.info(
+        "DEBUG: Profiled %d transformation cycles and %d ticks in %.1f ms",
+        cycles,
+        ticks,
+        duration_ms,
+    )
+
+    return result
+
+
+def _run_profiled[**P](profiler: cProfile.Profile, func: Callable[P, None], *args: P.args, **kwargs: P.kwargs) -> None:
+    """
+    Run a function with the profiler enabled.
+
+    Raises:
+        _ProfilerBusyError: If another profiler is already active.
+
+    """
+    try:
+        profiler.enable()
+    except ValueError as err:
+        raise _ProfilerBusyError(str(err)) from err
+    try:
+        func(*args, **kwargs)
+    finally:
+        profiler.disable()
+
+
+def _run_cycles(
+    transformer: TibberPricesDataTransformer,
+    calculator: TibberPricesPeriodCalculator,
+    raw_data: dict[str, Any],
+    cycles: int,
+) -> None:
+    """
+    Run full transformation cycles on the coordinator's current data (in an executor thread).
+
+    Each cycle drops the caches of the profiling transformer first, so it does
+    the work of a data update with new prices (without the API call).
+
+    Args:
+        transformer: Profiling transformer (see _build_profile_transformer).
+        calculator: Period calculator of the profiling transformer.
+        raw_data: Price data of the coordinator in raw form.
+        cycles: Number of transformation cycles.
+
+    """
+    for _ in range(cycles):
+        transformer.invalidate_config_cache()
+        calculator.invalidate_config_cache()
+        transformer.transform_data(raw_data)
+
+
+def _run_ticks(coordinator: TibberPricesDataUpdateCoordinator, ticks: int) -> None:
+    """
+    Run Timer #2 and Timer #3 fan-outs at the current time (on the event loop).
+
+    Args:
+        coordinator: Coordinator of the profiled entry.
+        ticks: Number of fan-outs.
+
+    """
+    with _preserved_tick_state(coordinator):
+        for _ in range(ticks):
+            time_service = coordinator._create_time_service()  # noqa: SLF001
+            coordinator._async_update_time_sensitive_listeners(time_service)  # noqa: SLF001
+            coordinator._async_update_minute_listeners(time_service)  # noqa: SLF001
+
+
+def _build_profile_transformer(
+    coordinator: TibberPricesDataUpdateCoordinator,
+) -> tuple[TibberPricesDataTransformer, TibberPricesPeriodCalculator]:
+    """
+    Create a data transformer and period calculator wired like the coordinator's.
+
+    They read the same config entry and runtime overrides and use the
+    coordinator's current TimeService, but keep their own caches and stage
+    timings, so profiling neither replaces nor invalidates the coordinator's.
+
+    Returns:
+        Tuple of (transformer, period calculator).
+
+    """
+    log_prefix = f"{coordinator._log_prefix} [profile]"  # noqa: SLF001
+    calculator = TibberPricesPeriodCalculator(
+        config_entry=coordinator.config_entry,
+        log_prefix=log_prefix,
+        get_config_override_fn=coordinator.get_config_override,
+    )
+    calculator.time = coordinator.time
+    transformer = TibberPricesDataTransformer(
+        config_entry=coordinator.config_entry,
+        log_prefix=log_prefix,
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=coordinator.time,
+        get_active_overrides_fn=coordinator.get_active_overrides,
+    )
+    return transformer, calculator
+
+
+@contextmanager
+def _preserved_tick_state(coordinator: TibberPricesDataUpdateCoordinator) -> Iterator[None]:
+    """Restore the coordinator's tick bookkeeping after the profiling ticks."""
+    listener_manager = coordinator._listener_manager  # noqa: SLF001
+    saved_time = coordinator.time
+    saved_context = coordinator._tick_context  # noqa: SLF001
+    saved_timings = listener_manager.stage_timings
+    saved_stats = (
+        listener_manager.last_tick_writes,
+        listener_manager.entities_evaluated_total,
+        listener_manager.entities_written_total,
+    )
+    # Keep the profiling ticks out of the fan-out timings shown in diagnostics
+    listener_manager.stage_timings = TibberPricesStageTimings()
+    try:
+        yield
+    finally:
+        coordinator.time = saved_time
+        coordinator._tick_context = saved_context  # noqa: SLF001
+        listener_manager.stage_timings = saved_timings
+        (
+            listener_manager.last_tick_writes,
+            listener_manager.entities_evaluated_total,
+            listener_manager.entities_written_total,
+        ) = saved_stats
+
+
+def _short_path(filename: str) -> str:
+    """Shorten a source path to the part below custom_components or site-packages."""
+    parts = PurePath(filename).parts
+    for anchor in ("custom_components", "site-packages"):
+        if anchor in parts:
+            return "/".join(parts[parts.index(anchor) + 1 :])
+    return "/".join(parts[-2:])
+
+
+def _top_functions(profiler: cProfile.Profile, top: int) -> list[dict[str, Any]]:
+    """
+    Return the functions with the highest cumulative time.
+
+    Args:
+        profiler: Profiler of the run (disabled).
+        top: Number of functions to return.
+
+    Returns:
+        List of functions, slowest first. Times are in milliseconds; own_ms
+        excludes the time spent in called functions.
+
+    """
+    entries = sorted(profiler.getstats(), key=lambda entry: entry.totaltime, reverse=True)
+    return [
+        {
+            # Built-in functions have a description instead of a code object
+            "function": entry.code
+            if isinstance(entry.code, str)
+            else f"{_short_path(entry.code.co_filename)}:{entry.code.co_firstlineno}({entry.code.co_name})",
+            "calls": entry.callcount,
+            "own_ms": round(entry.inlinetime * 1000, 3),
+            "cumulative_ms": round(entry.totaltime * 1000, 3),
+        }
+        for entry in entries[:top]
+    ]
+
+
+def _top_allocations(
+    before: tracemalloc.Snapshot,
+    after: tracemalloc.Snapshot,
+    top: int,
+) -> list[dict[str, Any]]:
+    """
+    Return the source lines that gained the most memory during the run.
+
+    Args:
+        before: tracemalloc snapshot taken before the run.
+        after: tracemalloc snapshot taken at the end of the run.
+        top: Number of allocation sites to return.
+
+    Returns:
+        List of allocation sites, largest growth first.
+
+    """
+    ignored = [tracemalloc.Filter(inclusive=False, filename_pattern=f"*{name}") for name in _IGNORED_ALLOCATION_FILES]
+    differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+    return [
+        {
+            "site": f"{_short_path(stat.traceback[0].filename)}:{stat.traceback[0].lineno}",
+            "size_kib": round(stat.size_diff / 1024, 1),
+            "count": stat.count_diff,
+        }
+        for stat in differences[:top]
+        if stat.size_diff > 0
+    ]
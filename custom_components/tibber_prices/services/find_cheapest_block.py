@@ -8,6 +8,7 @@ machine, dryer).
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, time as dt_time, timedelta
 import logging
 import math
@@ -17,6 +18,7 @@ import voluptuous as vol
 
 from custom_components.tibber_prices.const import DOMAIN, get_display_unit_factor, get_display_unit_string
 from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
     calculate_window_statistics,
     find_cheapest_contiguous_window,
 )
@@ -43,6 +45,7 @@ from .helpers import (
     validate_power_profile_length,
     validate_price_level_range,
     validate_search_params,
+    validate_unique_device_names,
 )
 from .relaxation import (
     MIN_RELAXED_DURATION_INTERVALS,
@@ -58,6 +61,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 FIND_CHEAPEST_BLOCK_SERVICE_NAME = "find_cheapest_block"
+FIND_CHEAPEST_BLOCK_BATCH_SERVICE_NAME = "find_cheapest_block_batch"
 
 # Parameter types for entity reference resolution (param_name → expected Python type)
 COMMON_BLOCK_ENTITY_PARAMS: dict[str, type] = {
@@ -120,6 +124,40 @@ _COMMON_BLOCK_SCHEMA = {
 
 FIND_CHEAPEST_BLOCK_SERVICE_SCHEMA = vol.Schema(_COMMON_BLOCK_SCHEMA)
 
+# Parameters shared by all devices of a batch call (search range and output)
+_BLOCK_BATCH_SHARED_KEYS = frozenset(
+    {
+        "entry_id",
+        "view_id",
+        "search_start",
+        "search_end",
+        "search_start_time",
+        "search_start_day_offset",
+        "search_end_time",
+        "search_end_day_offset",
+        "search_start_offset_minutes",
+        "search_end_offset_minutes",
+        "search_scope",
+        "include_current_interval",
+        "must_finish_by",
+        "use_base_unit",
+    }
+)
+
+_BLOCK_DEVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        **{key: value for key, value in _COMMON_BLOCK_SCHEMA.items() if str(key) not in _BLOCK_BATCH_SHARED_KEYS},
+    }
+)
+
+FIND_CHEAPEST_BLOCK_BATCH_SERVICE_SCHEMA = vol.Schema(
+    {
+        **{key: value for key, value in _COMMON_BLOCK_SCHEMA.items() if str(key) in _BLOCK_BATCH_SHARED_KEYS},
+        vol.Required("devices"): vol.All([_BLOCK_DEVICE_SCHEMA], vol.Length(min=1, max=50)),
+    }
+)
+
 
 def _compute_price_comparison(
     comparison_result: dict | None,
@@ -194,23 +232,32 @@ def _attempt_find_block(
     min_distance_from_avg: float | None,
     power_profile: list[int] | None,
     reverse: bool,
+    prepared: TibberPricesPreparedRange | None = None,
+    search_cache: dict[tuple[str | None, str | None, bool], tuple[list[dict], list[dict]]] | None = None,
 ) -> tuple[dict | None, str]:
     """Attempt to find a block with specific filter parameters.
 
+    `prepared` is the prepared search range of price_info; filtered and smoothed
+    subsets reuse its parsed timestamps. `search_cache` keeps the filtered and
+    smoothed intervals per level filter for the other requests of a batch call.
+
     Returns:
         (result_dict, "") on success or (None, reason_code) on failure.
 
     """
     level_filter_active = min_price_level is not None or max_price_level is not None
-    filtered = filter_intervals_by_price_level(price_info, min_price_level, max_price_level)
-
-    if smooth_outliers and filtered:
-        search_data = smooth_service_intervals(filtered)
+    cache_key = (min_price_level, max_price_level, smooth_outliers)
+    cached = search_cache.get(cache_key) if search_cache is not None else None
+    if cached is not None:
+        filtered, search_data = cached
     else:
-        search_data = filtered
+        filtered = filter_intervals_by_price_level(price_info, min_price_level, max_price_level)
+        search_data = smooth_service_intervals(filtered) if smooth_outliers and filtered else filtered
+        if search_cache is not None:
+            search_cache[cache_key] = (filtered, search_data)
 
     result = find_cheapest_contiguous_window(
-        search_data, duration_intervals, reverse=reverse, power_profile=power_profile
+        search_data, duration_intervals, reverse=reverse, power_profile=power_profile, prepared=prepared
     )
 
     if result is None:
@@ -234,144 +281,107 @@ def _attempt_find_block(
     return result, ""
 
 
-async def _handle_find_block(
-    call: ServiceCall,
-    *,
-    reverse: bool = False,
-) -> ServiceResponse:
-    """
-    Core handler for finding price blocks (cheapest or most expensive).
-
-    Finds the cheapest/most expensive contiguous window of the requested
-    duration within the search range using a sliding window algorithm.
-    """
-    service_label = "find_most_expensive_block" if reverse else "find_cheapest_block"
-    hass: HomeAssistant = call.hass
-
-    # Resolve entity references (e.g., "input_number.wash_duration" → 90 minutes)
-    data, resolved_refs = resolve_entity_references(hass, call.data, COMMON_BLOCK_ENTITY_PARAMS)
-
-    entry_id: str = data.get("entry_id", "")
-    view_device_id: str = data.get("view_id", "")
+@dataclass(frozen=True)
+class _BlockRequest:
+    """Validated inputs of one block request (one appliance)."""
+
+    duration_minutes_requested: int
+    duration_intervals: int
+    max_price_level: str | None
+    min_price_level: str | None
+    include_comparison_details: bool
+    power_profile: list[int] | None
+    smooth_outliers: bool
+    min_distance_from_avg: float | None
+    allow_relaxation: bool
+    duration_flexibility_minutes: int | None
+
+
+@dataclass(frozen=True)
+class _BlockSearch:
+    """Fetched prices and output settings shared by every request of one service call."""
+
+    price_info: list[dict]
+    prepared: TibberPricesPreparedRange
+    now: datetime
+    unit_factor: int
+    price_unit: str
+    rating_lookup: dict[str, str | None]
+    reverse: bool
+    service_label: str
+    # Filtered/smoothed intervals per level filter, shared by relaxation attempts and batch requests
+    search_cache: dict[tuple[str | None, str | None, bool], tuple[list[dict], list[dict]]] = field(default_factory=dict)
+
+
+def _parse_block_request(data: dict[str, Any]) -> _BlockRequest:
+    """Validate the duration and search inputs of one request."""
     duration_td: timedelta = data["duration"]
-    use_base_unit: bool = data.get("use_base_unit", False)
-    max_price_level: str | None = data.get("max_price_level")
-    min_price_level: str | None = data.get("min_price_level")
-    include_comparison_details: bool = data.get("include_comparison_details", False)
-    power_profile: list[int] | None = data.get("power_profile")
-    smooth_outliers: bool = data.get("smooth_outliers", True)
-    min_distance_from_avg: float | None = data.get("min_distance_from_avg")
-    allow_relaxation: bool = data.get("allow_relaxation", True)
-    duration_flexibility_minutes: int | None = data.get("duration_flexibility_minutes")
-
     duration_minutes_requested = int(duration_td.total_seconds() / 60)
     # Round up to nearest quarter-hour interval
     duration_minutes = math.ceil(duration_minutes_requested / INTERVAL_MINUTES) * INTERVAL_MINUTES
-
-    # Note: rebind to coordinator_data — `data` (the resolved service call
-    # data) is still needed below for validate_search_params() and
-    # apply_must_finish_by(), which read search-range parameters from it.
-    target = resolve_service_target(hass, entry_id, view_device_id)
-    entry = target.entry
-    coordinator = target.coordinator
-    coordinator_data = target.data
-    rating_lookup = build_rating_lookup(coordinator_data)
-
-    home_id = entry.data.get("home_id")
-    if not home_id:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="missing_home_id",
-        )
-
-    # Resolve timezone
-    home_timezone = resolve_home_timezone(coordinator, home_id)
-    home_tz: ZoneInfo
-    from zoneinfo import ZoneInfo  # noqa: PLC0415
-
-    home_tz = ZoneInfo(home_timezone)
-
-    # Handle must_finish_by: convert deadline to search_end
-    validate_search_params(data)
-    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
-
-    # Resolve search range (priority: explicit datetime > time+offset > minutes offset > default)
-    now = target.now(home_tz)
-    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
-
     duration_intervals = duration_minutes // INTERVAL_MINUTES
+    max_price_level: str | None = data.get("max_price_level")
+    min_price_level: str | None = data.get("min_price_level")
+    power_profile: list[int] | None = data.get("power_profile")
 
     # Validate parameter combinations
     validate_price_level_range(min_price_level, max_price_level)
     validate_power_profile_length(power_profile, duration_intervals)
 
-    _LOGGER.info(
-        "%s called: duration=%dmin, range=%s to %s",
-        service_label,
-        duration_minutes,
-        search_start,
-        search_end,
+    return _BlockRequest(
+        duration_minutes_requested=duration_minutes_requested,
+        duration_intervals=duration_intervals,
+        max_price_level=max_price_level,
+        min_price_level=min_price_level,
+        include_comparison_details=data.get("include_comparison_details", False),
+        power_profile=power_profile,
+        smooth_outliers=data.get("smooth_outliers", True),
+        min_distance_from_avg=data.get("min_distance_from_avg"),
+        allow_relaxation=data.get("allow_relaxation", True),
+        duration_flexibility_minutes=data.get("duration_flexibility_minutes"),
     )
 
-    # Fetch intervals via pool
-    api_client = coordinator.api
-    user_data = coordinator._cached_user_data  # noqa: SLF001
-    pool = target.interval_pool
 
-    price_info, fetch_ok = await async_fetch_service_intervals(
-        pool,
-        api_client=api_client,
-        user_data=user_data,
-        start_time=search_start,
-        end_time=search_end,
-        service_label=service_label,
-    )
+def _find_block_body(request: _BlockRequest, search: _BlockSearch) -> dict[str, Any]:
+    """
+    Find the block of one request in the fetched prices and build its response body.
 
-    # Determine currency and unit
-    currency = entry.data.get("currency", "EUR")
-    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
-    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+    Args:
+        request: Validated request inputs.
+        search: Prices and output settings shared by the service call.
 
-    if not fetch_ok:
-        # Price data unavailable (API outage on uncached range). Return a well-formed
-        # empty response with success=False so automations can detect this directly.
-        unavailable: dict[str, Any] = {
-            "success": False,
-            "reason": "price_data_unavailable",
-            "home_id": home_id,
-            "search_start": search_start.isoformat(),
-            "search_end": search_end.isoformat(),
-            "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
-            "duration_minutes_requested": duration_minutes_requested,
-            "duration_minutes": duration_minutes_requested,
-            "currency": currency,
-            "price_unit": price_unit,
-            "window_found": False,
-            "relaxation_applied": False,
-            "window": None,
-        }
-        if resolved_refs:
-            unavailable["_resolved"] = resolved_refs
-        return unavailable
+    Returns:
+        Response keys of the request (duration, window, price comparison, ...).
+
+    """
+    service_label = search.service_label
+    reverse = search.reverse
+    price_info = search.price_info
+    prepared = search.prepared
+    unit_factor = search.unit_factor
+    duration_intervals = request.duration_intervals
+    power_profile = request.power_profile
 
     # --- Attempt with original parameters ---
     effective_duration = duration_intervals
     result, reason = _attempt_find_block(
         price_info,
-        max_price_level=max_price_level,
-        min_price_level=min_price_level,
+        max_price_level=request.max_price_level,
+        min_price_level=request.min_price_level,
         duration_intervals=effective_duration,
-        smooth_outliers=smooth_outliers,
-        min_distance_from_avg=min_distance_from_avg,
+        smooth_outliers=request.smooth_outliers,
+        min_distance_from_avg=request.min_distance_from_avg,
         power_profile=power_profile,
         reverse=reverse,
+        prepared=prepared,
+        search_cache=search.search_cache,
     )
 
     relaxation_applied = False
     relaxation_steps = 0
 
     # --- Relaxation loop ---
-    if result is None and allow_relaxation:
+    if result is None and request.allow_relaxation:
         # A power_profile is a fixed per-interval watt array matching the original
         # requested duration. Reducing duration during relaxation would silently
         # truncate it (dropping trailing phases of the appliance cycle) and
@@ -381,12 +391,12 @@ async def _handle_find_block(
         max_reduction = (
             0
             if power_profile
-            else calculate_max_duration_reduction_intervals(duration_intervals, duration_flexibility_minutes)
+            else calculate_max_duration_reduction_intervals(duration_intervals, request.duration_flexibility_minutes)
         )
         steps = generate_relaxation_steps(
-            min_distance_from_avg=min_distance_from_avg,
-            max_price_level=max_price_level,
-            min_price_level=min_price_level,
+            min_distance_from_avg=request.min_distance_from_avg,
+            max_price_level=request.max_price_level,
+            min_price_level=request.min_price_level,
             total_intervals=duration_intervals,
             min_duration_intervals=MIN_RELAXED_DURATION_INTERVALS,
             max_duration_reduction_intervals=max_reduction,
@@ -399,10 +409,12 @@ async def _handle_find_block(
                 max_price_level=step.max_price_level,
                 min_price_level=step.min_price_level,
                 duration_intervals=effective_duration,
-                smooth_outliers=smooth_outliers,
+                smooth_outliers=request.smooth_outliers,
                 min_distance_from_avg=step.min_distance_from_avg,
                 power_profile=power_profile,
                 reverse=reverse,
+                prepared=prepared,
+                search_cache=search.search_cache,
             )
             if result is not None:
                 relaxation_applied = True
@@ -427,33 +439,24 @@ async def _handle_find_block(
             effective_duration,
             len(price_info),
         )
-        response: dict[str, Any] = {
-            "success": True,
-            "home_id": home_id,
-            "search_start": search_start.isoformat(),
-            "search_end": search_end.isoformat(),
-            "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
-            "duration_minutes_requested": duration_minutes_requested,
+        body: dict[str, Any] = {
+            "duration_minutes_requested": request.duration_minutes_requested,
             "duration_minutes": effective_duration * INTERVAL_MINUTES,
-            "currency": currency,
-            "price_unit": price_unit,
             "window_found": False,
             "reason": reason,
             "relaxation_applied": relaxation_applied,
             "window": None,
         }
         if relaxation_applied:
-            response["relaxation_steps"] = relaxation_steps
-        if resolved_refs:
-            response["_resolved"] = resolved_refs
-        return response
+            body["relaxation_steps"] = relaxation_steps
+        return body
 
     # Effective duration may differ from original if relaxation reduced it
     effective_duration_minutes = effective_duration * INTERVAL_MINUTES
 
     # Find the opposite-direction window for price comparison (from full unfiltered list)
     comparison_result = find_cheapest_contiguous_window(
-        price_info, effective_duration, reverse=not reverse, power_profile=power_profile
+        price_info, effective_duration, reverse=not reverse, power_profile=power_profile, prepared=prepared
     )
 
     # Calculate statistics and build response
@@ -463,11 +466,11 @@ async def _handle_find_block(
 
     # Calculate price comparison (difference to opposite-direction window)
     price_comparison = _compute_price_comparison(
-        comparison_result, unit_factor, stats, reverse=reverse, include_details=include_comparison_details
+        comparison_result, unit_factor, stats, reverse=reverse, include_details=request.include_comparison_details
     )
 
     # Build interval list with converted prices
-    response_intervals = [build_response_interval(iv, unit_factor, rating_lookup) for iv in result["intervals"]]
+    response_intervals = [build_response_interval(iv, unit_factor, search.rating_lookup) for iv in result["intervals"]]
 
     # Calculate end time (last interval start + 15 min)
     last_start = result["intervals"][-1]["startsAt"]
@@ -483,20 +486,13 @@ async def _handle_find_block(
         else result["intervals"][0]["startsAt"].isoformat()
     )
     window_start_dt = datetime.fromisoformat(window_start_str)
-    seconds_until_start = max(0, int((window_start_dt - now).total_seconds()))
+    seconds_until_start = max(0, int((window_start_dt - search.now).total_seconds()))
     end_time_dt = end_time if isinstance(end_time, datetime) else datetime.fromisoformat(end_time)
-    seconds_until_end = max(0, int((end_time_dt - now).total_seconds()))
+    seconds_until_end = max(0, int((end_time_dt - search.now).total_seconds()))
 
-    response = {
-        "success": True,
-        "home_id": home_id,
-        "search_start": search_start.isoformat(),
-        "search_end": search_end.isoformat(),
-        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
-        "duration_minutes_requested": duration_minutes_requested,
+    body = {
+        "duration_minutes_requested": request.duration_minutes_requested,
         "duration_minutes": effective_duration_minutes,
-        "currency": currency,
-        "price_unit": price_unit,
         "window_found": True,
         "relaxation_applied": relaxation_applied,
         "window": {
@@ -512,21 +508,263 @@ async def _handle_find_block(
         "price_comparison": price_comparison or None,
     }
     if relaxation_applied:
-        response["relaxation_steps"] = relaxation_steps
-    if resolved_refs:
-        response["_resolved"] = resolved_refs
+        body["relaxation_steps"] = relaxation_steps
 
     _LOGGER.info(
         "%s: found window at %s, mean=%.4f %s",
         service_label,
-        response["window"]["start"],
+        body["window"]["start"],
         stats.get("price_mean", 0) or 0,
-        price_unit,
+        search.price_unit,
+    )
+
+    return body
+
+
+def _unavailable_block_body(request: _BlockRequest) -> dict[str, Any]:
+    """Build the block keys of a request whose prices could not be fetched."""
+    return {
+        "duration_minutes_requested": request.duration_minutes_requested,
+        "duration_minutes": request.duration_minutes_requested,
+        "window_found": False,
+        "relaxation_applied": False,
+        "window": None,
+    }
+
+
+async def _handle_find_block(
+    call: ServiceCall,
+    *,
+    reverse: bool = False,
+) -> ServiceResponse:
+    """
+    Core handler for finding price blocks (cheapest or most expensive).
+
+    Finds the cheapest/most expensive contiguous window of the requested
+    duration within the search range using a sliding window algorithm.
+    """
+    service_label = "find_most_expensive_block" if reverse else "find_cheapest_block"
+    hass: HomeAssistant = call.hass
+
+    # Resolve entity references (e.g., "input_number.wash_duration" → 90 minutes)
+    data, resolved_refs = resolve_entity_references(hass, call.data, COMMON_BLOCK_ENTITY_PARAMS)
+
+    entry_id: str = data.get("entry_id", "")
+    view_device_id: str = data.get("view_id", "")
+    use_base_unit: bool = data.get("use_base_unit", False)
+
+    # Note: rebind to coordinator_data — `data` (the resolved service call
+    # data) is still needed below for validate_search_params() and
+    # apply_must_finish_by(), which read search-range parameters from it.
+    target = resolve_service_target(hass, entry_id, view_device_id)
+    entry = target.entry
+    coordinator = target.coordinator
+    coordinator_data = target.data
+    rating_lookup = build_rating_lookup(coordinator_data)
+
+    home_id = entry.data.get("home_id")
+    if not home_id:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_home_id",
+        )
+
+    # Resolve timezone
+    home_timezone = resolve_home_timezone(coordinator, home_id)
+    home_tz: ZoneInfo
+    from zoneinfo import ZoneInfo  # noqa: PLC0415
+
+    home_tz = ZoneInfo(home_timezone)
+
+    # Handle must_finish_by: convert deadline to search_end
+    validate_search_params(data)
+    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
+
+    # Resolve search range (priority: explicit datetime > time+offset > minutes offset > default)
+    now = target.now(home_tz)
+    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
+
+    request = _parse_block_request(data)
+
+    _LOGGER.info(
+        "%s called: duration=%dmin, range=%s to %s",
+        service_label,
+        request.duration_intervals * INTERVAL_MINUTES,
+        search_start,
+        search_end,
+    )
+
+    # Fetch intervals via pool
+    api_client = coordinator.api
+    user_data = coordinator._cached_user_data  # noqa: SLF001
+    pool = target.interval_pool
+
+    price_info, fetch_ok = await async_fetch_service_intervals(
+        pool,
+        api_client=api_client,
+        user_data=user_data,
+        start_time=search_start,
+        end_time=search_end,
+        service_label=service_label,
     )
 
+    # Determine currency and unit
+    currency = entry.data.get("currency", "EUR")
+    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
+    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+
+    response: dict[str, Any] = {
+        "success": True,
+        "home_id": home_id,
+        "search_start": search_start.isoformat(),
+        "search_end": search_end.isoformat(),
+        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+        "currency": currency,
+        "price_unit": price_unit,
+    }
+    if not fetch_ok:
+        # Price data unavailable (API outage on uncached range). Return a well-formed
+        # empty response with success=False so automations can detect this directly.
+        response["success"] = False
+        response["reason"] = "price_data_unavailable"
+        response.update(_unavailable_block_body(request))
+    else:
+        search = _BlockSearch(
+            price_info=price_info,
+            # Parse timestamps and contiguity once; every attempt below works on subsets
+            prepared=TibberPricesPreparedRange(price_info),
+            now=now,
+            unit_factor=unit_factor,
+            price_unit=price_unit,
+            rating_lookup=rating_lookup,
+            reverse=reverse,
+            service_label=service_label,
+        )
+        response.update(_find_block_body(request, search))
+    if resolved_refs:
+        response["_resolved"] = resolved_refs
     return response
 
 
 async def handle_find_cheapest_block(call: ServiceCall) -> ServiceResponse:
     """Handle find_cheapest_block service call."""
     return await _handle_find_block(call, reverse=False)
+
+
+def _resolve_block_batch_entity_refs(
+    hass: HomeAssistant,
+    call_data: dict[str, Any] | Any,
+) -> tuple[dict[str, Any], dict[str, dict[str, str | None]]]:
+    """Resolve entity references in batch call data (top-level + devices)."""
+    data, resolved_refs = resolve_entity_references(
+        hass,
+        call_data,
+        {key: kind for key, kind in COMMON_BLOCK_ENTITY_PARAMS.items() if key in _BLOCK_BATCH_SHARED_KEYS},
+    )
+    device_params = {
+        key: kind for key, kind in COMMON_BLOCK_ENTITY_PARAMS.items() if key not in _BLOCK_BATCH_SHARED_KEYS
+    }
+    devices: list[dict[str, Any]] = []
+    for index, device in enumerate(data["devices"]):
+        resolved_device, device_refs = resolve_entity_references(hass, device, device_params)
+        devices.append(resolved_device)
+        for param_name, info in device_refs.items():
+            resolved_refs[f"devices[{index}].{param_name}"] = info
+    data["devices"] = devices
+    return data, resolved_refs
+
+
+async def handle_find_cheapest_block_batch(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the find_cheapest_block_batch service call.
+
+    Finds the cheapest block of every device in one fetched and prepared
+    search range instead of one find_cheapest_block call per device. The
+    filtered and smoothed intervals per price level filter are shared too.
+    Devices are searched independently; blocks may overlap.
+    """
+    hass: HomeAssistant = call.hass
+    data, resolved_refs = _resolve_block_batch_entity_refs(hass, call.data)
+
+    names = [device["name"] for device in data["devices"]]
+    validate_unique_device_names(names)
+    use_base_unit: bool = data.get("use_base_unit", False)
+
+    target = resolve_service_target(hass, data.get("entry_id", ""), data.get("view_id", ""))
+    entry = target.entry
+    coordinator = target.coordinator
+    home_id = entry.data.get("home_id")
+    if not home_id:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_home_id",
+        )
+
+    home_timezone = resolve_home_timezone(coordinator, home_id)
+    from zoneinfo import ZoneInfo  # noqa: PLC0415
+
+    home_tz: ZoneInfo = ZoneInfo(home_timezone)
+    validate_search_params(data)
+    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
+    now = target.now(home_tz)
+    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
+
+    requests = [_parse_block_request(device) for device in data["devices"]]
+
+    _LOGGER.info(
+        "%s called: %d devices, range=%s to %s",
+        FIND_CHEAPEST_BLOCK_BATCH_SERVICE_NAME,
+        len(requests),
+        search_start,
+        search_end,
+    )
+
+    price_info, fetch_ok = await async_fetch_service_intervals(
+        target.interval_pool,
+        api_client=coordinator.api,
+        user_data=coordinator._cached_user_data,  # noqa: SLF001
+        start_time=search_start,
+        end_time=search_end,
+        service_label=FIND_CHEAPEST_BLOCK_BATCH_SERVICE_NAME,
+    )
+
+    currency = entry.data.get("currency", "EUR")
+    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
+    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+
+    if fetch_ok:
+        search = _BlockSearch(
+            price_info=price_info,
+            prepared=TibberPricesPreparedRange(price_info),
+            now=now,
+            unit_factor=unit_factor,
+            price_unit=price_unit,
+            rating_lookup=build_rating_lookup(target.data),
+            reverse=False,
+            service_label=FIND_CHEAPEST_BLOCK_BATCH_SERVICE_NAME,
+        )
+        device_responses = [
+            {"name": name, **_find_block_body(request, search)} for name, request in zip(names, requests, strict=True)
+        ]
+    else:
+        device_responses = [
+            {"name": name, **_unavailable_block_body(request)} for name, request in zip(names, requests, strict=True)
+        ]
+
+    response: dict[str, Any] = {
+        "success": fetch_ok,
+        "home_id": home_id,
+        "search_start": search_start.isoformat(),
+        "search_end": search_end.isoformat(),
+        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+        "currency": currency,
+        "price_unit": price_unit,
+        "device_count": len(device_responses),
+        "devices_found": sum(1 for device in device_responses if device["window_found"]),
+        "devices": device_responses,
+    }
+    if not fetch_ok:
+        response["reason"] = "price_data_unavailable"
+    if resolved_refs:
+        response["_resolved"] = resolved_refs
+    return response
@@ -16,7 +16,11 @@ from typing import TYPE_CHECKING, Any
 import voluptuous as vol
 
 from custom_components.tibber_prices.const import DOMAIN, get_display_unit_factor, get_display_unit_string
-from custom_components.tibber_prices.utils.price_window import calculate_window_statistics, find_cheapest_n_intervals
+from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
+    calculate_window_statistics,
+    find_cheapest_n_intervals,
+)
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
@@ -57,7 +61,7 @@ _LOGGER = logging.getLogger(__name__)
 FIND_CHEAPEST_HOURS_SERVICE_NAME = "find_cheapest_hours"
 
 # Parameter types for entity reference resolution
-_HOURS_ENTITY_PARAMS: dict[str, type] = {
+HOURS_ENTITY_PARAMS: dict[str, type] = {
     "duration": timedelta,
     "min_segment_duration": timedelta,
     "search_start": datetime,
@@ -149,9 +153,13 @@ def _attempt_find_hours(
     smooth_outliers: bool,
     min_distance_from_avg: float | None,
     reverse: bool,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> tuple[dict | None, str]:
     """Attempt to find hours with specific filter parameters.
 
+    `prepared` is the prepared search range of price_info; filtered and smoothed
+    subsets reuse its parsed timestamps.
+
     Returns:
         (result_dict, "") on success or (None, reason_code) on failure.
 
@@ -164,7 +172,9 @@ def _attempt_find_hours(
     else:
         search_data = filtered
 
-    result = find_cheapest_n_intervals(search_data, total_intervals, min_segment_intervals, reverse=reverse)
+    result = find_cheapest_n_intervals(
+        search_data, total_intervals, min_segment_intervals, reverse=reverse, prepared=prepared
+    )
 
     if result is None:
         return None, _determine_no_intervals_reason(
@@ -307,7 +317,7 @@ async def _handle_find_hours(
     hass: HomeAssistant = call.hass
 
     # Resolve entity references
-    data, resolved_refs = resolve_entity_references(hass, call.data, _HOURS_ENTITY_PARAMS)
+    data, resolved_refs = resolve_entity_references(hass, call.data, HOURS_ENTITY_PARAMS)
 
     entry_id: str = data.get("entry_id", "")
     view_device_id: str = data.get("view_id", "")
@@ -429,6 +439,9 @@ async def _handle_find_hours(
             unavailable["_resolved"] = resolved_refs
         return unavailable
 
+    # Parse timestamps and contiguity once; every attempt below works on subsets
+    prepared = TibberPricesPreparedRange(price_info)
+
     # --- Attempt with original parameters ---
     effective_total = total_intervals
     result, reason = _attempt_find_hours(
@@ -440,6 +453,7 @@ async def _handle_find_hours(
         smooth_outliers=smooth_outliers,
         min_distance_from_avg=min_distance_from_avg,
         reverse=reverse,
+        prepared=prepared,
     )
 
     relaxation_applied = False
@@ -480,6 +494,7 @@ async def _handle_find_hours(
                 smooth_outliers=smooth_outliers,
                 min_distance_from_avg=step.min_distance_from_avg,
                 reverse=reverse,
+                prepared=prepared,
             )
             if result is not None:
                 relaxation_applied = True
@@ -530,7 +545,7 @@ async def _handle_find_hours(
 
     # Find opposite-direction selection for price comparison (from full unfiltered list)
     comparison_result = find_cheapest_n_intervals(
-        price_info, effective_total, min_segment_intervals, reverse=not reverse
+        price_info, effective_total, min_segment_intervals, reverse=not reverse, prepared=prepared
     )
 
     found_response = _build_found_response(
@@ -2,8 +2,10 @@
 Service handler for find_cheapest_schedule service.
 
 Finds optimal non-overlapping blocks for multiple tasks within a search range.
-Uses a greedy algorithm: tasks are sorted by duration (longest first), then
-each task claims the cheapest available contiguous window in the remaining pool.
+The placement with the lowest total cost is found by schedule_solver; if the
+solver exceeds its time budget, tasks are placed greedily instead (longest
+first, each claiming the cheapest available contiguous window in the remaining
+pool).
 """
 
 from __future__ import annotations
@@ -17,8 +19,12 @@ import voluptuous as vol
 
 from custom_components.tibber_prices.const import DOMAIN, get_display_unit_factor, get_display_unit_string
 from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
+    calculate_window_scores,
     calculate_window_statistics,
     find_cheapest_contiguous_window,
+    find_contiguous_runs,
+    select_best_window_start,
 )
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
@@ -47,6 +53,7 @@ from .relaxation import (
     build_level_filter_steps,
     calculate_max_duration_reduction_intervals,
 )
+from .schedule_solver import solve_schedule
 
 if TYPE_CHECKING:
     from zoneinfo import ZoneInfo
@@ -136,11 +143,12 @@ def _compute_task_price_comparison(
     *,
     include_details: bool,
     power_profile: list[int] | None = None,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> dict[str, float | str | None] | None:
     """Compute per-task comparison against most expensive window of same duration."""
     duration_intervals = len(task_intervals)
     comparison_result = find_cheapest_contiguous_window(
-        full_price_info, duration_intervals, reverse=True, power_profile=power_profile
+        full_price_info, duration_intervals, reverse=True, power_profile=power_profile, prepared=prepared
     )
     if comparison_result is None:
         return None
@@ -203,10 +211,17 @@ def _find_cheapest_window_in_pool(
     available: list[bool],
     *,
     power_profile: list[int] | None = None,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> tuple[int, int] | None:
     """
     Find the cheapest contiguous window of `duration_intervals` in available pool slots.
 
+    The pool is split once into runs of slots that are available and contiguous
+    in time; every run long enough is scored in a single pass by
+    calculate_window_scores(). A window never spans an unavailable slot or a
+    time gap (caused by price-level filtering or missing data), and the slot
+    right after a gap is a valid window start.
+
     Args:
         pool: Full sorted interval list.
         duration_intervals: Required contiguous count.
@@ -214,114 +229,61 @@ def _find_cheapest_window_in_pool(
         power_profile: Optional watt value per interval for weighted scoring.
             Only the first duration_intervals values are used. When provided,
             scoring uses \u03a3 price[i] \u00d7 watt[i] instead of \u03a3 price[i].
+        prepared: Optional prepared search range the pool belongs to.
 
     Returns:
         (start_index, end_index_exclusive) of the best window, or None if not found.
 
     """
-    n = len(pool)
-    best_sum: float | None = None
-    best_start: int = -1
-
-    i = 0
-    while i <= n - duration_intervals:
-        # Check if a contiguous block starting at i is fully available
-        # and all intervals are contiguous in time (no gaps)
-        block: list[dict[str, Any]] = []
-        j = i
-        stopped_at_gap = False
-        while j < n and len(block) < duration_intervals:
-            if not available[j]:
-                break
-            if block:
-                # Check temporal contiguity
-                prev_start = block[-1]["startsAt"]
-                curr_start = pool[j]["startsAt"]
-                prev_dt = datetime.fromisoformat(prev_start) if isinstance(prev_start, str) else prev_start
-                curr_dt = datetime.fromisoformat(curr_start) if isinstance(curr_start, str) else curr_start
-                if curr_dt - prev_dt != timedelta(minutes=INTERVAL_MINUTES):
-                    # Gap in time — can't extend this block, but slot j itself
-                    # (already confirmed available above) is a fresh, untried
-                    # candidate window start and must not be skipped.
-                    stopped_at_gap = True
-                    break
-            block.append(pool[j])
-            j += 1
-
-        if len(block) == duration_intervals:
-            if power_profile:
-                window_sum = sum(block[k]["total"] * power_profile[k] for k in range(len(block)))
-            else:
-                window_sum = sum(iv["total"] for iv in block)
-            if best_sum is None or window_sum < best_sum:
-                best_sum = window_sum
-                best_start = i
-            i += 1
-        elif stopped_at_gap:
-            # Retry starting exactly at the gap position (index j), not j+1 —
-            # j is available and untested as a window start. Regression guard:
-            # previously this jumped to j+1, silently skipping a valid
-            # (sometimes cheaper) candidate window right after a time gap
-            # caused by price-level filtering or missing data.
-            i = j
-        else:
-            # Skip past the blocking unavailable slot (or end of pool)
-            i = j + 1
-
-    if best_start == -1:
+    if duration_intervals <= 0:
+        return None
+
+    weights = power_profile[:duration_intervals] if power_profile else None
+    candidate_starts: list[int] = []
+    candidate_scores: list[float] = []
+
+    for run_start, run_end in find_contiguous_runs(pool, available, prepared=prepared):
+        if run_end - run_start < duration_intervals:
+            continue
+        scores = calculate_window_scores([iv["total"] for iv in pool[run_start:run_end]], duration_intervals, weights)
+        candidate_starts.extend(range(run_start, run_start + len(scores)))
+        candidate_scores.extend(scores)
+
+    if not candidate_scores:
         return None
 
+    best_start = candidate_starts[select_best_window_start(candidate_scores)]
     return (best_start, best_start + duration_intervals)
 
 
-def _attempt_schedule(
-    price_info: list[dict[str, Any]],
+def _greedy_window_starts(
+    search_data: list[dict[str, Any]],
+    tasks_ordered: list[dict[str, Any]],
     *,
-    max_price_level: str | None,
-    min_price_level: str | None,
-    tasks: list[dict[str, Any]],
     gap_intervals: int,
-    smooth_outliers: bool,
-    sequential: bool = False,
-) -> tuple[list[dict[str, Any]], list[str], list[dict[str, Any]]]:
-    """Attempt to schedule tasks with specific filter parameters.
+    sequential: bool,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> list[int | None]:
+    """Place tasks one by one, each claiming its cheapest remaining window.
 
-    When sequential=True, tasks are placed in declaration order and each task's
-    search window begins after the previous task's end + gap.  When False
-    (default), tasks are sorted longest-first for optimal greedy packing.
+    Used when the optimal solver exceeds its time budget.
 
     Returns:
-        (assignments, unscheduled_names, filtered_price_info)
+        Start index per task in `tasks_ordered` (None = not scheduled).
 
     """
-    filtered = filter_intervals_by_price_level(price_info, min_price_level, max_price_level)
-
-    if smooth_outliers and filtered:
-        search_data = smooth_service_intervals(filtered)
-    else:
-        search_data = filtered
-
-    if not search_data:
-        return [], [t["name"] for t in tasks], filtered
-
-    # Task ordering: declaration order when sequential, longest-first otherwise
-    tasks_ordered = list(tasks) if sequential else sorted(tasks, key=lambda t: t["duration_intervals"], reverse=True)
-
     available = [True] * len(search_data)
-    assignments: list[dict[str, Any]] = []
-    unscheduled: list[str] = []
+    starts: list[int | None] = []
 
     # In sequential mode, track the earliest allowed start index for the next task
     sequential_min_idx = 0
     sequential_chain_broken = False
 
     for task in tasks_ordered:
-        dur_intervals = task["duration_intervals"]
-
         # In sequential mode, if the chain is broken (previous task failed),
         # all remaining tasks are also unscheduled
         if sequential and sequential_chain_broken:
-            unscheduled.append(task["name"])
+            starts.append(None)
             continue
 
         # In sequential mode, restrict search to intervals at or after the
@@ -331,21 +293,20 @@ def _attempt_schedule(
                 available[k] = False
 
         window = _find_cheapest_window_in_pool(
-            search_data, dur_intervals, available, power_profile=task.get("power_profile")
+            search_data,
+            task["duration_intervals"],
+            available,
+            power_profile=task.get("power_profile"),
+            prepared=prepared,
         )
 
         if window is None:
-            unscheduled.append(task["name"])
+            starts.append(None)
             if sequential:
                 sequential_chain_broken = True
             continue
 
         start_idx, end_idx = window
-        task_intervals = search_data[start_idx:end_idx]
-
-        # Restore original prices for response
-        if smooth_outliers:
-            task_intervals = restore_original_prices(task_intervals)
 
         # Mark task intervals + trailing gap as unavailable
         gap_end = min(end_idx + gap_intervals, len(search_data))
@@ -356,6 +317,81 @@ def _attempt_schedule(
         if sequential:
             sequential_min_idx = gap_end
 
+        starts.append(start_idx)
+
+    return starts
+
+
+def _attempt_schedule(
+    price_info: list[dict[str, Any]],
+    *,
+    max_price_level: str | None,
+    min_price_level: str | None,
+    tasks: list[dict[str, Any]],
+    gap_intervals: int,
+    smooth_outliers: bool,
+    sequential: bool = False,
+    optimal: bool = True,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> tuple[list[dict[str, Any]], list[str], list[dict[str, Any]]]:
+    """Attempt to schedule tasks with specific filter parameters.
+
+    When sequential=True, tasks are placed in declaration order and each task's
+    search window begins after the previous task's end + gap.  When False
+    (default), tasks may run in any order.
+
+    With optimal=True (default) the placement with the lowest total cost is
+    found by solve_schedule(). If that exceeds its time budget (or optimal=False),
+    tasks are placed greedily, longest first.
+
+    `prepared` is the prepared search range of price_info; filtered and smoothed
+    subsets reuse its parsed timestamps.
+
+    Returns:
+        (assignments, unscheduled_names, filtered_price_info)
+
+    """
+    filtered = filter_intervals_by_price_level(price_info, min_price_level, max_price_level)
+
+    if smooth_outliers and filtered:
+        search_data = smooth_service_intervals(filtered)
+    else:
+        search_data = filtered
+
+    if not search_data:
+        return [], [t["name"] for t in tasks], filtered
+
+    # Task ordering: declaration order when sequential, longest-first otherwise
+    tasks_ordered = list(tasks) if sequential else sorted(tasks, key=lambda t: t["duration_intervals"], reverse=True)
+
+    starts = (
+        solve_schedule(
+            search_data, tasks_ordered, gap_intervals=gap_intervals, sequential=sequential, prepared=prepared
+        )
+        if optimal
+        else None
+    )
+    if starts is None:
+        if optimal:
+            _LOGGER.debug("Schedule solver exceeded its time budget, falling back to greedy placement")
+        starts = _greedy_window_starts(
+            search_data, tasks_ordered, gap_intervals=gap_intervals, sequential=sequential, prepared=prepared
+        )
+
+    assignments: list[dict[str, Any]] = []
+    unscheduled: list[str] = []
+
+    for task, start_idx in zip(tasks_ordered, starts, strict=True):
+        if start_idx is None:
+            unscheduled.append(task["name"])
+            continue
+
+        task_intervals = search_data[start_idx : start_idx + task["duration_intervals"]]
+
+        # Restore original prices for response
+        if smooth_outliers:
+            task_intervals = restore_original_prices(task_intervals)
+
         assignments.append(
             {
                 "name": task["name"],
@@ -531,6 +567,9 @@ async def handle_find_cheapest_schedule(call: ServiceCall) -> ServiceResponse:
             unavailable["_resolved"] = resolved_refs
         return unavailable
 
+    # Parse timestamps and contiguity once; every attempt below works on subsets
+    prepared = TibberPricesPreparedRange(price_info)
+
     # --- Attempt with original parameters ---
     raw_assignments, unscheduled, filtered = _attempt_schedule(
         price_info,
@@ -540,6 +579,7 @@ async def handle_find_cheapest_schedule(call: ServiceCall) -> ServiceResponse:
         gap_intervals=gap_intervals,
         smooth_outliers=smooth_outliers,
         sequential=sequential,
+        prepared=prepared,
     )
     all_scheduled = len(unscheduled) == 0
     level_filter_active = min_price_level is not None or max_price_level is not None
@@ -567,6 +607,7 @@ async def handle_find_cheapest_schedule(call: ServiceCall) -> ServiceResponse:
                 gap_intervals=gap_intervals,
                 smooth_outliers=smooth_outliers,
                 sequential=sequential,
+                prepared=prepared,
             )
             if len(a) > len(best_assignments):
                 best_assignments, best_unscheduled, best_filtered = a, u, f
@@ -611,6 +652,7 @@ async def handle_find_cheapest_schedule(call: ServiceCall) -> ServiceResponse:
                     gap_intervals=gap_intervals,
                     smooth_outliers=smooth_outliers,
                     sequential=sequential,
+                    prepared=prepared,
                 )
                 if len(a) > len(best_assignments):
                     best_assignments, best_unscheduled, best_filtered = a, u, f
@@ -677,6 +719,7 @@ async def handle_find_cheapest_schedule(call: ServiceCall) -> ServiceResponse:
                     unit_factor,
                     include_details=include_comparison_details,
                     power_profile=task.get("power_profile"),
+                    prepared=prepared,
                 ),
             }
         )
@@ -8,6 +8,7 @@ and period data extraction.
 Functions:
     normalize_level_filter: Convert level filter values to uppercase
     normalize_rating_level_filter: Convert rating level filter values to uppercase
+    iter_hourly_aggregates: Yield rolling hourly aggregates of 15-minute intervals
     aggregate_hourly_exact: Aggregate 15-minute intervals to exact hourly averages
     get_period_data: Extract period summary data instead of interval data
     get_level_translation: Get translated name for price level or rating level
@@ -21,7 +22,7 @@ Used by:
 from __future__ import annotations
 
 from datetime import datetime, time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from custom_components.tibber_prices.const import (
     CONF_AVERAGE_SENSOR_DISPLAY,
@@ -34,6 +35,9 @@ from custom_components.tibber_prices.coordinator.helpers import get_intervals_fo
 from custom_components.tibber_prices.sensor.helpers import aggregate_level_data, aggregate_rating_data
 from custom_components.tibber_prices.utils.average import calculate_mean, calculate_median
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
 
 def normalize_level_filter(value: list[str] | None) -> list[str] | None:
     """Convert level filter values to uppercase for case-insensitive comparison."""
@@ -49,17 +53,19 @@ def normalize_rating_level_filter(value: list[str] | None) -> list[str] | None:
     return [v.upper() for v in value]
 
 
-def aggregate_to_hourly(
-    intervals: list[dict],
+def iter_hourly_aggregates(
+    intervals: Sequence[dict],
     coordinator: Any,
     threshold_low: float = DEFAULT_PRICE_RATING_THRESHOLD_LOW,
     threshold_high: float = DEFAULT_PRICE_RATING_THRESHOLD_HIGH,
-) -> list[dict]:
+) -> Iterator[dict]:
     """
     Aggregate 15-minute intervals to hourly using rolling 5-interval window.
 
     Preserves original field names (startsAt, total, level, rating_level) so the
     aggregated data can be processed by the same code path as interval data.
+    Hourly points are yielded one at a time, so get_chartdata can filter and
+    format them without building the aggregated list first.
 
     Uses the same methodology as sensor rolling hour calculations:
     - 5-interval window: 2 before + center + 2 after (60 minutes total)
@@ -75,19 +81,17 @@ def aggregate_to_hourly(
         threshold_low: Rating level threshold (low/normal boundary)
         threshold_high: Rating level threshold (normal/high boundary)
 
-    Returns:
-        List of hourly data points with same structure as input (startsAt, total, level, rating_level)
+    Yields:
+        Hourly data points with same structure as input (startsAt, total, level, rating_level)
 
     """
     if not intervals:
-        return []
+        return
 
     # Get user's average display preference (mean or median)
     average_display = coordinator.config_entry.options.get(CONF_AVERAGE_SENSOR_DISPLAY, DEFAULT_AVERAGE_SENSOR_DISPLAY)
     use_median = average_display == "median"
 
-    hourly_data = []
-
     # Iterate through all intervals, only process those at :00
     for i, interval in enumerate(intervals):
         start_time = interval.get("startsAt")
@@ -159,9 +163,7 @@ def aggregate_to_hourly(
                 if aggregated_rating:
                     data_point["rating_level"] = aggregated_rating.upper()
 
-            hourly_data.append(data_point)
-
-    return hourly_data
+            yield data_point
 
 
 def aggregate_hourly_exact(
@@ -25,7 +25,7 @@ from datetime import datetime, timedelta
 import math
 import re
 import statistics
-from typing import TYPE_CHECKING, Any, Final
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
 
 import voluptuous as vol
 
@@ -54,10 +54,12 @@ from custom_components.tibber_prices.coordinator.helpers import get_intervals_fo
 from homeassistant.exceptions import ServiceValidationError
 
 from .entity_resolver import or_entity_ref, resolve_entity_references
-from .formatters import aggregate_to_hourly, get_period_data, normalize_level_filter, normalize_rating_level_filter
+from .formatters import get_period_data, iter_hourly_aggregates, normalize_level_filter, normalize_rating_level_filter
 from .helpers import has_tomorrow_data, resolve_service_target
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
     from homeassistant.core import ServiceCall
 
 
@@ -110,6 +112,37 @@ def _calculate_metadata(
     Returns:
         Metadata dictionary with price statistics, yaxis suggestions, and time info
 
+    """
+    return _calculate_metadata_from_columns(
+        [item.get(start_time_field) for item in chart_data],
+        [item.get(price_field) for item in chart_data],
+        currency,
+        resolution=resolution,
+        subunit_currency=subunit_currency,
+    )
+
+
+def _calculate_metadata_from_columns(
+    starts: list[Any],
+    price_column: list[float | None],
+    currency: str,
+    *,
+    resolution: str,
+    subunit_currency: bool = False,
+) -> dict[str, Any]:
+    """
+    Calculate metadata from the start time and price columns of the chart data.
+
+    Args:
+        starts: Start time of each chart point (ISO string or datetime)
+        price_column: Price of each chart point (None for NULL points)
+        currency: Currency code (e.g., "EUR", "NOK")
+        resolution: Resolution type ("interval" or "hourly")
+        subunit_currency: Whether prices are in subunit currency units
+
+    Returns:
+        Metadata dictionary with price statistics, yaxis suggestions, and time info
+
     """
     # Get currency info (returns tuple: base_symbol, subunit_symbol, subunit_name)
     base_symbol, subunit_symbol, subunit_name = get_currency_info(currency)
@@ -131,42 +164,22 @@ def _calculate_metadata(
         }
 
     # Extract all prices (excluding None values)
-    prices = [item[price_field] for item in chart_data if item.get(price_field) is not None]
+    prices = [price for price in price_column if price is not None]
 
     if not prices:
         return {}
 
-    # Parse timestamps to determine day boundaries
-    # Group by date (midnight-to-midnight)
-    dates_seen = set()
-    for item in chart_data:
-        timestamp_str = item.get(start_time_field)
-        if timestamp_str and item.get(price_field) is not None:
-            # Parse ISO timestamp
-            dt = datetime.fromisoformat(timestamp_str) if isinstance(timestamp_str, str) else timestamp_str
-            date = dt.date()
-            dates_seen.add(date)
-
-    # Sort dates to ensure consistent day numbering
-    sorted_dates = sorted(dates_seen)
-
-    # Split data by day - dynamically handle any number of days
-    days_data: dict[str, list[float]] = {}
-    for i, _date in enumerate(sorted_dates, start=1):
-        day_key = f"day{i}"
-        days_data[day_key] = []
-
-    # Assign prices to their respective days
-    for item in chart_data:
-        timestamp_str = item.get(start_time_field)
-        price = item.get(price_field)
-        if timestamp_str and price is not None:
-            dt = datetime.fromisoformat(timestamp_str) if isinstance(timestamp_str, str) else timestamp_str
-            date = dt.date()
-            # Find which day this date corresponds to
-            day_index = sorted_dates.index(date) + 1
-            day_key = f"day{day_index}"
-            days_data[day_key].append(price)
+    # Group prices by date (midnight-to-midnight), parsing each timestamp once
+    prices_by_date: dict[Any, list[float]] = {}
+    for timestamp, price in zip(starts, price_column, strict=True):
+        if timestamp and price is not None:
+            dt = datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp
+            prices_by_date.setdefault(dt.date(), []).append(price)
+
+    # Number days in date order - dynamically handle any number of days
+    days_data: dict[str, list[float]] = {
+        f"day{i}": prices_by_date[date] for i, date in enumerate(sorted(prices_by_date), start=1)
+    }
 
     def calc_stats(data: list[float]) -> dict[str, float]:
         """Calculate comprehensive statistics for a dataset."""
@@ -215,7 +228,7 @@ def _calculate_metadata(
     yaxis_max = math.ceil(combined_stats["max"]) + 1 if combined_stats else 100
 
     # Get time range from chart data
-    timestamps = [item[start_time_field] for item in chart_data if item.get(start_time_field)]
+    timestamps = [timestamp for timestamp in starts if timestamp]
     time_range = {}
 
     if timestamps:
@@ -255,13 +268,375 @@ def _calculate_metadata(
     return {
         "currency": currency_obj,
         "resolution": interval_duration_minutes,
-        "data_count": len(chart_data),
+        "data_count": len(starts),
         "price_stats": {"combined": combined_stats, **per_day_stats},
         "yaxis_suggested": {"min": yaxis_min, "max": yaxis_max},
         "time_range": time_range,
     }
 
 
+# Chart points flow through the handler as tuples with one column per output field:
+# start, price, level, rating_level, average, energy, tax. Formatting them into
+# dicts or rows is the last step, so no intermediate list of dicts is built.
+_START, _PRICE, _LEVEL, _RATING_LEVEL, _AVERAGE, _ENERGY, _TAX = range(7)
+
+# Column value for a field the point does not have (no key in array_of_objects, None in array_of_arrays)
+_ABSENT: Final = object()
+
+_DAY_OFFSETS: Final = {"yesterday": -1, "today": 0, "tomorrow": 1}
+
+
+class TibberPricesChartPointConfig(NamedTuple):
+    """Settings that turn price intervals into chart points."""
+
+    price_source: str
+    subunit_currency: bool
+    round_decimals: int | None
+    include_level: bool
+    include_rating_level: bool
+    include_average: bool
+    include_energy: bool
+    include_tax: bool
+    day_averages: dict[str, float]
+    date_to_day_key: dict[Any, str]
+
+    def convert(self, value: float) -> float:
+        """Convert a price to the requested currency unit and rounding."""
+        converted = round(value * 100, 2) if self.subunit_currency else round(value, 4)
+        if self.round_decimals is not None:
+            converted = round(converted, self.round_decimals)
+        return converted
+
+
+def _serialize_start(start_time: Any) -> Any:
+    """Return a start time as ISO string (strings and None pass through)."""
+    return start_time.isoformat() if hasattr(start_time, "isoformat") else start_time
+
+
+def _null_point(start: Any) -> tuple[Any, ...]:
+    """Return a NULL point that interrupts the chart series."""
+    return (start, None, _ABSENT, _ABSENT, _ABSENT, _ABSENT, _ABSENT)
+
+
+def _make_point(
+    config: TibberPricesChartPointConfig,
+    start: Any,
+    price: float | None,
+    interval: Mapping[str, Any],
+    *,
+    with_energy_tax: bool = False,
+) -> tuple[Any, ...]:
+    """
+    Return a chart point with the optional fields taken from its interval.
+
+    Args:
+        config: Chart point settings
+        start: Serialized start time of the point
+        price: Converted price, or None for a NULL price
+        interval: Source interval (level, rating_level, energy, tax, startsAt for the day average)
+        with_energy_tax: Add energy and tax (data points only, not bridge/hold points)
+
+    Returns:
+        Point tuple (start, price, level, rating_level, average, energy, tax)
+
+    """
+    has_price = price is not None
+    level = interval["level"] if has_price and config.include_level and "level" in interval else _ABSENT
+    rating_level = (
+        interval["rating_level"]
+        if has_price and config.include_rating_level and "rating_level" in interval
+        else _ABSENT
+    )
+
+    average = _ABSENT
+    if config.include_average:
+        interval_start = interval.get("startsAt")
+        if interval_start and hasattr(interval_start, "date"):
+            day_key = config.date_to_day_key.get(interval_start.date())
+            if day_key and day_key in config.day_averages:
+                average = config.day_averages[day_key]
+
+    energy = tax = _ABSENT
+    if with_energy_tax and has_price:
+        if config.include_energy and interval.get("energy") is not None:
+            energy = config.convert(float(interval["energy"]))
+        if config.include_tax and interval.get("tax") is not None:
+            tax = config.convert(float(interval["tax"]))
+
+    return (start, price, level, rating_level, average, energy, tax)
+
+
+def _iter_filtered_points(
+    intervals: Iterable[Mapping[str, Any]],
+    config: TibberPricesChartPointConfig,
+    level_filter: list[str] | None,
+    rating_level_filter: list[str] | None,
+) -> Iterator[tuple[Any, ...]]:
+    """Yield a point per interval that matches the filters (insert_nulls='none')."""
+    for interval in intervals:
+        start_time = interval.get("startsAt")
+        price = interval.get(config.price_source)
+        if start_time is None or price is None:
+            continue
+        if level_filter is not None and "level" in interval and interval["level"] not in level_filter:
+            continue
+        if (
+            rating_level_filter is not None
+            and "rating_level" in interval
+            and interval["rating_level"] not in rating_level_filter
+        ):
+            continue
+        yield _make_point(config, _serialize_start(start_time), config.convert(price), interval, with_energy_tax=True)
+
+
+def _iter_points_with_nulls(
+    intervals: Iterable[Mapping[str, Any]],
+    config: TibberPricesChartPointConfig,
+    level_filter: list[str] | None,
+    rating_level_filter: list[str] | None,
+) -> Iterator[tuple[Any, ...]]:
+    """Yield a point per interval, with a NULL price where the filter does not match (insert_nulls='all')."""
+    # One interval per distinct start time, in chronological order
+    interval_map = {interval["startsAt"]: interval for interval in intervals if interval.get("startsAt")}
+
+    for start_time in sorted(interval_map):
+        interval = interval_map[start_time]
+        price = interval.get(config.price_source)
+        if price is None:
+            continue
+
+        matches_filter = False
+        if level_filter and "level" in interval:
+            matches_filter = interval["level"] in level_filter
+        elif rating_level_filter and "rating_level" in interval:
+            matches_filter = interval["rating_level"] in rating_level_filter
+
+        converted_price = config.convert(price) if matches_filter else None
+        yield _make_point(config, _serialize_start(start_time), converted_price, interval, with_energy_tax=True)
+
+
+def _iter_segment_points(
+    intervals: Iterable[Mapping[str, Any]],
+    config: TibberPricesChartPointConfig,
+    filter_field: str,
+    filter_values: list[str],
+    *,
+    use_rating: bool,
+    connect_segments: bool,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    Yield the points of the matching segments with NULL points at their boundaries (insert_nulls='segments').
+
+    Walks the intervals with a window of previous, current and next interval, so
+    segment starts and ends are detected in the same pass that emits the points.
+
+    Args:
+        intervals: Intervals (or hourly aggregates) of the whole selection, in chronological order
+        config: Chart point settings
+        filter_field: "level" or "rating_level"
+        filter_values: Filter values that form the segments
+        use_rating: Compare transitions by rating hierarchy instead of level hierarchy
+        connect_segments: Add bridge points so adjacent segments connect visually
+
+    Yields:
+        Point tuples, including hold, bridge and NULL points
+
+    """
+    iterator = iter(intervals)
+    interval = next(iterator, None)
+    if interval is None:
+        return
+    previous: Mapping[str, Any] | None = None
+
+    for next_interval in iterator:
+        yield from _segment_points_for_interval(
+            config,
+            previous,
+            interval,
+            next_interval,
+            filter_field=filter_field,
+            filter_values=filter_values,
+            use_rating=use_rating,
+            connect_segments=connect_segments,
+        )
+        previous, interval = interval, next_interval
+
+    # LAST interval of the entire selection: hold its price until midnight, then end the series
+    last_start_time = interval.get("startsAt")
+    last_price = interval.get(config.price_source)
+    if not last_start_time or last_price is None or interval.get(filter_field) not in filter_values:
+        return
+
+    converted_last_price = config.convert(last_price)
+    yield _make_point(config, _serialize_start(last_start_time), converted_last_price, interval, with_energy_tax=True)
+    next_midnight = last_start_time.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+    midnight_timestamp = next_midnight.isoformat()
+    yield _make_point(config, midnight_timestamp, converted_last_price, interval)
+    yield _null_point(midnight_timestamp)
+
+
+def _segment_points_for_interval(
+    config: TibberPricesChartPointConfig,
+    previous: Mapping[str, Any] | None,
+    interval: Mapping[str, Any],
+    next_interval: Mapping[str, Any],
+    *,
+    filter_field: str,
+    filter_values: list[str],
+    use_rating: bool,
+    connect_segments: bool,
+) -> Iterator[tuple[Any, ...]]:
+    """Yield the points of one interval in segments mode (see _iter_segment_points)."""
+    start_time = interval.get("startsAt")
+    price = interval.get(config.price_source)
+    if start_time is None or price is None:
+        return
+
+    interval_value = interval.get(filter_field)
+    if interval_value not in filter_values:
+        return
+
+    prev_value = previous.get(filter_field) if previous is not None else None
+    prev_price = previous.get(config.price_source) if previous is not None else None
+    next_value = next_interval.get(filter_field)
+    next_price = next_interval.get(config.price_source)
+
+    converted_price = config.convert(price)
+    start_str = _serialize_start(start_time)
+
+    # Check if this is the START of a new segment (previous interval had different level)
+    # and the transition was from a CHEAPER level (price increase)
+    is_segment_start = prev_value != interval_value and prev_value not in filter_values
+    is_from_cheaper = (
+        _is_transition_to_more_expensive(prev_value, interval_value, use_rating=use_rating) if prev_value else False
+    )
+
+    # Add current point FIRST (tooltip will show here - at the actual price!)
+    data_point = _make_point(config, start_str, converted_price, interval, with_energy_tax=True)
+    yield data_point
+
+    # AFTER the real point: Add END-BRIDGE to draw vertical line DOWN to previous price
+    # This ensures the vertical upward transition line is drawn in THIS (more expensive) color
+    # but the tooltip shows the actual (higher) price
+    if connect_segments and is_segment_start and is_from_cheaper and prev_price is not None:
+        # End-bridge: draws line DOWN to previous (cheaper) price, keeps THIS level for color
+        yield _make_point(config, start_str, config.convert(prev_price), interval)
+        # NULL to stop this "bridge sequence" - prevents line from going to next point
+        yield _null_point(start_str)
+
+    yield data_point
+
+    # Check if next interval is different level (segment boundary = END of this segment)
+    if next_value == interval_value:
+        return
+
+    next_start_serialized = _serialize_start(next_interval.get("startsAt"))
+    if connect_segments and next_price is not None:
+        # Connect segments visually at boundaries
+        # Strategy: The vertical line should be drawn by the MORE EXPENSIVE segment
+        #
+        # - Price INCREASE (cheap → expensive): Vertical line belongs to NEXT segment
+        #   → THIS segment just holds at current price, NEXT segment draws the bridge UP
+        #     via its start-bridge logic
+        #
+        # - Price DECREASE (expensive → cheap): Vertical line belongs to THIS segment
+        #   → THIS segment draws the bridge DOWN to next price
+        if _is_transition_to_more_expensive(interval_value, next_value, use_rating=use_rating):
+            yield _make_point(config, next_start_serialized, converted_price, interval)
+        else:
+            yield _make_point(config, next_start_serialized, config.convert(next_price), interval)
+    else:
+        # Original behavior: Hold current price until next timestamp
+        yield _make_point(config, next_start_serialized, converted_price, interval)
+
+    # NULL point: stops the current series (creates the gap)
+    yield _null_point(next_start_serialized)
+
+
+def _drop_trailing_nulls(points: Iterable[tuple[Any, ...]]) -> Iterator[tuple[Any, ...]]:
+    """
+    Yield points without the NULL points at the end of the series.
+
+    Trailing NULLs make the ApexCharts header show "N/A". NULL points are held
+    back until a point with a price follows, so internal NULLs are preserved.
+    """
+    pending_nulls: list[tuple[Any, ...]] = []
+    for point in points:
+        if point[_PRICE] is None:
+            pending_nulls.append(point)
+            continue
+        if pending_nulls:
+            yield from pending_nulls
+            pending_nulls.clear()
+        yield point
+
+
+def _collect_objects(
+    points: Iterable[tuple[Any, ...]],
+    field_names: tuple[str, ...],
+) -> tuple[list[dict[str, Any]], list[Any], list[float | None]]:
+    """
+    Format points as dicts (array_of_objects) and collect the columns metadata needs.
+
+    Args:
+        points: Point tuples
+        field_names: Output field name of each point column
+
+    Returns:
+        Tuple of (chart data dicts, start column, price column)
+
+    """
+    chart_data: list[dict[str, Any]] = []
+    starts: list[Any] = []
+    prices: list[float | None] = []
+    optional_columns = tuple(enumerate(field_names))[_LEVEL:]
+
+    for point in points:
+        item = {field_names[_START]: point[_START], field_names[_PRICE]: point[_PRICE]}
+        for column, field_name in optional_columns:
+            value = point[column]
+            if value is not _ABSENT:
+                item[field_name] = value
+        chart_data.append(item)
+        starts.append(point[_START])
+        prices.append(point[_PRICE])
+
+    return chart_data, starts, prices
+
+
+def _collect_rows(
+    points: Iterable[tuple[Any, ...]],
+    field_names: tuple[str, ...],
+    row_fields: list[str],
+) -> tuple[list[list[Any]], list[Any], list[float | None]]:
+    """
+    Format points as rows (array_of_arrays) and collect the columns metadata needs.
+
+    Rows are taken straight from the point columns; no per-point dict is built.
+
+    Args:
+        points: Point tuples
+        field_names: Output field name of each point column
+        row_fields: Field names of the row template, in row order
+
+    Returns:
+        Tuple of (rows, start column, price column)
+
+    """
+    column_by_field = {field_name: column for column, field_name in enumerate(field_names)}
+    row_columns = [column_by_field.get(field_name) for field_name in row_fields]
+    rows: list[list[Any]] = []
+    starts: list[Any] = []
+    prices: list[float | None] = []
+
+    for point in points:
+        rows.append([None if column is None or point[column] is _ABSENT else point[column] for column in row_columns])
+        starts.append(point[_START])
+        prices.append(point[_PRICE])
+
+    return rows, starts, prices
+
+
 # Service constants
 CHARTDATA_SERVICE_NAME: Final = "get_chartdata"
 ATTR_DAY: Final = "day"
@@ -269,7 +644,7 @@ ATTR_ENTRY_ID: Final = "entry_id"
 ATTR_VIEW: Final = "view_id"
 
 # Parameter types for entity reference resolution
-_CHARTDATA_ENTITY_PARAMS: dict[str, type] = {
+CHARTDATA_ENTITY_PARAMS: dict[str, type] = {
     "round_decimals": int,
 }
 
@@ -356,7 +731,7 @@ async def handle_chartdata(call: ServiceCall) -> dict[str, Any]:  # noqa: C901
     hass = call.hass
 
     # Resolve entity references
-    data, resolved_refs = resolve_entity_references(hass, call.data, _CHARTDATA_ENTITY_PARAMS)
+    data, resolved_refs = resolve_entity_references(hass, call.data, CHARTDATA_ENTITY_PARAMS)
 
     entry_id: str = data.get(ATTR_ENTRY_ID, "")
     view_device_id: str = data.get(ATTR_VIEW, "")
@@ -455,33 +830,25 @@ async def handle_chartdata(call: ServiceCall) -> dict[str, Any]:  # noqa: C901
     # === METADATA-ONLY MODE ===
     # Early return: calculate and return only metadata, skip all data processing
     if metadata == "only":
-        # Get minimal data to calculate metadata (just timestamps and prices)
+        # Get minimal data to calculate metadata (just the timestamp and price columns)
         # Use helper to get intervals for requested days
-        day_offset_map = {"yesterday": -1, "today": 0, "tomorrow": 1}
-        offsets = [day_offset_map[day] for day in days]
-        all_intervals = get_intervals_for_day_offsets(coordinator.data, offsets)
+        all_intervals = get_intervals_for_day_offsets(coordinator.data, [_DAY_OFFSETS[day] for day in days])
 
-        # Build minimal chart_data for metadata calculation
-        chart_data_for_meta = []
+        starts: list[Any] = []
+        prices: list[float | None] = []
         for interval in all_intervals:
             start_time = interval.get("startsAt")
             price = interval.get(price_source)
             if start_time is not None and price is not None:
                 # Convert price to requested currency
-                converted_price = round(price * 100, 2) if subunit_currency else round(price, 4)
-                chart_data_for_meta.append(
-                    {
-                        start_time_field: start_time.isoformat() if hasattr(start_time, "isoformat") else start_time,
-                        price_field: converted_price,
-                    }
-                )
+                starts.append(_serialize_start(start_time))
+                prices.append(round(price * 100, 2) if subunit_currency else round(price, 4))
 
         # Calculate metadata
-        metadata = _calculate_metadata(
-            chart_data=chart_data_for_meta,
-            price_field=price_field,
-            start_time_field=start_time_field,
-            currency=coordinator.data.get("currency", "EUR"),
+        metadata = _calculate_metadata_from_columns(
+            starts,
+            prices,
+            coordinator.data.get("currency", "EUR"),
             resolution=resolution,
             subunit_currency=subunit_currency,
         )
@@ -568,78 +935,43 @@ async def handle_chartdata(call: ServiceCall) -> dict[str, Any]:  # noqa: C901
         )
 
     # === NORMAL HANDLING: Interval Data ===
-    # Get price data for all requested days
-    chart_data = []
+    # Single pass: intervals → (hourly aggregation) → filter / NULL insertion → output format.
+    # Each stage is a generator; only the formatted output and the two columns
+    # needed for metadata (start time, price) are materialized.
 
-    def _add_energy_tax_fields(data_point: dict, interval: dict, price: float | None) -> None:
-        """Add energy and tax fields to a data point if requested and price is not None."""
-        if price is None:
-            return
-        if include_energy and "energy" in interval:
-            energy_val = interval["energy"]
-            if energy_val is not None:
-                energy_val = round(float(energy_val) * 100, 2) if subunit_currency else round(float(energy_val), 4)
-                if round_decimals is not None:
-                    energy_val = round(energy_val, round_decimals)
-                data_point[energy_field] = energy_val
-        if include_tax and "tax" in interval:
-            tax_val = interval["tax"]
-            if tax_val is not None:
-                tax_val = round(float(tax_val) * 100, 2) if subunit_currency else round(float(tax_val), 4)
-                if round_decimals is not None:
-                    tax_val = round(tax_val, round_decimals)
-                data_point[tax_field] = tax_val
+    # Parse the row template up front so an invalid one fails before any work
+    row_fields: list[str] = []
+    if output_format == "array_of_arrays":
+        array_fields_template = data.get("array_fields")
 
-    # Build set of timestamps that match period_filter if specified
-    period_timestamps = None
-    if period_filter:
-        period_timestamps = set()
-        periods_data = coordinator.data.get("pricePeriods", {})
-        period_data = periods_data.get(period_filter)
-        if period_data:
-            period_summaries = period_data.get("periods", [])
-            # Period summaries don't contain intervals, only start/end timestamps
-            # Build set of all 15-minute intervals within period ranges
-            for period_summary in period_summaries:
-                start = period_summary.get("start")
-                end = period_summary.get("end")
-                if start and end:
-                    # Generate all 15-minute timestamps within this period
-                    current = start
-                    while current < end:
-                        period_timestamps.add(current.isoformat())
-                        current = current + coordinator.time.get_interval_duration()
-
-    # Collect all timestamps if insert_nulls='all' (needed to insert NULLs for missing filter matches)
-    all_timestamps = set()
-    if insert_nulls == "all" and (level_filter or rating_level_filter):
-        # Use helper to get intervals for requested days
-        # Map day keys to offsets: yesterday=-1, today=0, tomorrow=1
-        day_offset_map = {"yesterday": -1, "today": 0, "tomorrow": 1}
-        offsets = [day_offset_map[day] for day in days]
-        day_intervals = get_intervals_for_day_offsets(coordinator.data, offsets)
-        all_timestamps = {interval["startsAt"] for interval in day_intervals if interval.get("startsAt")}
-        all_timestamps = sorted(all_timestamps)
+        # Default: nur timestamp und price
+        if not array_fields_template:
+            array_fields_template = f"{{{start_time_field}}}, {{{price_field}}}"
+
+        # Parse template to extract field names
+        row_fields = re.findall(r"\{([^}]+)\}", array_fields_template)
+
+        if not row_fields:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_array_fields",
+                translation_placeholders={"template": array_fields_template},
+            )
 
     # Calculate average if requested (per day for average_field)
-    # Also build a mapping from date -> day_key for later lookup
+    # Also build a mapping from date -> day_key for the per-point lookup
     day_averages: dict[str, float] = {}
     date_to_day_key: dict[Any, str] = {}  # Maps date object to "yesterday"/"today"/"tomorrow"
+    if include_average:
+        for day in days:
+            day_intervals = get_intervals_for_day_offsets(coordinator.data, [_DAY_OFFSETS[day]])
 
-    for day in days:
-        # Use helper to get intervals for this day
-        # Map day key to offset: yesterday=-1, today=0, tomorrow=1
-        day_offset = {"yesterday": -1, "today": 0, "tomorrow": 1}[day]
-        day_intervals = get_intervals_for_day_offsets(coordinator.data, [day_offset])
-
-        # Build date -> day_key mapping from actual interval data
-        for interval in day_intervals:
-            start_time = interval.get("startsAt")
-            if start_time and hasattr(start_time, "date"):
-                date_to_day_key[start_time.date()] = day
+            # Build date -> day_key mapping from actual interval data (TimeService-compatible)
+            for interval in day_intervals:
+                start_time = interval.get("startsAt")
+                if start_time and hasattr(start_time, "date"):
+                    date_to_day_key[start_time.date()] = day
 
-        # Calculate average if requested
-        if include_average:
             prices = [p[price_source] for p in day_intervals if p.get(price_source) is not None]
             if prices:
                 avg = sum(prices) / len(prices)
@@ -649,499 +981,96 @@ async def handle_chartdata(call: ServiceCall) -> dict[str, Any]:  # noqa: C901
                     avg = round(avg, round_decimals)
                 day_averages[day] = avg
 
+    config = TibberPricesChartPointConfig(
+        price_source=price_source,
+        subunit_currency=subunit_currency,
+        round_decimals=round_decimals,
+        include_level=include_level,
+        include_rating_level=include_rating_level,
+        include_average=include_average,
+        include_energy=include_energy,
+        include_tax=include_tax,
+        day_averages=day_averages,
+        date_to_day_key=date_to_day_key,
+    )
+
     # Collect ALL intervals for the selected days as one continuous list
     # This simplifies processing - no special midnight handling needed
-    day_offsets = [{"yesterday": -1, "today": 0, "tomorrow": 1}[day] for day in days]
-    all_prices = get_intervals_for_day_offsets(coordinator.data, day_offsets)
-
-    # For hourly resolution, aggregate BEFORE processing
-    # This keeps the same data format (startsAt, total, level, rating_level)
-    # so all subsequent code (filters, insert_nulls, etc.) works unchanged
-    if resolution == "hourly":
-        all_prices = aggregate_to_hourly(
+    all_prices = get_intervals_for_day_offsets(coordinator.data, [_DAY_OFFSETS[day] for day in days])
+
+    # For hourly resolution, aggregate BEFORE filtering
+    # Hourly points keep the interval format (startsAt, total, level, rating_level),
+    # so the filter and NULL insertion stages work unchanged
+    intervals: Iterable[Mapping[str, Any]] = (
+        iter_hourly_aggregates(
             all_prices,
             coordinator=coordinator,
             threshold_low=threshold_low,
             threshold_high=threshold_high,
         )
-        # Also update all_timestamps for insert_nulls='all' mode
-        all_timestamps = sorted({interval["startsAt"] for interval in all_prices if interval.get("startsAt")})
-
-    # Helper to get day key from interval timestamp for average lookup
-    def _get_day_key_for_interval(interval_start: Any) -> str | None:
-        """Determine which day key (yesterday/today/tomorrow) an interval belongs to."""
-        if not interval_start or not hasattr(interval_start, "date"):
-            return None
-        # Use pre-built mapping from actual interval data (TimeService-compatible)
-        return date_to_day_key.get(interval_start.date())
-
-    # Process price data - same logic handles both interval and hourly resolution
-    # (hourly data was already aggregated above, but has the same format)
-    if resolution in ("interval", "hourly"):
-        if insert_nulls == "all" and (level_filter or rating_level_filter):
-            # Mode 'all': Insert NULL for all timestamps where filter doesn't match
-            # Build a map of timestamp -> interval for quick lookup
-            interval_map = {interval.get("startsAt"): interval for interval in all_prices if interval.get("startsAt")}
-
-            # Process all timestamps, filling gaps with NULL
-            for start_time in all_timestamps:
-                interval = interval_map.get(start_time)
-
-                if interval is None:
-                    # No data for this timestamp - skip entirely
-                    continue
-
-                price = interval.get(price_source)
-                if price is None:
-                    continue
-
-                # Check if this interval matches the filter
-                matches_filter = False
-                if level_filter and "level" in interval:
-                    matches_filter = interval["level"] in level_filter
-                elif rating_level_filter and "rating_level" in interval:
-                    matches_filter = interval["rating_level"] in rating_level_filter
-
-                # If filter is set but doesn't match, insert NULL price
-                if not matches_filter:
-                    price = None
-                elif price is not None:
-                    # Convert to subunit currency (cents/øre) if requested
-                    price = round(price * 100, 2) if subunit_currency else round(price, 4)
-                    # Apply custom rounding if specified
-                    if round_decimals is not None:
-                        price = round(price, round_decimals)
-
-                data_point = {
-                    start_time_field: start_time.isoformat() if hasattr(start_time, "isoformat") else start_time,
-                    price_field: price,
-                }
-
-                # Add level if requested (only when price is not NULL)
-                if include_level and "level" in interval and price is not None:
-                    data_point[level_field] = interval["level"]
-
-                # Add rating_level if requested (only when price is not NULL)
-                if include_rating_level and "rating_level" in interval and price is not None:
-                    data_point[rating_level_field] = interval["rating_level"]
-
-                # Add average if requested
-                day_key = _get_day_key_for_interval(start_time)
-                if include_average and day_key and day_key in day_averages:
-                    data_point[average_field] = day_averages[day_key]
-
-                # Add energy/tax if requested
-                _add_energy_tax_fields(data_point, interval, price)
-
-                chart_data.append(data_point)
-
-        elif insert_nulls == "segments" and period_filter is not None and period_timestamps is not None:
-            # Mode 'segments' with period_filter: Insert NULL separators at period boundaries
-            # so that separate best/peak price periods appear as distinct areas in the chart,
-            # rather than one continuous area spanning the gaps between periods.
-            prev_start_time: Any | None = None
-
-            for interval in all_prices:
-                start_time = interval.get("startsAt")
-                price = interval.get(price_source)
-
-                if start_time is None or price is None:
-                    continue
-
-                start_str = start_time.isoformat() if hasattr(start_time, "isoformat") else start_time
-
-                if start_str not in period_timestamps:
-                    # Leaving a period — close the previous segment with a NULL
-                    if prev_start_time is not None:
-                        chart_data.append({start_time_field: start_str, price_field: None})
-                        prev_start_time = None
-                    continue
-
-                # Still inside a period — check for a temporal gap (new disjoint period starting)
-                if prev_start_time is not None:
-                    interval_duration = coordinator.time.get_interval_duration()
-                    expected = prev_start_time + interval_duration
-                    if start_time != expected:
-                        prev_str = (
-                            prev_start_time.isoformat() if hasattr(prev_start_time, "isoformat") else prev_start_time
-                        )
-                        chart_data.append({start_time_field: prev_str, price_field: None})
-
-                converted_price = round(price * 100, 2) if subunit_currency else round(price, 4)
-                if round_decimals is not None:
-                    converted_price = round(converted_price, round_decimals)
-
-                data_point: dict = {
-                    start_time_field: start_str,
-                    price_field: converted_price,
-                }
-                if include_level and "level" in interval:
-                    data_point[level_field] = interval["level"]
-                if include_rating_level and "rating_level" in interval:
-                    data_point[rating_level_field] = interval["rating_level"]
-                day_key = _get_day_key_for_interval(start_time)
-                if include_average and day_key and day_key in day_averages:
-                    data_point[average_field] = day_averages[day_key]
-                _add_energy_tax_fields(data_point, interval, converted_price)
-
-                chart_data.append(data_point)
-                prev_start_time = start_time
-
-        elif insert_nulls == "segments" and (level_filter or rating_level_filter):
-            # Mode 'segments': Add NULL points at segment boundaries for clean gaps
-            # Process ALL intervals as one continuous list - no special midnight handling needed
-            filter_field = "rating_level" if rating_level_filter else "level"
-            filter_values = rating_level_filter or level_filter
-            use_rating = rating_level_filter is not None
-
-            for i in range(len(all_prices) - 1):
-                interval = all_prices[i]
-                next_interval = all_prices[i + 1]
-
-                start_time = interval.get("startsAt")
-                price = interval.get(price_source)
-                next_price = next_interval.get(price_source)
-                next_start_time = next_interval.get("startsAt")
-
-                if start_time is None or price is None:
-                    continue
-
-                interval_value = interval.get(filter_field)
-                next_value = next_interval.get(filter_field)
-                prev_value = all_prices[i - 1].get(filter_field) if i > 0 else None
-                prev_price = all_prices[i - 1].get(price_source) if i > 0 else None
-
-                # Check if current interval matches filter
-                if interval_value in filter_values:  # type: ignore[operator]
-                    # Convert price
-                    converted_price = round(price * 100, 2) if subunit_currency else round(price, 4)
-                    if round_decimals is not None:
-                        converted_price = round(converted_price, round_decimals)
-
-                    # Check if this is the START of a new segment (previous interval had different level)
-                    # and the transition was from a CHEAPER level (price increase)
-                    is_segment_start = prev_value != interval_value and prev_value not in filter_values  # type: ignore[operator]
-                    is_from_cheaper = (
-                        _is_transition_to_more_expensive(prev_value, interval_value, use_rating=use_rating)
-                        if prev_value
-                        else False
-                    )
-
-                    # Add current point FIRST (tooltip will show here - at the actual price!)
-                    data_point = {
-                        start_time_field: start_time.isoformat() if hasattr(start_time, "isoformat") else start_time,
-                        price_field: converted_price,
-                    }
-
-                    if include_level and "level" in interval:
-                        data_point[level_field] = interval["level"]
-                    if include_rating_level and "rating_level" in interval:
-                        data_point[rating_level_field] = interval["rating_level"]
-
-                    day_key = _get_day_key_for_interval(start_time)
-                    if include_average and day_key and day_key in day_averages:
-                        data_point[average_field] = day_averages[day_key]
-
-                    _add_energy_tax_fields(data_point, interval, converted_price)
-
-                    chart_data.append(data_point)
-
-                    # AFTER the real point: Add END-BRIDGE to draw vertical line DOWN to previous price
-                    # This ensures the vertical upward transition line is drawn in THIS (more expensive) color
-                    # but the tooltip shows the actual (higher) price
-                    if connect_segments and is_segment_start and is_from_cheaper and prev_price is not None:
-                        converted_prev_price = round(prev_price * 100, 2) if subunit_currency else round(prev_price, 4)
-                        if round_decimals is not None:
-                            converted_prev_price = round(converted_prev_price, round_decimals)
-
-                        # End-bridge: draws line DOWN to previous (cheaper) price
-                        end_bridge = {
-                            start_time_field: start_time.isoformat()
-                            if hasattr(start_time, "isoformat")
-                            else start_time,
-                            price_field: converted_prev_price,  # Go DOWN to previous (cheaper) price
-                        }
-                        if include_level and "level" in interval:
-                            end_bridge[level_field] = interval["level"]  # Keep THIS level for color
-                        if include_rating_level and "rating_level" in interval:
-                            end_bridge[rating_level_field] = interval["rating_level"]
-                        if include_average and day_key and day_key in day_averages:
-                            end_bridge[average_field] = day_averages[day_key]
-                        chart_data.append(end_bridge)
-
-                        # NULL to stop this "bridge sequence" - prevents line from going to next point
-                        null_point = {start_time_field: data_point[start_time_field], price_field: None}
-                        chart_data.append(null_point)
-
-                    chart_data.append(data_point)
-
-                    # Check if next interval is different level (segment boundary = END of this segment)
-                    if next_value != interval_value:
-                        next_start_serialized = (
-                            next_start_time.isoformat()
-                            if next_start_time and hasattr(next_start_time, "isoformat")
-                            else next_start_time
-                        )
-
-                        is_to_more_expensive = _is_transition_to_more_expensive(
-                            interval_value, next_value, use_rating=use_rating
-                        )
-
-                        if connect_segments and next_price is not None:
-                            # Connect segments visually at boundaries
-                            # Strategy: The vertical line should be drawn by the MORE EXPENSIVE segment
-                            #
-                            # - Price INCREASE (cheap → expensive): Vertical line belongs to NEXT segment
-                            #   → THIS segment just holds at current price, NEXT segment draws the bridge UP
-                            #   → We add a hold point here, the start-bridge logic handles the NEXT segment
-                            #
-                            # - Price DECREASE (expensive → cheap): Vertical line belongs to THIS segment
-                            #   → THIS segment draws the bridge DOWN to next price
-
-                            if is_to_more_expensive:
-                                # Transition to MORE EXPENSIVE level (price increase)
-                                # Just hold at current price - the NEXT segment will draw the upward line
-                                # via its start-bridge logic
-                                hold_point = {
-                                    start_time_field: next_start_serialized,
-                                    price_field: converted_price,  # Hold at CURRENT price
-                                }
-                                if include_level and "level" in interval:
-                                    hold_point[level_field] = interval["level"]
-                                if include_rating_level and "rating_level" in interval:
-                                    hold_point[rating_level_field] = interval["rating_level"]
-                                if include_average and day_key and day_key in day_averages:
-                                    hold_point[average_field] = day_averages[day_key]
-                                chart_data.append(hold_point)
-                            else:
-                                # Transition to LESS EXPENSIVE or SAME level (price decrease/stable)
-                                # Draw the bridge DOWN to the next price in THIS level's color
-                                converted_next_price = (
-                                    round(next_price * 100, 2) if subunit_currency else round(next_price, 4)
-                                )
-                                if round_decimals is not None:
-                                    converted_next_price = round(converted_next_price, round_decimals)
-
-                                bridge_point = {
-                                    start_time_field: next_start_serialized,
-                                    price_field: converted_next_price,
-                                }
-                                if include_level and "level" in interval:
-                                    bridge_point[level_field] = interval["level"]
-                                if include_rating_level and "rating_level" in interval:
-                                    bridge_point[rating_level_field] = interval["rating_level"]
-                                if include_average and day_key and day_key in day_averages:
-                                    bridge_point[average_field] = day_averages[day_key]
-                                chart_data.append(bridge_point)
-
-                            # NULL point: stops the current series
-                            null_point = {start_time_field: next_start_serialized, price_field: None}
-                            chart_data.append(null_point)
-                        else:
-                            # Original behavior: Hold current price until next timestamp
-                            hold_point = {
-                                start_time_field: next_start_serialized,
-                                price_field: converted_price,
-                            }
-                            if include_level and "level" in interval:
-                                hold_point[level_field] = interval["level"]
-                            if include_rating_level and "rating_level" in interval:
-                                hold_point[rating_level_field] = interval["rating_level"]
-                            if include_average and day_key and day_key in day_averages:
-                                hold_point[average_field] = day_averages[day_key]
-                            chart_data.append(hold_point)
-
-                            # Add NULL point to create gap
-                            null_point = {start_time_field: next_start_serialized, price_field: None}
-                            chart_data.append(null_point)
-
-            # Handle LAST interval of the entire selection (not per-day)
-            # The main loop processes up to n-1, so we need to add the last interval
-            if all_prices:
-                last_interval = all_prices[-1]
-                last_start_time = last_interval.get("startsAt")
-                last_price = last_interval.get(price_source)
-                last_value = last_interval.get(filter_field)
-
-                if last_start_time and last_price is not None and last_value in filter_values:  # type: ignore[operator]
-                    # Add the last interval as a data point
-                    converted_last_price = round(last_price * 100, 2) if subunit_currency else round(last_price, 4)
-                    if round_decimals is not None:
-                        converted_last_price = round(converted_last_price, round_decimals)
-
-                    last_data_point = {
-                        start_time_field: last_start_time.isoformat()
-                        if hasattr(last_start_time, "isoformat")
-                        else last_start_time,
-                        price_field: converted_last_price,
-                    }
-                    if include_level and "level" in last_interval:
-                        last_data_point[level_field] = last_interval["level"]
-                    if include_rating_level and "rating_level" in last_interval:
-                        last_data_point[rating_level_field] = last_interval["rating_level"]
-
-                    day_key = _get_day_key_for_interval(last_start_time)
-                    if include_average and day_key and day_key in day_averages:
-                        last_data_point[average_field] = day_averages[day_key]
-
-                    _add_energy_tax_fields(last_data_point, last_interval, converted_last_price)
-
-                    chart_data.append(last_data_point)
-
-                    # Extend to end of selected time range (midnight after last day)
-                    last_dt = last_start_time
-                    if last_dt:
-                        # Calculate midnight after the last interval
-                        next_midnight = last_dt.replace(hour=0, minute=0, second=0, microsecond=0)
-                        next_midnight = next_midnight + timedelta(days=1)
-                        midnight_timestamp = next_midnight.isoformat()
-
-                        # Add hold point at midnight
-                        end_point = {start_time_field: midnight_timestamp, price_field: converted_last_price}
-                        if include_level and "level" in last_interval:
-                            end_point[level_field] = last_interval["level"]
-                        if include_rating_level and "rating_level" in last_interval:
-                            end_point[rating_level_field] = last_interval["rating_level"]
-                        if include_average and day_key and day_key in day_averages:
-                            end_point[average_field] = day_averages[day_key]
-                        chart_data.append(end_point)
-
-                        # Add NULL to end series
-                        null_point = {start_time_field: midnight_timestamp, price_field: None}
-                        chart_data.append(null_point)
+        if resolution == "hourly"
+        else all_prices
+    )
 
-        else:
-            # Mode 'none' (default): Only return matching intervals, no NULL insertion
-            for interval in all_prices:
-                start_time = interval.get("startsAt")
-                price = interval.get(price_source)
-
-                if start_time is not None and price is not None:
-                    # Apply period filter if specified
-                    if (
-                        period_filter is not None
-                        and period_timestamps is not None
-                        and start_time not in period_timestamps
-                    ):
-                        continue
-
-                    # Apply level filter if specified
-                    if level_filter is not None and "level" in interval and interval["level"] not in level_filter:
-                        continue
-
-                    # Apply rating_level filter if specified
-                    if (
-                        rating_level_filter is not None
-                        and "rating_level" in interval
-                        and interval["rating_level"] not in rating_level_filter
-                    ):
-                        continue
-
-                    # Convert to subunit currency (cents/øre) if requested
-                    price = round(price * 100, 2) if subunit_currency else round(price, 4)
-
-                    # Apply custom rounding if specified
-                    if round_decimals is not None:
-                        price = round(price, round_decimals)
-
-                    data_point = {
-                        start_time_field: start_time.isoformat() if hasattr(start_time, "isoformat") else start_time,
-                        price_field: price,
-                    }
-
-                    # Add level if requested
-                    if include_level and "level" in interval:
-                        data_point[level_field] = interval["level"]
-
-                    # Add rating_level if requested
-                    if include_rating_level and "rating_level" in interval:
-                        data_point[rating_level_field] = interval["rating_level"]
-
-                    # Add average if requested
-                    day_key = _get_day_key_for_interval(start_time)
-                    if include_average and day_key and day_key in day_averages:
-                        data_point[average_field] = day_averages[day_key]
-
-                    _add_energy_tax_fields(data_point, interval, price)
-
-                    chart_data.append(data_point)
-
-    # Remove trailing null values ONLY for insert_nulls='segments' mode.
-    # For 'all' mode, trailing nulls are intentional (show no-match until end of day).
-    # For 'segments' mode, trailing nulls cause ApexCharts header to show "N/A".
-    # Internal nulls at segment boundaries are preserved for gap visualization.
-    if insert_nulls == "segments":
-        while chart_data and chart_data[-1].get(price_field) is None:
-            chart_data.pop()
+    if insert_nulls == "all" and (level_filter or rating_level_filter):
+        # Mode 'all': Insert NULL for all timestamps where filter doesn't match
+        points = _iter_points_with_nulls(intervals, config, level_filter, rating_level_filter)
+    elif insert_nulls == "segments" and (level_filter or rating_level_filter):
+        # Mode 'segments': Add NULL points at segment boundaries for clean gaps.
+        # Trailing NULLs are removed (they make the ApexCharts header show "N/A");
+        # for 'all' mode they are intentional (show no-match until end of day).
+        points = _drop_trailing_nulls(
+            _iter_segment_points(
+                intervals,
+                config,
+                "rating_level" if rating_level_filter else "level",
+                rating_level_filter or level_filter,
+                use_rating=rating_level_filter is not None,
+                connect_segments=connect_segments,
+            )
+        )
+    else:
+        # Mode 'none' (default): Only return matching intervals, no NULL insertion
+        points = _iter_filtered_points(intervals, config, level_filter, rating_level_filter)
+
+    field_names = (
+        start_time_field,
+        price_field,
+        level_field,
+        rating_level_field,
+        average_field,
+        energy_field,
+        tax_field,
+    )
 
     # Convert to array of arrays format if requested
     if output_format == "array_of_arrays":
-        array_fields_template = data.get("array_fields")
-
-        # Default: nur timestamp und price
-        if not array_fields_template:
-            array_fields_template = f"{{{start_time_field}}}, {{{price_field}}}"
-
-        # Parse template to extract field names
-        field_pattern = re.compile(r"\{([^}]+)\}")
-        field_names = field_pattern.findall(array_fields_template)
-
-        if not field_names:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="invalid_array_fields",
-                translation_placeholders={"template": array_fields_template},
-            )
-
-        # Convert to [[field1, field2, ...], ...] format
-        points = []
-        for item in chart_data:
-            row = []
-            for field_name in field_names:
-                # Get value from item, or None if field doesn't exist
-                value = item.get(field_name)
-                row.append(value)
-            points.append(row)
+        rows, starts, prices = _collect_rows(points, field_names, row_fields)
 
         # Add final null point for stepline rendering if requested
         # (some chart libraries need this to prevent extrapolation to viewport edge)
-        if add_trailing_null and points:
-            null_row = [points[-1][0]] + [None] * (len(field_names) - 1)
-            points.append(null_row)
-
-        # Calculate metadata (before adding trailing null to chart_data)
-        result = {data_key: points}
-        if metadata in ("include", "only"):
-            metadata_obj = _calculate_metadata(
-                chart_data=chart_data,
-                price_field=price_field,
-                start_time_field=start_time_field,
-                currency=coordinator.data.get("currency", "EUR"),
-                resolution=resolution,
-                subunit_currency=subunit_currency,
-            )
-            if metadata_obj:
-                result["metadata"] = metadata_obj  # type: ignore[index]
-        if resolved_refs:
-            result["_resolved"] = resolved_refs  # type: ignore[index]
-        return result
+        if add_trailing_null and rows:
+            rows.append([rows[-1][0]] + [None] * (len(row_fields) - 1))
+
+        result: dict[str, Any] = {data_key: rows}
+    else:
+        chart_data, starts, prices = _collect_objects(points, field_names)
+        result = {data_key: chart_data}
 
     # Calculate metadata (before adding trailing null)
-    result = {data_key: chart_data}
     if metadata in ("include", "only"):
-        metadata_obj = _calculate_metadata(
-            chart_data=chart_data,
-            price_field=price_field,
-            start_time_field=start_time_field,
-            currency=coordinator.data.get("currency", "EUR"),
+        metadata_obj = _calculate_metadata_from_columns(
+            starts,
+            prices,
+            coordinator.data.get("currency", "EUR"),
             resolution=resolution,
             subunit_currency=subunit_currency,
         )
         if metadata_obj:
-            result["metadata"] = metadata_obj  # type: ignore[index]
+            result["metadata"] = metadata_obj
 
     # Add trailing null point for array_of_objects format if requested
-    if add_trailing_null and chart_data:
+    if output_format != "array_of_arrays" and add_trailing_null and chart_data:
         # Create a null point with only timestamp from last item, all other fields as None
         last_item = chart_data[-1]
         null_point = {start_time_field: last_item.get(start_time_field)}
@@ -1152,6 +1081,6 @@ async def handle_chartdata(call: ServiceCall) -> dict[str, Any]:  # noqa: C901
         chart_data.append(null_point)
 
     if resolved_refs:
-        result["_resolved"] = resolved_refs  # type: ignore[index]
+        result["_resolved"] = resolved_refs
 
     return result
@@ -34,7 +34,7 @@ _LOGGER = logging.getLogger(__name__)
 
 GET_PRICE_SERVICE_NAME = "get_price"
 
-_PRICE_ENTITY_PARAMS: dict[str, type] = {
+PRICE_ENTITY_PARAMS: dict[str, type] = {
     "start_time": datetime,
     "end_time": datetime,
 }
@@ -78,7 +78,7 @@ async def handle_get_price(call: ServiceCall) -> ServiceResponse:
     hass: HomeAssistant = call.hass
 
     # Resolve entity references
-    data, resolved_refs = resolve_entity_references(hass, call.data, _PRICE_ENTITY_PARAMS)
+    data, resolved_refs = resolve_entity_references(hass, call.data, PRICE_ENTITY_PARAMS)
 
     entry_id: str = data.get("entry_id", "")
     view_device_id: str = data.get("view_id", "")
@@ -43,6 +43,7 @@ from custom_components.tibber_prices.api.exceptions import (
 )
 from custom_components.tibber_prices.const import DOMAIN
 from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
+from custom_components.tibber_prices.utils.interval_time import parse_starts_at
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.util import dt as dt_util
@@ -240,6 +241,23 @@ def validate_power_profile_length(
         )
 
 
+def validate_unique_device_names(names: list[str]) -> None:
+    """
+    Validate that every device of a batch call has its own name.
+
+    Raises:
+        ServiceValidationError: If a name is used more than once
+
+    """
+    duplicate_names = sorted({name for name in names if names.count(name) > 1})
+    if duplicate_names:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="duplicate_device_names",
+            translation_placeholders={"names": ", ".join(duplicate_names)},
+        )
+
+
 @dataclass(frozen=True)
 class ServiceTarget:
     """What a service call operates on: a home, or one time-travel view of it.
@@ -792,10 +810,7 @@ def build_response_interval(
 
     """
     starts_at = iv["startsAt"]
-    if isinstance(starts_at, str):
-        ends_at = (datetime.fromisoformat(starts_at) + timedelta(minutes=INTERVAL_MINUTES)).isoformat()
-    else:
-        ends_at = (starts_at + timedelta(minutes=INTERVAL_MINUTES)).isoformat()
+    ends_at = (parse_starts_at(starts_at) + timedelta(minutes=INTERVAL_MINUTES)).isoformat()
 
     return {
         "starts_at": starts_at,
@@ -806,6 +821,71 @@ def build_response_interval(
     }
 
 
+def interval_start(interval: dict[str, Any]) -> datetime:
+    """Return the start of a price interval as a datetime."""
+    return parse_starts_at(interval["startsAt"])
+
+
+def resolve_soc_value(
+    data: dict[str, Any],
+    *,
+    percent_key: str,
+    kwh_key: str,
+    capacity_kwh: float | None,
+    field_name: str,
+    required: bool,
+) -> float | None:
+    """
+    Resolve a state of charge given either in percent or in kWh.
+
+    Args:
+        data: Service call data
+        percent_key: Parameter name of the percent variant
+        kwh_key: Parameter name of the kWh variant
+        capacity_kwh: Battery capacity, needed to convert a percent value
+        field_name: Name used in the error translation keys
+        required: Whether a missing value is an error
+
+    Returns:
+        State of charge in kWh, or None if it is optional and not given
+
+    Raises:
+        ServiceValidationError: If both or (when required) neither variant is
+            given, or a percent value is given without a capacity
+
+    """
+    # Deferred: the charging package imports this module
+    from .charging import soc_percent_to_kwh  # noqa: PLC0415
+
+    has_percent = percent_key in data
+    has_kwh = kwh_key in data
+
+    if has_percent and has_kwh:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="ambiguous_soc_input",
+            translation_placeholders={"field": field_name},
+        )
+
+    if not has_percent and not has_kwh:
+        if required:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key=f"missing_{field_name}",
+            )
+        return None
+
+    if has_percent:
+        if capacity_kwh is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="capacity_required_for_percent",
+            )
+        return soc_percent_to_kwh(float(data[percent_key]), capacity_kwh)
+
+    return float(data[kwh_key])
+
+
 def resolve_search_range(
     call_data: dict[str, Any],
     now: datetime,
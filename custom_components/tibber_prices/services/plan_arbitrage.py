@@ -0,0 +1,374 @@
+"""Service handler for the plan_arbitrage service."""
+
+from __future__ import annotations
+
+from datetime import datetime, time as dt_time, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from custom_components.tibber_prices.const import DOMAIN, get_display_unit_factor, get_display_unit_string
+from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange, calculate_window_statistics
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .charging import soc_percent_to_kwh, solve_arbitrage_schedule
+from .entity_resolver import or_entity_ref, resolve_entity_references
+from .helpers import (
+    INTERVAL_MINUTES,
+    VALID_SEARCH_SCOPES,
+    async_fetch_service_intervals,
+    build_rating_lookup,
+    build_response_interval,
+    interval_start,
+    resolve_home_timezone,
+    resolve_search_range,
+    resolve_service_target,
+    resolve_soc_value,
+    validate_search_params,
+)
+
+if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+
+    from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+PLAN_ARBITRAGE_SERVICE_NAME = "plan_arbitrage"
+
+_ARBITRAGE_ENTITY_PARAMS: dict[str, type] = {
+    "battery_capacity_kwh": float,
+    "current_soc_percent": float,
+    "current_soc_kwh": float,
+    "min_soc_percent": float,
+    "max_soc_percent": float,
+    "final_soc_percent": float,
+    "max_charge_power_w": int,
+    "max_discharge_power_w": int,
+    "charging_efficiency": float,
+    "discharging_efficiency": float,
+    "max_cycles_per_day": int,
+    "search_start": datetime,
+    "search_end": datetime,
+    "search_start_time": dt_time,
+    "search_end_time": dt_time,
+    "search_start_day_offset": int,
+    "search_end_day_offset": int,
+    "search_start_offset_minutes": int,
+    "search_end_offset_minutes": int,
+}
+
+PLAN_ARBITRAGE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entry_id", default=""): cv.string,
+        vol.Optional("view_id", default=""): cv.string,
+        vol.Required("battery_capacity_kwh"): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.1, max=1000.0)),
+        ),
+        vol.Optional("current_soc_percent"): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0)),
+        ),
+        vol.Optional("current_soc_kwh"): or_entity_ref(vol.All(vol.Coerce(float), vol.Range(min=0.0))),
+        vol.Optional("min_soc_percent", default=0.0): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0)),
+        ),
+        vol.Optional("max_soc_percent", default=100.0): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0)),
+        ),
+        vol.Optional("final_soc_percent"): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.0, max=100.0)),
+        ),
+        vol.Required("max_charge_power_w"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=100000)),
+        ),
+        vol.Optional("max_discharge_power_w"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=100000)),
+        ),
+        vol.Optional("charging_efficiency", default=1.0): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.5, max=1.0)),
+        ),
+        vol.Optional("discharging_efficiency", default=1.0): or_entity_ref(
+            vol.All(vol.Coerce(float), vol.Range(min=0.5, max=1.0)),
+        ),
+        vol.Optional("max_cycles_per_day"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+        ),
+        vol.Optional("search_start"): or_entity_ref(cv.datetime),
+        vol.Optional("search_end"): or_entity_ref(cv.datetime),
+        vol.Optional("search_start_time"): or_entity_ref(cv.time),
+        vol.Optional("search_start_day_offset", default=0): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=-7, max=2)),
+        ),
+        vol.Optional("search_end_time"): or_entity_ref(cv.time),
+        vol.Optional("search_end_day_offset", default=0): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=-7, max=2)),
+        ),
+        vol.Optional("search_start_offset_minutes"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=-10080, max=10080)),
+        ),
+        vol.Optional("search_end_offset_minutes"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=-10080, max=10080)),
+        ),
+        vol.Optional("search_scope"): vol.In(VALID_SEARCH_SCOPES),
+        vol.Optional("include_current_interval", default=True): cv.boolean,
+        vol.Optional("use_base_unit", default=False): cv.boolean,
+    }
+)
+
+
+def _validate_battery_inputs(data: dict[str, Any]) -> dict[str, float]:
+    capacity_kwh = float(data["battery_capacity_kwh"])
+    current_soc_kwh = resolve_soc_value(
+        data,
+        percent_key="current_soc_percent",
+        kwh_key="current_soc_kwh",
+        capacity_kwh=capacity_kwh,
+        field_name="current_soc",
+        required=True,
+    )
+    if current_soc_kwh is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_current_soc",
+        )
+
+    min_soc_kwh = soc_percent_to_kwh(float(data.get("min_soc_percent", 0.0)), capacity_kwh)
+    max_soc_kwh = soc_percent_to_kwh(float(data.get("max_soc_percent", 100.0)), capacity_kwh)
+    if min_soc_kwh >= max_soc_kwh - 1e-6:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_soc_limits",
+        )
+
+    # The plan starts from the current SoC even when it lies outside the limits
+    current_soc_kwh = min(max(current_soc_kwh, min_soc_kwh), max_soc_kwh)
+    final_soc_kwh = (
+        soc_percent_to_kwh(float(data["final_soc_percent"]), capacity_kwh)
+        if "final_soc_percent" in data
+        else current_soc_kwh
+    )
+    return {
+        "capacity_kwh": capacity_kwh,
+        "current_soc_kwh": current_soc_kwh,
+        "min_soc_kwh": min_soc_kwh,
+        "max_soc_kwh": max_soc_kwh,
+        "final_soc_kwh": min(max(final_soc_kwh, min_soc_kwh), max_soc_kwh),
+    }
+
+
+def _build_battery_info(
+    battery: dict[str, float],
+    *,
+    charging_efficiency: float,
+    discharging_efficiency: float,
+    achieved_final_soc_kwh: float,
+    final_soc_met: bool,
+) -> dict[str, Any]:
+    capacity_kwh = battery["capacity_kwh"]
+    info: dict[str, Any] = {
+        "capacity_kwh": round(capacity_kwh, 4),
+        "charging_efficiency": charging_efficiency,
+        "discharging_efficiency": discharging_efficiency,
+        "round_trip_efficiency": round(charging_efficiency * discharging_efficiency, 4),
+        "final_soc_met": final_soc_met,
+    }
+    for key, value in (
+        ("current_soc", battery["current_soc_kwh"]),
+        ("min_soc", battery["min_soc_kwh"]),
+        ("max_soc", battery["max_soc_kwh"]),
+        ("required_final_soc", battery["final_soc_kwh"]),
+        ("final_soc", achieved_final_soc_kwh),
+    ):
+        info[f"{key}_kwh"] = round(value, 4)
+        info[f"{key}_percent"] = round(value / capacity_kwh * 100.0, 2)
+    return info
+
+
+def _build_arbitrage_interval(
+    interval: dict[str, Any],
+    *,
+    capacity_kwh: float,
+    unit_factor: int,
+    rating_lookup: dict[str, str | None],
+) -> dict[str, Any]:
+    response = build_response_interval(interval, unit_factor, rating_lookup)
+    response["action"] = interval["action"]
+    response["power_w"] = interval["power_w"]
+    response["energy_kwh"] = interval["energy_kwh"]
+    response["battery_energy_kwh"] = interval["battery_energy_kwh"]
+    response["soc_after_kwh"] = interval["soc_after_kwh"]
+    response["soc_after_percent"] = round(interval["soc_after_kwh"] / capacity_kwh * 100.0, 2)
+    return response
+
+
+def _build_response_segments(
+    plan: dict[str, Any],
+    *,
+    capacity_kwh: float,
+    unit_factor: int,
+    rating_lookup: dict[str, str | None],
+) -> list[dict[str, Any]]:
+    response_segments: list[dict[str, Any]] = []
+    for segment in plan["segments"]:
+        seg_stats = calculate_window_statistics(
+            segment["intervals"],
+            unit_factor=unit_factor,
+            round_decimals=4,
+            power_profile=[int(interval["power_w"]) for interval in segment["intervals"]],
+        )
+        segment_end = interval_start(segment["intervals"][-1]) + timedelta(minutes=INTERVAL_MINUTES)
+        response_segments.append(
+            {
+                "action": segment["action"],
+                "start": segment["start"],
+                "end": segment_end.isoformat(),
+                "duration_minutes": segment["duration_minutes"],
+                "interval_count": segment["interval_count"],
+                "energy_kwh": round(sum(float(interval["energy_kwh"]) for interval in segment["intervals"]), 6),
+                "price_mean": seg_stats.get("price_mean"),
+                "intervals": [
+                    _build_arbitrage_interval(
+                        interval, capacity_kwh=capacity_kwh, unit_factor=unit_factor, rating_lookup=rating_lookup
+                    )
+                    for interval in segment["intervals"]
+                ],
+            }
+        )
+    return response_segments
+
+
+async def handle_plan_arbitrage(call: ServiceCall) -> ServiceResponse:
+    """Handle the plan_arbitrage service call."""
+    hass: HomeAssistant = call.hass
+    data, resolved_refs = resolve_entity_references(hass, call.data, _ARBITRAGE_ENTITY_PARAMS)
+
+    battery = _validate_battery_inputs(data)
+    entry_id = data.get("entry_id", "")
+    view_device_id = data.get("view_id", "")
+    max_charge_power_w = int(data["max_charge_power_w"])
+    max_discharge_power_w = int(data.get("max_discharge_power_w", max_charge_power_w))
+    charging_efficiency = float(data.get("charging_efficiency", 1.0))
+    discharging_efficiency = float(data.get("discharging_efficiency", 1.0))
+    max_cycles_per_day = int(data["max_cycles_per_day"]) if "max_cycles_per_day" in data else None
+    use_base_unit = bool(data.get("use_base_unit", False))
+
+    target = resolve_service_target(hass, entry_id, view_device_id)
+    entry = target.entry
+    coordinator = target.coordinator
+    rating_lookup = build_rating_lookup(target.data)
+    home_id = entry.data.get("home_id")
+    if not home_id:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_home_id",
+        )
+
+    validate_search_params(data)
+    home_timezone = resolve_home_timezone(coordinator, home_id)
+    from zoneinfo import ZoneInfo  # noqa: PLC0415
+
+    home_tz: ZoneInfo = ZoneInfo(home_timezone)
+    now = target.now(home_tz)
+    search_start, search_end = resolve_search_range(data, now, home_tz)
+
+    currency = entry.data.get("currency", "EUR")
+    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
+    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+
+    api_client = coordinator.api
+    user_data = coordinator._cached_user_data  # noqa: SLF001
+    price_info, fetch_ok = await async_fetch_service_intervals(
+        target.interval_pool,
+        api_client=api_client,
+        user_data=user_data,
+        start_time=search_start,
+        end_time=search_end,
+        service_label=PLAN_ARBITRAGE_SERVICE_NAME,
+    )
+
+    response: dict[str, Any] = {
+        "success": True,
+        "home_id": home_id,
+        "search_start": search_start.isoformat(),
+        "search_end": search_end.isoformat(),
+        "intervals_found": False,
+        "currency": currency,
+        "price_unit": price_unit,
+        "battery": _build_battery_info(
+            battery,
+            charging_efficiency=charging_efficiency,
+            discharging_efficiency=discharging_efficiency,
+            achieved_final_soc_kwh=battery["current_soc_kwh"],
+            final_soc_met=battery["current_soc_kwh"] >= battery["final_soc_kwh"] - 1e-6,
+        ),
+        "arbitrage": None,
+    }
+    if resolved_refs:
+        response["_resolved"] = resolved_refs
+
+    if not fetch_ok:
+        # Price data unavailable (API outage on uncached range); automations can check success
+        response["success"] = False
+        response["reason"] = "price_data_unavailable"
+        return response
+    if not price_info:
+        response["reason"] = "no_data_in_range"
+        return response
+
+    prepared = TibberPricesPreparedRange(price_info)
+    plan = solve_arbitrage_schedule(
+        price_info,
+        current_soc_kwh=battery["current_soc_kwh"],
+        min_soc_kwh=battery["min_soc_kwh"],
+        max_soc_kwh=battery["max_soc_kwh"],
+        max_charge_power_w=max_charge_power_w,
+        max_discharge_power_w=max_discharge_power_w,
+        charging_efficiency=charging_efficiency,
+        discharging_efficiency=discharging_efficiency,
+        min_final_soc_kwh=battery["final_soc_kwh"],
+        max_cycles_per_day=max_cycles_per_day,
+        interval_minutes=INTERVAL_MINUTES,
+        prepared=prepared,
+    )
+    if plan is None:
+        _LOGGER.warning("%s: planning exceeded its time budget", PLAN_ARBITRAGE_SERVICE_NAME)
+        response["reason"] = "time_budget_exceeded"
+        return response
+
+    response["battery"] = _build_battery_info(
+        battery,
+        charging_efficiency=charging_efficiency,
+        discharging_efficiency=discharging_efficiency,
+        achieved_final_soc_kwh=plan["final_soc_kwh"],
+        final_soc_met=plan["final_soc_met"],
+    )
+    if not plan["intervals"]:
+        response["reason"] = "no_profitable_arbitrage"
+        return response
+
+    response_segments = _build_response_segments(
+        plan, capacity_kwh=battery["capacity_kwh"], unit_factor=unit_factor, rating_lookup=rating_lookup
+    )
+    first_dt = datetime.fromisoformat(response_segments[0]["start"])
+    response["intervals_found"] = True
+    response["arbitrage"] = {
+        "charge_power_w": max_charge_power_w,
+        "discharge_power_w": max_discharge_power_w,
+        "max_cycles_per_day": max_cycles_per_day,
+        "soc_step_kwh": plan["soc_step_kwh"],
+        "charged_energy_kwh": plan["charged_energy_kwh"],
+        "discharged_energy_kwh": plan["discharged_energy_kwh"],
+        "charge_cost": round(plan["charge_cost"] * unit_factor, 4),
+        "discharge_value": round(plan["discharge_value"] * unit_factor, 4),
+        "profit": round(plan["profit"] * unit_factor, 4),
+        "schedule": {
+            "segment_count": len(response_segments),
+            "charge_segment_count": sum(1 for segment in response_segments if segment["action"] == "charge"),
+            "discharge_segment_count": sum(1 for segment in response_segments if segment["action"] == "discharge"),
+            "segments": response_segments,
+            "seconds_until_start": max(0, int((first_dt - now).total_seconds())),
+        },
+    }
+    return response
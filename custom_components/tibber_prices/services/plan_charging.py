@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time as dt_time, timedelta
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
 from custom_components.tibber_prices.const import DOMAIN, get_display_unit_factor, get_display_unit_string
 from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
     calculate_window_statistics,
     find_cheapest_n_intervals,
     group_intervals_into_segments,
@@ -19,18 +21,21 @@ from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import config_validation as cv
 
 from .charging import (
+    CHARGE_SOLVER_TIME_BUDGET_SECONDS,
     apply_segment_constraints,
     build_deadline_schedule,
+    build_economics_filter_metadata,
     build_power_schedule,
     build_soc_progression_from_schedule,
     calculate_energy_needed,
     calculate_plan_economics,
     determine_power_mode,
     energy_for_power,
-    filter_intervals_by_profitability,
     get_deadline_events,
+    profitability_exclusions,
     resolve_deadline,
-    soc_percent_to_kwh,
+    schedule_cost,
+    solve_charge_schedule,
 )
 from .entity_resolver import or_entity_ref, resolve_entity_references
 from .helpers import (
@@ -44,11 +49,14 @@ from .helpers import (
     calculate_search_range_avg,
     check_min_distance_from_avg,
     filter_intervals_by_price_level,
+    interval_start,
     resolve_home_timezone,
     resolve_search_range,
     resolve_service_target,
+    resolve_soc_value,
     validate_price_level_range,
     validate_search_params,
+    validate_unique_device_names,
 )
 from .relaxation import (
     MIN_RELAXED_DURATION_INTERVALS,
@@ -64,6 +72,7 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 PLAN_CHARGING_SERVICE_NAME = "plan_charging"
+PLAN_CHARGING_BATCH_SERVICE_NAME = "plan_charging_batch"
 
 _CHARGING_ENTITY_PARAMS: dict[str, type] = {
     "battery_capacity_kwh": float,
@@ -183,10 +192,50 @@ PLAN_CHARGING_SERVICE_SCHEMA = vol.Schema(
     }
 )
 
+# Inputs shared by every device of a plan_charging_batch call; all others are per device
+_BATCH_SHARED_KEYS = frozenset(
+    {
+        "entry_id",
+        "view_id",
+        "search_start",
+        "search_end",
+        "search_start_time",
+        "search_start_day_offset",
+        "search_end_time",
+        "search_end_day_offset",
+        "search_start_offset_minutes",
+        "search_end_offset_minutes",
+        "search_scope",
+        "include_current_interval",
+        "must_finish_by",
+        "use_base_unit",
+    }
+)
 
-def _interval_start(interval: dict[str, Any]) -> datetime:
-    starts_at = interval["startsAt"]
-    return datetime.fromisoformat(starts_at) if isinstance(starts_at, str) else starts_at
+_CHARGING_DEVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): cv.string,
+        **{
+            key: validator
+            for key, validator in PLAN_CHARGING_SERVICE_SCHEMA.schema.items()
+            if str(key) not in _BATCH_SHARED_KEYS
+        },
+    }
+)
+
+PLAN_CHARGING_BATCH_SERVICE_SCHEMA = vol.Schema(
+    {
+        **{
+            key: validator
+            for key, validator in PLAN_CHARGING_SERVICE_SCHEMA.schema.items()
+            if str(key) in _BATCH_SHARED_KEYS
+        },
+        vol.Required("devices"): vol.All([_CHARGING_DEVICE_SCHEMA], vol.Length(min=1, max=50)),
+        vol.Optional("shared_grid_import_limit_w"): or_entity_ref(
+            vol.All(vol.Coerce(int), vol.Range(min=1, max=1000000)),
+        ),
+    }
+)
 
 
 def _translate_error_key(error_key: str) -> ServiceValidationError:
@@ -196,47 +245,9 @@ def _translate_error_key(error_key: str) -> ServiceValidationError:
     )
 
 
-def _resolve_soc_value(
-    data: dict[str, Any],
-    *,
-    percent_key: str,
-    kwh_key: str,
-    capacity_kwh: float | None,
-    field_name: str,
-    required: bool,
-) -> float | None:
-    has_percent = percent_key in data
-    has_kwh = kwh_key in data
-
-    if has_percent and has_kwh:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="ambiguous_soc_input",
-            translation_placeholders={"field": field_name},
-        )
-
-    if not has_percent and not has_kwh:
-        if required:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key=f"missing_{field_name}",
-            )
-        return None
-
-    if has_percent:
-        if capacity_kwh is None:
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="capacity_required_for_percent",
-            )
-        return soc_percent_to_kwh(float(data[percent_key]), capacity_kwh)
-
-    return float(data[kwh_key])
-
-
 def _validate_soc_inputs(data: dict[str, Any]) -> dict[str, float | None]:
     capacity_kwh = float(data["battery_capacity_kwh"]) if "battery_capacity_kwh" in data else None
-    current_soc_kwh = _resolve_soc_value(
+    current_soc_kwh = resolve_soc_value(
         data,
         percent_key="current_soc_percent",
         kwh_key="current_soc_kwh",
@@ -244,7 +255,7 @@ def _validate_soc_inputs(data: dict[str, Any]) -> dict[str, float | None]:
         field_name="current_soc",
         required=True,
     )
-    target_soc_kwh = _resolve_soc_value(
+    target_soc_kwh = resolve_soc_value(
         data,
         percent_key="target_soc_percent",
         kwh_key="target_soc_kwh",
@@ -252,7 +263,7 @@ def _validate_soc_inputs(data: dict[str, Any]) -> dict[str, float | None]:
         field_name="target_soc",
         required=True,
     )
-    must_reach_soc_kwh = _resolve_soc_value(
+    must_reach_soc_kwh = resolve_soc_value(
         data,
         percent_key="must_reach_soc_percent",
         kwh_key="must_reach_soc_kwh",
@@ -298,40 +309,6 @@ def _validate_soc_inputs(data: dict[str, Any]) -> dict[str, float | None]:
     }
 
 
-def _build_candidate_intervals(
-    price_info: list[dict[str, Any]],
-    *,
-    max_price_level: str | None,
-    min_price_level: str | None,
-    smooth_outliers: bool,
-    charging_efficiency: float,
-    discharging_efficiency: float,
-    expected_discharge_price_base: float | None,
-    reserve_for_discharge: bool,
-    max_cost_per_kwh_base: float | None,
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, Any]]:
-    filtered_by_level = filter_intervals_by_price_level(price_info, min_price_level, max_price_level)
-    candidates = [dict(interval) for interval in filtered_by_level]
-
-    if smooth_outliers and candidates:
-        from .helpers import smooth_service_intervals  # noqa: PLC0415
-
-        smoothed = smooth_service_intervals([dict(interval) for interval in candidates])
-        smoothed_map = {interval["startsAt"]: float(interval["total"]) for interval in smoothed}
-        for candidate in candidates:
-            candidate["_sort_total"] = smoothed_map.get(candidate["startsAt"], float(candidate["total"]))
-
-    candidates, economics_filter = filter_intervals_by_profitability(
-        candidates,
-        charging_efficiency=charging_efficiency,
-        discharging_efficiency=discharging_efficiency,
-        expected_discharge_price=expected_discharge_price_base,
-        reserve_for_discharge=reserve_for_discharge,
-        max_cost_per_kwh=max_cost_per_kwh_base,
-    )
-    return candidates, filtered_by_level, economics_filter
-
-
 def _build_charging_interval(
     interval: dict[str, Any],
     *,
@@ -354,16 +331,17 @@ def _build_response_segments(
     *,
     unit_factor: int,
     rating_lookup: dict[str, str | None],
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> list[dict[str, Any]]:
     response_segments: list[dict[str, Any]] = []
-    for segment in group_intervals_into_segments(scheduled_intervals):
+    for segment in group_intervals_into_segments(scheduled_intervals, prepared=prepared):
         seg_stats = calculate_window_statistics(
             segment["intervals"],
             unit_factor=unit_factor,
             round_decimals=4,
             power_profile=[int(interval["power_w"]) for interval in segment["intervals"]],
         )
-        segment_end = _interval_start(segment["intervals"][-1]) + timedelta(minutes=INTERVAL_MINUTES)
+        segment_end = interval_start(segment["intervals"][-1]) + timedelta(minutes=INTERVAL_MINUTES)
         response_segments.append(
             {
                 "start": segment["start"],
@@ -433,6 +411,11 @@ class _PlanContext:
     reserve_for_discharge: bool
     max_cost_per_kwh_base: float | None
     unit_factor: int
+    prepared: TibberPricesPreparedRange | None = None
+    # Interval starts taken by other devices sharing a grid import limit (plan_charging_batch)
+    blocked_starts: frozenset[str] | None = None
+    # time.monotonic() at which the charge solver budget of the whole service call runs out
+    solver_deadline_at: float | None = None
 
     @property
     def economic_filter_active(self) -> bool:
@@ -444,6 +427,105 @@ class _PlanContext:
         )
 
 
+@dataclass(frozen=True)
+class _CandidateSet:
+    """Candidate intervals of one price level filter."""
+
+    intervals: list[dict[str, Any]]
+    by_price: list[dict[str, Any]]
+    filtered_by_level: list[dict[str, Any]]
+    economics_filter: dict[str, Any]
+
+
+class _CandidatePool:
+    """
+    Candidate intervals for every relaxation attempt of one plan_charging call.
+
+    Attempts differ in energy, distance threshold and price level filter. The
+    economic filter judges each interval on its own and is evaluated once for
+    the whole range. Level filtering, outlier smoothing (which depends on the
+    filtered neighbours) and the price order are computed once per distinct
+    level filter; attempts sharing a filter reuse the same candidate set.
+    """
+
+    def __init__(
+        self,
+        ctx: _PlanContext,
+        *,
+        smoothed_totals: dict[tuple[str | None, str | None], dict[str, float]] | None = None,
+    ) -> None:
+        """Evaluate the economic filter and the interval start offsets once.
+
+        smoothed_totals caches the smoothed sort prices per level filter. It only
+        depends on the prices, so the requests of a batch call share one cache.
+        """
+        self._ctx = ctx
+        self._smoothed_totals = {} if smoothed_totals is None else smoothed_totals
+        prepared = ctx.prepared or TibberPricesPreparedRange(ctx.price_info)
+        self._offsets = prepared.offsets_of(ctx.price_info)
+        self._index_by_id = {id(interval): index for index, interval in enumerate(ctx.price_info)}
+        self._exclusions, self._break_even_price = profitability_exclusions(
+            ctx.price_info,
+            charging_efficiency=ctx.charging_efficiency,
+            discharging_efficiency=ctx.discharging_efficiency,
+            expected_discharge_price=ctx.expected_discharge_price_base,
+            reserve_for_discharge=ctx.reserve_for_discharge,
+            max_cost_per_kwh=ctx.max_cost_per_kwh_base,
+        )
+        self._sets: dict[tuple[str | None, str | None], _CandidateSet] = {}
+
+    def get(self, *, max_price_level: str | None, min_price_level: str | None) -> _CandidateSet:
+        """Return the (cached) candidate set of a price level filter."""
+        key = (min_price_level, max_price_level)
+        candidate_set = self._sets.get(key)
+        if candidate_set is None:
+            candidate_set = self._sets[key] = self._build(max_price_level, min_price_level)
+        return candidate_set
+
+    def _build(self, max_price_level: str | None, min_price_level: str | None) -> _CandidateSet:
+        ctx = self._ctx
+        filtered_by_level = filter_intervals_by_price_level(ctx.price_info, min_price_level, max_price_level)
+        indices = [self._index_by_id[id(interval)] for interval in filtered_by_level]
+        candidates = [dict(interval) for interval in filtered_by_level]
+
+        if ctx.smooth_outliers and candidates:
+            key = (min_price_level, max_price_level)
+            smoothed_map = self._smoothed_totals.get(key)
+            if smoothed_map is None:
+                from .helpers import smooth_service_intervals  # noqa: PLC0415
+
+                smoothed = smooth_service_intervals([dict(interval) for interval in candidates])
+                smoothed_map = self._smoothed_totals[key] = {
+                    interval["startsAt"]: float(interval["total"]) for interval in smoothed
+                }
+            for candidate in candidates:
+                candidate["_sort_total"] = smoothed_map.get(candidate["startsAt"], float(candidate["total"]))
+
+        exclusions = [self._exclusions[index] for index in indices]
+        blocked = ctx.blocked_starts or frozenset()
+        kept = [
+            (candidate, index)
+            for candidate, index, excluded in zip(candidates, indices, exclusions, strict=True)
+            if excluded is None and candidate["startsAt"] not in blocked
+        ]
+        offsets = self._offsets
+        by_price = sorted(
+            kept, key=lambda pair: (float(pair[0].get("_sort_total", pair[0]["total"])), offsets[pair[1]])
+        )
+        return _CandidateSet(
+            intervals=[candidate for candidate, _index in kept],
+            by_price=[candidate for candidate, _index in by_price],
+            filtered_by_level=filtered_by_level,
+            economics_filter=build_economics_filter_metadata(
+                exclusions,
+                break_even_price=self._break_even_price,
+                expected_discharge_price=ctx.expected_discharge_price_base,
+                reserve_for_discharge=ctx.reserve_for_discharge,
+                max_cost_per_kwh=ctx.max_cost_per_kwh_base,
+            ),
+        )
+
+
 def _classify_empty_candidates(
     ctx: _PlanContext,
     filtered_by_level: list[dict[str, Any]],
@@ -463,21 +545,27 @@ def _classify_empty_candidates(
     return "energy_unreachable"
 
 
+def _energy_needed_by_deadline(ctx: _PlanContext, effective_energy_needed_grid_kwh: float) -> float:
+    """Return the grid energy required before the must_reach_by deadline."""
+    if ctx.must_reach_soc_kwh is None:
+        return 0.0
+    return min(
+        effective_energy_needed_grid_kwh,
+        calculate_energy_needed(ctx.current_soc_kwh, ctx.must_reach_soc_kwh, ctx.charging_efficiency),
+    )
+
+
 def _build_raw_schedule(
     ctx: _PlanContext,
-    candidates: list[dict[str, Any]],
+    candidates: _CandidateSet,
     effective_energy_needed_grid_kwh: float,
 ) -> tuple[dict[str, Any] | None, str]:
     """Run the deadline-aware or single-pass scheduler and return a schedule dict."""
     if ctx.deadline is not None and ctx.must_reach_soc_kwh is not None:
-        energy_needed_by_deadline = min(
-            effective_energy_needed_grid_kwh,
-            calculate_energy_needed(ctx.current_soc_kwh, ctx.must_reach_soc_kwh, ctx.charging_efficiency),
-        )
         schedule = build_deadline_schedule(
-            candidates,
+            candidates.by_price,
             total_energy_needed_grid_kwh=effective_energy_needed_grid_kwh,
-            energy_needed_by_deadline_grid_kwh=energy_needed_by_deadline,
+            energy_needed_by_deadline_grid_kwh=_energy_needed_by_deadline(ctx, effective_energy_needed_grid_kwh),
             deadline=ctx.deadline,
             max_charge_power_w=ctx.max_charge_power_w,
             charging_efficiency=ctx.charging_efficiency,
@@ -485,13 +573,15 @@ def _build_raw_schedule(
             charge_power_steps_w=ctx.charge_power_steps_w,
             grid_import_limit_w=ctx.grid_import_limit_w,
             interval_minutes=INTERVAL_MINUTES,
+            prepared=ctx.prepared,
+            presorted=True,
         )
         if schedule["deadline_unallocated_grid_energy_kwh"] > 1e-6:
             return None, "energy_unreachable_by_deadline"
         return schedule, ""
 
     schedule = build_power_schedule(
-        candidates,
+        candidates.by_price,
         effective_energy_needed_grid_kwh,
         max_charge_power_w=ctx.max_charge_power_w,
         charging_efficiency=ctx.charging_efficiency,
@@ -499,10 +589,65 @@ def _build_raw_schedule(
         charge_power_steps_w=ctx.charge_power_steps_w,
         grid_import_limit_w=ctx.grid_import_limit_w,
         interval_minutes=INTERVAL_MINUTES,
+        prepared=ctx.prepared,
+        presorted=True,
     )
     return schedule, ""
 
 
+def _solve_segment_constraints(
+    ctx: _PlanContext,
+    candidates: list[dict[str, Any]],
+    effective_energy_needed_grid_kwh: float,
+    schedule: dict[str, Any],
+    warnings: list[str],
+) -> tuple[dict[str, Any], list[str]]:
+    """Replace the repaired greedy schedule by the jointly optimized one if it is better.
+
+    The greedy allocation only repairs min_charge_duration_minutes and
+    max_cycles_per_day violations afterwards. solve_charge_schedule() plans
+    them together with energy, power steps and the deadline. Its plan is used
+    when the repaired schedule still violates a constraint or costs more.
+    """
+    if not ctx.min_charge_duration_minutes and not ctx.max_cycles_per_day:
+        return schedule, warnings
+
+    # One budget for all attempts (and batch devices) of a service call, not one per solve
+    time_budget = CHARGE_SOLVER_TIME_BUDGET_SECONDS
+    if ctx.solver_deadline_at is not None:
+        time_budget = ctx.solver_deadline_at - time.monotonic()
+        if time_budget <= 0:
+            _LOGGER.debug("Charge solver budget of this call is used up, keeping the repaired greedy schedule")
+            return schedule, warnings
+
+    solved = solve_charge_schedule(
+        candidates,
+        effective_energy_needed_grid_kwh,
+        max_charge_power_w=ctx.max_charge_power_w,
+        charging_efficiency=ctx.charging_efficiency,
+        min_charge_power_w=ctx.min_charge_power_w,
+        charge_power_steps_w=ctx.charge_power_steps_w,
+        grid_import_limit_w=ctx.grid_import_limit_w,
+        min_charge_duration_minutes=ctx.min_charge_duration_minutes,
+        max_cycles_per_day=ctx.max_cycles_per_day,
+        deadline=ctx.deadline,
+        energy_needed_by_deadline_grid_kwh=_energy_needed_by_deadline(ctx, effective_energy_needed_grid_kwh),
+        interval_minutes=INTERVAL_MINUTES,
+        time_budget=time_budget,
+        prepared=ctx.prepared,
+    )
+    if solved is None:
+        _LOGGER.info(
+            "Charge solver found no plan for %d candidate intervals (time budget exceeded or constraints "
+            "unsatisfiable), keeping the repaired greedy schedule",
+            len(candidates),
+        )
+        return schedule, warnings
+    if warnings or schedule_cost(solved) < schedule_cost(schedule) - 1e-9:
+        return solved, []
+    return schedule, warnings
+
+
 def _selection_passes_distance_check(
     ctx: _PlanContext,
     scheduled_intervals: list[dict[str, Any]],
@@ -528,7 +673,7 @@ def _build_deadline_info(
     pre_stored_kwh = sum(
         float(interval.get("stored_energy_kwh", 0.0))
         for interval in scheduled_intervals
-        if _interval_start(interval) < ctx.deadline
+        if interval_start(interval) < ctx.deadline
     )
     achieved_by_deadline = ctx.current_soc_kwh + pre_stored_kwh
     return {
@@ -541,6 +686,7 @@ def _build_deadline_info(
 
 def _attempt_plan(
     ctx: _PlanContext,
+    pool: _CandidatePool,
     *,
     effective_energy_needed_grid_kwh: float,
     max_price_level: str | None,
@@ -548,29 +694,21 @@ def _attempt_plan(
     min_distance_from_avg: float | None,
 ) -> tuple[dict[str, Any] | None, str]:
     """Run one scheduling attempt with the provided (possibly relaxed) filters."""
-    candidates, filtered_by_level, economics_filter = _build_candidate_intervals(
-        ctx.price_info,
-        max_price_level=max_price_level,
-        min_price_level=min_price_level,
-        smooth_outliers=ctx.smooth_outliers,
-        charging_efficiency=ctx.charging_efficiency,
-        discharging_efficiency=ctx.discharging_efficiency,
-        expected_discharge_price_base=ctx.expected_discharge_price_base,
-        reserve_for_discharge=ctx.reserve_for_discharge,
-        max_cost_per_kwh_base=ctx.max_cost_per_kwh_base,
-    )
+    candidate_set = pool.get(max_price_level=max_price_level, min_price_level=min_price_level)
+    candidates = candidate_set.intervals
+    economics_filter = candidate_set.economics_filter
 
     if not candidates:
         reason = _classify_empty_candidates(
             ctx,
-            filtered_by_level,
+            candidate_set.filtered_by_level,
             economics_filter,
             max_price_level=max_price_level,
             min_price_level=min_price_level,
         )
         return None, reason
 
-    schedule, reason = _build_raw_schedule(ctx, candidates, effective_energy_needed_grid_kwh)
+    schedule, reason = _build_raw_schedule(ctx, candidate_set, effective_energy_needed_grid_kwh)
     if schedule is None:
         return None, reason
     if schedule["unallocated_grid_energy_kwh"] > 1e-6:
@@ -594,6 +732,10 @@ def _attempt_plan(
         target_grid_energy_kwh=effective_energy_needed_grid_kwh,
         protected_starts=protected_starts,
         interval_minutes=INTERVAL_MINUTES,
+        prepared=ctx.prepared,
+    )
+    schedule, warnings = _solve_segment_constraints(
+        ctx, candidates, effective_energy_needed_grid_kwh, schedule, warnings
     )
     scheduled_intervals = build_soc_progression_from_schedule(
         schedule["intervals"], ctx.current_soc_kwh, ctx.capacity_kwh
@@ -626,13 +768,63 @@ def _attempt_plan(
     )
 
 
-async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
-    """Handle the plan_charging service call."""
-    hass: HomeAssistant = call.hass
-    data, resolved_refs = resolve_entity_references(hass, call.data, _CHARGING_ENTITY_PARAMS)
+@dataclass(frozen=True)
+class _ChargingRequest:
+    """Validated inputs of one charging request (one battery or vehicle)."""
 
+    capacity_kwh: float | None
+    current_soc_kwh: float
+    target_soc_kwh: float
+    must_reach_soc_kwh: float | None
+    max_charge_power_w: int
+    min_charge_power_w: int | None
+    charge_power_steps_w: list[int] | None
+    grid_import_limit_w: int | None
+    effective_max_power_w: int
+    charging_efficiency: float
+    discharging_efficiency: float
+    max_price_level: str | None
+    min_price_level: str | None
+    include_comparison_details: bool
+    smooth_outliers: bool
+    min_distance_from_avg: float | None
+    allow_relaxation: bool
+    duration_flexibility_minutes: int | None
+    expected_discharge_price: float | None
+    reserve_for_discharge: bool
+    max_cost_per_kwh: float | None
+    min_charge_duration_minutes: int | None
+    max_cycles_per_day: int | None
+    must_reach_by: datetime | None
+    must_reach_by_event: str | None
+
+    @property
+    def already_at_target(self) -> bool:
+        """Whether the current SoC already meets the target."""
+        return self.current_soc_kwh >= self.target_soc_kwh - 1e-6
+
+    @property
+    def energy_needed_grid_kwh(self) -> float:
+        """Grid energy needed to reach the target SoC."""
+        return calculate_energy_needed(self.current_soc_kwh, self.target_soc_kwh, self.charging_efficiency)
+
+
+@dataclass(frozen=True)
+class _PriceRange:
+    """Fetched prices and output settings shared by every request of one service call."""
+
+    price_info: list[dict[str, Any]]
+    prepared: TibberPricesPreparedRange
+    now: datetime
+    unit_factor: int
+    rating_lookup: dict[str, str | None]
+    # Smoothed sort prices per price level filter; smoothing does not depend on the battery
+    smoothed_totals: dict[tuple[str | None, str | None], dict[str, float]] = field(default_factory=dict)
+
+
+def _parse_charging_request(data: dict[str, Any]) -> _ChargingRequest:
+    """Validate the battery, power and planning inputs of one request."""
     validated = _validate_soc_inputs(data)
-    capacity_kwh = validated["capacity_kwh"]
     current_soc_value = validated["current_soc_kwh"]
     target_soc_value = validated["target_soc_kwh"]
     if current_soc_value is None or target_soc_value is None:
@@ -640,91 +832,15 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
             translation_domain=DOMAIN,
             translation_key="missing_current_soc" if current_soc_value is None else "missing_target_soc",
         )
-
-    current_soc_kwh = float(current_soc_value)
-    target_soc_kwh = float(target_soc_value)
     must_reach_soc_value = validated["must_reach_soc_kwh"]
-    must_reach_soc_kwh = float(must_reach_soc_value) if must_reach_soc_value is not None else None
 
-    entry_id = data.get("entry_id", "")
-    view_device_id = data.get("view_id", "")
     max_charge_power_w = int(data["max_charge_power_w"])
     min_charge_power_w = int(data["min_charge_power_w"]) if "min_charge_power_w" in data else None
     charge_power_steps_w = [int(step) for step in data.get("charge_power_steps_w", [])] or None
     grid_import_limit_w = int(data["grid_import_limit_w"]) if "grid_import_limit_w" in data else None
-    charging_efficiency = float(data.get("charging_efficiency", 1.0))
-    discharging_efficiency = float(data.get("discharging_efficiency", 1.0))
-    use_base_unit = bool(data.get("use_base_unit", False))
     max_price_level = data.get("max_price_level")
     min_price_level = data.get("min_price_level")
-    include_comparison_details = bool(data.get("include_comparison_details", False))
-    smooth_outliers = bool(data.get("smooth_outliers", True))
-    min_distance_from_avg = data.get("min_distance_from_avg")
-    allow_relaxation = bool(data.get("allow_relaxation", True))
-    duration_flexibility_minutes = data.get("duration_flexibility_minutes")
-    reserve_for_discharge = bool(data.get("reserve_for_discharge", False))
-    min_charge_duration_minutes = (
-        int(data["min_charge_duration_minutes"]) if "min_charge_duration_minutes" in data else None
-    )
-    max_cycles_per_day = int(data["max_cycles_per_day"]) if "max_cycles_per_day" in data else None
-
-    if current_soc_kwh >= target_soc_kwh - 1e-6:
-        entry = resolve_service_target(hass, entry_id, view_device_id).entry
-        currency = entry.data.get("currency", "EUR")
-        price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
-        response: dict[str, Any] = {
-            "success": True,
-            "home_id": entry.data.get("home_id", ""),
-            "intervals_found": False,
-            "reason": "already_at_target",
-            "battery": _build_battery_info(
-                current_soc_kwh=current_soc_kwh,
-                target_soc_kwh=target_soc_kwh,
-                capacity_kwh=capacity_kwh,
-                requested_energy_needed_kwh=0.0,
-                charging_efficiency=charging_efficiency,
-                achieved_soc_kwh=current_soc_kwh,
-                must_reach_soc_kwh=must_reach_soc_kwh,
-            ),
-            "charging": None,
-            "currency": currency,
-            "price_unit": price_unit,
-        }
-        if resolved_refs:
-            response["_resolved"] = resolved_refs
-        return response
-
-    requested_energy_needed_grid_kwh = calculate_energy_needed(current_soc_kwh, target_soc_kwh, charging_efficiency)
-
-    target = resolve_service_target(hass, entry_id, view_device_id)
-    entry = target.entry
-    coordinator = target.coordinator
-    coordinator_data = target.data
-    rating_lookup = build_rating_lookup(coordinator_data)
-    home_id = entry.data.get("home_id")
-    if not home_id:
-        raise ServiceValidationError(
-            translation_domain=DOMAIN,
-            translation_key="missing_home_id",
-        )
-
     validate_price_level_range(min_price_level, max_price_level)
-    validate_search_params(data)
-    home_timezone = resolve_home_timezone(coordinator, home_id)
-    from zoneinfo import ZoneInfo  # noqa: PLC0415
-
-    home_tz: ZoneInfo = ZoneInfo(home_timezone)
-    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
-    now = target.now(home_tz)
-    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
-
-    currency = entry.data.get("currency", "EUR")
-    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
-    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
-    expected_discharge_price_base = (
-        float(data["expected_discharge_price"]) / unit_factor if "expected_discharge_price" in data else None
-    )
-    max_cost_per_kwh_base = float(data["max_cost_per_kwh"]) / unit_factor if "max_cost_per_kwh" in data else None
 
     try:
         _mode, effective_max_power_w, _allowed_steps = determine_power_mode(
@@ -736,16 +852,56 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
     except ValueError as error:
         raise _translate_error_key(str(error)) from error
 
-    max_interval_energy = energy_for_power(effective_max_power_w, INTERVAL_MINUTES)
-    requested_intervals = max(1, int((requested_energy_needed_grid_kwh / max_interval_energy) + 0.999999))
+    return _ChargingRequest(
+        capacity_kwh=validated["capacity_kwh"],
+        current_soc_kwh=float(current_soc_value),
+        target_soc_kwh=float(target_soc_value),
+        must_reach_soc_kwh=float(must_reach_soc_value) if must_reach_soc_value is not None else None,
+        max_charge_power_w=max_charge_power_w,
+        min_charge_power_w=min_charge_power_w,
+        charge_power_steps_w=charge_power_steps_w,
+        grid_import_limit_w=grid_import_limit_w,
+        effective_max_power_w=effective_max_power_w,
+        charging_efficiency=float(data.get("charging_efficiency", 1.0)),
+        discharging_efficiency=float(data.get("discharging_efficiency", 1.0)),
+        max_price_level=max_price_level,
+        min_price_level=min_price_level,
+        include_comparison_details=bool(data.get("include_comparison_details", False)),
+        smooth_outliers=bool(data.get("smooth_outliers", True)),
+        min_distance_from_avg=data.get("min_distance_from_avg"),
+        allow_relaxation=bool(data.get("allow_relaxation", True)),
+        duration_flexibility_minutes=data.get("duration_flexibility_minutes"),
+        expected_discharge_price=(
+            float(data["expected_discharge_price"]) if "expected_discharge_price" in data else None
+        ),
+        reserve_for_discharge=bool(data.get("reserve_for_discharge", False)),
+        max_cost_per_kwh=float(data["max_cost_per_kwh"]) if "max_cost_per_kwh" in data else None,
+        min_charge_duration_minutes=(
+            int(data["min_charge_duration_minutes"]) if "min_charge_duration_minutes" in data else None
+        ),
+        max_cycles_per_day=int(data["max_cycles_per_day"]) if "max_cycles_per_day" in data else None,
+        must_reach_by=data.get("must_reach_by"),
+        must_reach_by_event=data.get("must_reach_by_event"),
+    )
 
+
+def _resolve_request_deadline(
+    request: _ChargingRequest,
+    *,
+    coordinator_data: dict[str, Any],
+    now: datetime,
+    home_tz: ZoneInfo,
+    search_start: datetime,
+    search_end: datetime,
+) -> tuple[datetime | None, str | None]:
+    """Resolve must_reach_by / must_reach_by_event and check it lies in the search range."""
     try:
         deadline, deadline_source = resolve_deadline(
             coordinator_data=coordinator_data,
             now=now,
             home_tz=home_tz,
-            must_reach_by=data.get("must_reach_by"),
-            must_reach_by_event=data.get("must_reach_by_event"),
+            must_reach_by=request.must_reach_by,
+            must_reach_by_event=request.must_reach_by_event,
         )
     except ValueError as error:
         raise _translate_error_key(str(error)) from error
@@ -755,49 +911,87 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
             translation_domain=DOMAIN,
             translation_key="deadline_outside_search_range",
         )
-
-    api_client = coordinator.api
-    user_data = coordinator._cached_user_data  # noqa: SLF001
-    pool = target.interval_pool
-    price_info, fetch_ok = await async_fetch_service_intervals(
-        pool,
-        api_client=api_client,
-        user_data=user_data,
-        start_time=search_start,
-        end_time=search_end,
-        service_label=PLAN_CHARGING_SERVICE_NAME,
+    return deadline, deadline_source
+
+
+def _request_battery_info(request: _ChargingRequest, *, energy_needed_kwh: float) -> dict[str, Any]:
+    """Battery info of a request that was not (or could not be) planned."""
+    return _build_battery_info(
+        current_soc_kwh=request.current_soc_kwh,
+        target_soc_kwh=request.target_soc_kwh,
+        capacity_kwh=request.capacity_kwh,
+        requested_energy_needed_kwh=energy_needed_kwh,
+        charging_efficiency=request.charging_efficiency,
+        achieved_soc_kwh=request.current_soc_kwh,
+        must_reach_soc_kwh=request.must_reach_soc_kwh,
     )
 
-    if not fetch_ok:
-        # Price data unavailable (API outage on uncached range). Return a well-formed
-        # empty response with success=False so automations can detect this directly.
-        unavailable: dict[str, Any] = {
-            "success": False,
-            "reason": "price_data_unavailable",
-            "home_id": home_id,
-            "search_start": search_start.isoformat(),
-            "search_end": search_end.isoformat(),
-            "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
-            "intervals_found": False,
-            "battery": _build_battery_info(
-                current_soc_kwh=current_soc_kwh,
-                target_soc_kwh=target_soc_kwh,
-                capacity_kwh=capacity_kwh,
-                requested_energy_needed_kwh=requested_energy_needed_grid_kwh,
-                charging_efficiency=charging_efficiency,
-                achieved_soc_kwh=current_soc_kwh,
-                must_reach_soc_kwh=must_reach_soc_kwh,
-            ),
-            "charging": None,
-            "deadline": {"must_reach_by": deadline.isoformat(), "source": deadline_source} if deadline else None,
-            "economics": None,
-            "currency": currency,
-            "price_unit": price_unit,
-            "relaxation_applied": False,
-        }
-        if resolved_refs:
-            unavailable["_resolved"] = resolved_refs
-        return unavailable
+
+def _already_at_target_body(request: _ChargingRequest) -> dict[str, Any]:
+    return {
+        "intervals_found": False,
+        "reason": "already_at_target",
+        "battery": _request_battery_info(request, energy_needed_kwh=0.0),
+        "charging": None,
+    }
+
+
+def _unavailable_body(
+    request: _ChargingRequest,
+    deadline: datetime | None,
+    deadline_source: str | None,
+) -> dict[str, Any]:
+    return {
+        "intervals_found": False,
+        "battery": _request_battery_info(request, energy_needed_kwh=request.energy_needed_grid_kwh),
+        "charging": None,
+        "deadline": {"must_reach_by": deadline.isoformat(), "source": deadline_source} if deadline else None,
+        "economics": None,
+        "relaxation_applied": False,
+    }
+
+
+def _plan_charging_body(
+    request: _ChargingRequest,
+    price_range: _PriceRange,
+    *,
+    deadline: datetime | None,
+    deadline_source: str | None,
+    blocked_starts: frozenset[str] | None = None,
+    solver_deadline_at: float | None = None,
+) -> dict[str, Any]:
+    """
+    Plan one request against the fetched prices and build its response body.
+
+    Args:
+        request: Validated request inputs.
+        price_range: Prices and output settings shared by the service call.
+        deadline: Resolved must_reach_by deadline.
+        deadline_source: How the deadline was given (absolute time or event).
+        blocked_starts: Interval starts this request may not charge in.
+        solver_deadline_at: time.monotonic() at which the charge solver budget
+            runs out. Defaults to one CHARGE_SOLVER_TIME_BUDGET_SECONDS from now,
+            shared by all relaxation attempts.
+
+    Returns:
+        Response keys of the request (battery, charging, deadline, economics, ...).
+
+    """
+    unit_factor = price_range.unit_factor
+    rating_lookup = price_range.rating_lookup
+    price_info = price_range.price_info
+    current_soc_kwh = request.current_soc_kwh
+    target_soc_kwh = request.target_soc_kwh
+    capacity_kwh = request.capacity_kwh
+    charging_efficiency = request.charging_efficiency
+    must_reach_soc_kwh = request.must_reach_soc_kwh
+    max_price_level = request.max_price_level
+    min_price_level = request.min_price_level
+    min_distance_from_avg = request.min_distance_from_avg
+    requested_energy_needed_grid_kwh = request.energy_needed_grid_kwh
+
+    max_interval_energy = energy_for_power(request.effective_max_power_w, INTERVAL_MINUTES)
+    requested_intervals = max(1, int((requested_energy_needed_grid_kwh / max_interval_energy) + 0.999999))
 
     plan_ctx = _PlanContext(
         price_info=price_info,
@@ -807,22 +1001,34 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
         must_reach_soc_kwh=must_reach_soc_kwh,
         deadline=deadline,
         charging_efficiency=charging_efficiency,
-        discharging_efficiency=discharging_efficiency,
-        max_charge_power_w=max_charge_power_w,
-        min_charge_power_w=min_charge_power_w,
-        charge_power_steps_w=charge_power_steps_w,
-        grid_import_limit_w=grid_import_limit_w,
-        min_charge_duration_minutes=min_charge_duration_minutes,
-        max_cycles_per_day=max_cycles_per_day,
-        smooth_outliers=smooth_outliers,
-        expected_discharge_price_base=expected_discharge_price_base,
-        reserve_for_discharge=reserve_for_discharge,
-        max_cost_per_kwh_base=max_cost_per_kwh_base,
+        discharging_efficiency=request.discharging_efficiency,
+        max_charge_power_w=request.max_charge_power_w,
+        min_charge_power_w=request.min_charge_power_w,
+        charge_power_steps_w=request.charge_power_steps_w,
+        grid_import_limit_w=request.grid_import_limit_w,
+        min_charge_duration_minutes=request.min_charge_duration_minutes,
+        max_cycles_per_day=request.max_cycles_per_day,
+        smooth_outliers=request.smooth_outliers,
+        expected_discharge_price_base=(
+            request.expected_discharge_price / unit_factor if request.expected_discharge_price is not None else None
+        ),
+        reserve_for_discharge=request.reserve_for_discharge,
+        max_cost_per_kwh_base=request.max_cost_per_kwh / unit_factor if request.max_cost_per_kwh is not None else None,
         unit_factor=unit_factor,
+        prepared=price_range.prepared,
+        blocked_starts=blocked_starts,
+        solver_deadline_at=(
+            solver_deadline_at
+            if solver_deadline_at is not None
+            else time.monotonic() + CHARGE_SOLVER_TIME_BUDGET_SECONDS
+        ),
     )
 
+    # Level filtering, smoothing and sorting are shared by all relaxation attempts
+    candidate_pool = _CandidatePool(plan_ctx, smoothed_totals=price_range.smoothed_totals)
     planning_result, reason = _attempt_plan(
         plan_ctx,
+        candidate_pool,
         effective_energy_needed_grid_kwh=requested_energy_needed_grid_kwh,
         max_price_level=max_price_level,
         min_price_level=min_price_level,
@@ -833,8 +1039,10 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
     relaxation_steps = 0
     warnings: list[str] = []
 
-    if planning_result is None and allow_relaxation:
-        max_reduction = calculate_max_duration_reduction_intervals(requested_intervals, duration_flexibility_minutes)
+    if planning_result is None and request.allow_relaxation:
+        max_reduction = calculate_max_duration_reduction_intervals(
+            requested_intervals, request.duration_flexibility_minutes
+        )
         steps = generate_relaxation_steps(
             min_distance_from_avg=min_distance_from_avg,
             max_price_level=max_price_level,
@@ -853,6 +1061,7 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
             )
             attempt, reason = _attempt_plan(
                 plan_ctx,
+                candidate_pool,
                 effective_energy_needed_grid_kwh=reduced_energy,
                 max_price_level=step.max_price_level,
                 min_price_level=step.min_price_level,
@@ -866,35 +1075,18 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
                 break
 
     if planning_result is None:
-        response: dict[str, Any] = {
-            "success": True,
-            "home_id": home_id,
-            "search_start": search_start.isoformat(),
-            "search_end": search_end.isoformat(),
-            "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+        body: dict[str, Any] = {
             "intervals_found": False,
             "reason": reason,
-            "battery": _build_battery_info(
-                current_soc_kwh=current_soc_kwh,
-                target_soc_kwh=target_soc_kwh,
-                capacity_kwh=capacity_kwh,
-                requested_energy_needed_kwh=requested_energy_needed_grid_kwh,
-                charging_efficiency=charging_efficiency,
-                achieved_soc_kwh=current_soc_kwh,
-                must_reach_soc_kwh=must_reach_soc_kwh,
-            ),
+            "battery": _request_battery_info(request, energy_needed_kwh=requested_energy_needed_grid_kwh),
             "charging": None,
             "deadline": {"must_reach_by": deadline.isoformat(), "source": deadline_source} if deadline else None,
             "economics": None,
-            "currency": currency,
-            "price_unit": price_unit,
             "relaxation_applied": relaxation_applied,
         }
         if relaxation_applied:
-            response["relaxation_steps"] = relaxation_steps
-        if resolved_refs:
-            response["_resolved"] = resolved_refs
-        return response
+            body["relaxation_steps"] = relaxation_steps
+        return body
 
     scheduled_intervals = planning_result["scheduled_intervals"]
     schedule_data = planning_result["schedule"]
@@ -909,6 +1101,7 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
         scheduled_intervals,
         unit_factor=unit_factor,
         rating_lookup=rating_lookup,
+        prepared=plan_ctx.prepared,
     )
     power_profile = [int(interval["power_w"]) for interval in scheduled_intervals]
     stats = calculate_window_statistics(
@@ -924,7 +1117,9 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
         total_cost_base / schedule_data["total_grid_energy_kwh"] if schedule_data["total_grid_energy_kwh"] > 0 else 0.0
     )
 
-    comparison_result = find_cheapest_n_intervals(price_info, len(scheduled_intervals), 1, reverse=True)
+    comparison_result = find_cheapest_n_intervals(
+        price_info, len(scheduled_intervals), 1, reverse=True, prepared=plan_ctx.prepared
+    )
     price_comparison: dict[str, Any] = {}
     if comparison_result is not None:
         comparison_stats = calculate_window_statistics(
@@ -939,7 +1134,7 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
                 "comparison_price_mean": comparison_mean,
                 "price_difference": abs(round(float(comparison_mean) - float(own_mean), 4)),
             }
-            if include_comparison_details:
+            if request.include_comparison_details:
                 price_comparison["comparison_price_min"] = comparison_stats.get("price_min")
                 price_comparison["comparison_price_max"] = comparison_stats.get("price_max")
 
@@ -948,8 +1143,8 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
     if response_segments:
         first_dt = datetime.fromisoformat(response_segments[0]["start"])
         last_dt = datetime.fromisoformat(response_segments[-1]["end"])
-        seconds_until_start = max(0, int((first_dt - now).total_seconds()))
-        seconds_until_end = max(0, int((last_dt - now).total_seconds()))
+        seconds_until_start = max(0, int((first_dt - price_range.now).total_seconds()))
+        seconds_until_end = max(0, int((last_dt - price_range.now).total_seconds()))
 
     battery_info = _build_battery_info(
         current_soc_kwh=current_soc_kwh,
@@ -973,22 +1168,15 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
                 deadline_info["must_reach_soc_kwh"] / capacity_kwh * 100.0, 2
             )
 
-    response: dict[str, Any] = {
-        "success": True,
-        "home_id": home_id,
-        "search_start": search_start.isoformat(),
-        "search_end": search_end.isoformat(),
-        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+    body = {
         "intervals_found": True,
-        "currency": currency,
-        "price_unit": price_unit,
         "battery": battery_info,
         "charging": {
             "mode": schedule_data["mode"],
-            "charge_power_w": max_charge_power_w,
-            "min_charge_power_w": min_charge_power_w,
-            "charge_power_steps_w": charge_power_steps_w,
-            "grid_import_limit_w": grid_import_limit_w,
+            "charge_power_w": request.max_charge_power_w,
+            "min_charge_power_w": request.min_charge_power_w,
+            "charge_power_steps_w": request.charge_power_steps_w,
+            "grid_import_limit_w": request.grid_import_limit_w,
             "effective_max_charge_power_w": schedule_data["effective_max_power_w"],
             "total_duration_minutes": len(scheduled_intervals) * INTERVAL_MINUTES,
             "total_energy_kwh": round(schedule_data["total_grid_energy_kwh"], 6),
@@ -1012,7 +1200,261 @@ async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
         "warnings": warnings or None,
     }
     if relaxation_applied:
-        response["relaxation_steps"] = relaxation_steps
+        body["relaxation_steps"] = relaxation_steps
+    return body
+
+
+async def handle_plan_charging(call: ServiceCall) -> ServiceResponse:
+    """Handle the plan_charging service call."""
+    hass: HomeAssistant = call.hass
+    data, resolved_refs = resolve_entity_references(hass, call.data, _CHARGING_ENTITY_PARAMS)
+
+    request = _parse_charging_request(data)
+    entry_id = data.get("entry_id", "")
+    view_device_id = data.get("view_id", "")
+    use_base_unit = bool(data.get("use_base_unit", False))
+
+    if request.already_at_target:
+        entry = resolve_service_target(hass, entry_id, view_device_id).entry
+        currency = entry.data.get("currency", "EUR")
+        price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+        response: dict[str, Any] = {
+            "success": True,
+            "home_id": entry.data.get("home_id", ""),
+            **_already_at_target_body(request),
+            "currency": currency,
+            "price_unit": price_unit,
+        }
+        if resolved_refs:
+            response["_resolved"] = resolved_refs
+        return response
+
+    target = resolve_service_target(hass, entry_id, view_device_id)
+    entry = target.entry
+    coordinator = target.coordinator
+    home_id = entry.data.get("home_id")
+    if not home_id:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_home_id",
+        )
+
+    validate_search_params(data)
+    home_timezone = resolve_home_timezone(coordinator, home_id)
+    from zoneinfo import ZoneInfo  # noqa: PLC0415
+
+    home_tz: ZoneInfo = ZoneInfo(home_timezone)
+    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
+    now = target.now(home_tz)
+    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
+
+    currency = entry.data.get("currency", "EUR")
+    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
+    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+
+    deadline, deadline_source = _resolve_request_deadline(
+        request,
+        coordinator_data=target.data,
+        now=now,
+        home_tz=home_tz,
+        search_start=search_start,
+        search_end=search_end,
+    )
+
+    api_client = coordinator.api
+    user_data = coordinator._cached_user_data  # noqa: SLF001
+    price_info, fetch_ok = await async_fetch_service_intervals(
+        target.interval_pool,
+        api_client=api_client,
+        user_data=user_data,
+        start_time=search_start,
+        end_time=search_end,
+        service_label=PLAN_CHARGING_SERVICE_NAME,
+    )
+
+    response = {
+        "success": True,
+        "home_id": home_id,
+        "search_start": search_start.isoformat(),
+        "search_end": search_end.isoformat(),
+        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+        "currency": currency,
+        "price_unit": price_unit,
+    }
+    if not fetch_ok:
+        # Price data unavailable (API outage on uncached range). Return a well-formed
+        # empty response with success=False so automations can detect this directly.
+        response["success"] = False
+        response["reason"] = "price_data_unavailable"
+        response.update(_unavailable_body(request, deadline, deadline_source))
+    else:
+        price_range = _PriceRange(
+            price_info=price_info,
+            now=now,
+            unit_factor=unit_factor,
+            rating_lookup=build_rating_lookup(target.data),
+            # Parse timestamps and contiguity once; every attempt works on subsets
+            prepared=TibberPricesPreparedRange(price_info),
+        )
+        response.update(_plan_charging_body(request, price_range, deadline=deadline, deadline_source=deadline_source))
+    if resolved_refs:
+        response["_resolved"] = resolved_refs
+    return response
+
+
+def _resolve_batch_entity_refs(
+    hass: HomeAssistant,
+    call_data: dict[str, Any] | Any,
+) -> tuple[dict[str, Any], dict[str, dict[str, str | None]]]:
+    """Resolve entity references in batch call data (top-level + devices)."""
+    data, resolved_refs = resolve_entity_references(
+        hass,
+        call_data,
+        {
+            **{key: kind for key, kind in _CHARGING_ENTITY_PARAMS.items() if key in _BATCH_SHARED_KEYS},
+            "shared_grid_import_limit_w": int,
+        },
+    )
+    device_params = {key: kind for key, kind in _CHARGING_ENTITY_PARAMS.items() if key not in _BATCH_SHARED_KEYS}
+    devices: list[dict[str, Any]] = []
+    for index, device in enumerate(data["devices"]):
+        resolved_device, device_refs = resolve_entity_references(hass, device, device_params)
+        devices.append(resolved_device)
+        for param_name, info in device_refs.items():
+            resolved_refs[f"devices[{index}].{param_name}"] = info
+    data["devices"] = devices
+    return data, resolved_refs
+
+
+async def handle_plan_charging_batch(call: ServiceCall) -> ServiceResponse:
+    """
+    Handle the plan_charging_batch service call.
+
+    Plans every device against one fetched and prepared search range instead
+    of one plan_charging call per device. Outlier smoothing per price level
+    filter is shared as well. With shared_grid_import_limit_w the devices are
+    planned in the given order (first = highest priority); a device only
+    charges in intervals where the power left under the limit covers its
+    maximum charge power. The charge solver budget is shared by all devices,
+    so a batch blocks the event loop no longer than one plan_charging call
+    in the solver.
+    """
+    hass: HomeAssistant = call.hass
+    data, resolved_refs = _resolve_batch_entity_refs(hass, call.data)
+
+    names = [device["name"] for device in data["devices"]]
+    validate_unique_device_names(names)
+    requests = [_parse_charging_request(device) for device in data["devices"]]
+    shared_limit_w = int(data["shared_grid_import_limit_w"]) if "shared_grid_import_limit_w" in data else None
+    use_base_unit = bool(data.get("use_base_unit", False))
+
+    target = resolve_service_target(hass, data.get("entry_id", ""), data.get("view_id", ""))
+    entry = target.entry
+    coordinator = target.coordinator
+    home_id = entry.data.get("home_id")
+    if not home_id:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="missing_home_id",
+        )
+
+    validate_search_params(data)
+    home_timezone = resolve_home_timezone(coordinator, home_id)
+    from zoneinfo import ZoneInfo  # noqa: PLC0415
+
+    home_tz: ZoneInfo = ZoneInfo(home_timezone)
+    effective_data, must_finish_by_dt = apply_must_finish_by(data, home_tz)
+    now = target.now(home_tz)
+    search_start, search_end = resolve_search_range(effective_data, now, home_tz)
+
+    currency = entry.data.get("currency", "EUR")
+    unit_factor = 1 if use_base_unit else get_display_unit_factor(entry)
+    price_unit = f"{currency}/kWh" if use_base_unit else get_display_unit_string(entry, currency)
+
+    deadlines = [
+        (None, None)
+        if request.already_at_target
+        else _resolve_request_deadline(
+            request,
+            coordinator_data=target.data,
+            now=now,
+            home_tz=home_tz,
+            search_start=search_start,
+            search_end=search_end,
+        )
+        for request in requests
+    ]
+
+    price_info: list[dict[str, Any]] = []
+    fetch_ok = True
+    if not all(request.already_at_target for request in requests):
+        price_info, fetch_ok = await async_fetch_service_intervals(
+            target.interval_pool,
+            api_client=coordinator.api,
+            user_data=coordinator._cached_user_data,  # noqa: SLF001
+            start_time=search_start,
+            end_time=search_end,
+            service_label=PLAN_CHARGING_BATCH_SERVICE_NAME,
+        )
+    price_range = _PriceRange(
+        price_info=price_info,
+        now=now,
+        unit_factor=unit_factor,
+        rating_lookup=build_rating_lookup(target.data),
+        prepared=TibberPricesPreparedRange(price_info),
+    )
+
+    # Power left under the shared limit per interval start
+    remaining_w = {interval["startsAt"]: shared_limit_w for interval in price_info} if shared_limit_w else None
+    # One solver budget for the whole batch; devices after it runs out keep their greedy plans
+    solver_deadline_at = time.monotonic() + CHARGE_SOLVER_TIME_BUDGET_SECONDS
+    device_responses: list[dict[str, Any]] = []
+    for name, request, (deadline, deadline_source) in zip(names, requests, deadlines, strict=True):
+        if request.already_at_target:
+            body = _already_at_target_body(request)
+        elif not fetch_ok:
+            body = _unavailable_body(request, deadline, deadline_source)
+        else:
+            blocked_starts = (
+                frozenset(start for start, power_w in remaining_w.items() if power_w < request.effective_max_power_w)
+                if remaining_w is not None
+                else None
+            )
+            body = _plan_charging_body(
+                request,
+                price_range,
+                deadline=deadline,
+                deadline_source=deadline_source,
+                blocked_starts=blocked_starts,
+                solver_deadline_at=solver_deadline_at,
+            )
+            if remaining_w is not None and body["charging"] is not None:
+                for interval in body["charging"]["schedule"]["intervals"]:
+                    remaining_w[interval["starts_at"]] -= int(interval["power_w"])
+        device_responses.append({"name": name, **body})
+
+    response: dict[str, Any] = {
+        "success": fetch_ok,
+        "home_id": home_id,
+        "search_start": search_start.isoformat(),
+        "search_end": search_end.isoformat(),
+        "must_finish_by": must_finish_by_dt.isoformat() if must_finish_by_dt else None,
+        "currency": currency,
+        "price_unit": price_unit,
+        "device_count": len(device_responses),
+        "devices_planned": sum(1 for device in device_responses if device["intervals_found"]),
+        "shared_grid_import": (
+            {
+                "limit_w": shared_limit_w,
+                "peak_w": max((shared_limit_w - power_w for power_w in remaining_w.values()), default=0),
+            }
+            if shared_limit_w and remaining_w is not None
+            else None
+        ),
+        "devices": device_responses,
+    }
+    if not fetch_ok:
+        response["reason"] = "price_data_unavailable"
     if resolved_refs:
         response["_resolved"] = resolved_refs
     return response
@@ -0,0 +1,157 @@
+"""
+Response caching for read-only services.
+
+Wraps a service handler so that identical calls against the same coordinator
+data within one quarter-hour are answered from the coordinator's
+TibberPricesResponseCache (see coordinator/response_cache.py) instead of being
+computed again.
+
+The cache key is the call data after entity references are resolved, so a
+changed input_number or sensor value is a different call. For the find_*
+services the key also holds the search range the call resolves to:
+search_*_offset_minutes are added to "now" at minute precision before they
+snap to the grid, so two identical calls in one quarter-hour can search
+different ranges. Only handlers that return a pure function of (coordinator
+data, call data, quarter-hour, search range) may be wrapped. get_apexcharts_yaml is not: it creates persistent notifications and
+inspects entity and frontend state.
+
+Countdown fields (seconds_until_start/end) are relative to the exact moment of
+the call; a refresh function recomputes them on every cache hit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from functools import wraps
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+from homeassistant.exceptions import ServiceValidationError
+
+from .entity_resolver import resolve_entity_references
+from .helpers import (
+    apply_must_finish_by,
+    floor_to_quarter_hour,
+    resolve_home_timezone,
+    resolve_search_range,
+    resolve_service_target,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    from homeassistant.core import ServiceCall
+
+    from .helpers import ServiceTarget
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert call data into a hashable value (dicts and lists become tuples)."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _seconds_until(timestamp: str, now: datetime) -> int:
+    return max(0, int((datetime.fromisoformat(timestamp) - now).total_seconds()))
+
+
+def _resolve_call_search_range(data: dict[str, Any], target: ServiceTarget) -> tuple[datetime, datetime]:
+    """Resolve the search range of a find_* call the same way its handler does."""
+    home_tz = ZoneInfo(resolve_home_timezone(target.coordinator, target.entry.data.get("home_id")))
+    effective_data, _must_finish_by = apply_must_finish_by(data, home_tz)
+    return resolve_search_range(effective_data, target.now(home_tz), home_tz)
+
+
+def refresh_block_countdown(response: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """Recompute the window countdown of a cached find_*_block response."""
+    window = response.get("window")
+    if not window:
+        return response
+    return {
+        **response,
+        "window": {
+            **window,
+            "seconds_until_start": _seconds_until(window["start"], now),
+            "seconds_until_end": _seconds_until(window["end"], now),
+        },
+    }
+
+
+def refresh_hours_countdown(response: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """Recompute the schedule countdown of a cached find_*_hours response."""
+    schedule = response.get("schedule")
+    if not schedule or not schedule.get("segments"):
+        return response
+    return {
+        **response,
+        "schedule": {
+            **schedule,
+            "seconds_until_start": _seconds_until(schedule["segments"][0]["start"], now),
+            "seconds_until_end": _seconds_until(schedule["segments"][-1]["end"], now),
+        },
+    }
+
+
+def cache_service_response(
+    handler: Callable[[ServiceCall], Awaitable[Any]],
+    *,
+    service_name: str,
+    entity_params: dict[str, type],
+    refresh: Callable[[dict[str, Any], datetime], dict[str, Any]] | None = None,
+    key_on_search_range: bool = False,
+) -> Callable[[ServiceCall], Awaitable[Any]]:
+    """
+    Wrap a read-only service handler with the coordinator's response cache.
+
+    Args:
+        handler: Service handler to wrap.
+        service_name: Service name, part of the cache key.
+        entity_params: The handler's entity reference parameters (resolved for the key).
+        refresh: Updates time-relative fields of a cached response.
+        key_on_search_range: Add the resolved search range to the key (find_* services).
+
+    Returns:
+        Handler answering repeated calls from the cache.
+
+    """
+
+    @wraps(handler)
+    async def cached_handler(call: ServiceCall) -> Any:
+        hass = call.hass
+        try:
+            data, resolved_refs = resolve_entity_references(hass, call.data, entity_params)
+            target = resolve_service_target(hass, data.get("entry_id", ""), data.get("view_id", ""))
+            search_range = _resolve_call_search_range(data, target) if key_on_search_range else None
+        except ServiceValidationError:
+            # Let the handler report the problem in its own context
+            return await handler(call)
+
+        key = (service_name, _freeze(data), _freeze(resolved_refs), search_range)
+        try:
+            hash(key)
+        except TypeError:
+            return await handler(call)
+
+        coordinator = target.coordinator
+        cache = coordinator.response_cache
+        now = target.time.now()
+        bucket = floor_to_quarter_hour(now)
+        snapshot = coordinator.data
+
+        response = cache.get(key, data=snapshot, bucket=bucket)
+        if response is not None:
+            return refresh(response, now) if refresh is not None else response
+
+        response = await handler(call)
+        # success=False marks a failed fetch - retry it on the next call
+        if isinstance(response, dict) and response.get("success", True) is not False:
+            cache.put(key, response, data=snapshot, bucket=bucket)
+        return response
+
+    return cached_handler
@@ -0,0 +1,249 @@
+"""Optimal multi-task placement for the find_cheapest_schedule service.
+
+Greedy placement (longest task first, each claiming its cheapest window) can
+block a cheaper combined schedule: the first task takes a window that a later
+task needed, leaving it an expensive remainder. This module finds the
+placement with the lowest total cost by dynamic programming over the pool
+positions:
+
+- Window scores for every task and start position are computed once per
+  contiguous run of the pool (calculate_window_scores), never per candidate.
+- Free order (sequential=False): state is (position, set of tasks still to
+  place). Cost O(n x tasks x 2^tasks), a few milliseconds for the 4 tasks the
+  service accepts.
+- Sequential: state is (position, next task in declaration order). Cost
+  O(n x tasks).
+
+The solver maximizes the number of scheduled tasks first and minimizes the
+total cost second. Tasks never overlap and keep `gap_intervals` pool slots
+between each other. Ties prefer earlier windows.
+
+The free-order DP grows exponentially with the task count, so it runs under a
+time budget. solve_schedule() returns None when the budget is exceeded and the
+caller falls back to greedy placement.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from custom_components.tibber_prices.utils.price_window import calculate_window_scores, find_contiguous_runs
+
+if TYPE_CHECKING:
+    from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange
+
+#: Wall-clock budget for one solve (the service runs in the event loop)
+SCHEDULE_SOLVER_TIME_BUDGET_SECONDS = 0.25
+
+#: Above this many tasks the free-order state space (2^tasks per position) is not attempted
+MAX_SOLVER_TASKS = 10
+
+_INF = math.inf
+
+
+def _score_task_windows(
+    prices: list[float],
+    runs: list[tuple[int, int]],
+    duration_intervals: int,
+    weights: list[int] | None,
+    scale: float,
+) -> list[float | None]:
+    """Score every window start of one task (None where no window fits)."""
+    scores: list[float | None] = [None] * len(prices)
+    for run_start, run_end in runs:
+        if run_end - run_start < duration_intervals:
+            continue
+        run_scores = calculate_window_scores(prices[run_start:run_end], duration_intervals, weights)
+        scores[run_start : run_start + len(run_scores)] = [score / scale for score in run_scores]
+    return scores
+
+
+def _task_cost_scales(tasks: list[dict[str, Any]]) -> list[float]:
+    """Return the divisor that makes task window scores comparable.
+
+    Window scores are price sums for plain tasks and price x watt sums for
+    tasks with a power profile. When every task has a profile the raw scores
+    are real energy costs and are summed as-is. Otherwise profiled tasks are
+    normalized to their average power so that one unit of load counts the same
+    for every task.
+    """
+    profiles = [task.get("power_profile") for task in tasks]
+    if all(profiles):
+        return [1.0] * len(tasks)
+    scales = []
+    for task, profile in zip(tasks, profiles, strict=True):
+        weights = profile[: task["duration_intervals"]] if profile else None
+        scales.append(sum(weights) / len(weights) if weights else 1.0)
+    return scales
+
+
+def _solve_free_order(
+    scores: list[list[float | None]],
+    durations: list[int],
+    gap_intervals: int,
+    deadline: float,
+) -> list[int | None] | None:
+    """Place tasks in any order; DP over (position, remaining task set)."""
+    task_count = len(durations)
+    n = len(scores[0])
+    subset_count = 1 << task_count
+    subsets_with_task = [[subset for subset in range(subset_count) if subset & (1 << t)] for t in range(task_count)]
+
+    # best[i][subset]: min cost to place exactly `subset` using slots >= i
+    empty_row = [_INF] * subset_count
+    empty_row[0] = 0.0
+    best: list[list[float]] = [empty_row] * (n + 1)
+    no_choice = [-1] * subset_count
+    choice: list[list[int]] = [no_choice] * n
+
+    for i in range(n - 1, -1, -1):
+        if time.monotonic() > deadline:
+            return None
+        row = best[i + 1]
+        row_choice = no_choice
+        for t in range(task_count):
+            score = scores[t][i]
+            if score is None:
+                continue
+            if row_choice is no_choice:
+                row = row.copy()
+                row_choice = no_choice.copy()
+            bit = 1 << t
+            following = best[min(i + durations[t] + gap_intervals, n)]
+            for subset in subsets_with_task[t]:
+                cost = score + following[subset ^ bit]
+                # <= prefers starting here, i.e. the earlier window on ties
+                if cost <= row[subset]:
+                    row[subset] = cost
+                    row_choice[subset] = t
+        best[i] = row
+        choice[i] = row_choice
+
+    # Most tasks first, then lowest cost
+    target = 0
+    for subset in range(1, subset_count):
+        cost = best[0][subset]
+        if cost == _INF:
+            continue
+        if subset.bit_count() > target.bit_count() or (
+            subset.bit_count() == target.bit_count() and cost < best[0][target]
+        ):
+            target = subset
+
+    starts: list[int | None] = [None] * task_count
+    i = 0
+    while target:
+        t = choice[i][target]
+        if t == -1:
+            i += 1
+            continue
+        starts[t] = i
+        target ^= 1 << t
+        i = min(i + durations[t] + gap_intervals, n)
+    return starts
+
+
+def _solve_sequential(
+    scores: list[list[float | None]],
+    durations: list[int],
+    gap_intervals: int,
+    deadline: float,
+) -> list[int | None] | None:
+    """Place tasks in declaration order; DP over (position, next task).
+
+    Like greedy sequential placement, a task that cannot be placed breaks the
+    chain: the longest placeable prefix of tasks is scheduled.
+    """
+    task_count = len(durations)
+    n = len(scores[0])
+
+    for placed in range(task_count, 0, -1):
+        # best[i]: min cost to place tasks t..placed-1 in order using slots >= i
+        following = [0.0] * (n + 1)
+        choices: list[list[bool]] = [[]] * placed
+        for t in range(placed - 1, -1, -1):
+            if time.monotonic() > deadline:
+                return None
+            task_scores = scores[t]
+            step = durations[t] + gap_intervals
+            best = [_INF] * (n + 1)
+            take = [False] * n
+            for i in range(n - 1, -1, -1):
+                best[i] = best[i + 1]
+                score = task_scores[i]
+                if score is None:
+                    continue
+                cost = score + following[min(i + step, n)]
+                if cost <= best[i]:
+                    best[i] = cost
+                    take[i] = True
+            following = best
+            choices[t] = take
+
+        if following[0] == _INF:
+            continue
+
+        starts: list[int | None] = [None] * task_count
+        i = 0
+        for t in range(placed):
+            while not choices[t][i]:
+                i += 1
+            starts[t] = i
+            i = min(i + durations[t] + gap_intervals, n)
+        return starts
+
+    return [None] * task_count
+
+
+def solve_schedule(
+    search_data: list[dict[str, Any]],
+    tasks: list[dict[str, Any]],
+    *,
+    gap_intervals: int,
+    sequential: bool,
+    time_budget: float = SCHEDULE_SOLVER_TIME_BUDGET_SECONDS,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> list[int | None] | None:
+    """Find the cheapest combined placement of all tasks.
+
+    Args:
+        search_data: Sorted (filtered, optionally smoothed) interval pool.
+        tasks: Tasks with 'duration_intervals' and optional 'power_profile'.
+            In sequential mode the list order is the execution order.
+        gap_intervals: Pool slots required between two tasks.
+        sequential: Keep declaration order, each task after the previous one.
+        time_budget: Wall-clock budget in seconds.
+        prepared: Optional prepared search range the pool belongs to.
+
+    Returns:
+        Start index per task (aligned with `tasks`, None = not scheduled),
+        or None if the budget was exceeded or the task count is too large.
+
+    """
+    if not tasks:
+        return []
+    if not search_data:
+        return [None] * len(tasks)
+    if not sequential and len(tasks) > MAX_SOLVER_TASKS:
+        return None
+
+    deadline = time.monotonic() + time_budget
+    prices = [interval["total"] for interval in search_data]
+    runs = find_contiguous_runs(search_data, prepared=prepared)
+    durations = [task["duration_intervals"] for task in tasks]
+
+    scores: list[list[float | None]] = []
+    score_cache: dict[tuple[int, tuple[int, ...] | None, float], list[float | None]] = {}
+    for task, duration, scale in zip(tasks, durations, _task_cost_scales(tasks), strict=True):
+        profile = task.get("power_profile")
+        weights = profile[:duration] if profile else None
+        key = (duration, tuple(weights) if weights else None, scale)
+        if key not in score_cache:
+            score_cache[key] = _score_task_windows(prices, runs, duration, weights, scale)
+        scores.append(score_cache[key])
+
+    if sequential:
+        return _solve_sequential(scores, durations, gap_intervals, deadline)
+    return _solve_free_order(scores, durations, gap_intervals, deadline)
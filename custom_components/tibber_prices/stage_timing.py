@@ -0,0 +1,129 @@
+"""
+Always-on timing of the update pipeline stages.
+
+Each coordinator owns one TibberPricesStageTimings and hands it to every
+helper that runs a stage of its update cycle: the IntervalPool (fetch and
+cache lookup), the API client (round trips), the data transformer (deep copy,
+enrichment, day patterns), the period calculator (one span per side) and the
+listener manager (quarter-hour and minute fan-out).
+
+Recording a span costs two perf_counter() calls and one deque append, so the
+spans stay enabled in production. The last STAGE_TIMING_WINDOW durations are
+kept per stage; percentiles are only computed when the statistics are read
+(diagnostics, the processing time sensor).
+
+The module has no dependencies on the rest of the integration so that the API
+client and the IntervalPool can import it without import cycles.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import math
+import time
+from typing import TYPE_CHECKING, Any, Concatenate
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
+# Durations kept per stage (rolling window for p50/p95/max)
+STAGE_TIMING_WINDOW = 100
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class TibberPricesStageTimings:
+    """Rolling duration samples per pipeline stage."""
+
+    def __init__(self, *, window: int = STAGE_TIMING_WINDOW) -> None:
+        """Initialize without samples."""
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Add one duration (in seconds) to a stage."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=self._window))
+        samples.append(seconds)
+        self._counts[stage] = self._counts.get(stage, 0) + 1
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        """Record the duration of the with-block, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._samples.clear()
+        self._counts.clear()
+
+    @property
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return p50/p95/max of the rolling window per stage, in milliseconds.
+
+        Returns:
+            Dict keyed by stage name, sorted by name. "count" is the number of
+            spans recorded since startup, the other values cover the last
+            STAGE_TIMING_WINDOW spans.
+
+        """
+        stats: dict[str, dict[str, Any]] = {}
+        for stage in sorted(self._samples):
+            samples = list(self._samples[stage])
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            stats[stage] = {
+                "count": self._counts.get(stage, 0),
+                "last_ms": round(samples[-1] * 1000, 3),
+                "p50_ms": round(_percentile(ordered, 0.5) * 1000, 3),
+                "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return stats
+
+
+def timed_stage[S, **P, R](
+    stage: str,
+) -> Callable[[Callable[Concatenate[S, P], Awaitable[R]]], Callable[Concatenate[S, P], Awaitable[R]]]:
+    """
+    Time an async method with the stage_timings attribute of its instance.
+
+    Nothing is recorded while the attribute is None (e.g. an API client used
+    by the config flow, which has no coordinator).
+
+    Args:
+        stage: Stage name the durations are recorded under.
+
+    Returns:
+        Decorator for async methods.
+
+    """
+
+    def decorator(func: Callable[Concatenate[S, P], Awaitable[R]]) -> Callable[Concatenate[S, P], Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> R:
+            timings: TibberPricesStageTimings | None = getattr(self, "stage_timings", None)
+            if timings is None:
+                return await func(self, *args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                timings.record(stage, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
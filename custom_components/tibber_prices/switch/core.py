@@ -141,6 +141,10 @@ class TibberPricesConfigSwitch(RestoreEntity, SwitchEntity):
                 self.entity_description.config_section,
             )
 
+        # Apply the change; debounced, so all entities restoring their values
+        # on startup cost a single recalculation
+        await self.coordinator.async_handle_config_override_update()
+
     async def async_turn_on(self, **_kwargs: Any) -> None:
         """Turn the switch on."""
         await self._set_value(is_on=True)
@@ -0,0 +1,138 @@
+"""
+Compact record type for price intervals.
+
+The enriched intervals in coordinator.data["priceInfo"] live until the next
+transformation and are read by every entity on every tick. As plain dicts with
+the eight API and enrichment keys they take about two and a half times the
+memory of a __slots__ object per interval.
+
+TibberPricesIntervalRecord keeps the known interval fields in slots and any
+other key in a small overflow dict. It implements the mutable mapping protocol,
+so code written against interval dicts keeps working unchanged: item access,
+get(), 'in', iteration, dict(record), {**record}, equality with dicts.
+as_dict() is the JSON view (Home Assistant's JSON encoder calls it for
+attributes and service responses). Copies (copy(), copy.copy(),
+copy.deepcopy()) are flat: interval values are immutable (str, float,
+datetime, None), so there is nothing to copy below the first level.
+
+Item access goes through Python methods and is slower than on a dict, so the
+transformation enriches and computes periods on dicts and converts to records
+once at the end.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+# Fields of API intervals plus the enrichment fields, in the order the API and
+# enrichment add them (iteration order matches the dicts they replace).
+INTERVAL_FIELDS = ("startsAt", "total", "energy", "tax", "level", "difference", "rating_level", "_original_level")
+_FIELD_SET = frozenset(INTERVAL_FIELDS)
+
+_MISSING = object()
+
+
+class TibberPricesIntervalRecord(MutableMapping[str, Any]):
+    """A price interval with slots for the known fields and a dict-compatible view."""
+
+    __slots__ = (*INTERVAL_FIELDS, "_extra")
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        """
+        Initialize the record from an interval mapping.
+
+        Args:
+            data: Interval dict (or record) to copy the fields from.
+
+        """
+        self._extra: dict[str, Any] | None = None
+        if data is not None:
+            for key, value in data.items():
+                self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field like dict[key]."""
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field, or default if it is not set (like dict.get)."""
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field; unknown keys go to the overflow dict."""
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        """Remove a field like del dict[key]."""
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the field is set."""
+        if key in _FIELD_SET:
+            return getattr(self, key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the set fields, known fields first."""
+        for key in INTERVAL_FIELDS:
+            if getattr(self, key, _MISSING) is not _MISSING:
+                yield key
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        """Return the number of set fields."""
+        count = sum(getattr(self, key, _MISSING) is not _MISSING for key in INTERVAL_FIELDS)
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def __repr__(self) -> str:
+        """Represent the record like the dict it replaces."""
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the interval as plain dict (JSON view for attributes and service responses)."""
+        result = {key: value for key in INTERVAL_FIELDS if (value := getattr(self, key, _MISSING)) is not _MISSING}
+        if self._extra is not None:
+            result.update(self._extra)
+        return result
+
+    def copy(self) -> TibberPricesIntervalRecord:
+        """Return a flat copy (interval values are immutable)."""
+        new = TibberPricesIntervalRecord.__new__(TibberPricesIntervalRecord)
+        for key in INTERVAL_FIELDS:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                setattr(new, key, value)
+        new._extra = dict(self._extra) if self._extra is not None else None  # noqa: SLF001
+        return new
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> TibberPricesIntervalRecord:
+        """Return a flat copy; see copy()."""
+        return self.copy()
@@ -0,0 +1,95 @@
+"""
+Canonical parsed form of interval start timestamps.
+
+Interval 'startsAt' values travel as ISO strings through the interval pool and
+the services, and as aware datetimes through the coordinator data. Gap checks,
+contiguity checks and the charging solvers used to call datetime.fromisoformat()
+on the same few hundred strings in every loop, on every update cycle.
+
+Each distinct string is now parsed once into an (epoch seconds, aware datetime)
+pair and interned. The pool registers its intervals with intern_starts_at()
+when they enter it; every consumer afterwards gets the parsed values from
+starts_at_epoch() / parse_starts_at() and compares integers where it only
+needs ordering or distances.
+
+The interned datetime keeps the offset of the string (as fromisoformat() does).
+Callers that need local time convert it themselves.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Distinct timestamps kept parsed. A pool holds at most 960 intervals per home,
+# so this covers several homes plus the search ranges of service calls.
+_MAX_INTERNED_TIMESTAMPS = 4096
+
+
+@lru_cache(maxsize=_MAX_INTERNED_TIMESTAMPS)
+def _parse_iso(value: str) -> tuple[int, datetime]:
+    """Parse an ISO timestamp once into epoch seconds and an aware datetime."""
+    parsed = datetime.fromisoformat(value)
+    return int(parsed.timestamp()), parsed
+
+
+def intern_starts_at(intervals: Iterable[dict[str, Any]]) -> None:
+    """
+    Parse the start timestamps of intervals entering the pool.
+
+    Args:
+        intervals: Interval dicts with 'startsAt' (ISO string; datetimes are skipped).
+
+    """
+    for interval in intervals:
+        starts_at = interval.get("startsAt")
+        if isinstance(starts_at, str):
+            _parse_iso(starts_at)
+
+
+def parse_starts_at(value: str | datetime) -> datetime:
+    """
+    Return an interval start as aware datetime.
+
+    Args:
+        value: ISO timestamp string or datetime (returned unchanged).
+
+    Returns:
+        The parsed datetime, shared by all callers of the same string.
+
+    """
+    if isinstance(value, datetime):
+        return value
+    return _parse_iso(value)[1]
+
+
+def starts_at_epoch(value: str | datetime) -> int:
+    """
+    Return an interval start in whole seconds since the Unix epoch.
+
+    Args:
+        value: ISO timestamp string or aware datetime.
+
+    Returns:
+        Epoch seconds, comparable across UTC offsets (e.g. both sides of a DST change).
+
+    """
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return _parse_iso(value)[0]
+
+
+def get_parse_stats() -> dict[str, int]:
+    """
+    Return how often timestamps were looked up and actually parsed.
+
+    Returns:
+        Dict with 'lookups' (calls for a string), 'parses' (cache misses) and 'interned' (current size).
+
+    """
+    info = _parse_iso.cache_info()
+    return {"lookups": info.hits + info.misses, "parses": info.misses, "interned": info.currsize}
@@ -5,17 +5,168 @@ Two independent algorithms:
 1. find_cheapest_contiguous_window — Sliding window for appliance scheduling
 2. find_cheapest_n_intervals — Cheapest N picks for flexible-load scheduling
 
+calculate_window_scores() is the shared scoring engine for (power-weighted)
+windows; callers that manage their own availability masks use it directly.
+
+TibberPricesPreparedRange holds the contiguity data of a service search range
+(epoch offsets, contiguity bitmap, runs). Services build it
+once per call; every function here accepts it as `prepared` and then looks
+timestamps up instead of parsing them again for each filtered subset.
+
 These are stateless pure functions with no Home Assistant dependencies.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import datetime
+from itertools import accumulate, pairwise
 import statistics
 from typing import Any
 
+from custom_components.tibber_prices.utils.interval_time import starts_at_epoch
 from custom_components.tibber_prices.utils.price import calculate_coefficient_of_variation
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup, pure-Python fallback below
+    np = None  # type: ignore[assignment]
+
+# Below this many multiply-adds (window positions x profile length) converting
+# to NumPy arrays costs more than the pure-Python prefix-sum scoring saves.
+_NUMPY_MIN_WORK = 4096
+
+# Relative tolerance when picking the best window score. Different summation
+# orders (prefix sums, NumPy) can differ in the last bits; windows within this
+# tolerance count as tied and the earliest one wins, as in a direct scan.
+_SCORE_TIE_TOLERANCE = 1e-9
+
+# Seconds between two contiguous quarter-hour intervals
+_INTERVAL_SECONDS = 15 * 60
+
+# Below this many DP states per interval ((count + 1) x (min_segment + 1)) the
+# pure-Python min-segment DP is faster than its NumPy variant.
+_NUMPY_MIN_SEGMENT_STATES = 128
+
+# NumPy min-segment path keys double per interval; re-ranking them this often
+# keeps them below 2^53 (exact float64) for any realistic state count.
+_PATH_KEY_RERANK_INTERVALS = 30
+
+_INF = float("inf")
+
+
+class TibberPricesPreparedRange:
+    """
+    Contiguity and price data of a search range, computed once per service call.
+
+    Attributes:
+        intervals: The sorted intervals of the search range.
+        contiguous: Bitmap, 1 if the interval starts 15 minutes after its predecessor.
+        runs: (start, end_exclusive) index pairs of contiguous runs.
+
+    Filtered or smoothed subsets of the range (copies included) are supported
+    by offsets_of(), contiguity_of() and runs_of(): they look each interval up
+    by its 'startsAt' value. Timestamps outside the range are parsed as usual.
+
+    """
+
+    __slots__ = ("_offset_by_start", "contiguous", "intervals", "runs")
+
+    def __init__(self, intervals: list[dict[str, Any]]) -> None:
+        """Parse every timestamp of the range once."""
+        self.intervals = intervals
+        self._offset_by_start: dict[str | datetime, int] = {}
+        for interval in intervals:
+            starts_at = interval["startsAt"]
+            self._offset_by_start[starts_at] = _epoch_offset(starts_at)
+        offsets = [self._offset_by_start[interval["startsAt"]] for interval in intervals]
+        self.contiguous = bytearray(_contiguity_from_offsets(offsets))
+        self.runs = _runs_from_contiguity(self.contiguous)
+
+    def offsets_of(self, intervals: list[dict[str, Any]]) -> list[int]:
+        """Return the epoch offset of each interval (any subset of the range)."""
+        lookup = self._offset_by_start
+        offsets = []
+        for interval in intervals:
+            starts_at = interval["startsAt"]
+            offset = lookup.get(starts_at)
+            offsets.append(_epoch_offset(starts_at) if offset is None else offset)
+        return offsets
+
+    def contiguity_of(self, intervals: list[dict[str, Any]]) -> list[bool]:
+        """Return per interval whether it directly follows its predecessor in the list."""
+        if intervals is self.intervals:
+            return [bool(flag) for flag in self.contiguous]
+        return _contiguity_from_offsets(self.offsets_of(intervals))
+
+    def runs_of(
+        self,
+        intervals: list[dict[str, Any]],
+        available: list[bool] | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return contiguous runs of a subset, optionally split at unavailable slots."""
+        if intervals is self.intervals and available is None:
+            return list(self.runs)
+        return _runs_from_contiguity(self.contiguity_of(intervals), available)
+
+
+def _epoch_offset(ts: str | datetime) -> int:
+    """Return an interval start in whole seconds since the Unix epoch (parsed once per timestamp)."""
+    return starts_at_epoch(ts)
+
+
+def _contiguity_from_offsets(offsets: list[int]) -> list[bool]:
+    """Flag each offset that follows its predecessor by exactly one interval."""
+    if not offsets:
+        return []
+    return [False] + [curr - prev == _INTERVAL_SECONDS for prev, curr in pairwise(offsets)]
+
+
+def _runs_from_contiguity(
+    contiguous: list[bool] | bytearray,
+    available: list[bool] | None = None,
+) -> list[tuple[int, int]]:
+    """Split indices into runs at contiguity breaks and unavailable slots."""
+    runs: list[tuple[int, int]] = []
+    run_start = -1
+    for idx, is_contiguous in enumerate(contiguous):
+        if available is not None and not available[idx]:
+            if run_start != -1:
+                runs.append((run_start, idx))
+            run_start = -1
+            continue
+        if run_start == -1:
+            run_start = idx
+        elif not is_contiguous:
+            runs.append((run_start, idx))
+            run_start = idx
+    if run_start != -1:
+        runs.append((run_start, len(contiguous)))
+    return runs
+
+
+def find_contiguous_runs(
+    intervals: list[dict[str, Any]],
+    available: list[bool] | None = None,
+    *,
+    prepared: TibberPricesPreparedRange | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Split sorted intervals into runs of available, quarter-hour contiguous slots.
+
+    Args:
+        intervals: Sorted interval list with 'startsAt' (str or datetime).
+        available: Optional availability mask; unavailable slots end a run.
+        prepared: Optional prepared search range the intervals belong to.
+
+    Returns:
+        List of (start_index, end_index_exclusive) tuples.
+
+    """
+    if prepared is not None:
+        return prepared.runs_of(intervals, available)
+    offsets = [_epoch_offset(interval["startsAt"]) for interval in intervals]
+    return _runs_from_contiguity(_contiguity_from_offsets(offsets), available)
+
 
 def find_cheapest_contiguous_window(
     intervals: list[dict[str, Any]],
@@ -23,14 +174,16 @@ def find_cheapest_contiguous_window(
     *,
     reverse: bool = False,
     power_profile: list[int] | None = None,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> dict[str, Any] | None:
     """
     Find the cheapest (or most expensive) contiguous window of exactly N intervals.
 
     Uses a sliding window algorithm (O(n)) when no power profile is given.
-    With a power profile, uses O(n\u00d7k) direct scoring so that the window with the
-    lowest weighted cost (\u03a3 price[i] \u00d7 watt[i]) is selected instead of lowest
-    average price. This ensures high-wattage phases of the cycle land on cheap intervals.
+    With a power profile, all window scores are computed at once by
+    calculate_window_scores() so that the window with the lowest weighted cost
+    (\u03a3 price[i] \u00d7 watt[i]) is selected instead of lowest average price. This
+    ensures high-wattage phases of the cycle land on cheap intervals.
 
     Args:
         intervals: Sorted list of price interval dicts with 'startsAt' and 'total' keys.
@@ -40,6 +193,7 @@ def find_cheapest_contiguous_window(
         power_profile: Optional watt value per interval. Only the first
             duration_intervals values are used (profile may be longer). When
             provided, scoring uses \u03a3 price[i] \u00d7 watt[i] instead of \u03a3 price[i].
+        prepared: Optional prepared search range the intervals belong to.
 
     Returns:
         Dict with window details (start, end, intervals, statistics),
@@ -55,24 +209,22 @@ def find_cheapest_contiguous_window(
 
     # Price-level filtering can create gaps in time. Search each truly contiguous
     # run independently so the returned window always matches real timestamps.
-    for segment in group_intervals_into_segments(intervals):
-        segment_intervals = segment["intervals"]
-        if len(segment_intervals) < duration_intervals:
+    for run_start, run_end in find_contiguous_runs(intervals, prepared=prepared):
+        if run_end - run_start < duration_intervals:
             continue
+        segment_intervals = intervals[run_start:run_end]
 
         if power_profile:
             # With a power profile the weights rotate with each window position,
-            # so a simple O(1) sliding update is not possible. Recompute each score
-            # directly. Only the first duration_intervals weights are used.
-            segment_best_sum: float = sum(
-                segment_intervals[k]["total"] * power_profile[k] for k in range(duration_intervals)
+            # so a simple O(1) sliding update is not possible. Score every window
+            # position in one pass. Only the first duration_intervals weights are used.
+            scores = calculate_window_scores(
+                [iv["total"] for iv in segment_intervals],
+                duration_intervals,
+                power_profile[:duration_intervals],
             )
-            segment_best_start = 0
-            for i in range(1, len(segment_intervals) - duration_intervals + 1):
-                score = sum(segment_intervals[i + k]["total"] * power_profile[k] for k in range(duration_intervals))
-                if (score > segment_best_sum) if reverse else (score < segment_best_sum):
-                    segment_best_sum = score
-                    segment_best_start = i
+            segment_best_start = select_best_window_start(scores, reverse=reverse)
+            segment_best_sum: float = scores[segment_best_start]
         else:
             window_sum = sum(segment_intervals[i]["total"] for i in range(duration_intervals))
             segment_best_sum = window_sum
@@ -98,12 +250,83 @@ def find_cheapest_contiguous_window(
     }
 
 
+def calculate_window_scores(
+    prices: list[float],
+    duration_intervals: int,
+    weights: list[float] | list[int] | None = None,
+) -> list[float]:
+    """
+    Score every window position of a contiguous price series at once.
+
+    Score at position i is \u03a3 prices[i + k] \u00d7 weights[k] for k < duration_intervals
+    (a sliding dot product). Without weights it is the plain window sum.
+
+    Engines, fastest available first:
+    - NumPy `correlate` for large inputs (C loop, O(n\u00d7k)).
+    - Pure Python: the weights are run-length compressed and each run of equal
+      weights is scored with price prefix sums, O(n\u00d7r) for r weight runs.
+      Appliance power profiles consist of a few constant phases, so r is
+      usually much smaller than k.
+
+    Args:
+        prices: Prices of a contiguous run of intervals.
+        duration_intervals: Window length in intervals.
+        weights: Optional weight per window offset (e.g. watts). Must have at
+            least duration_intervals values; extra values are ignored.
+
+    Returns:
+        One score per window start (len(prices) - duration_intervals + 1 values),
+        or an empty list if the series is shorter than the window.
+
+    """
+    window_count = len(prices) - duration_intervals + 1
+    if duration_intervals <= 0 or window_count <= 0:
+        return []
+
+    if weights is not None and np is not None and window_count * duration_intervals >= _NUMPY_MIN_WORK:
+        kernel = np.asarray(weights[:duration_intervals], dtype=float)
+        return np.correlate(np.asarray(prices, dtype=float), kernel, mode="valid").tolist()
+
+    prefix = [0.0, *accumulate(prices)]
+    if weights is None:
+        return [prefix[i + duration_intervals] - prefix[i] for i in range(window_count)]
+
+    scores = [0.0] * window_count
+    run_start = 0
+    while run_start < duration_intervals:
+        weight = weights[run_start]
+        run_end = run_start + 1
+        while run_end < duration_intervals and weights[run_end] == weight:
+            run_end += 1
+        if weight:
+            for i in range(window_count):
+                scores[i] += weight * (prefix[i + run_end] - prefix[i + run_start])
+        run_start = run_end
+    return scores
+
+
+def select_best_window_start(scores: list[float], *, reverse: bool = False) -> int:
+    """
+    Return the index of the lowest (or highest, if reverse) window score.
+
+    Scores within a small relative tolerance of the optimum are treated as ties
+    and the earliest window wins, so the choice does not depend on the engine
+    that calculate_window_scores() used.
+    """
+    best = max(scores) if reverse else min(scores)
+    tolerance = _SCORE_TIE_TOLERANCE * max(1.0, abs(best))
+    if reverse:
+        return next(i for i, score in enumerate(scores) if score >= best - tolerance)
+    return next(i for i, score in enumerate(scores) if score <= best + tolerance)
+
+
 def find_cheapest_n_intervals(
     intervals: list[dict[str, Any]],
     count: int,
     min_segment_intervals: int = 1,
     *,
     reverse: bool = False,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> dict[str, Any] | None:
     """
     Find the cheapest (or most expensive) N intervals, not necessarily contiguous.
@@ -120,6 +343,7 @@ def find_cheapest_n_intervals(
         min_segment_intervals: Minimum contiguous length for each segment.
             Default 1 means no constraint.
         reverse: If True, find the most expensive intervals instead of cheapest.
+        prepared: Optional prepared search range the intervals belong to.
 
     Returns:
         Dict with schedule details (segments, intervals, statistics),
@@ -136,14 +360,14 @@ def find_cheapest_n_intervals(
         indexed.sort(key=lambda x: x[1]["total"], reverse=reverse)
         selected_indices = sorted(idx for idx, _ in indexed[:count])
         selected = [intervals[i] for i in selected_indices]
-        segments = group_intervals_into_segments(selected)
+        segments = group_intervals_into_segments(selected, prepared=prepared)
         return {
             "intervals": selected,
             "segments": segments,
         }
 
     # Complex case: enforce minimum segment length
-    return _find_with_min_segment(intervals, count, min_segment_intervals, reverse=reverse)
+    return _find_with_min_segment(intervals, count, min_segment_intervals, reverse=reverse, prepared=prepared)
 
 
 def _find_with_min_segment(
@@ -152,6 +376,7 @@ def _find_with_min_segment(
     min_segment: int,
     *,
     reverse: bool = False,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> dict[str, Any] | None:
     """
     Find cheapest/most expensive N intervals with minimum segment length constraint.
@@ -159,86 +384,21 @@ def _find_with_min_segment(
     Uses dynamic programming to find an exact selection of `count` intervals
     where every contiguous run has at least `min_segment` intervals. Real time
     gaps break segments even if the filtered list remains index-contiguous.
-    """
-    n = len(intervals)
 
-    contiguous_with_prev = [False] * n
-    for i in range(1, n):
-        prev_start = _parse_timestamp(intervals[i - 1]["startsAt"])
-        curr_start = _parse_timestamp(intervals[i]["startsAt"])
-        contiguous_with_prev[i] = curr_start - prev_start == timedelta(minutes=15)
-
-    def is_better(new_cost: float, old_cost: float | None) -> bool:
-        if old_cost is None:
-            return True
-        return new_cost > old_cost if reverse else new_cost < old_cost
-
-    current_states: dict[tuple[int, int], float] = {(0, 0): 0.0}
-    backpointers: list[dict[tuple[int, int], tuple[tuple[int, int], bool]]] = [{} for _ in range(n + 1)]
-
-    for idx, interval in enumerate(intervals, start=1):
-        next_states: dict[tuple[int, int], float] = {}
-        next_back: dict[tuple[int, int], tuple[tuple[int, int], bool]] = {}
-        interval_cost = float(interval["total"])
-
-        for prev_state, prev_cost in current_states.items():
-            selected_count, run_len = prev_state
-            effective_run_len = run_len
-
-            if idx > 1 and not contiguous_with_prev[idx - 1] and run_len != 0:
-                if run_len < min_segment:
-                    continue
-                effective_run_len = 0
-
-            if effective_run_len in (0, min_segment):
-                skip_state = (selected_count, 0)
-                if is_better(prev_cost, next_states.get(skip_state)):
-                    next_states[skip_state] = prev_cost
-                    next_back[skip_state] = (prev_state, False)
-
-            if selected_count >= count:
-                continue
-
-            if effective_run_len == 0:
-                new_run_len = 1
-            elif effective_run_len < min_segment:
-                new_run_len = effective_run_len + 1
-            else:
-                new_run_len = min_segment
-
-            take_state = (selected_count + 1, new_run_len)
-            take_cost = prev_cost + interval_cost
-            if is_better(take_cost, next_states.get(take_state)):
-                next_states[take_state] = take_cost
-                next_back[take_state] = (prev_state, True)
-
-        current_states = next_states
-        backpointers[idx] = next_back
-
-    best_state: tuple[int, int] | None = None
-    best_cost: float | None = None
-    for state, cost in current_states.items():
-        selected_count, run_len = state
-        if selected_count != count or run_len not in (0, min_segment):
-            continue
-        if is_better(cost, best_cost):
-            best_state = state
-            best_cost = cost
+    The DP state is (selected count, current run length capped at
+    min_segment). States are kept as dense rows, one per run length, indexed
+    by the selected count; see _min_segment_tables() for the tie-breaking.
+    """
+    contiguous = _contiguity_of(intervals, prepared)
+    # Maximizing a sum is minimizing the negated sum (negation is exact in IEEE 754)
+    costs = [-float(interval["total"]) if reverse else float(interval["total"]) for interval in intervals]
 
-    if best_state is None:
+    selected_indices = _select_min_segment_indices(costs, contiguous, count, min_segment)
+    if selected_indices is None:
         return None
 
-    selected_indices: list[int] = []
-    state = best_state
-    for idx in range(n, 0, -1):
-        prev_state, took_interval = backpointers[idx][state]
-        if took_interval:
-            selected_indices.append(idx - 1)
-        state = prev_state
-
-    selected_indices.reverse()
     result_intervals = [intervals[i] for i in selected_indices]
-    segments = group_intervals_into_segments(result_intervals)
+    segments = group_intervals_into_segments(result_intervals, prepared=prepared)
 
     if len(result_intervals) != count:
         return None
@@ -251,8 +411,202 @@ def _find_with_min_segment(
     }
 
 
+def _select_min_segment_indices(
+    costs: list[float],
+    contiguous: list[bool],
+    count: int,
+    min_segment: int,
+) -> list[int] | None:
+    """Return the indices of the cheapest valid selection, or None if there is none."""
+    states_per_interval = (count + 1) * (min_segment + 1)
+    if np is not None and states_per_interval >= _NUMPY_MIN_SEGMENT_STATES:
+        tables = _min_segment_tables_numpy(costs, contiguous, count, min_segment)
+    else:
+        tables = _min_segment_tables(costs, contiguous, count, min_segment)
+    final_costs, final_keys, skip_back, take_back = tables
+
+    # A selection ends outside a run (0) or after a complete one (min_segment)
+    if final_costs[0] == _INF and final_costs[1] == _INF:
+        return None
+    run_len = min_segment if _prefers_second(final_costs, final_keys) else 0
+
+    selected: list[int] = []
+    selected_count = count
+    for idx in range(len(costs) - 1, -1, -1):
+        if run_len == 0:
+            run_len = min_segment if skip_back[idx][selected_count] else 0
+            continue
+        selected.append(idx)
+        selected_count -= 1
+        if run_len == min_segment or (run_len == 1 and idx > 0 and not contiguous[idx]):
+            taken_after_full = take_back[idx][selected_count]
+            run_len = min_segment if taken_after_full else run_len - 1
+        else:
+            run_len -= 1
+    selected.reverse()
+    return selected
+
+
+def _prefers_second(costs: tuple[float, float], keys: tuple[float, float]) -> bool:
+    """Return True if the second candidate wins (lower cost, or equal cost and earlier path)."""
+    return costs[1] < costs[0] or (costs[1] == costs[0] and keys[1] < keys[0])
+
+
+def _second_wins(
+    first_costs: list[float],
+    second_costs: list[float],
+    first_keys: list[float],
+    second_keys: list[float],
+) -> list[bool]:
+    """Element-wise _prefers_second() for two candidate rows."""
+    return [
+        cost_b < cost_a or (cost_b == cost_a and key_b < key_a)
+        for cost_a, cost_b, key_a, key_b in zip(first_costs, second_costs, first_keys, second_keys, strict=True)
+    ]
+
+
+def _min_segment_tables(
+    costs: list[float],
+    contiguous: list[bool],
+    count: int,
+    min_segment: int,
+) -> tuple[tuple[float, float], tuple[float, float], list[bytes], list[bytes]]:
+    """
+    Run the min-segment DP over dense rows (pure Python).
+
+    Row r holds the best cost per selected count for run length r (0 = outside
+    a run, min_segment = complete run). Only three states have two possible
+    predecessors: run length 0 (skip after nothing or after a complete run),
+    run length 1 after a time gap (same choice) and min_segment (extend a
+    complete run or complete a partial one). Per interval one byte per count
+    records which predecessor won for the skip and for the take transition;
+    all other predecessors are implied by the run length.
+
+    Equal costs are resolved by a path key: the binary number of the
+    skip (0) / take (1) decisions leading to the state, minimized over its
+    predecessors. The lower key wins, i.e. the state that a forward scan over
+    intervals reaches first, which keeps selections independent of the engine.
+
+    Returns:
+        ((cost, key) at run length 0 and min_segment for the full count as
+        two pairs, skip backpointers, take backpointers indexed by the
+        predecessor count).
+
+    """
+    full = min_segment
+    width = count + 1
+    unreachable = [_INF] * width
+    cost_rows: list[list[float]] = [[0.0, *unreachable[1:]], *([unreachable] * full)]
+    key_rows: list[list[float]] = [[0, *unreachable[1:]], *([unreachable] * full)]
+    skip_back: list[bytes] = []
+    take_back: list[bytes] = []
+
+    for idx, price in enumerate(costs):
+        empty_costs, full_costs = cost_rows[0], cost_rows[full]
+        empty_keys, full_keys = key_rows[0], key_rows[full]
+
+        skip_wins = _second_wins(empty_costs, full_costs, empty_keys, full_keys)
+        next_cost_rows = [[b if won else a for a, b, won in zip(empty_costs, full_costs, skip_wins, strict=True)]]
+        next_key_rows = [[2 * min(a, b) for a, b in zip(empty_keys, full_keys, strict=True)]]
+        skip_back.append(bytes(skip_wins))
+
+        if idx > 0 and not contiguous[idx]:
+            # Time gap: partial runs die, a complete run counts as outside a run
+            first_rows, second_rows = (empty_costs, empty_keys), (full_costs, full_keys)
+            tail_rows = [unreachable] * (full - 1)
+        else:
+            first_rows, second_rows = (cost_rows[full - 1], key_rows[full - 1]), (full_costs, full_keys)
+            next_cost_rows += [[_INF, *(cost + price for cost in row[:-1])] for row in cost_rows[: full - 1]]
+            next_key_rows += [[_INF, *(2 * key + 1 for key in row[:-1])] for row in key_rows[: full - 1]]
+            tail_rows = []
+
+        from_first = [cost + price for cost in first_rows[0][:-1]]
+        from_second = [cost + price for cost in second_rows[0][:-1]]
+        take_wins = _second_wins(from_first, from_second, first_rows[1][:-1], second_rows[1][:-1])
+        next_cost_rows.append(
+            [_INF, *(b if won else a for a, b, won in zip(from_first, from_second, take_wins, strict=True))]
+        )
+        next_key_rows.append(
+            [_INF, *(2 * min(a, b) + 1 for a, b in zip(first_rows[1][:-1], second_rows[1][:-1], strict=True))]
+        )
+        take_back.append(bytes(take_wins))
+
+        cost_rows = next_cost_rows + tail_rows
+        key_rows = next_key_rows + tail_rows
+
+    return (
+        (cost_rows[0][count], cost_rows[full][count]),
+        (key_rows[0][count], key_rows[full][count]),
+        skip_back,
+        take_back,
+    )
+
+
+def _min_segment_tables_numpy(
+    costs: list[float],
+    contiguous: list[bool],
+    count: int,
+    min_segment: int,
+) -> tuple[tuple[float, float], tuple[float, float], Any, Any]:
+    """
+    Run the min-segment DP with NumPy rows.
+
+    Same transitions, tie-breaking and return layout as _min_segment_tables().
+    Path keys are float64 here: they double per interval, so they are
+    re-ranked every _PATH_KEY_RERANK_INTERVALS intervals to stay exact.
+    """
+    full = min_segment
+    width = count + 1
+    cost_rows = np.full((full + 1, width), _INF)
+    key_rows = np.full((full + 1, width), _INF)
+    cost_rows[0, 0] = key_rows[0, 0] = 0.0
+    skip_back = np.zeros((len(costs), width), dtype=bool)
+    take_back = np.zeros((len(costs), count), dtype=bool)
+
+    for idx, price in enumerate(costs):
+        next_costs = np.full_like(cost_rows, _INF)
+        next_keys = np.full_like(key_rows, _INF)
+        empty_costs, full_costs = cost_rows[0], cost_rows[full]
+        empty_keys, full_keys = key_rows[0], key_rows[full]
+
+        skip_wins = (full_costs < empty_costs) | ((full_costs == empty_costs) & (full_keys < empty_keys))
+        next_costs[0] = np.where(skip_wins, full_costs, empty_costs)
+        next_keys[0] = 2 * np.minimum(empty_keys, full_keys)
+        skip_back[idx] = skip_wins
+
+        if idx > 0 and not contiguous[idx]:
+            # Time gap: partial runs die, a complete run counts as outside a run
+            first, target = 0, 1
+        else:
+            next_costs[1:full, 1:] = cost_rows[: full - 1, :-1] + price
+            next_keys[1:full, 1:] = 2 * key_rows[: full - 1, :-1] + 1
+            first, target = full - 1, full
+
+        from_first = cost_rows[first, :-1] + price
+        from_second = full_costs[:-1] + price
+        first_keys, second_keys = key_rows[first, :-1], full_keys[:-1]
+        take_wins = (from_second < from_first) | ((from_second == from_first) & (second_keys < first_keys))
+        next_costs[target, 1:] = np.where(take_wins, from_second, from_first)
+        next_keys[target, 1:] = 2 * np.minimum(first_keys, second_keys) + 1
+        take_back[idx] = take_wins
+
+        if idx % _PATH_KEY_RERANK_INTERVALS == _PATH_KEY_RERANK_INTERVALS - 1:
+            reachable = np.isfinite(next_keys)
+            next_keys[reachable] = np.unique(next_keys[reachable], return_inverse=True)[1]
+        cost_rows, key_rows = next_costs, next_keys
+
+    return (
+        (float(cost_rows[0, count]), float(cost_rows[full, count])),
+        (float(key_rows[0, count]), float(key_rows[full, count])),
+        skip_back,
+        take_back,
+    )
+
+
 def group_intervals_into_segments(
     intervals: list[dict[str, Any]],
+    *,
+    prepared: TibberPricesPreparedRange | None = None,
 ) -> list[dict[str, Any]]:
     """
     Group chronologically sorted intervals into contiguous segments.
@@ -262,6 +616,7 @@ def group_intervals_into_segments(
 
     Args:
         intervals: Chronologically sorted interval dicts with 'startsAt' key.
+        prepared: Optional prepared search range the intervals belong to.
 
     Returns:
         List of segment dicts, each containing:
@@ -275,21 +630,10 @@ def group_intervals_into_segments(
     if not intervals:
         return []
 
-    segments: list[dict[str, Any]] = []
-    current_segment: list[dict[str, Any]] = [intervals[0]]
-
-    for i in range(1, len(intervals)):
-        prev_start = _parse_timestamp(intervals[i - 1]["startsAt"])
-        curr_start = _parse_timestamp(intervals[i]["startsAt"])
-
-        if curr_start - prev_start == timedelta(minutes=15):
-            current_segment.append(intervals[i])
-        else:
-            segments.append(_build_segment(current_segment))
-            current_segment = [intervals[i]]
-
-    segments.append(_build_segment(current_segment))
-    return segments
+    return [
+        _build_segment(intervals[run_start:run_end])
+        for run_start, run_end in find_contiguous_runs(intervals, prepared=prepared)
+    ]
 
 
 def _build_segment(intervals: list[dict[str, Any]]) -> dict[str, Any]:
@@ -391,8 +735,11 @@ def calculate_window_statistics(
     }
 
 
-def _parse_timestamp(ts: str | datetime) -> datetime:
-    """Parse an ISO timestamp string or pass through a datetime object."""
-    if isinstance(ts, datetime):
-        return ts
-    return datetime.fromisoformat(ts)
+def _contiguity_of(
+    intervals: list[dict[str, Any]],
+    prepared: TibberPricesPreparedRange | None,
+) -> list[bool]:
+    """Return per interval whether it starts 15 minutes after its predecessor."""
+    if prepared is not None:
+        return prepared.contiguity_of(intervals)
+    return _contiguity_from_offsets([_epoch_offset(interval["startsAt"]) for interval in intervals])
@@ -0,0 +1,246 @@
+"""
+Shared helpers for opt-in benchmarks.
+
+Benchmarks are skipped in regular test runs. Enable them with:
+
+    TIBBER_PRICES_BENCHMARK=1 pytest tests/benchmarks -s
+
+Timings passed to the record_benchmark fixture are written to
+.benchmarks/latest.json (or TIBBER_PRICES_BENCHMARK_JSON). Point
+TIBBER_PRICES_BENCHMARK_BASELINE at an earlier results file to get a
+comparison in the terminal summary:
+
+    TIBBER_PRICES_BENCHMARK=1 TIBBER_PRICES_BENCHMARK_JSON=before.json pytest tests/benchmarks
+    # ... change code ...
+    TIBBER_PRICES_BENCHMARK=1 TIBBER_PRICES_BENCHMARK_BASELINE=before.json pytest tests/benchmarks
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+import json
+import math
+import os
+from pathlib import Path
+import platform
+import random
+import time
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BENCHMARK_ENV_VAR = "TIBBER_PRICES_BENCHMARK"
+RESULTS_ENV_VAR = "TIBBER_PRICES_BENCHMARK_JSON"
+BASELINE_ENV_VAR = "TIBBER_PRICES_BENCHMARK_BASELINE"
+DEFAULT_RESULTS_PATH = Path(".benchmarks") / "latest.json"
+
+# Slowdown against the baseline that is flagged in the terminal summary
+REGRESSION_THRESHOLD = 1.2
+
+# Synthetic price days (see make_synthetic_prices)
+PRICE_SHAPES = ("flat", "v_shape", "duck_curve", "negative", "dst_fall_back", "dst_spring_forward")
+PRICE_HORIZONS = (4, 30, 365)
+SYNTHETIC_TIMEZONE = ZoneInfo("Europe/Berlin")
+_DEFAULT_TODAY = date(2025, 11, 22)
+_DST_DAYS = {"dst_fall_back": date(2025, 10, 26), "dst_spring_forward": date(2026, 3, 29)}
+_LEVELS = (
+    (0.6, "VERY_CHEAP"),
+    (0.9, "CHEAP"),
+    (1.15, "NORMAL"),
+    (1.4, "EXPENSIVE"),
+)
+
+_results: dict[str, dict[str, Any]] = {}
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every benchmark and skip it unless explicitly enabled."""
+    enabled = os.environ.get(BENCHMARK_ENV_VAR) == "1"
+    skip = pytest.mark.skip(reason=f"benchmarks disabled (set {BENCHMARK_ENV_VAR}=1)")
+    for item in items:
+        if "benchmarks" not in item.path.parts:
+            continue
+        item.add_marker(pytest.mark.benchmark)
+        if not enabled:
+            item.add_marker(skip)
+
+
+def _best_of(func: Callable[[], object], *, repeat: int = 5, number: int = 10) -> float:
+    """
+    Return the best average runtime of func in milliseconds.
+
+    Args:
+        func: Zero-argument callable to time.
+        repeat: Number of timing rounds (best round wins).
+        number: Calls per round.
+
+    Returns:
+        Best per-call runtime in milliseconds.
+
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000
+
+
+@pytest.fixture
+def best_of() -> Callable[..., float]:
+    """Provide the best-of-N timing helper (tests may not import from tests/)."""
+    return _best_of
+
+
+def synthetic_today(shape: str) -> date:
+    """Return the day a synthetic series treats as today (the DST day for the DST shapes)."""
+    return _DST_DAYS.get(shape, _DEFAULT_TODAY)
+
+
+def _price_at(shape: str, hour: float) -> float:
+    """Price of one quarter-hour in EUR/kWh, before noise and the day factor."""
+    if shape == "flat":
+        return 0.25
+    if shape == "v_shape":
+        return 0.10 + 0.30 * abs(hour - 12) / 12
+    # Duck curve: solar valley at midday, steep ramp into the evening peak
+    duck = (
+        0.25
+        + 0.05 * math.exp(-(((hour - 8) / 1.5) ** 2))
+        - 0.14 * math.exp(-(((hour - 13) / 2.5) ** 2))
+        + 0.18 * math.exp(-(((hour - 19) / 1.5) ** 2))
+    )
+    if shape == "negative":
+        # Same curve shifted down so the midday valley drops below zero
+        return duck - 0.2
+    return duck
+
+
+def _level_for(price: float, day_mean: float) -> str:
+    """Tibber-style price level relative to the day's mean."""
+    if price < 0 or day_mean <= 0:
+        return "VERY_CHEAP" if price <= 0 else "VERY_EXPENSIVE"
+    ratio = price / day_mean
+    for limit, level in _LEVELS:
+        if ratio < limit:
+            return level
+    return "VERY_EXPENSIVE"
+
+
+def make_synthetic_prices(shape: str, days: int) -> list[dict[str, Any]]:
+    """
+    Create deterministic quarter-hourly prices in the API format (ISO startsAt).
+
+    The series starts at the day before yesterday (like the coordinator's
+    sensor window) and covers days local days in Europe/Berlin, so DST days
+    have 92 or 100 intervals. The DST shapes use the duck curve and make
+    the DST transition day "today".
+
+    Args:
+        shape: One of PRICE_SHAPES.
+        days: Number of days (e.g. one of PRICE_HORIZONS).
+
+    Returns:
+        Interval dicts with startsAt, total, energy, tax and level.
+
+    """
+    if shape not in PRICE_SHAPES:
+        msg = f"Unknown price shape: {shape}"
+        raise ValueError(msg)
+    rng = random.Random(f"{shape}-{days}")
+    first_day = synthetic_today(shape) - timedelta(days=2)
+    intervals: list[dict[str, Any]] = []
+    for day_offset in range(days):
+        day = first_day + timedelta(days=day_offset)
+        start = datetime(day.year, day.month, day.day, tzinfo=SYNTHETIC_TIMEZONE)
+        next_day = day + timedelta(days=1)
+        end = datetime(next_day.year, next_day.month, next_day.day, tzinfo=SYNTHETIC_TIMEZONE)
+        day_factor = 1 + 0.15 * math.sin(day_offset / 7 * math.pi)
+        # Walk in UTC so the repeated (or skipped) DST hour is handled correctly
+        moment = start.astimezone(UTC)
+        day_prices: list[tuple[datetime, float]] = []
+        while moment < end:
+            local = moment.astimezone(SYNTHETIC_TIMEZONE)
+            hour = local.hour + local.minute / 60
+            noise = 0.0 if shape == "flat" else rng.uniform(-0.01, 0.01)
+            day_prices.append((local, round(_price_at(shape, hour) * day_factor + noise, 4)))
+            moment += timedelta(minutes=15)
+        day_mean = sum(price for _, price in day_prices) / len(day_prices)
+        intervals.extend(
+            {
+                "startsAt": local.isoformat(),
+                "total": price,
+                "energy": round(price * 0.8, 4),
+                "tax": round(price * 0.2, 4),
+                "level": _level_for(price, day_mean),
+            }
+            for local, price in day_prices
+        )
+    return intervals
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize the price_shape and price_horizon arguments over all shapes and horizons."""
+    if "price_shape" in metafunc.fixturenames:
+        metafunc.parametrize("price_shape", PRICE_SHAPES)
+    if "price_horizon" in metafunc.fixturenames:
+        metafunc.parametrize("price_horizon", PRICE_HORIZONS, ids=[f"{days}d" for days in PRICE_HORIZONS])
+
+
+@pytest.fixture
+def synthetic_prices() -> Callable[[str, int], list[dict[str, Any]]]:
+    """Provide the synthetic price generator (tests may not import from tests/)."""
+    return make_synthetic_prices
+
+
+@pytest.fixture
+def record_benchmark(request: pytest.FixtureRequest) -> Callable[..., None]:
+    """
+    Provide a recorder for timings that end up in the JSON results file.
+
+    Call it as record_benchmark(ms, label="...", **params). The result is
+    stored under the test's node ID, suffixed with the label if given.
+    """
+
+    def record(ms: float, *, label: str | None = None, **params: Any) -> None:
+        name = request.node.nodeid if label is None else f"{request.node.nodeid}::{label}"
+        _results[name] = {"ms": round(ms, 4), "params": params}
+
+    return record
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Write the recorded timings as JSON."""
+    if not _results:
+        return
+    path = Path(os.environ.get(RESULTS_ENV_VAR) or session.config.rootpath / DEFAULT_RESULTS_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "created": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(_results.items())),
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    """Compare the recorded timings with the baseline file, if one is configured."""
+    baseline_path = os.environ.get(BASELINE_ENV_VAR)
+    if not baseline_path or not _results:
+        return
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8")).get("results", {})
+    terminalreporter.section("benchmark comparison")
+    for name, result in sorted(_results.items()):
+        before = baseline.get(name)
+        if before is None:
+            terminalreporter.write_line(f"{name}: {result['ms']:.3f} ms (new)")
+            continue
+        ratio = result["ms"] / before["ms"] if before["ms"] else math.inf
+        flag = "  <-- slower" if ratio > REGRESSION_THRESHOLD else ""
+        terminalreporter.write_line(f"{name}: {before['ms']:.3f} -> {result['ms']:.3f} ms ({ratio:.2f}x){flag}")
@@ -0,0 +1,68 @@
+"""Benchmark the plan_arbitrage planner over a 48h horizon."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.tibber_prices.services.charging.arbitrage_solver import (
+    ARBITRAGE_TIME_BUDGET_SECONDS,
+    solve_arbitrage_schedule,
+)
+
+
+def _make_range(days: int) -> list[dict[str, Any]]:
+    """Create quarter-hourly prices with morning and evening peaks and noise."""
+    rng = random.Random(days)
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(
+                0.25
+                + 0.08 * math.sin(i / 96 * 2 * math.pi)
+                + 0.06 * math.sin(i / 48 * 2 * math.pi)
+                + rng.uniform(-0.03, 0.03),
+                4,
+            ),
+        }
+        for i in range(days * 96)
+    ]
+
+
+@pytest.mark.parametrize("max_cycles", [None, 1, 2, 4])
+def test_arbitrage_solver(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None], max_cycles: int | None
+) -> None:
+    """A 48h plan for a 10 kWh / 5 kW battery stays within the time budget and respects the cycle limit."""
+    intervals = _make_range(2)
+    kwargs: dict[str, Any] = {
+        "current_soc_kwh": 5.0,
+        "min_soc_kwh": 1.0,
+        "max_soc_kwh": 10.0,
+        "max_charge_power_w": 5000,
+        "max_discharge_power_w": 5000,
+        "charging_efficiency": 0.95,
+        "discharging_efficiency": 0.95,
+        "max_cycles_per_day": max_cycles,
+    }
+
+    plan = solve_arbitrage_schedule(intervals, **kwargs)
+
+    assert plan is not None, "planner exceeded its time budget"
+    assert plan["final_soc_met"]
+    charge_days = [segment["start"][:10] for segment in plan["segments"] if segment["action"] == "charge"]
+    assert not max_cycles or all(charge_days.count(day) <= max_cycles for day in charge_days)
+
+    solver_ms = best_of(lambda: solve_arbitrage_schedule(intervals, **kwargs), number=1)
+    assert solver_ms < ARBITRAGE_TIME_BUDGET_SECONDS * 1000
+    record_benchmark(solver_ms, segments=len(plan["segments"]), profit=round(plan["profit"], 4))
+    print(  # noqa: T201 - benchmark report
+        f"\n48h / {max_cycles} cycles: {solver_ms:.1f} ms, step {plan['soc_step_kwh']} kWh, "
+        f"{len(plan['segments'])} segments, profit {plan['profit']:.3f}"
+    )
@@ -0,0 +1,82 @@
+"""Measure serialized chart_data_export attribute bytes per hour, with and without compact mode."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any
+
+from custom_components.tibber_prices.sensor.chart_data import build_chart_data_attributes, get_payload_size
+from custom_components.tibber_prices.sensor.core import TibberPricesSensor
+
+# chart_data_export writes on every coordinator update (every 15 minutes) and once
+# more when the get_chartdata refresh it triggers has finished
+_WRITES_PER_HOUR = 8
+# Compact mode budget used for the "after" numbers
+_BYTE_BUDGET = 8192
+# The recorder logs a warning and stores no attributes at all above this size
+_RECORDER_LIMIT = 16384
+
+
+def _chart_response(data_key: str) -> dict[str, Any]:
+    """get_chartdata response for today and tomorrow (array_of_objects, level and rating level)."""
+    start = datetime.fromisoformat("2025-11-22T00:00:00+01:00")
+    levels = ("VERY_CHEAP", "CHEAP", "NORMAL", "EXPENSIVE", "VERY_EXPENSIVE")
+    ratings = ("LOW", "NORMAL", "HIGH")
+    return {
+        data_key: [
+            {
+                "start_time": (start + timedelta(minutes=15 * i)).isoformat(),
+                "price_per_kwh": round(24.5 + (i * 7919 % 97) / 10, 2),
+                "level": levels[i * 31 % 5],
+                "rating_level": ratings[i * 17 % 3],
+            }
+            for i in range(192)
+        ]
+    }
+
+
+def _bytes_per_hour(attributes: dict[str, object], unrecorded: frozenset[str]) -> tuple[int, int]:
+    """Return (state machine, recorder) bytes per hour of the serialized attributes."""
+    written = get_payload_size(attributes)
+    recorded = get_payload_size({key: value for key, value in attributes.items() if key not in unrecorded})
+    return written * _WRITES_PER_HOUR, recorded * _WRITES_PER_HOUR
+
+
+def test_chart_data_export_bytes_per_hour(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """Default and custom data_key, before and after dynamic exclusion and compact mode."""
+    last_update = datetime.fromisoformat("2025-11-22T12:00:00+01:00")
+    static_unrecorded = TibberPricesSensor._unrecorded_attributes  # noqa: SLF001
+    rows = []
+    for data_key in ("data", "prices"):
+        response = _chart_response(data_key)
+        size = get_payload_size(response)
+        full = build_chart_data_attributes(response, last_update, None)
+        compact = build_chart_data_attributes(
+            response, last_update, None, byte_budget=_BYTE_BUDGET, response_bytes=size
+        )
+        assert full is not None
+        assert compact is not None
+        assert data_key not in compact
+        full_ms = best_of(lambda response=response: build_chart_data_attributes(response, last_update, None))
+        compact_ms = best_of(
+            lambda response=response, size=size: build_chart_data_attributes(
+                response, last_update, None, byte_budget=_BYTE_BUDGET, response_bytes=size
+            )
+        )
+        data_key_rows = (
+            (f"{data_key} before", full_ms, *_bytes_per_hour(full, static_unrecorded)),
+            (f"{data_key} unrecorded key", full_ms, *_bytes_per_hour(full, static_unrecorded | {data_key})),
+            (f"{data_key} compact", compact_ms, *_bytes_per_hour(compact, static_unrecorded | {data_key})),
+        )
+        for label, build_ms, written, recorded in data_key_rows:
+            # The baseline comparison reads the build time; the byte counts are stored with it
+            record_benchmark(build_ms, label=label, written_bytes_per_hour=written, recorded_bytes_per_hour=recorded)
+        rows += [(label, written, recorded) for label, _build_ms, written, recorded in data_key_rows]
+
+    report = "\n".join(
+        f"  {label:<22} state machine {written / 1024:8.1f} KiB/h, recorder {recorded / 1024:8.1f} KiB/h"
+        + (" (over the recorder limit)" if recorded / _WRITES_PER_HOUR > _RECORDER_LIMIT else "")
+        for label, written, recorded in rows
+    )
+    print(f"\nchart_data_export, 192 intervals, {_WRITES_PER_HOUR} writes/h:\n{report}")  # noqa: T201 - benchmark report
@@ -0,0 +1,215 @@
+"""Benchmark the batch service variants against one service call per device (30 devices, 2 days)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+
+from custom_components.tibber_prices.services import (
+    find_cheapest_block as block_module,
+    plan_charging as charging_module,
+)
+from custom_components.tibber_prices.services.charging import CHARGE_SOLVER_TIME_BUDGET_SECONDS
+from custom_components.tibber_prices.services.helpers import ServiceTarget
+
+_LEVELS = ["VERY_CHEAP", "CHEAP", "NORMAL", "EXPENSIVE", "VERY_EXPENSIVE"]
+_DEVICE_COUNT = 30
+
+
+def _make_range() -> list[dict[str, Any]]:
+    """Create 2 days of quarter-hourly prices with a daily cycle and matching levels."""
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    intervals = []
+    for i in range(2 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        intervals.append(
+            {
+                "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+                "total": price,
+                "level": _LEVELS[min(4, max(0, int((price - 0.15) / 0.06)))],
+            }
+        )
+    return intervals
+
+
+class _FakePool:
+    """Interval pool returning the same prices for every fetch."""
+
+    def __init__(self, intervals: list[dict[str, Any]]) -> None:
+        self._intervals = intervals
+
+    async def get_intervals(self, **_kwargs: object) -> tuple[list[dict[str, Any]], bool]:
+        return self._intervals, False
+
+
+def _patch_target(monkeypatch: pytest.MonkeyPatch, module: Any, intervals: list[dict[str, Any]]) -> None:
+    """Route the module's handlers to a live ServiceTarget with the given prices."""
+    pool = _FakePool(intervals)
+    entry = SimpleNamespace(data={"home_id": "home_1", "currency": "EUR"}, runtime_data=SimpleNamespace())
+    coordinator = SimpleNamespace(
+        api=object(),
+        _cached_user_data={},
+        time=SimpleNamespace(now=lambda: datetime(2026, 1, 5, tzinfo=UTC)),
+        headless=False,
+    )
+    target = ServiceTarget(
+        entry=entry,
+        subentry=None,
+        coordinator=coordinator,
+        interval_pool=pool,
+        data={"priceInfo": intervals, "pricePeriods": {}},
+    )
+    search_range = (datetime(2026, 1, 5, tzinfo=UTC), datetime(2026, 1, 7, tzinfo=UTC))
+    monkeypatch.setattr(module, "resolve_service_target", lambda _hass, _entry_id, _view="": target)
+    monkeypatch.setattr(module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(module, "resolve_search_range", lambda _call_data, _now, _home_tz: search_range)
+    monkeypatch.setattr(module, "get_display_unit_factor", lambda _entry: 100)
+    monkeypatch.setattr(module, "get_display_unit_string", lambda _entry, _currency: "ct/kWh")
+
+
+def _charging_devices() -> list[dict[str, Any]]:
+    """30 vehicles and home batteries with a few shared price level filters."""
+    return [
+        {
+            "name": f"device_{index}",
+            "battery_capacity_kwh": 60.0 if index % 2 else 10.0,
+            "current_soc_percent": float(10 + index % 5 * 10),
+            "target_soc_percent": 80.0,
+            "max_charge_power_w": 11000 if index % 2 else 4000,
+            "max_price_level": [None, "cheap", "normal"][index % 3],
+            "allow_relaxation": True,
+        }
+        for index in range(_DEVICE_COUNT)
+    ]
+
+
+def _constrained_charging_devices() -> list[dict[str, Any]]:
+    """The charging devices with a minimum charge duration and cycle limit, so every attempt runs the solver."""
+    return [
+        {
+            **device,
+            "min_charge_duration_minutes": 60,
+            "max_cycles_per_day": 2,
+            **({"charge_power_steps_w": [1400, 2300, 3700], "max_charge_power_w": 3700} if index % 2 else {}),
+        }
+        for index, device in enumerate(_charging_devices())
+    ]
+
+
+def _block_devices() -> list[dict[str, Any]]:
+    """30 appliances with mixed durations and price level filters."""
+    return [
+        {
+            "name": f"device_{index}",
+            "duration": timedelta(minutes=30 + index % 8 * 15),
+            "max_price_level": [None, "cheap", "very_cheap"][index % 3],
+            "min_distance_from_avg": 10.0 if index % 4 == 0 else None,
+        }
+        for index in range(_DEVICE_COUNT)
+    ]
+
+
+def _single_calls(devices: list[dict[str, Any]]) -> list[Any]:
+    return [
+        SimpleNamespace(
+            hass=object(),
+            data={key: value for key, value in device.items() if key != "name" and value is not None},
+        )
+        for device in devices
+    ]
+
+
+def _batch_call(devices: list[dict[str, Any]]) -> Any:
+    return SimpleNamespace(
+        hass=object(),
+        data={"devices": [{key: value for key, value in device.items() if value is not None} for device in devices]},
+    )
+
+
+@pytest.mark.parametrize(
+    ("service", "module"),
+    [
+        ("plan_charging", charging_module),
+        ("find_cheapest_block", block_module),
+    ],
+)
+def test_batch_vs_sequential(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+    service: str,
+    module: Any,
+) -> None:
+    """A batch call returns the per-device results of the single calls, with one fetch and shared preparation."""
+    intervals = _make_range()
+    _patch_target(monkeypatch, module, intervals)
+    if service == "plan_charging":
+        devices = _charging_devices()
+        single, batch = module.handle_plan_charging, module.handle_plan_charging_batch
+    else:
+        devices = _block_devices()
+        single, batch = module.handle_find_cheapest_block, module.handle_find_cheapest_block_batch
+    single_calls = _single_calls(devices)
+    batch_call = _batch_call(devices)
+
+    async def run_sequential() -> list[dict[str, Any]]:
+        return [cast("dict[str, Any]", await single(cast("ServiceCall", call))) for call in single_calls]
+
+    async def run_batch() -> dict[str, Any]:
+        return cast("dict[str, Any]", await batch(cast("ServiceCall", batch_call)))
+
+    shared_keys = {"success", "home_id", "search_start", "search_end", "must_finish_by", "currency", "price_unit"}
+    batch_response = asyncio.run(run_batch())
+    for single_response, device_response in zip(asyncio.run(run_sequential()), batch_response["devices"], strict=True):
+        expected = {key: value for key, value in single_response.items() if key not in shared_keys}
+        assert {key: value for key, value in device_response.items() if key != "name"} == expected
+
+    sequential_ms = best_of(lambda: asyncio.run(run_sequential()), number=1)
+    batch_ms = best_of(lambda: asyncio.run(run_batch()), number=1)
+    record_benchmark(sequential_ms, label="sequential", devices=_DEVICE_COUNT)
+    record_benchmark(batch_ms, label="batch", devices=_DEVICE_COUNT)
+    print(  # noqa: T201 - benchmark report
+        f"\n{service}, {_DEVICE_COUNT} devices, 2 days: "
+        f"sequential {sequential_ms:.1f} ms vs batch {batch_ms:.1f} ms ({sequential_ms / batch_ms:.1f}x)"
+    )
+
+
+def test_constrained_charging_batch(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A batch of constrained devices shares one solver budget instead of one per device and attempt."""
+    intervals = _make_range()
+    _patch_target(monkeypatch, charging_module, intervals)
+    devices = _constrained_charging_devices()
+    single_calls = _single_calls(devices)
+    batch_call = _batch_call(devices)
+
+    async def run_sequential() -> list[dict[str, Any]]:
+        return [
+            cast("dict[str, Any]", await charging_module.handle_plan_charging(cast("ServiceCall", call)))
+            for call in single_calls
+        ]
+
+    async def run_batch() -> dict[str, Any]:
+        return cast("dict[str, Any]", await charging_module.handle_plan_charging_batch(cast("ServiceCall", batch_call)))
+
+    assert asyncio.run(run_batch())["devices_planned"] == _DEVICE_COUNT
+
+    sequential_ms = best_of(lambda: asyncio.run(run_sequential()), repeat=3, number=1)
+    batch_ms = best_of(lambda: asyncio.run(run_batch()), repeat=3, number=1)
+    record_benchmark(sequential_ms, label="sequential", devices=_DEVICE_COUNT)
+    record_benchmark(batch_ms, label="batch", devices=_DEVICE_COUNT)
+    print(  # noqa: T201 - benchmark report
+        f"\nplan_charging, {_DEVICE_COUNT} constrained devices, 2 days: "
+        f"sequential {sequential_ms:.1f} ms vs batch {batch_ms:.1f} ms "
+        f"(solver budget {CHARGE_SOLVER_TIME_BUDGET_SECONDS * 1000:.0f} ms per call)"
+    )
@@ -0,0 +1,101 @@
+"""Benchmark the joint charge solver vs greedy allocation with constraint repair (plan_charging)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.tibber_prices.services.charging.charge_solver import (
+    CHARGE_SOLVER_TIME_BUDGET_SECONDS,
+    schedule_cost,
+    solve_charge_schedule,
+)
+from custom_components.tibber_prices.services.charging.power_scheduler import (
+    apply_segment_constraints,
+    build_power_schedule,
+)
+from custom_components.tibber_prices.utils.price_window import group_intervals_into_segments
+
+_POWER_MODES: dict[str, dict[str, Any]] = {
+    "fixed": {"max_charge_power_w": 4000},
+    "stepped": {"max_charge_power_w": 3700, "charge_power_steps_w": [1400, 2300, 3700]},
+    "continuous": {"max_charge_power_w": 11000, "min_charge_power_w": 4140},
+}
+
+# (min_charge_duration_minutes, max_cycles_per_day)
+_CONSTRAINTS = [(60, None), (None, 2), (60, 2)]
+
+
+def _make_candidates(days: int) -> list[dict[str, Any]]:
+    """Create quarter-hourly prices with a daily cycle and noise; ~10% filtered out."""
+    rng = random.Random(days)
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    intervals = [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + rng.uniform(-0.05, 0.05), 4),
+        }
+        for i in range(days * 96)
+    ]
+    return [interval for interval in intervals if rng.random() > 0.1]
+
+
+def _greedy(candidates: list[dict[str, Any]], energy: float, **kwargs: Any) -> tuple[dict[str, Any], list[str]]:
+    """Greedy allocation followed by apply_segment_constraints (the plan_charging default before the solver)."""
+    min_duration = kwargs.pop("min_charge_duration_minutes")
+    max_cycles = kwargs.pop("max_cycles_per_day")
+    schedule = build_power_schedule(candidates, energy, charging_efficiency=1.0, **kwargs)
+    return apply_segment_constraints(
+        schedule,
+        candidates,
+        charging_efficiency=1.0,
+        min_charge_duration_minutes=min_duration,
+        max_cycles_per_day=max_cycles,
+        target_grid_energy_kwh=energy,
+    )
+
+
+@pytest.mark.parametrize("days", [1, 2, 4, 7])
+@pytest.mark.parametrize("mode", list(_POWER_MODES))
+@pytest.mark.parametrize(("min_duration", "max_cycles"), _CONSTRAINTS)
+def test_charge_solver(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    days: int,
+    mode: str,
+    min_duration: int | None,
+    max_cycles: int | None,
+) -> None:
+    """The solver plan meets every constraint, within the time budget; cost and runtime vs greedy are reported."""
+    candidates = _make_candidates(days)
+    energy = 10.0
+    kwargs: dict[str, Any] = {
+        **_POWER_MODES[mode],
+        "min_charge_duration_minutes": min_duration,
+        "max_cycles_per_day": max_cycles,
+    }
+
+    solved = solve_charge_schedule(candidates, energy, charging_efficiency=1.0, **kwargs)
+    greedy, warnings = _greedy(candidates, energy, **kwargs)
+
+    assert solved is not None, "solver exceeded its time budget"
+    segments = group_intervals_into_segments(solved["intervals"])
+    assert solved["total_grid_energy_kwh"] >= energy - 1e-6
+    assert not max_cycles or len(segments) <= max_cycles
+    assert not min_duration or all(segment["duration_minutes"] >= min_duration for segment in segments)
+
+    solver_ms = best_of(lambda: solve_charge_schedule(candidates, energy, charging_efficiency=1.0, **kwargs), number=1)
+    greedy_ms = best_of(lambda: _greedy(candidates, energy, **kwargs), number=1)
+    assert solver_ms < CHARGE_SOLVER_TIME_BUDGET_SECONDS * 1000
+    record_benchmark(solver_ms, label="solver", cost=round(schedule_cost(solved), 4))
+    record_benchmark(greedy_ms, label="greedy", cost=round(schedule_cost(greedy), 4))
+    print(  # noqa: T201 - benchmark report
+        f"\n{mode} / {days} days / min {min_duration} min / {max_cycles} cycles: "
+        f"solver {solver_ms:.1f} ms (cost {schedule_cost(solved):.3f}), "
+        f"greedy {greedy_ms:.1f} ms (cost {schedule_cost(greedy):.3f}, warnings {sorted(set(warnings)) or None})"
+    )
@@ -0,0 +1,85 @@
+"""Benchmark latency and peak memory of a 30-day get_chartdata export."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import tracemalloc
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import Mock
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+
+from custom_components.tibber_prices.services import get_chartdata as chartdata_module
+
+_EXPORT_DAYS = 30
+
+# Requests of a long export; the day selection is routed to the whole 30-day range
+_SCENARIOS = {
+    "objects": {"include_level": True, "include_energy": True, "include_tax": True},
+    "arrays": {"output_format": "array_of_arrays", "array_fields": "{start_time}, {price_per_kwh}, {level}"},
+    "hourly_segments": {
+        "resolution": "hourly",
+        "level_filter": ["VERY_CHEAP", "CHEAP"],
+        "insert_nulls": "segments",
+        "connect_segments": True,
+        "include_level": True,
+    },
+}
+
+
+def _call(params: dict[str, Any]) -> ServiceCall:
+    """Build a service call with the schema defaults applied."""
+    return cast("ServiceCall", SimpleNamespace(hass=None, data=chartdata_module.CHARTDATA_SERVICE_SCHEMA(params)))
+
+
+def _peak_memory_kb(func: Callable[[], object]) -> float:
+    """Return the peak traced allocation of one call in KB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("scenario", list(_SCENARIOS))
+def test_chartdata_export_30_days(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    monkeypatch: pytest.MonkeyPatch,
+    scenario: str,
+) -> None:
+    """Report latency and peak memory of a 30-day export per output shape."""
+    intervals = [
+        {**interval, "startsAt": datetime.fromisoformat(interval["startsAt"])}
+        for interval in synthetic_prices("duck_curve", _EXPORT_DAYS)
+    ]
+    coordinator = SimpleNamespace(data={"priceInfo": intervals, "currency": "EUR"}, config_entry=Mock(options={}))
+    monkeypatch.setattr(
+        chartdata_module,
+        "resolve_service_target",
+        lambda _hass, _entry_id, _view="": SimpleNamespace(coordinator=coordinator),
+    )
+    monkeypatch.setattr(chartdata_module, "get_intervals_for_day_offsets", lambda _data, _offsets: intervals)
+    call = _call({"day": ["today"], **_SCENARIOS[scenario]})
+
+    def export() -> dict[str, Any]:
+        return asyncio.run(chartdata_module.handle_chartdata(call))
+
+    points = len(export()["data"])
+    peak_kb = _peak_memory_kb(export)
+    export_ms = best_of(export, repeat=5, number=3)
+
+    assert points > 0
+
+    record_benchmark(export_ms, label=scenario, intervals=len(intervals), points=points)
+    print(  # noqa: T201 - benchmark report
+        f"\n{_EXPORT_DAYS}-day export ({scenario}): {points} points, {export_ms:.1f} ms, peak {peak_kb:.0f} KB"
+    )
@@ -0,0 +1,91 @@
+"""Benchmark memory and copy time of the interval copies per update: deep-copied dicts vs flat copies and records."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import copy
+from datetime import datetime
+import tracemalloc
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.tibber_prices.coordinator.data_transformation import (
+    TibberPricesDataTransformer,
+    _build_period_calculation_intervals,
+    _build_price_info_records,
+)
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+
+
+def _transform_inputs(raw_intervals: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return the raw intervals of one update and the enriched dicts the transformation builds from them."""
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=datetime.fromisoformat("2025-11-22T12:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(config_entry, "[bench]")
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[bench]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+    )
+    price_info = [{**interval, "startsAt": datetime.fromisoformat(interval["startsAt"])} for interval in raw_intervals]
+    data = transformer.transform_data(
+        {"timestamp": None, "home_id": "home_123", "price_info": price_info, "currency": "EUR"}
+    )
+    enriched = [{**interval, "_original_level": interval["level"]} for interval in data["priceInfo"]]
+    return price_info, enriched
+
+
+def _deepcopy_dicts(raw: list[dict[str, Any]], enriched: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Former copies per update: deepcopy before enrichment, deepcopy for the period calculation."""
+    copy.deepcopy(raw)
+    copy.deepcopy(enriched)
+    return enriched
+
+
+def _flat_copies_and_records(raw: list[dict[str, Any]], enriched: list[dict[str, Any]]) -> list[Any]:
+    """Current copies per update: flat copies before enrichment and for periods, records for priceInfo."""
+    [dict(interval) for interval in raw]
+    _build_period_calculation_intervals(enriched)
+    return _build_price_info_records(enriched)
+
+
+def _retained_kb(build: Callable[[], list[Any]]) -> float:
+    """Return the memory held by the list build() returns, in KB."""
+    tracemalloc.start()
+    try:
+        result = build()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def test_interval_copies_per_update(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+) -> None:
+    """priceInfo records hold the same intervals in less memory; flat copies are faster than deepcopy."""
+    raw, enriched = _transform_inputs(synthetic_prices("duck_curve", 4))
+    records = _flat_copies_and_records(raw, enriched)
+
+    assert [{**record, "_original_level": record["level"]} for record in records] == enriched
+
+    dict_kb = _retained_kb(lambda: [dict(interval) for interval in enriched])
+    record_kb = _retained_kb(lambda: _build_price_info_records(enriched))
+    deepcopy_ms = best_of(lambda: _deepcopy_dicts(raw, enriched), repeat=5, number=10)
+    flat_ms = best_of(lambda: _flat_copies_and_records(raw, enriched), repeat=5, number=10)
+
+    assert record_kb < dict_kb
+    assert flat_ms < deepcopy_ms
+
+    record_benchmark(deepcopy_ms, label="deepcopy", intervals=len(raw))
+    record_benchmark(flat_ms, label="flat copies and records", intervals=len(raw))
+    print(  # noqa: T201 - benchmark report
+        f"\n{len(raw)} intervals: priceInfo dicts {dict_kb:.0f} KB, records {record_kb:.0f} KB; "
+        f"copies per update {deepcopy_ms:.2f} ms (deepcopy) vs {flat_ms:.2f} ms (flat copies and records)"
+    )
@@ -0,0 +1,108 @@
+"""Benchmark the min-segment DP of find_cheapest_n_intervals over a 7-day search range."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+import tracemalloc
+
+import pytest
+
+from custom_components.tibber_prices.utils import price_window
+from custom_components.tibber_prices.utils.price_window import find_cheapest_n_intervals
+
+SEARCH_RANGE_INTERVALS = 7 * 96
+
+
+def _make_range() -> list[dict]:
+    """Create 7 days of quarter-hourly prices with a daily cycle."""
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4),
+        }
+        for i in range(SEARCH_RANGE_INTERVALS)
+    ]
+
+
+def _dict_state_selection(intervals: list[dict], count: int, min_segment: int) -> list[int] | None:
+    """Select indices with the previous dict-of-tuples DP (one backpointer dict per interval)."""
+    states: dict[tuple[int, int], float] = {(0, 0): 0.0}
+    backpointers: list[dict[tuple[int, int], tuple[tuple[int, int], bool]]] = []
+    for interval in intervals:  # contiguous range: no gap handling needed
+        next_states: dict[tuple[int, int], float] = {}
+        back: dict[tuple[int, int], tuple[tuple[int, int], bool]] = {}
+        for state, cost in states.items():
+            selected, run_len = state
+            candidates = []
+            if run_len in (0, min_segment):
+                candidates.append(((selected, 0), cost, False))
+            if selected < count:
+                next_run = min(run_len + 1, min_segment)
+                candidates.append(((selected + 1, next_run), cost + interval["total"], True))
+            for target, target_cost, took in candidates:
+                if target not in next_states or target_cost < next_states[target]:
+                    next_states[target] = target_cost
+                    back[target] = (state, took)
+        states = next_states
+        backpointers.append(back)
+
+    finals = [(cost, state) for state, cost in states.items() if state[0] == count and state[1] in (0, min_segment)]
+    if not finals:
+        return None
+    state = min(finals, key=lambda final: final[0])[1]
+    selected_indices = []
+    for idx in range(len(intervals) - 1, -1, -1):
+        state, took = backpointers[idx][state]
+        if took:
+            selected_indices.append(idx)
+    return selected_indices[::-1]
+
+
+def _peak_memory_mb(func: Callable[[], object]) -> float:
+    """Return the peak traced allocation of one call in MB."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize(("count", "min_segment"), [(32, 4), (96, 4), (200, 8)])
+def test_min_segment_selection(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    monkeypatch: pytest.MonkeyPatch,
+    count: int,
+    min_segment: int,
+) -> None:
+    """Both DP engines pick the dict-based selection; report time and peak memory."""
+    intervals = _make_range()
+    expected = [intervals[i] for i in _dict_state_selection(intervals, count, min_segment) or []]
+
+    def select() -> dict | None:
+        return find_cheapest_n_intervals(intervals, count, min_segment_intervals=min_segment)
+
+    result = select()
+    assert result is not None
+    assert result["intervals"] == expected
+
+    dict_ms = best_of(lambda: _dict_state_selection(intervals, count, min_segment), repeat=2, number=1)
+    dict_mb = _peak_memory_mb(lambda: _dict_state_selection(intervals, count, min_segment))
+    numpy_ms = best_of(select, repeat=3, number=2)
+    numpy_mb = _peak_memory_mb(select)
+    monkeypatch.setattr(price_window, "np", None)
+    assert select() == result
+    python_ms = best_of(select, repeat=2, number=1)
+    python_mb = _peak_memory_mb(select)
+    record_benchmark(dict_ms, label="dict states", peak_mb=round(dict_mb, 2))
+    record_benchmark(python_ms, label="array rows", peak_mb=round(python_mb, 2))
+    record_benchmark(numpy_ms, label="numpy", peak_mb=round(numpy_mb, 2))
+
+    print(  # noqa: T201 - benchmark report
+        f"\n{count} of 7 days, min segment {min_segment}: dict states {dict_ms:.0f} ms / {dict_mb:.1f} MB, "
+        f"array rows {python_ms:.0f} ms / {python_mb:.1f} MB, numpy {numpy_ms:.0f} ms / {numpy_mb:.1f} MB"
+    )
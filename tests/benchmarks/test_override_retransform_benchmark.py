@@ -0,0 +1,79 @@
+"""Benchmark a peak-only override change: full retransform vs. peak period stage only."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import math
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.tibber_prices import const as _const
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.coordinator.transform_stages import STAGE_PEAK_PERIODS
+from homeassistant.util import dt as dt_util
+
+
+def _make_raw_data() -> dict[str, Any]:
+    """Create day-before-yesterday through tomorrow (4 days) with a daily cycle."""
+    base = dt_util.parse_datetime("2025-11-20T00:00:00+01:00")
+    assert base is not None
+    intervals = []
+    for i in range(4 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        level = "CHEAP" if price < 0.2 else "EXPENSIVE" if price > 0.33 else "NORMAL"
+        intervals.append(
+            {
+                "startsAt": base + timedelta(minutes=15 * i),
+                "total": price,
+                "energy": price * 0.8,
+                "tax": price * 0.2,
+                "level": level,
+            }
+        )
+    return {"timestamp": base, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+
+
+def test_peak_override_retransform(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """Changing peak flex reruns one period side instead of the whole pipeline."""
+    overrides: dict[str, dict[str, Any]] = {}
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=dt_util.parse_datetime("2025-11-22T12:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(
+        config_entry, "[bench]", get_config_override_fn=lambda key, section: overrides.get(section, {}).get(key)
+    )
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[bench]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+        get_active_overrides_fn=lambda: overrides,
+    )
+    raw_data = _make_raw_data()
+    transformer.transform_data(raw_data)
+    flex_values = iter(range(1_000_000))
+
+    def full_retransform() -> None:
+        overrides["flexibility_settings"] = {_const.CONF_PEAK_PRICE_FLEX: 20 + next(flex_values) % 10}
+        transformer.invalidate_config_cache()
+        calculator.invalidate_config_cache()
+        transformer.transform_data(raw_data)
+
+    def peak_only() -> None:
+        overrides["flexibility_settings"] = {_const.CONF_PEAK_PRICE_FLEX: 20 + next(flex_values) % 10}
+        stages = transformer.get_config_change_stages()
+        assert stages == {STAGE_PEAK_PERIODS}
+        transformer.invalidate_config_cache(keep_results=True)
+        calculator.invalidate_config_cache(keep_periods=True)
+        transformer.rerun_period_stages(stages)
+
+    full_ms = best_of(full_retransform, repeat=3, number=3)
+    peak_ms = best_of(peak_only, repeat=3, number=3)
+    record_benchmark(full_ms, label="full retransform")
+    record_benchmark(peak_ms, label="peak stage only")
+    print(  # noqa: T201 - benchmark report
+        f"\npeak flex override, 4 days: full retransform {full_ms:.1f} ms, peak stage only {peak_ms:.1f} ms"
+    )
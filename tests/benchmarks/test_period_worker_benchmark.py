@@ -0,0 +1,84 @@
+"""
+Benchmark the peak price side in a worker process against both sides in-process.
+
+With a TibberPricesPeriodSideWorker the calling thread calculates the best
+price side while the worker process calculates the peak price side, so the
+wall-clock time of a period calculation drops from best + peak to roughly the
+slower of the two plus the pickling of the job (~4ms for the 4-day window).
+The gain needs a second CPU core; on a single core both sides share it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import os
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.period_pipeline import TibberPricesPeriodSideWorker
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.utils.price import enrich_price_info_with_differences
+
+_SENSOR_WINDOW_DAYS = 4
+
+
+def _enriched_window(raw: list[dict[str, Any]], time: TibberPricesTimeService) -> list[dict[str, Any]]:
+    """Coordinator form of the synthetic window (startsAt as datetime), enriched like the suite does."""
+    return enrich_price_info_with_differences(
+        [{**interval, "startsAt": datetime.fromisoformat(interval["startsAt"])} for interval in raw],
+        threshold_low=-10,
+        threshold_high=10,
+        hysteresis=2.0,
+        gap_tolerance=1,
+        level_gap_tolerance=1,
+        time=time,
+    )
+
+
+def test_period_side_worker(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    price_shape: str,
+) -> None:
+    """Both sides in-process vs the peak side in the worker, on the sensor window."""
+    cores = os.cpu_count() or 1
+    if cores < 2:
+        pytest.skip("the worker process is only used with a second CPU core")
+    raw = synthetic_prices(price_shape, _SENSOR_WINDOW_DAYS)
+    today = datetime.fromisoformat(raw[0]["startsAt"]) + timedelta(days=2)
+    time = TibberPricesTimeService(reference_time=today + timedelta(hours=12))
+    enriched = _enriched_window(raw, time)
+
+    worker = TibberPricesPeriodSideWorker()
+    try:
+        calculators = {}
+        for name, side_worker in (("in_process", None), ("worker", worker)):
+            calculator = TibberPricesPeriodCalculator(Mock(options={}), "[bench]", side_worker=side_worker)
+            calculator.time = time
+            calculators[name] = calculator
+
+        def calculate(name: str) -> dict[str, Any]:
+            calculators[name].invalidate_config_cache()
+            return calculators[name].calculate_periods_for_price_info(enriched)
+
+        # Start the worker process outside the timed runs
+        expected = calculate("in_process")
+        calculate("worker")
+        worker._warm_up.result(timeout=120)  # noqa: SLF001 - wait for the process to start
+        assert calculate("worker") == expected
+
+        timings = {name: best_of(lambda name=name: calculate(name), repeat=5, number=2) for name in calculators}
+    finally:
+        worker.shutdown()
+
+    for name, elapsed_ms in timings.items():
+        record_benchmark(elapsed_ms, label=name, shape=price_shape, cpu_count=cores)
+    print(  # noqa: T201 - benchmark report
+        f"\n{price_shape}: in-process {timings['in_process']:.1f} ms, "
+        f"worker {timings['worker']:.1f} ms ({timings['in_process'] / timings['worker']:.2f}x, {cores} cores)"
+    )
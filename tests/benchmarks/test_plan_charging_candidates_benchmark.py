@@ -0,0 +1,125 @@
+"""Benchmark candidate building across plan_charging relaxation attempts (7-day range)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+from typing import Any
+
+import pytest
+
+from custom_components.tibber_prices.services.charging import build_power_schedule, filter_intervals_by_profitability
+from custom_components.tibber_prices.services.helpers import filter_intervals_by_price_level, smooth_service_intervals
+from custom_components.tibber_prices.services.plan_charging import _CandidatePool, _PlanContext
+from custom_components.tibber_prices.services.relaxation import generate_relaxation_steps
+from custom_components.tibber_prices.utils.price_window import TibberPricesPreparedRange
+
+_LEVELS = ["VERY_CHEAP", "CHEAP", "NORMAL", "EXPENSIVE", "VERY_EXPENSIVE"]
+
+
+def _make_range() -> list[dict[str, Any]]:
+    """Create 7 days of quarter-hourly prices with a daily cycle and matching levels."""
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    intervals = []
+    for i in range(7 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        intervals.append(
+            {
+                "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+                "total": price,
+                "level": _LEVELS[min(4, max(0, int((price - 0.15) / 0.06)))],
+            }
+        )
+    return intervals
+
+
+def _make_context(price_info: list[dict[str, Any]], *, smooth_outliers: bool) -> _PlanContext:
+    return _PlanContext(
+        price_info=price_info,
+        current_soc_kwh=2.0,
+        target_soc_kwh=12.0,
+        capacity_kwh=15.0,
+        must_reach_soc_kwh=None,
+        deadline=None,
+        charging_efficiency=0.9,
+        discharging_efficiency=0.9,
+        max_charge_power_w=4000,
+        min_charge_power_w=None,
+        charge_power_steps_w=None,
+        grid_import_limit_w=None,
+        min_charge_duration_minutes=None,
+        max_cycles_per_day=None,
+        smooth_outliers=smooth_outliers,
+        expected_discharge_price_base=0.45,
+        reserve_for_discharge=True,
+        max_cost_per_kwh_base=0.4,
+        unit_factor=100,
+        prepared=TibberPricesPreparedRange(price_info),
+    )
+
+
+def _rebuild(ctx: _PlanContext, max_price_level: str | None, min_price_level: str | None) -> dict[str, Any]:
+    """Per-attempt candidate building and scheduling as done before the pool."""
+    candidates = [
+        dict(interval) for interval in filter_intervals_by_price_level(ctx.price_info, min_price_level, max_price_level)
+    ]
+    if ctx.smooth_outliers and candidates:
+        smoothed = smooth_service_intervals([dict(interval) for interval in candidates])
+        smoothed_map = {interval["startsAt"]: float(interval["total"]) for interval in smoothed}
+        for candidate in candidates:
+            candidate["_sort_total"] = smoothed_map.get(candidate["startsAt"], float(candidate["total"]))
+    candidates, _economics_filter = filter_intervals_by_profitability(
+        candidates,
+        charging_efficiency=ctx.charging_efficiency,
+        discharging_efficiency=ctx.discharging_efficiency,
+        expected_discharge_price=ctx.expected_discharge_price_base,
+        reserve_for_discharge=ctx.reserve_for_discharge,
+        max_cost_per_kwh=ctx.max_cost_per_kwh_base,
+    )
+    return build_power_schedule(candidates, 20.0, max_charge_power_w=4000, charging_efficiency=0.9)
+
+
+def _pooled(pool: _CandidatePool, max_price_level: str | None, min_price_level: str | None) -> dict[str, Any]:
+    candidates = pool.get(max_price_level=max_price_level, min_price_level=min_price_level)
+    return build_power_schedule(
+        candidates.by_price, 20.0, max_charge_power_w=4000, charging_efficiency=0.9, presorted=True
+    )
+
+
+@pytest.mark.parametrize("smooth_outliers", [False, True])
+def test_candidate_pool(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None], smooth_outliers: bool
+) -> None:
+    """Every relaxation attempt gets the same schedule from the pool as from a full rebuild."""
+    ctx = _make_context(_make_range(), smooth_outliers=smooth_outliers)
+    levels = [("cheap", None)] + [
+        (step.max_price_level, step.min_price_level)
+        for step in generate_relaxation_steps(
+            min_distance_from_avg=10.0,
+            max_price_level="cheap",
+            min_price_level=None,
+            total_intervals=24,
+            min_duration_intervals=4,
+            max_duration_reduction_intervals=8,
+            reverse=False,
+        )
+    ]
+
+    pool = _CandidatePool(ctx)
+    for max_level, min_level in levels:
+        assert _pooled(pool, max_level, min_level) == _rebuild(ctx, max_level, min_level)
+
+    def run_pooled() -> None:
+        attempt_pool = _CandidatePool(ctx)
+        for max_level, min_level in levels:
+            _pooled(attempt_pool, max_level, min_level)
+
+    rebuild_ms = best_of(lambda: [_rebuild(ctx, max_level, min_level) for max_level, min_level in levels], number=3)
+    pooled_ms = best_of(run_pooled, number=3)
+    record_benchmark(rebuild_ms, label="rebuild", attempts=len(levels))
+    record_benchmark(pooled_ms, label="pool", attempts=len(levels))
+    print(  # noqa: T201 - benchmark report
+        f"\n7 days, {len(levels)} attempts, smoothing {smooth_outliers}: "
+        f"rebuild {rebuild_ms:.1f} ms vs pool {pooled_ms:.1f} ms"
+    )
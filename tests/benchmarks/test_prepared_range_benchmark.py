@@ -0,0 +1,49 @@
+"""Benchmark contiguity lookups through a prepared search range (7-day range, filtered subset)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+
+from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
+    find_cheapest_contiguous_window,
+    group_intervals_into_segments,
+)
+
+
+def _make_range() -> list[dict]:
+    """Create 7 days of quarter-hourly prices with a daily cycle."""
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4),
+        }
+        for i in range(7 * 96)
+    ]
+
+
+def test_prepared_range_lookups(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """Level-filtered copies are grouped without re-parsing timestamps."""
+    price_info = _make_range()
+    # Like a level filter followed by smoothing: a subset made of copies
+    search_data = [dict(iv) for iv in price_info if iv["total"] < 0.3]
+    prepared = TibberPricesPreparedRange(price_info)
+
+    assert group_intervals_into_segments(search_data, prepared=prepared) == group_intervals_into_segments(search_data)
+    assert find_cheapest_contiguous_window(search_data, 8, prepared=prepared) == find_cheapest_contiguous_window(
+        search_data, 8
+    )
+
+    prepare_ms = best_of(lambda: TibberPricesPreparedRange(price_info))
+    parse_ms = best_of(lambda: group_intervals_into_segments(search_data))
+    lookup_ms = best_of(lambda: group_intervals_into_segments(search_data, prepared=prepared))
+    record_benchmark(prepare_ms, label="prepare", intervals=len(price_info))
+    record_benchmark(parse_ms, label="grouping parsed", intervals=len(search_data))
+    record_benchmark(lookup_ms, label="grouping prepared", intervals=len(search_data))
+    print(  # noqa: T201 - benchmark report
+        f"\n7 days, {len(search_data)} filtered intervals: prepare {prepare_ms:.2f} ms once, "
+        f"grouping {parse_ms:.2f} ms parsed vs {lookup_ms:.2f} ms prepared"
+    )
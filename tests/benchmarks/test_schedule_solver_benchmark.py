@@ -0,0 +1,70 @@
+"""Benchmark optimal vs greedy multi-task scheduling (2-8 tasks, 48h and 7-day ranges)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+import random
+from typing import Any
+
+import pytest
+
+from custom_components.tibber_prices.services.find_cheapest_schedule import _greedy_window_starts
+from custom_components.tibber_prices.services.schedule_solver import SCHEDULE_SOLVER_TIME_BUDGET_SECONDS, solve_schedule
+
+
+def _make_range(days: int) -> list[dict[str, Any]]:
+    """Create quarter-hourly prices with a daily cycle and noise."""
+    rng = random.Random(days)
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + rng.uniform(-0.05, 0.05), 4),
+        }
+        for i in range(days * 96)
+    ]
+
+
+def _make_tasks(count: int) -> list[dict[str, Any]]:
+    """Create tasks of 30min-4h, sorted longest first like the service does."""
+    rng = random.Random(count)
+    durations = sorted((rng.randint(2, 16) for _ in range(count)), reverse=True)
+    return [{"name": f"task_{i}", "duration_intervals": dur, "power_profile": None} for i, dur in enumerate(durations)]
+
+
+def _total_cost(pool: list[dict[str, Any]], tasks: list[dict[str, Any]], starts: list[int | None]) -> float:
+    return sum(
+        sum(iv["total"] for iv in pool[start : start + task["duration_intervals"]])
+        for task, start in zip(tasks, starts, strict=True)
+        if start is not None
+    )
+
+
+@pytest.mark.parametrize("days", [2, 7])
+@pytest.mark.parametrize("task_count", range(2, 9))
+def test_schedule_solver(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None], days: int, task_count: int
+) -> None:
+    """Optimal placement is never worse than greedy and stays within the time budget."""
+    pool = _make_range(days)
+    tasks = _make_tasks(task_count)
+
+    optimal = solve_schedule(pool, tasks, gap_intervals=1, sequential=False)
+    greedy = _greedy_window_starts(pool, tasks, gap_intervals=1, sequential=False)
+
+    assert optimal is not None, "solver exceeded its time budget"
+    assert None not in optimal
+    assert _total_cost(pool, tasks, optimal) <= _total_cost(pool, tasks, greedy) + 1e-9
+
+    optimal_ms = best_of(lambda: solve_schedule(pool, tasks, gap_intervals=1, sequential=False), number=3)
+    greedy_ms = best_of(lambda: _greedy_window_starts(pool, tasks, gap_intervals=1, sequential=False), number=3)
+    assert optimal_ms < SCHEDULE_SOLVER_TIME_BUDGET_SECONDS * 1000
+    record_benchmark(optimal_ms, label="optimal", cost=round(_total_cost(pool, tasks, optimal), 4))
+    record_benchmark(greedy_ms, label="greedy", cost=round(_total_cost(pool, tasks, greedy), 4))
+    print(  # noqa: T201 - benchmark report
+        f"\n{task_count} tasks / {days} days: optimal {optimal_ms:.1f} ms "
+        f"(cost {_total_cost(pool, tasks, optimal):.3f}), greedy {greedy_ms:.1f} ms "
+        f"(cost {_total_cost(pool, tasks, greedy):.3f})"
+    )
@@ -0,0 +1,76 @@
+"""Benchmark the overhead of the always-on stage timing spans on a full data transformation."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import math
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
+from homeassistant.util import dt as dt_util
+
+
+def _make_raw_data() -> dict[str, Any]:
+    """Create day-before-yesterday through tomorrow (4 days) with a daily cycle."""
+    base = dt_util.parse_datetime("2025-11-20T00:00:00+01:00")
+    assert base is not None
+    intervals = []
+    for i in range(4 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        level = "CHEAP" if price < 0.2 else "EXPENSIVE" if price > 0.33 else "NORMAL"
+        intervals.append(
+            {
+                "startsAt": base + timedelta(minutes=15 * i),
+                "total": price,
+                "energy": price * 0.8,
+                "tax": price * 0.2,
+                "level": level,
+            }
+        )
+    return {"timestamp": base, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+
+
+def test_stage_timing_overhead(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """The spans of one full transformation cost well below 1% of the transformation itself."""
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=dt_util.parse_datetime("2025-11-22T12:00:00+01:00"))
+    timings = TibberPricesStageTimings()
+    calculator = TibberPricesPeriodCalculator(config_entry, "[bench]")
+    calculator.time = time
+    calculator.stage_timings = timings
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[bench]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+    )
+    transformer.stage_timings = timings
+    raw_data = _make_raw_data()
+
+    def full_transform() -> None:
+        transformer.invalidate_config_cache()
+        calculator.invalidate_config_cache()
+        transformer.transform_data(raw_data)
+
+    full_transform()
+    spans_per_transform = sum(stage["count"] for stage in timings.stats.values())
+
+    def empty_span() -> None:
+        with timings.measure("empty"):
+            pass
+
+    transform_ms = best_of(full_transform, repeat=3, number=3)
+    span_ms = best_of(empty_span, number=10_000)
+    overhead = spans_per_transform * span_ms / transform_ms
+    record_benchmark(transform_ms, label="full transform", spans=spans_per_transform)
+    record_benchmark(span_ms, label="empty span")
+    print(  # noqa: T201 - benchmark report
+        f"\nfull transform, 4 days: {transform_ms:.1f} ms, {spans_per_transform} spans "
+        f"at {span_ms * 1000:.2f} us each ({overhead:.4%} overhead)"
+    )
+    assert overhead < 0.01
@@ -0,0 +1,107 @@
+"""Benchmark sensor calculator setup: ten calculators per sensor vs. lazily created, partly shared ones."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import suppress
+from types import SimpleNamespace
+from typing import Any, cast
+
+from custom_components.tibber_prices.sensor.calculators import (
+    TibberPricesCalculatorSet,
+    TibberPricesDailyStatCalculator,
+    TibberPricesIntervalCalculator,
+    TibberPricesLifecycleCalculator,
+    TibberPricesMetadataCalculator,
+    TibberPricesRollingHourCalculator,
+    TibberPricesTimeTravelCalculator,
+    TibberPricesTimingCalculator,
+    TibberPricesTrendCalculator,
+    TibberPricesVolatilityCalculator,
+    TibberPricesWindow24hCalculator,
+)
+from custom_components.tibber_prices.sensor.definitions import ENTITY_DESCRIPTIONS
+from custom_components.tibber_prices.sensor.value_getters import get_value_getter_mapping
+
+# 3 homes, each with its live view and one time-travel view
+_HOMES = 3
+_VIEWS_PER_HOME = 2
+_SHARED_CALCULATORS = ("metadata", "window_24h", "rolling_hour", "timing", "lifecycle", "time_travel")
+_OWN_CALCULATORS = ("interval", "daily_stat", "trend", "volatility")
+
+
+def _coordinators() -> list[Any]:
+    return [SimpleNamespace(sensor_calculators=None, data=None) for _ in range(_HOMES * _VIEWS_PER_HOME)]
+
+
+def _mapping(calculators: Any) -> dict[str, Callable]:
+    return get_value_getter_mapping(
+        calculators=calculators,
+        get_next_avg_n_hours_value=lambda _hours: None,
+        get_data_timestamp=lambda: None,
+        get_chart_data_export_value=lambda: None,
+        get_chart_metadata_value=lambda: None,
+    )
+
+
+def _eager_setup() -> int:
+    """Sensor setup before: every sensor created all ten calculators and its value getter mapping."""
+    created = 0
+    for coordinator in _coordinators():
+        for _description in ENTITY_DESCRIPTIONS:
+            calculators = SimpleNamespace(
+                metadata=TibberPricesMetadataCalculator(coordinator),
+                volatility=TibberPricesVolatilityCalculator(coordinator),
+                window_24h=TibberPricesWindow24hCalculator(coordinator),
+                rolling_hour=TibberPricesRollingHourCalculator(coordinator),
+                daily_stat=TibberPricesDailyStatCalculator(coordinator),
+                interval=TibberPricesIntervalCalculator(coordinator),
+                timing=TibberPricesTimingCalculator(coordinator),
+                trend=TibberPricesTrendCalculator(coordinator),
+                lifecycle=TibberPricesLifecycleCalculator(coordinator),
+                time_travel=TibberPricesTimeTravelCalculator(coordinator),
+            )
+            _mapping(calculators)
+            created += 10
+    return created
+
+
+def _lazy_setup(*, evaluate: bool) -> int:
+    """Sensor setup now; with evaluate, also the first evaluation of the sensors enabled by default."""
+    created = 0
+    for coordinator in _coordinators():
+        sets = [TibberPricesCalculatorSet(cast("Any", coordinator)) for _description in ENTITY_DESCRIPTIONS]
+        if not evaluate:
+            continue
+        for description, calculators in zip(ENTITY_DESCRIPTIONS, sets, strict=True):
+            if description.entity_registry_enabled_default is False:
+                continue
+            getter = _mapping(calculators).get(description.key)
+            if getter is not None:
+                # Without data the getters return early (or fail) right after creating their calculator
+                with suppress(Exception):
+                    getter()
+            created += sum(name in vars(calculators) for name in _OWN_CALCULATORS)
+        shared = coordinator.sensor_calculators
+        created += sum(name in vars(shared) for name in _SHARED_CALCULATORS) if shared is not None else 0
+    return created
+
+
+def test_sensor_setup(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """All sensor descriptions of 3 homes x 2 views: setup, and setup plus first evaluation."""
+    sensors = len(ENTITY_DESCRIPTIONS) * _HOMES * _VIEWS_PER_HOME
+    eager_created = _eager_setup()
+    lazy_created = _lazy_setup(evaluate=True)
+    assert lazy_created < eager_created
+
+    eager_ms = best_of(_eager_setup, repeat=5, number=3)
+    lazy_ms = best_of(lambda: _lazy_setup(evaluate=False), repeat=5, number=3)
+    evaluated_ms = best_of(lambda: _lazy_setup(evaluate=True), repeat=5, number=3)
+    record_benchmark(eager_ms, label="eager")
+    record_benchmark(lazy_ms, label="lazy")
+    record_benchmark(evaluated_ms, label="lazy + first evaluation")
+    print(  # noqa: T201 - benchmark report
+        f"\n{sensors} sensors ({_HOMES} homes x {_VIEWS_PER_HOME} views): "
+        f"eager {eager_ms:.2f} ms ({eager_created} calculators), lazy {lazy_ms:.2f} ms (0 calculators), "
+        f"lazy + first evaluation {evaluated_ms:.2f} ms ({lazy_created} calculators)"
+    )
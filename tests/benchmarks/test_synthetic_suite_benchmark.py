@@ -0,0 +1,247 @@
+"""
+Regression suite on synthetic prices: every price shape at 4, 30 and 365 days.
+
+The shapes (flat, V-shape, duck curve, negative prices, DST fall-back and
+spring-forward days) come from the synthetic_prices generator in conftest.py,
+which also parametrizes price_shape and price_horizon. Every timing is passed
+to record_benchmark, so a run leaves a JSON file that a later run can be
+compared against (see conftest.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import MagicMock, Mock
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.interval_pool.manager import TibberPricesIntervalPool
+from custom_components.tibber_prices.services import (
+    find_cheapest_block as block_module,
+    find_cheapest_hours as hours_module,
+    find_cheapest_schedule as schedule_module,
+    plan_charging as charging_module,
+)
+from custom_components.tibber_prices.services.find_most_expensive_block import handle_find_most_expensive_block
+from custom_components.tibber_prices.services.find_most_expensive_hours import handle_find_most_expensive_hours
+from custom_components.tibber_prices.services.helpers import ServiceTarget
+from custom_components.tibber_prices.utils.price import enrich_price_info_with_differences
+
+# Horizons above this get fewer timing rounds, so the whole suite stays within minutes
+_LONG_HORIZON_DAYS = 30
+# The coordinator only enriches the 4-day sensor window, and the trailing 24h average scans
+# the whole list for every interval (quadratic), so a year takes about 20 minutes per call
+_SKIP_ENRICH_YEAR = "enrichment only runs on the sensor window; a year takes minutes per call"
+_TIMEZONE = "Europe/Berlin"
+
+
+def _today_start(intervals: list[dict[str, Any]]) -> datetime:
+    """Local midnight of "today" (the generated series starts the day before yesterday)."""
+    return datetime.fromisoformat(intervals[0]["startsAt"]) + timedelta(days=2)
+
+
+def _coordinator_intervals(intervals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Convert API intervals to the coordinator form (startsAt as datetime)."""
+    return [{**interval, "startsAt": datetime.fromisoformat(interval["startsAt"])} for interval in intervals]
+
+
+def _enrich(intervals: list[dict[str, Any]], time: TibberPricesTimeService) -> list[dict[str, Any]]:
+    return enrich_price_info_with_differences(
+        [dict(interval) for interval in intervals],
+        threshold_low=-10,
+        threshold_high=10,
+        hysteresis=2.0,
+        gap_tolerance=1,
+        level_gap_tolerance=1,
+        time=time,
+    )
+
+
+def _rounds(horizon: int) -> dict[str, int]:
+    return {"repeat": 3, "number": 1} if horizon > _LONG_HORIZON_DAYS else {"repeat": 3, "number": 3}
+
+
+def test_enrich_price_info(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    price_shape: str,
+    price_horizon: int,
+) -> None:
+    """Trailing averages, differences and rating levels for the whole series."""
+    if price_horizon > _LONG_HORIZON_DAYS:
+        pytest.skip(_SKIP_ENRICH_YEAR)
+    raw = synthetic_prices(price_shape, price_horizon)
+    intervals = _coordinator_intervals(raw)
+    time = TibberPricesTimeService(reference_time=_today_start(raw) + timedelta(hours=12))
+
+    elapsed_ms = best_of(lambda: _enrich(intervals, time), **_rounds(price_horizon))
+    record_benchmark(elapsed_ms, shape=price_shape, horizon_days=price_horizon, intervals=len(intervals))
+
+
+def test_calculate_periods(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    price_shape: str,
+    price_horizon: int,
+) -> None:
+    """Best and peak price periods, with relaxation, on enriched prices."""
+    if price_horizon > _LONG_HORIZON_DAYS:
+        pytest.skip(_SKIP_ENRICH_YEAR)
+    raw = synthetic_prices(price_shape, price_horizon)
+    time = TibberPricesTimeService(reference_time=_today_start(raw) + timedelta(hours=12))
+    enriched = _enrich(_coordinator_intervals(raw), time)
+    calculator = TibberPricesPeriodCalculator(Mock(options={}), "[bench]")
+    calculator.time = time
+
+    def calculate() -> dict[str, Any]:
+        calculator.invalidate_config_cache()
+        return calculator.calculate_periods_for_price_info(enriched)
+
+    result = calculate()
+    assert set(result) == {"best_price", "peak_price"}
+
+    elapsed_ms = best_of(calculate, **_rounds(price_horizon))
+    record_benchmark(elapsed_ms, shape=price_shape, horizon_days=price_horizon, intervals=len(enriched))
+
+
+def test_interval_pool(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    price_shape: str,
+    price_horizon: int,
+) -> None:
+    """Fill the pool one day per fetch (with GC), then look up the sensor window."""
+    intervals = synthetic_prices(price_shape, price_horizon)
+    time = TibberPricesTimeService(reference_time=_today_start(intervals) + timedelta(hours=12))
+    days: dict[str, list[dict[str, Any]]] = {}
+    for interval in intervals:
+        days.setdefault(interval["startsAt"][:10], []).append(interval)
+
+    def fill() -> TibberPricesIntervalPool:
+        pool = TibberPricesIntervalPool(home_id="home_1", api=MagicMock(), time_service=time)
+        for day, day_intervals in days.items():
+            pool._add_intervals(day_intervals, f"{day}T13:00:00+00:00")  # noqa: SLF001
+        return pool
+
+    pool = fill()
+    # Sensor window: the first four days (end taken from the data, so DST days keep their length)
+    window = [interval for day_intervals in list(days.values())[:4] for interval in day_intervals]
+    window_start = datetime.fromisoformat(window[0]["startsAt"])
+    window_end = datetime.fromisoformat(window[-1]["startsAt"]) + timedelta(minutes=15)
+    user_data = {"viewer": {"homes": [{"id": "home_1", "timeZone": _TIMEZONE}]}}
+
+    async def lookup() -> list[dict[str, Any]]:
+        result, api_called = await pool.get_intervals(MagicMock(), user_data, window_start, window_end)
+        assert not api_called
+        return result
+
+    assert len(asyncio.run(lookup())) == len(window)
+
+    fill_ms = best_of(fill, **_rounds(price_horizon))
+    lookup_ms = best_of(lambda: asyncio.run(lookup()), number=20)
+    gc_ms = best_of(pool._gc.run_gc, number=20)  # noqa: SLF001
+    record_benchmark(fill_ms, label="fill_with_gc", shape=price_shape, horizon_days=price_horizon)
+    record_benchmark(lookup_ms, label="lookup_4_days", shape=price_shape, horizon_days=price_horizon)
+    record_benchmark(gc_ms, label="gc_pass", shape=price_shape, horizon_days=price_horizon)
+
+
+class _FakePool:
+    """Interval pool returning the whole synthetic series for every fetch."""
+
+    def __init__(self, intervals: list[dict[str, Any]]) -> None:
+        self._intervals = intervals
+
+    async def get_intervals(self, **_kwargs: object) -> tuple[list[dict[str, Any]], bool]:
+        return self._intervals, False
+
+
+_SERVICES: dict[str, tuple[Any, Callable[[ServiceCall], Any], dict[str, Any]]] = {
+    "find_cheapest_block": (block_module, block_module.handle_find_cheapest_block, {"duration": timedelta(hours=3)}),
+    "find_most_expensive_block": (block_module, handle_find_most_expensive_block, {"duration": timedelta(hours=3)}),
+    "find_cheapest_hours": (hours_module, hours_module.handle_find_cheapest_hours, {"duration": timedelta(hours=4)}),
+    "find_most_expensive_hours": (hours_module, handle_find_most_expensive_hours, {"duration": timedelta(hours=4)}),
+    "find_cheapest_schedule": (
+        schedule_module,
+        schedule_module.handle_find_cheapest_schedule,
+        {
+            "tasks": [
+                {"name": "dishwasher", "duration": timedelta(hours=2)},
+                {"name": "washing_machine", "duration": timedelta(minutes=90)},
+                {"name": "dryer", "duration": timedelta(hours=1)},
+            ]
+        },
+    ),
+    "plan_charging": (
+        charging_module,
+        charging_module.handle_plan_charging,
+        {
+            "battery_capacity_kwh": 60.0,
+            "current_soc_percent": 20.0,
+            "target_soc_percent": 80.0,
+            "max_charge_power_w": 11000,
+        },
+    ),
+}
+
+
+def _patch_target(monkeypatch: pytest.MonkeyPatch, module: Any, intervals: list[dict[str, Any]]) -> None:
+    """Route the module's handlers to a ServiceTarget searching from today to the end of the series."""
+    pool = _FakePool(intervals)
+    today_start = _today_start(intervals)
+    entry = SimpleNamespace(data={"home_id": "home_1", "currency": "EUR"}, runtime_data=SimpleNamespace())
+    coordinator = SimpleNamespace(
+        api=object(),
+        _cached_user_data={},
+        time=SimpleNamespace(now=lambda: today_start),
+        headless=False,
+    )
+    target = ServiceTarget(
+        entry=entry,
+        subentry=None,
+        coordinator=coordinator,
+        interval_pool=pool,
+        data={"priceInfo": intervals, "pricePeriods": {}},
+    )
+    search_range = (today_start, datetime.fromisoformat(intervals[-1]["startsAt"]) + timedelta(minutes=15))
+    monkeypatch.setattr(module, "resolve_service_target", lambda _hass, _entry_id, _view="": target)
+    monkeypatch.setattr(module, "resolve_home_timezone", lambda _coord, _home_id: _TIMEZONE)
+    monkeypatch.setattr(module, "resolve_search_range", lambda _call_data, _now, _home_tz: search_range)
+    monkeypatch.setattr(module, "get_display_unit_factor", lambda _entry: 100)
+    monkeypatch.setattr(module, "get_display_unit_string", lambda _entry, _currency: "ct/kWh")
+
+
+@pytest.mark.parametrize("service", list(_SERVICES))
+def test_service(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+    monkeypatch: pytest.MonkeyPatch,
+    service: str,
+    price_shape: str,
+    price_horizon: int,
+) -> None:
+    """One service call searching from today to the end of the series."""
+    module, handler, data = _SERVICES[service]
+    intervals = synthetic_prices(price_shape, price_horizon)
+    _patch_target(monkeypatch, module, intervals)
+    call = cast("ServiceCall", SimpleNamespace(hass=object(), data=data))
+
+    async def run() -> dict[str, Any]:
+        return cast("dict[str, Any]", await handler(call))
+
+    assert asyncio.run(run())["success"] is True
+
+    elapsed_ms = best_of(lambda: asyncio.run(run()), **_rounds(price_horizon))
+    record_benchmark(elapsed_ms, service=service, shape=price_shape, horizon_days=price_horizon)
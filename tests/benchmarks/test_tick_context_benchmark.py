@@ -0,0 +1,161 @@
+"""Benchmark one quarter-hour tick: per-entity lookups vs. one shared tick context."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+import math
+import time as time_module
+from typing import Any
+from unittest.mock import Mock
+
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.tick_context import TibberPricesTickContext
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.sensor.calculators.interval import TibberPricesIntervalCalculator
+from custom_components.tibber_prices.sensor.calculators.rolling_hour import TibberPricesRollingHourCalculator
+from custom_components.tibber_prices.sensor.calculators.window_24h import TibberPricesWindow24hCalculator
+from custom_components.tibber_prices.utils.average import (
+    calculate_current_leading_max,
+    calculate_current_leading_mean,
+    calculate_current_leading_min,
+    calculate_current_trailing_max,
+    calculate_current_trailing_mean,
+    calculate_current_trailing_min,
+)
+from homeassistant.util import dt as dt_util
+
+_TICKS = 96  # One day of quarter-hour boundaries
+
+
+class _Coordinator:
+    """Coordinator stand-in exposing what the calculators read."""
+
+    def __init__(self, data: dict[str, Any], *, shared: bool) -> None:
+        self.data = data
+        self.config_entry = Mock(options={})
+        self.hass = None
+        self.time = TibberPricesTimeService()
+        self._shared = shared
+        self._tick_context: TibberPricesTickContext | None = None
+
+    def get_tick_context(self) -> TibberPricesTickContext:
+        # Per-entity mode: every lookup starts from scratch, as before the shared context
+        if not self._shared or self._tick_context is None or not self._tick_context.is_valid_for(self.data, self.time):
+            self._tick_context = TibberPricesTickContext(self.data, time=self.time)
+        return self._tick_context
+
+    def get_current_interval(self) -> dict | None:
+        return self.get_tick_context().current_interval
+
+
+def _make_data() -> dict[str, Any]:
+    """Transform yesterday, today and tomorrow with a daily price cycle."""
+    base = dt_util.parse_datetime("2025-11-21T00:00:00+01:00")
+    assert base is not None
+    intervals = []
+    for i in range(3 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        level = "CHEAP" if price < 0.2 else "EXPENSIVE" if price > 0.33 else "NORMAL"
+        intervals.append(
+            {
+                "startsAt": base + timedelta(minutes=15 * i),
+                "total": price,
+                "energy": price * 0.8,
+                "tax": price * 0.2,
+                "level": level,
+            }
+        )
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=dt_util.parse_datetime("2025-11-22T00:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(config_entry, "[bench]")
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[bench]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+    )
+    return transformer.transform_data(
+        {"timestamp": base, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+    )
+
+
+def _entity_getters(coordinator: _Coordinator) -> list[Callable[[], object]]:
+    """Return the value getters of all entities served by the tick context (one per entity)."""
+    interval = TibberPricesIntervalCalculator(coordinator)  # type: ignore[arg-type]
+    rolling_hour = TibberPricesRollingHourCalculator(coordinator)  # type: ignore[arg-type]
+    window_24h = TibberPricesWindow24hCalculator(coordinator)  # type: ignore[arg-type]
+
+    getters: list[Callable[[], object]] = [interval.get_price_level_value]
+    getters += [
+        lambda offset=offset, value_type=value_type: interval.get_interval_value(
+            interval_offset=offset, value_type=value_type
+        )
+        for offset in (-1, 0, 1)
+        for value_type in ("price", "level", "rating")
+    ]
+    getters.append(lambda: interval.get_rating_value(rating_type="current"))
+    getters += [
+        lambda hour_offset=hour_offset, value_type=value_type: rolling_hour.get_rolling_hour_value(
+            hour_offset=hour_offset, value_type=value_type
+        )
+        for hour_offset in (0, 1)
+        for value_type in ("price", "level", "rating")
+    ]
+    getters += [
+        lambda stat_func=stat_func: window_24h.get_24h_window_value(stat_func=stat_func)
+        for stat_func in (
+            calculate_current_trailing_mean,
+            calculate_current_leading_mean,
+            calculate_current_trailing_min,
+            calculate_current_trailing_max,
+            calculate_current_leading_min,
+            calculate_current_leading_max,
+        )
+    ]
+    # Period binary sensors plus the icon checks of the period timing sensors
+    getters += [
+        lambda reverse_sort=reverse_sort: coordinator.get_tick_context().period_bounds(reverse_sort=reverse_sort)
+        for reverse_sort in (False, True, False, True)
+    ]
+    return getters
+
+
+def test_tick_cpu_per_entity_vs_shared_context(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None]
+) -> None:
+    """All context-backed entities refreshed for every quarter-hour of one day."""
+    data = _make_data()
+    day_start = dt_util.parse_datetime("2025-11-22T00:00:00+01:00")
+    assert day_start is not None
+    tick_times = [day_start + timedelta(minutes=15 * tick, milliseconds=5) for tick in range(_TICKS)]
+    results: dict[bool, list[list[object]]] = {}
+
+    def run_day(coordinator: _Coordinator, getters: list[Callable[[], object]]) -> list[list[object]]:
+        values = []
+        for tick_time in tick_times:
+            # Timer #2 creates one TimeService per tick and hands it to every listener
+            coordinator.time = TibberPricesTimeService(reference_time=tick_time)
+            values.append([getter() for getter in getters])
+        return values
+
+    timings = {}
+    for shared in (False, True):
+        coordinator = _Coordinator(data, shared=shared)
+        getters = _entity_getters(coordinator)
+        results[shared] = run_day(coordinator, getters)
+        cpu_start = time_module.process_time()
+        day_ms = best_of(lambda coordinator=coordinator, getters=getters: run_day(coordinator, getters), number=3)
+        timings[shared] = (day_ms / _TICKS, (time_module.process_time() - cpu_start) / (5 * 3 * _TICKS) * 1000)
+
+    assert results[True] == results[False]
+    entity_count = len(_entity_getters(_Coordinator(data, shared=True)))
+    for shared, label in ((False, "per-entity lookups"), (True, "shared tick context")):
+        record_benchmark(timings[shared][0], label=label, entities=entity_count, cpu_ms=round(timings[shared][1], 4))
+    print(  # noqa: T201 - benchmark report
+        f"\n{entity_count} entities per tick: per-entity lookups {timings[False][0]:.2f} ms "
+        f"(cpu {timings[False][1]:.2f} ms), shared tick context {timings[True][0]:.2f} ms "
+        f"(cpu {timings[True][1]:.2f} ms)"
+    )
@@ -0,0 +1,67 @@
+"""Benchmark timestamp parsing per update cycle: pool checks, coordinator data and a service search range."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from unittest.mock import MagicMock
+
+from custom_components.tibber_prices.coordinator.helpers import parse_all_timestamps
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.interval_pool import TibberPricesIntervalPool
+from custom_components.tibber_prices.services.helpers import build_response_interval
+from custom_components.tibber_prices.utils.interval_time import get_parse_stats
+from custom_components.tibber_prices.utils.price_window import find_contiguous_runs
+
+# Protected pool range of the synthetic series: day before yesterday to the end of tomorrow
+_START_ISO = "2025-11-20T00:00:00+01:00"
+_END_ISO = "2025-11-24T00:00:00+01:00"
+
+
+def _update_cycle(pool: TibberPricesIntervalPool, time: TibberPricesTimeService) -> None:
+    """Everything that resolves interval timestamps during one coordinator update plus one service call."""
+    cached = pool._get_cached_intervals(_START_ISO, _END_ISO)  # noqa: SLF001
+    pool._fetcher.check_coverage(cached, _START_ISO, _END_ISO)  # noqa: SLF001
+    pool._has_real_gaps_in_range(_START_ISO, _END_ISO)  # noqa: SLF001
+    pool._covers_current_interval(cached)  # noqa: SLF001
+    # Service: contiguity of the search range and its response intervals
+    find_contiguous_runs(cached)
+    [build_response_interval(interval, 100, {}) for interval in cached]
+    # Coordinator: localized datetimes (mutates the pool's copies)
+    parse_all_timestamps({"price_info": cached}, time=time)
+
+
+def _parses_during(func: Callable[[], Any]) -> tuple[int, int]:
+    """Return (parses, lookups) of interval timestamps while func runs."""
+    before = get_parse_stats()
+    func()
+    after = get_parse_stats()
+    return after["parses"] - before["parses"], after["lookups"] - before["lookups"]
+
+
+def test_timestamp_parses_per_update_cycle(
+    best_of: Callable[..., float],
+    record_benchmark: Callable[..., None],
+    synthetic_prices: Callable[[str, int], list[dict[str, Any]]],
+) -> None:
+    """Timestamps are parsed when they enter the pool; update cycles afterwards only look them up."""
+    intervals = synthetic_prices("duck_curve", 4)
+    time = TibberPricesTimeService(reference_time=datetime.fromisoformat("2025-11-22T12:00:00+01:00"))
+    pool = TibberPricesIntervalPool(home_id="home_123", api=MagicMock(), time_service=time)
+
+    entry_parses, _ = _parses_during(lambda: pool._add_intervals(intervals, "2025-11-22T12:00:00+01:00"))  # noqa: SLF001
+    first_parses, lookups = _parses_during(lambda: _update_cycle(pool, time))
+    steady_parses, _ = _parses_during(lambda: _update_cycle(pool, time))
+
+    assert entry_parses <= len(intervals)
+    assert first_parses <= 2  # only the range bounds, which did not enter the pool
+    assert steady_parses == 0
+
+    cycle_ms = best_of(lambda: _update_cycle(pool, time), repeat=5, number=20)
+    record_benchmark(cycle_ms, label="update cycle", intervals=len(intervals))
+    print(  # noqa: T201 - benchmark report
+        f"\n{len(intervals)} intervals: {entry_parses} parses on pool entry, "
+        f"{first_parses} in the first update cycle, {steady_parses} per cycle afterwards "
+        f"({lookups} interned lookups per cycle); cycle {cycle_ms:.2f} ms"
+    )
@@ -0,0 +1,104 @@
+"""Benchmark description attribute building: nested translation lookups vs. the flattened index."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+import time
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices import const
+from custom_components.tibber_prices.const import (
+    CONF_EXTENDED_DESCRIPTIONS,
+    LOGGER,
+    async_load_standard_translations,
+    async_load_translations,
+)
+from custom_components.tibber_prices.entity_utils import add_description_attributes
+
+
+def _nested_get_translation(path: Sequence[str], language: str = "en") -> Any:
+    """get_translation before the index: walk both caches per call, English fallback each time."""
+
+    def _navigate_dict(d: dict, keys: Sequence[str]) -> Any:
+        current = d
+        for key in keys:
+            if not isinstance(current, dict) or key not in current:
+                return None
+            current = current[key]
+        return current
+
+    def _get_from_cache(cache: dict[str, dict], lang: str) -> Any:
+        if lang in cache:
+            result = _navigate_dict(cache[lang], path)
+            if result is not None:
+                return result
+        if lang != "en" and "en" in cache:
+            result = _navigate_dict(cache["en"], path)
+            if result is not None:
+                return result
+        return None
+
+    result = _get_from_cache(const._STANDARD_TRANSLATIONS_CACHE, language)  # noqa: SLF001
+    if result is not None:
+        return result
+    result = _get_from_cache(const._TRANSLATIONS_CACHE, language)  # noqa: SLF001
+    if result is not None:
+        return result
+    LOGGER.debug("Translation key '%s' not found for language %s", path, language)
+    return None
+
+
+def test_description_attributes(
+    best_of: Callable[..., float], record_benchmark: Callable[..., None], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Description attributes of every sensor and binary sensor, as written on one refresh of all entities."""
+    hass: Any = SimpleNamespace(data={}, config=SimpleNamespace(language="de"))
+
+    async def load() -> None:
+        for language in ("en", "de"):
+            await async_load_translations(hass, language)
+            await async_load_standard_translations(hass, language)
+
+    start = time.perf_counter()
+    asyncio.run(load())
+    load_ms = (time.perf_counter() - start) * 1000
+    index_ms = best_of(lambda: const._build_translation_index("en"), repeat=3, number=1)  # noqa: SLF001
+    index_size = sum(len(index) for index in const._TRANSLATION_INDEX.values())  # noqa: SLF001
+
+    entities = [
+        (platform, key)
+        for platform in ("sensor", "binary_sensor")
+        for key, value in const._TRANSLATIONS_CACHE["en"][platform].items()  # noqa: SLF001
+        if isinstance(value, dict)
+    ]
+    config_entry = cast("Any", Mock(options={CONF_EXTENDED_DESCRIPTIONS: True}, data={}))
+
+    def build_all() -> list[dict]:
+        results = []
+        for platform, key in entities:
+            attributes: dict = {}
+            add_description_attributes(attributes, platform, key, hass, config_entry)
+            results.append(attributes)
+        return results
+
+    indexed = build_all()
+    indexed_ms = best_of(build_all)
+    monkeypatch.setattr(const, "get_translation", _nested_get_translation)
+    nested = build_all()
+    nested_ms = best_of(build_all)
+
+    assert indexed == nested
+    record_benchmark(nested_ms, label="nested lookups", entities=len(entities))
+    record_benchmark(indexed_ms, label="index", entities=len(entities))
+    record_benchmark(load_ms, label="loading en+de")
+    record_benchmark(index_ms, label="indexing", paths=index_size)
+    print(  # noqa: T201 - benchmark report
+        f"\n{len(entities)} entities (de, extended descriptions): nested lookups {nested_ms:.3f} ms, "
+        f"index {indexed_ms:.3f} ms; loading en+de {load_ms:.1f} ms, "
+        f"indexing {index_ms:.1f} ms ({index_size} paths)"
+    )
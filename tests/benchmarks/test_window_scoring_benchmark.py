@@ -0,0 +1,60 @@
+"""Benchmark power-profile window scoring: 12h profile over a 7-day search range."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+
+from custom_components.tibber_prices.services.find_cheapest_schedule import _find_cheapest_window_in_pool
+from custom_components.tibber_prices.utils.price_window import find_cheapest_contiguous_window
+
+SEARCH_RANGE_INTERVALS = 7 * 96
+PROFILE = [2000] * 8 + [300] * 32 + [1200] * 8  # 12h = 48 quarter-hours
+
+
+def _make_range() -> list[dict]:
+    """Create 7 days of quarter-hourly prices with a daily cycle."""
+    base = datetime(2026, 1, 5, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4),
+        }
+        for i in range(SEARCH_RANGE_INTERVALS)
+    ]
+
+
+def _direct_scoring_start(intervals: list[dict], profile: list[int]) -> int:
+    """Select the window start by scoring every position directly (previous algorithm)."""
+    best_start, best_score = -1, None
+    for start in range(len(intervals) - len(profile) + 1):
+        score = sum(intervals[start + k]["total"] * profile[k] for k in range(len(profile)))
+        if best_score is None or score < best_score:
+            best_start, best_score = start, score
+    return best_start
+
+
+def test_power_profile_window_scoring(best_of: Callable[..., float], record_benchmark: Callable[..., None]) -> None:
+    """Engine picks the same window as direct scoring and reports the speedup."""
+    intervals = _make_range()
+    available = [True] * len(intervals)
+    expected_start = _direct_scoring_start(intervals, PROFILE)
+
+    window = find_cheapest_contiguous_window(intervals, len(PROFILE), power_profile=PROFILE)
+    pool_window = _find_cheapest_window_in_pool(intervals, len(PROFILE), available, power_profile=PROFILE)
+
+    assert window is not None
+    assert window["intervals"][0]["startsAt"] == intervals[expected_start]["startsAt"]
+    assert pool_window == (expected_start, expected_start + len(PROFILE))
+
+    direct_ms = best_of(lambda: _direct_scoring_start(intervals, PROFILE))
+    window_ms = best_of(lambda: find_cheapest_contiguous_window(intervals, len(PROFILE), power_profile=PROFILE))
+    pool_ms = best_of(lambda: _find_cheapest_window_in_pool(intervals, len(PROFILE), available, power_profile=PROFILE))
+    record_benchmark(direct_ms, label="direct")
+    record_benchmark(window_ms, label="contiguous window")
+    record_benchmark(pool_ms, label="pool window")
+    print(  # noqa: T201 - benchmark report
+        f"\n12h profile / 7 days: direct {direct_ms:.2f} ms, "
+        f"contiguous window {window_ms:.2f} ms, pool window {pool_ms:.2f} ms"
+    )
@@ -0,0 +1,160 @@
+"""Tests for the joint charge/discharge planner used by plan_arbitrage."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.tibber_prices.services.charging.arbitrage_solver import solve_arbitrage_schedule
+
+
+def _make_intervals(prices: list[float], *, base: datetime = datetime(2026, 1, 1, tzinfo=UTC)) -> list[dict[str, Any]]:
+    """Create consecutive quarter-hour intervals."""
+    return [
+        {"startsAt": (base + timedelta(minutes=15 * i)).isoformat(), "total": price, "level": "NORMAL"}
+        for i, price in enumerate(prices)
+    ]
+
+
+def _solve(prices: list[float], *, intervals: list[dict[str, Any]] | None = None, **kwargs: Any) -> dict[str, Any]:
+    """Solve with a 1 kWh/interval battery of 2 kWh that starts empty, unless overridden."""
+    params: dict[str, Any] = {
+        "current_soc_kwh": 0.0,
+        "min_soc_kwh": 0.0,
+        "max_soc_kwh": 2.0,
+        "max_charge_power_w": 4000,
+        "max_discharge_power_w": 4000,
+        "charging_efficiency": 1.0,
+        "discharging_efficiency": 1.0,
+        **kwargs,
+    }
+    plan = solve_arbitrage_schedule(intervals or _make_intervals(prices), **params)
+    assert plan is not None
+    return plan
+
+
+def _actions(plan: dict[str, Any]) -> list[tuple[float, str]]:
+    return [(interval["total"], interval["action"]) for interval in plan["intervals"]]
+
+
+class TestArbitragePlan:
+    """Charge and discharge intervals are chosen jointly."""
+
+    def test_charges_cheap_and_discharges_expensive(self) -> None:
+        """The full capacity is cycled once and the plan ends where it started."""
+        plan = _solve([0.10, 0.10, 0.50, 0.50])
+
+        assert _actions(plan) == [(0.10, "charge"), (0.10, "charge"), (0.50, "discharge"), (0.50, "discharge")]
+        assert plan["profit"] == pytest.approx(0.8)
+        assert plan["final_soc_kwh"] == pytest.approx(0.0)
+        assert plan["final_soc_met"] is True
+        assert [segment["action"] for segment in plan["segments"]] == ["charge", "discharge"]
+
+    def test_losses_make_small_spreads_unprofitable(self) -> None:
+        """A 5% spread does not cover 19% round-trip losses."""
+        plan = _solve([0.20, 0.21], charging_efficiency=0.9, discharging_efficiency=0.9)
+
+        assert plan["intervals"] == []
+        assert plan["profit"] == 0.0
+
+    def test_discharges_existing_energy_down_to_final_soc(self) -> None:
+        """Energy above the final SoC is sold in the most expensive interval."""
+        plan = _solve([0.30, 0.60, 0.40], current_soc_kwh=2.0, min_final_soc_kwh=1.0)
+
+        assert _actions(plan) == [(0.60, "discharge")]
+        assert plan["discharge_value"] == pytest.approx(0.6)
+        assert plan["final_soc_kwh"] == pytest.approx(1.0)
+
+    def test_respects_min_soc(self) -> None:
+        """Discharging stops at the minimum SoC."""
+        plan = _solve([0.60, 0.60], current_soc_kwh=2.0, min_soc_kwh=1.0, min_final_soc_kwh=1.0)
+
+        assert plan["discharged_energy_kwh"] == pytest.approx(1.0)
+
+
+class TestCycleLimit:
+    """max_cycles_per_day limits charging runs per calendar day."""
+
+    def test_unlimited_cycles_use_both_spreads(self) -> None:
+        """Without a limit the battery charges twice."""
+        plan = _solve([0.10, 0.50, 0.10, 0.50], max_soc_kwh=1.0)
+
+        assert plan["profit"] == pytest.approx(0.8)
+
+    def test_one_cycle_per_day(self) -> None:
+        """With one cycle only one charge run is planned."""
+        plan = _solve([0.10, 0.50, 0.10, 0.50], max_soc_kwh=1.0, max_cycles_per_day=1)
+
+        assert plan["profit"] == pytest.approx(0.4)
+        assert sum(1 for segment in plan["segments"] if segment["action"] == "charge") == 1
+
+    def test_cycle_count_restarts_at_midnight(self) -> None:
+        """A run before and a run after midnight are one cycle each on their own day."""
+        intervals = _make_intervals([0.10, 0.50, 0.10, 0.50], base=datetime(2026, 1, 1, 23, 30, tzinfo=UTC))
+        plan = _solve([], intervals=intervals, max_soc_kwh=1.0, max_cycles_per_day=1)
+
+        assert plan["profit"] == pytest.approx(0.8)
+
+
+class TestFinalSoc:
+    """The plan has to end at the final SoC when it can."""
+
+    def test_buys_energy_to_reach_final_soc(self) -> None:
+        """Reaching the final SoC is required even if it costs money."""
+        plan = _solve([0.50, 0.10], min_final_soc_kwh=1.0)
+
+        assert _actions(plan) == [(0.10, "charge")]
+        assert plan["profit"] == pytest.approx(-0.1)
+        assert plan["final_soc_met"] is True
+
+    def test_unreachable_final_soc_ends_as_high_as_possible(self) -> None:
+        """One interval of charging cannot fill the battery."""
+        plan = _solve([0.10], min_final_soc_kwh=2.0)
+
+        assert plan["final_soc_kwh"] == pytest.approx(1.0)
+        assert plan["final_soc_met"] is False
+
+    def test_final_soc_above_max_soc_is_not_met(self) -> None:
+        """A full battery below the requested final SoC does not count as met."""
+        plan = _solve([0.10, 0.10, 0.10], min_final_soc_kwh=3.0)
+
+        assert plan["final_soc_kwh"] == pytest.approx(2.0)
+        assert plan["final_soc_met"] is False
+
+
+def test_segments_are_ordered_across_dst_change() -> None:
+    """Segments sort by instant, not by their ISO strings with different UTC offsets."""
+    berlin = ZoneInfo("Europe/Berlin")
+    # 00:00Z-01:15Z on the fall-back day: 02:00+02:00 ... 02:45+02:00, 02:00+01:00, 02:15+01:00
+    intervals = [
+        {**interval, "startsAt": datetime.fromisoformat(interval["startsAt"]).astimezone(berlin).isoformat()}
+        for interval in _make_intervals(
+            [0.30, 0.31, 0.32, 0.50, 0.10, 0.29], base=datetime(2026, 10, 25, 0, 0, tzinfo=UTC)
+        )
+    ]
+    plan = _solve([], intervals=intervals, current_soc_kwh=1.0, max_soc_kwh=1.0, min_final_soc_kwh=1.0)
+
+    assert [(segment["action"], segment["start"]) for segment in plan["segments"]] == [
+        ("discharge", "2026-10-25T02:45:00+02:00"),
+        ("charge", "2026-10-25T02:00:00+01:00"),
+    ]
+
+
+def test_returns_none_when_time_budget_is_exhausted() -> None:
+    """The caller reports time_budget_exceeded instead of blocking the event loop."""
+    plan = solve_arbitrage_schedule(
+        _make_intervals([0.10, 0.50]),
+        current_soc_kwh=0.0,
+        min_soc_kwh=0.0,
+        max_soc_kwh=2.0,
+        max_charge_power_w=4000,
+        max_discharge_power_w=4000,
+        charging_efficiency=1.0,
+        discharging_efficiency=1.0,
+        time_budget=-1.0,
+    )
+
+    assert plan is None
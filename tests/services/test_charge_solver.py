@@ -0,0 +1,174 @@
+"""Tests for the joint charge planning solver used by plan_charging."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import math
+from typing import Any
+
+from custom_components.tibber_prices.services.charging.charge_solver import schedule_cost, solve_charge_schedule
+from custom_components.tibber_prices.services.charging.power_scheduler import (
+    apply_segment_constraints,
+    build_power_schedule,
+)
+from custom_components.tibber_prices.utils.price_window import group_intervals_into_segments
+
+
+def _make_intervals(prices: list[float], *, skip: set[int] | None = None) -> list[dict[str, Any]]:
+    """Create quarter-hour intervals; indices in `skip` are left out (time gaps)."""
+    base = datetime(2026, 1, 1, 0, 0, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": price,
+            "level": "NORMAL",
+        }
+        for i, price in enumerate(prices)
+        if i not in (skip or set())
+    ]
+
+
+def _prices(schedule: dict[str, Any]) -> list[float]:
+    return [interval["total"] for interval in schedule["intervals"]]
+
+
+class TestSegmentConstraints:
+    """Minimum duration and cycle limit are planned, not repaired."""
+
+    def test_min_duration_prefers_cheap_block_over_extending_cheap_interval(self) -> None:
+        """Greedy extends a lone cheap interval into expensive neighbours; the solver picks the cheap block."""
+        candidates = _make_intervals([0.05, 0.90, 0.90, 0.90, 0.30, 0.30, 0.30, 0.90])
+
+        greedy = build_power_schedule(candidates, 2.0, max_charge_power_w=4000, charging_efficiency=1.0)
+        greedy, _warnings = apply_segment_constraints(
+            greedy, candidates, charging_efficiency=1.0, min_charge_duration_minutes=45, target_grid_energy_kwh=2.0
+        )
+        solved = solve_charge_schedule(
+            candidates, 2.0, max_charge_power_w=4000, charging_efficiency=1.0, min_charge_duration_minutes=45
+        )
+
+        assert solved is not None
+        assert _prices(solved) == [0.30, 0.30, 0.30]
+        assert schedule_cost(solved) < schedule_cost(greedy)
+        assert solved["constraint_warnings"] == []
+
+    def test_max_cycles_counts_time_gaps_as_segment_breaks(self) -> None:
+        """A missing interval splits a block, so one cycle must use a gap-free run."""
+        candidates = _make_intervals([0.10, 0.10, 0.90, 0.10, 0.10, 0.40, 0.40, 0.40], skip={2})
+
+        solved = solve_charge_schedule(
+            candidates, 3.0, max_charge_power_w=4000, charging_efficiency=1.0, max_cycles_per_day=1
+        )
+
+        assert solved is not None
+        assert len(solved["segments"]) == 1
+        assert _prices(solved) == [0.10, 0.10, 0.40]
+
+    def test_returns_none_when_constraints_cannot_be_met(self) -> None:
+        """No contiguous run is long enough for the minimum duration."""
+        candidates = _make_intervals([0.10, 0.20, 0.10, 0.20], skip={1, 3})
+
+        assert (
+            solve_charge_schedule(
+                candidates, 1.0, max_charge_power_w=4000, charging_efficiency=1.0, min_charge_duration_minutes=30
+            )
+            is None
+        )
+
+
+class TestDeadlineAndPower:
+    """Deadline energy and power levels are part of the same plan."""
+
+    def test_block_across_deadline_covers_deadline_energy(self) -> None:
+        """One block starting before the deadline beats a separate pre-deadline block."""
+        candidates = _make_intervals([0.50, 0.60, 0.90, 0.10, 0.10, 0.10])
+
+        solved = solve_charge_schedule(
+            candidates,
+            3.0,
+            max_charge_power_w=4000,
+            charging_efficiency=1.0,
+            min_charge_duration_minutes=30,
+            deadline=datetime(2026, 1, 1, 0, 45, tzinfo=UTC),
+            energy_needed_by_deadline_grid_kwh=1.0,
+        )
+
+        assert solved is not None
+        # [0.50, 0.60] + [0.10, 0.10] would cost 1.3; the block across the deadline costs 1.1
+        assert _prices(solved) == [0.90, 0.10, 0.10]
+        assert len(group_intervals_into_segments(solved["intervals"])) == 1
+
+    def test_stepped_mode_uses_allowed_steps_only(self) -> None:
+        """Every interval runs at one of the configured steps and the target is reached."""
+        candidates = _make_intervals([0.20, 0.10, 0.15, 0.30])
+
+        solved = solve_charge_schedule(
+            candidates,
+            1.3,
+            max_charge_power_w=3700,
+            charge_power_steps_w=[1400, 2300, 3700],
+            charging_efficiency=1.0,
+            min_charge_duration_minutes=30,
+        )
+
+        assert solved is not None
+        assert [(interval["total"], interval["power_w"]) for interval in solved["intervals"]] == [
+            (0.10, 3700),
+            (0.15, 2300),
+        ]
+        assert solved["total_grid_energy_kwh"] >= 1.3
+
+    def test_continuous_mode_assigns_exact_power(self) -> None:
+        """The partial interval is the most expensive one of the block, at exactly the missing power."""
+        candidates = _make_intervals([0.20, 0.10, 0.15])
+
+        solved = solve_charge_schedule(
+            candidates,
+            2.5,
+            max_charge_power_w=4000,
+            min_charge_power_w=1000,
+            charging_efficiency=1.0,
+            max_cycles_per_day=1,
+        )
+
+        assert solved is not None
+        assert [interval["power_w"] for interval in solved["intervals"]] == [2000, 4000, 4000]
+        assert solved["total_grid_energy_kwh"] == 2.5
+
+    def test_week_long_stepped_plan_uses_coarse_buckets(self) -> None:
+        """A 7-day range shrinks the energy buckets; the plan still meets every constraint."""
+        candidates = _make_intervals([0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) for i in range(7 * 96)])
+
+        solved = solve_charge_schedule(
+            candidates,
+            10.0,
+            max_charge_power_w=3700,
+            charge_power_steps_w=[1400, 2300, 3700],
+            charging_efficiency=1.0,
+            min_charge_duration_minutes=60,
+            max_cycles_per_day=2,
+            time_budget=5.0,
+        )
+
+        assert solved is not None
+        segments = group_intervals_into_segments(solved["intervals"])
+        assert solved["total_grid_energy_kwh"] >= 10.0
+        assert len(segments) <= 2
+        assert all(segment["duration_minutes"] >= 60 for segment in segments)
+        assert {interval["power_w"] for interval in solved["intervals"]} <= {1400, 2300, 3700}
+
+    def test_time_budget_exceeded_returns_none(self) -> None:
+        """An exhausted budget gives up so the caller keeps the greedy plan."""
+        candidates = _make_intervals([0.20, 0.10, 0.15])
+
+        assert (
+            solve_charge_schedule(
+                candidates,
+                1.0,
+                max_charge_power_w=4000,
+                charging_efficiency=1.0,
+                max_cycles_per_day=1,
+                time_budget=-1.0,
+            )
+            is None
+        )
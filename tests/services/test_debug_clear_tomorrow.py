@@ -0,0 +1,31 @@
+"""Tests for the debug_clear_tomorrow service helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from custom_components.tibber_prices.coordinator import TibberPricesDataUpdateCoordinator
+
+from custom_components.tibber_prices.services.debug_clear_tomorrow import _clear_intervals_from_coordinator
+
+
+def test_cleared_intervals_replace_coordinator_data() -> None:
+    """coordinator.data is replaced, so identity-based staleness checks see the change."""
+    today = datetime.fromisoformat("2025-11-22T00:00:00+01:00")
+    tomorrow = today + timedelta(days=1)
+    price_info = [{"startsAt": today + timedelta(hours=hours), "total": 0.2} for hours in range(48)]
+    data: dict[str, Any] = {"priceInfo": price_info, "currency": "EUR"}
+    coordinator = SimpleNamespace(data=data)
+
+    removed = _clear_intervals_from_coordinator(
+        cast("TibberPricesDataUpdateCoordinator", coordinator), tomorrow, tomorrow + timedelta(days=1)
+    )
+
+    assert removed == 24
+    assert coordinator.data is not data
+    assert data["priceInfo"] is price_info
+    assert len(coordinator.data["priceInfo"]) == 24
+    assert coordinator.data["currency"] == "EUR"
@@ -0,0 +1,187 @@
+"""Tests for the debug_profile service."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import threading
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import Mock
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+import voluptuous as vol
+
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.services.debug_profile import DEBUG_PROFILE_SERVICE_SCHEMA, handle_debug_profile
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings
+from homeassistant.exceptions import Unauthorized
+
+_REFERENCE_TIME = datetime.fromisoformat("2025-11-22T12:00:00+01:00")
+
+
+def _price_info() -> list[dict[str, Any]]:
+    """One day of quarter-hourly prices (today)."""
+    start = datetime.fromisoformat("2025-11-22T00:00:00+01:00")
+    return [
+        {
+            "startsAt": start + timedelta(minutes=15 * index),
+            "total": 0.2 + (index % 96) / 1000,
+            "energy": 0.16,
+            "tax": 0.04,
+            "level": "NORMAL",
+        }
+        for index in range(96)
+    ]
+
+
+class _FakeCoordinator:
+    """Coordinator stand-in with the attributes the profiler reads, counting ticks."""
+
+    def __init__(self, data: dict[str, Any] | None) -> None:
+        self.data = data
+        self.config_entry = Mock(options={})
+        self.time = TibberPricesTimeService(reference_time=_REFERENCE_TIME)
+        self.ticks = 0
+        self.invalidated: list[str] = []
+        self._log_prefix = "[test]"
+        self._tick_context: object | None = None
+        self._listener_manager = SimpleNamespace(
+            stage_timings=TibberPricesStageTimings(),
+            last_tick_writes=None,
+            entities_evaluated_total=0,
+            entities_written_total=0,
+        )
+        # The coordinator's own transformer and calculator must not be touched
+        self._data_transformer = SimpleNamespace(invalidate_config_cache=lambda: self.invalidated.append("transformer"))
+        self._period_calculator = SimpleNamespace(invalidate_config_cache=lambda: self.invalidated.append("periods"))
+
+    def get_config_override(self, _config_key: str, _config_section: str) -> Any | None:
+        return None
+
+    def get_active_overrides(self) -> dict[str, dict[str, Any]]:
+        return {}
+
+    def _apply_tomorrow_realism(self, raw_data: dict[str, Any]) -> dict[str, Any]:
+        return raw_data
+
+    def _create_time_service(self) -> TibberPricesTimeService:
+        return TibberPricesTimeService(reference_time=_REFERENCE_TIME)
+
+    def _async_update_time_sensitive_listeners(self, time_service: TibberPricesTimeService) -> None:
+        # Like a real tick: entities switch coordinator.time, the tick replaces the context
+        self.ticks += 1
+        self.time = time_service
+        self._tick_context = object()
+        self._listener_manager.entities_evaluated_total += 1
+        with self._listener_manager.stage_timings.measure("quarter_hour_fanout"):
+            pass
+
+    def _async_update_minute_listeners(self, _time_service: TibberPricesTimeService) -> None:
+        pass
+
+
+def _call(coordinator: _FakeCoordinator, *, is_admin: bool = True, **data: Any) -> ServiceCall:
+    entry = SimpleNamespace(entry_id="entry_1", runtime_data=SimpleNamespace(coordinator=coordinator))
+
+    async def async_get_user(_user_id: str) -> SimpleNamespace:
+        return SimpleNamespace(is_admin=is_admin)
+
+    async def async_add_executor_job(func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    hass = SimpleNamespace(
+        auth=SimpleNamespace(async_get_user=async_get_user),
+        async_add_executor_job=async_add_executor_job,
+        config_entries=SimpleNamespace(async_entries=lambda _domain: [entry]),
+    )
+    return cast(
+        "ServiceCall",
+        SimpleNamespace(hass=hass, data=DEBUG_PROFILE_SERVICE_SCHEMA(data), context=SimpleNamespace(user_id="user_1")),
+    )
+
+
+@pytest.mark.asyncio
+async def test_profile_reports_functions_and_allocations() -> None:
+    """The requested cycles and ticks run, and the response names their functions and allocation sites."""
+    coordinator = _FakeCoordinator({"priceInfo": _price_info(), "currency": "EUR"})
+
+    response = cast("dict[str, Any]", await handle_debug_profile(_call(coordinator, cycles=2, ticks=4, top=100)))
+
+    assert response["success"] is True
+    assert coordinator.ticks == 4
+    transform = next(entry for entry in response["top_functions"] if "(transform_data)" in entry["function"])
+    assert transform["calls"] == 2
+    assert transform["cumulative_ms"] >= transform["own_ms"] >= 0
+    assert any("coordinator/" in site["site"] for site in response["memory"]["top_allocations"])
+    assert response["memory"]["peak_kib"] >= response["memory"]["retained_kib"]
+
+
+@pytest.mark.asyncio
+async def test_profile_leaves_coordinator_state_alone() -> None:
+    """Caches, data, TimeService, tick context and tick statistics of the coordinator are unchanged."""
+    data = {"priceInfo": _price_info(), "currency": "EUR"}
+    coordinator = _FakeCoordinator(data)
+    time_service = coordinator.time
+    listener_manager = coordinator._listener_manager  # noqa: SLF001 - fake coordinator internals
+    timings = listener_manager.stage_timings
+
+    await handle_debug_profile(_call(coordinator, cycles=1, ticks=2))
+
+    assert coordinator.invalidated == []
+    assert coordinator.data is data
+    assert coordinator.time is time_service
+    assert coordinator._tick_context is None  # noqa: SLF001 - fake coordinator internals
+    assert listener_manager.stage_timings is timings
+    assert timings.stats == {}
+    assert listener_manager.entities_evaluated_total == 0
+
+
+@pytest.mark.asyncio
+async def test_cycles_run_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The transformations run in an executor thread; only the ticks run on the event loop."""
+    coordinator = _FakeCoordinator({"priceInfo": _price_info(), "currency": "EUR"})
+    transform_data = TibberPricesDataTransformer.transform_data
+    threads: list[int] = []
+
+    def recording_transform_data(self: TibberPricesDataTransformer, raw_data: dict[str, Any]) -> dict[str, Any]:
+        threads.append(threading.get_ident())
+        return transform_data(self, raw_data)
+
+    monkeypatch.setattr(TibberPricesDataTransformer, "transform_data", recording_transform_data)
+
+    await handle_debug_profile(_call(coordinator, cycles=2, ticks=1))
+
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+    assert coordinator.ticks == 1
+
+
+def test_ticks_are_capped() -> None:
+    """Ticks block the event loop, so a call is limited to 100 of them."""
+    assert DEBUG_PROFILE_SERVICE_SCHEMA({"ticks": 100})["ticks"] == 100
+    with pytest.raises(vol.Invalid):
+        DEBUG_PROFILE_SERVICE_SCHEMA({"ticks": 101})
+
+
+@pytest.mark.asyncio
+async def test_non_admin_is_rejected() -> None:
+    """Only admin users may run the profiler."""
+    coordinator = _FakeCoordinator({"priceInfo": [{}]})
+
+    with pytest.raises(Unauthorized):
+        await handle_debug_profile(_call(coordinator, is_admin=False))
+
+    assert coordinator.ticks == 0
+
+
+@pytest.mark.asyncio
+async def test_without_price_data() -> None:
+    """An entry without price data returns an error instead of profiling nothing."""
+    response = cast("dict[str, Any]", await handle_debug_profile(_call(_FakeCoordinator(None))))
+
+    assert response == {"success": False, "error": "No price data loaded yet"}
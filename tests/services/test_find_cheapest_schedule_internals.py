@@ -74,3 +74,27 @@ class TestFindCheapestWindowInPoolTemporalGap:
 
         # Only (30, 45) is a valid contiguous available pair.
         assert result == (2, 4)
+
+
+class TestFindCheapestWindowInPoolPowerProfile:
+    """Power-profile scoring across contiguous runs of the pool."""
+
+    def test_profile_weights_pick_window_matching_load_shape(self) -> None:
+        """The heavy first slot of the profile lands on the cheapest interval."""
+        # Plain sums tie for every start, the profile decides.
+        pool = _build_pool([(0, 3.0), (15, 1.0), (30, 3.0), (45, 1.0), (60, 3.0)])
+        available = [True] * len(pool)
+
+        result = _find_cheapest_window_in_pool(pool, 2, available, power_profile=[2000, 100])
+
+        assert result == (1, 3)
+
+    def test_profile_window_never_spans_gap(self) -> None:
+        """Runs split at time gaps are scored independently."""
+        # Minutes: 0, 15, [gap], 45, 60 — only (0, 15) and (45, 60) are valid pairs.
+        pool = _build_pool([(0, 5.0), (15, 5.0), (45, 2.0), (60, 1.0)])
+        available = [True] * len(pool)
+
+        result = _find_cheapest_window_in_pool(pool, 2, available, power_profile=[100, 2000])
+
+        assert result == (2, 4)
@@ -20,6 +20,7 @@ from custom_components.tibber_prices.services import (
 from custom_components.tibber_prices.services.find_cheapest_block import (
     _determine_no_window_reason,
     handle_find_cheapest_block,
+    handle_find_cheapest_block_batch,
 )
 from custom_components.tibber_prices.services.find_cheapest_hours import (
     _determine_no_intervals_reason,
@@ -550,3 +551,40 @@ async def test_hours_handler_preserves_service_search_data(monkeypatch: pytest.M
     assert response["search_start"] == fixed_start.isoformat()
     assert response["search_end"] == deadline.isoformat()
     assert response["must_finish_by"] == deadline.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_block_batch_handler_matches_single_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Each device of a batch call gets the same window as its own find_cheapest_block call."""
+    intervals = _make_intervals([30.0, 10.0, 12.0, 40.0, 11.0, 9.0, 35.0, 20.0])
+    fake_target = _build_fake_entry_and_coordinator(intervals)
+
+    monkeypatch.setattr(block_module, "resolve_service_target", lambda _hass, _entry_id, _view="": fake_target)
+    monkeypatch.setattr(block_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        block_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 2, 0, tzinfo=UTC),
+        ),
+    )
+
+    devices = [
+        {"name": "dishwasher", "duration": timedelta(minutes=30), "smooth_outliers": False},
+        {"name": "dryer", "duration": timedelta(minutes=45), "power_profile": [2000, 1000, 500]},
+    ]
+    call = SimpleNamespace(hass=object(), data={"devices": devices, "use_base_unit": True})
+    response = cast("dict[str, Any]", await handle_find_cheapest_block_batch(cast("ServiceCall", call)))
+
+    assert response["success"] is True
+    assert response["device_count"] == 2
+    assert response["devices_found"] == 2
+    for device, result in zip(devices, response["devices"], strict=True):
+        single_data = {key: value for key, value in device.items() if key != "name"}
+        single_call = SimpleNamespace(hass=object(), data={**single_data, "use_base_unit": True})
+        single = cast("dict[str, Any]", await handle_find_cheapest_block(cast("ServiceCall", single_call)))
+        assert result["name"] == device["name"]
+        assert result["window"] == single["window"]
+        assert result["price_comparison"] == single["price_comparison"]
+    assert response["devices"][0]["window"]["start"] == intervals[4]["startsAt"]
@@ -0,0 +1,155 @@
+"""
+Regression test for the get_chartdata export against stored output.
+
+Every valid combination of insert_nulls, connect_segments (only allowed with
+insert_nulls="segments"), resolution and output_format, with cheap and
+expensive level filters and with low and high rating filters, runs on fixed
+prices and must return exactly the output stored in get_chartdata_golden.json.
+The stored output was recorded with the export
+before the single-pass point pipeline, so the test pins the behaviour that
+rewrite had to keep.
+
+After an intended output change, regenerate the file with:
+
+    TIBBER_PRICES_UPDATE_GOLDEN=1 pytest tests/services/test_get_chartdata_golden.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import itertools
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices.services import get_chartdata as chartdata_module
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+GOLDEN_PATH = Path(__file__).parent / "get_chartdata_golden.json"
+UPDATE_ENV_VAR = "TIBBER_PRICES_UPDATE_GOLDEN"
+
+_REFERENCE_TIME = datetime.fromisoformat("2025-11-22T12:00:00+01:00")
+_LEVELS = ("VERY_CHEAP", "CHEAP", "NORMAL", "EXPENSIVE", "VERY_EXPENSIVE")
+_RATINGS = ("LOW", "NORMAL", "HIGH")
+
+# Cheap and low segments are entered from more expensive prices, expensive and high
+# ones from cheaper prices, so both kinds of connect_segments bridges occur
+_FILTERS = {
+    "cheap": {"level_filter": ["VERY_CHEAP", "CHEAP"]},
+    "expensive": {"level_filter": ["EXPENSIVE", "VERY_EXPENSIVE"]},
+    "low": {"rating_level_filter": ["LOW"]},
+    "high": {"rating_level_filter": ["HIGH"]},
+}
+# Difference to the trailing average per rating, for the hourly rating aggregation
+_DIFFERENCES = {"LOW": -15.0, "NORMAL": 0.0, "HIGH": 15.0}
+_CASES = [
+    {
+        "filter": filter_name,
+        "insert_nulls": insert_nulls,
+        "connect_segments": connect_segments,
+        "resolution": resolution,
+        "output_format": output_format,
+    }
+    for filter_name, (insert_nulls, connect_segments), resolution, output_format in itertools.product(
+        _FILTERS,
+        (("none", False), ("segments", False), ("segments", True), ("all", False)),
+        ("interval", "hourly"),
+        ("array_of_objects", "array_of_arrays"),
+    )
+]
+
+
+def _case_id(case: dict[str, Any]) -> str:
+    return "-".join(str(value) for value in case.values())
+
+
+def _intervals() -> list[dict[str, Any]]:
+    """
+    Yesterday evening, today 06:00-12:00 and tomorrow morning, quarter-hourly.
+
+    Levels change every one or two intervals, so segments start and end inside
+    an hour. Ratings come in blocks of six, so the hourly ratings still vary.
+    One interval has no price.
+    """
+    intervals = []
+    for day_offset, first_hour, hours in ((-1, 20, 2), (0, 6, 6), (1, 0, 2)):
+        day_start = _REFERENCE_TIME.replace(hour=first_hour) + timedelta(days=day_offset)
+        for quarter in range(hours * 4):
+            index = len(intervals)
+            level = _LEVELS[(index * 7 // 5) % len(_LEVELS)]
+            total = round(0.12 + 0.04 * _LEVELS.index(level) + (index * 37 % 11) / 1000, 4)
+            rating_level = _RATINGS[(index // 6) % len(_RATINGS)]
+            intervals.append(
+                {
+                    "startsAt": day_start + timedelta(minutes=15 * quarter),
+                    "total": None if index == 17 else total,
+                    "energy": round(total * 0.8, 4),
+                    "tax": round(total * 0.2, 4),
+                    "level": level,
+                    "rating_level": rating_level,
+                    "difference": _DIFFERENCES[rating_level] + index % 3,
+                }
+            )
+    return intervals
+
+
+def _export(monkeypatch: pytest.MonkeyPatch, case: dict[str, Any]) -> dict[str, Any]:
+    """Run get_chartdata for one case on the fixed prices."""
+    coordinator = SimpleNamespace(
+        data={"priceInfo": _intervals(), "currency": "EUR", "referenceTime": _REFERENCE_TIME},
+        config_entry=Mock(options={}),
+    )
+    monkeypatch.setattr(
+        chartdata_module,
+        "resolve_service_target",
+        lambda _hass, _entry_id, _view="": SimpleNamespace(coordinator=coordinator),
+    )
+    params: dict[str, Any] = {
+        "day": ["yesterday", "today", "tomorrow"],
+        "include_level": True,
+        "include_rating_level": True,
+        "include_average": True,
+        "insert_nulls": case["insert_nulls"],
+        "connect_segments": case["connect_segments"],
+        "resolution": case["resolution"],
+        "output_format": case["output_format"],
+        **_FILTERS[case["filter"]],
+    }
+    if case["output_format"] == "array_of_arrays":
+        params["array_fields"] = "{start_time}, {price_per_kwh}, {level}, {rating_level}, {average}"
+    call = cast("ServiceCall", SimpleNamespace(hass=None, data=chartdata_module.CHARTDATA_SERVICE_SCHEMA(params)))
+    return asyncio.run(chartdata_module.handle_chartdata(call))
+
+
+def _load_golden() -> dict[str, Any]:
+    return json.loads(GOLDEN_PATH.read_text(encoding="utf-8")) if GOLDEN_PATH.exists() else {}
+
+
+def _write_golden(golden: dict[str, Any]) -> None:
+    """Write one case per line, so a changed case shows up as one changed line."""
+    lines = [
+        f"  {json.dumps(key)}: {json.dumps(value, separators=(',', ':'))}" for key, value in sorted(golden.items())
+    ]
+    GOLDEN_PATH.write_text("{\n" + ",\n".join(lines) + "\n}\n", encoding="utf-8")
+
+
+@pytest.mark.parametrize("case", _CASES, ids=_case_id)
+def test_export_matches_stored_output(monkeypatch: pytest.MonkeyPatch, case: dict[str, Any]) -> None:
+    """The export returns exactly the stored output for every parameter combination."""
+    # Round trip through JSON: datetimes become strings, tuples lists, as in the stored file
+    actual = json.loads(json.dumps(_export(monkeypatch, case), default=str))
+
+    if os.environ.get(UPDATE_ENV_VAR):
+        golden = _load_golden()
+        golden[_case_id(case)] = actual
+        _write_golden(golden)
+
+    assert actual == _load_golden()[_case_id(case)]
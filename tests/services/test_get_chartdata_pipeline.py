@@ -0,0 +1,47 @@
+"""Tests for the get_chartdata point pipeline (collection into objects/rows, trailing NULLs)."""
+
+from __future__ import annotations
+
+from custom_components.tibber_prices.services.get_chartdata import (
+    _ABSENT,
+    _collect_objects,
+    _collect_rows,
+    _drop_trailing_nulls,
+    _null_point,
+)
+
+_FIELD_NAMES = ("start_time", "price_per_kwh", "level", "rating_level", "average", "energy", "tax")
+
+
+def _point(start: str, price: float | None, level: object = _ABSENT) -> tuple[object, ...]:
+    """Build a point tuple with an optional level."""
+    return (start, price, level, _ABSENT, _ABSENT, _ABSENT, _ABSENT)
+
+
+def test_drop_trailing_nulls_keeps_internal_gaps() -> None:
+    """NULLs between prices stay, NULLs at the end are dropped."""
+    points = [
+        _point("00:00", 1.0),
+        _null_point("00:15"),
+        _point("00:30", 2.0),
+        _null_point("00:45"),
+        _null_point("01:00"),
+    ]
+
+    assert [point[0] for point in _drop_trailing_nulls(points)] == ["00:00", "00:15", "00:30"]
+
+
+def test_rows_match_objects() -> None:
+    """array_of_arrays rows hold the same values as the objects; absent fields become None."""
+    points = [_point("00:00", 1.0, "CHEAP"), _null_point("00:15")]
+
+    objects, starts, prices = _collect_objects(points, _FIELD_NAMES)
+    rows, row_starts, row_prices = _collect_rows(points, _FIELD_NAMES, ["start_time", "level", "price_per_kwh", "tax"])
+
+    assert objects == [
+        {"start_time": "00:00", "price_per_kwh": 1.0, "level": "CHEAP"},
+        {"start_time": "00:15", "price_per_kwh": None},
+    ]
+    assert rows == [["00:00", "CHEAP", 1.0, None], ["00:15", None, None, None]]
+    assert starts == row_starts == ["00:00", "00:15"]
+    assert prices == row_prices == [1.0, None]
@@ -0,0 +1,149 @@
+"""Tests for the plan_arbitrage service handler."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+
+from custom_components.tibber_prices.services import plan_arbitrage as arbitrage_module
+from custom_components.tibber_prices.services.helpers import ServiceTarget
+from custom_components.tibber_prices.services.plan_arbitrage import handle_plan_arbitrage
+from homeassistant.exceptions import ServiceValidationError
+
+
+class _FakePool:
+    """Minimal async interval pool for plan_arbitrage tests."""
+
+    def __init__(self, intervals: list[dict[str, Any]]) -> None:
+        self._intervals = intervals
+
+    async def get_intervals(self, **_kwargs: object) -> tuple[list[dict[str, Any]], bool]:
+        return self._intervals, False
+
+
+def _make_intervals(prices: list[float]) -> list[dict[str, Any]]:
+    """Create quarter-hour intervals for tests."""
+    base = datetime(2026, 1, 1, 0, 0, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * index)).isoformat(),
+            "total": price,
+            "level": "NORMAL",
+        }
+        for index, price in enumerate(prices)
+    ]
+
+
+def _patch_target(monkeypatch: pytest.MonkeyPatch, intervals: list[dict[str, Any]]) -> None:
+    """Route the handler to a minimal live ServiceTarget with the given prices."""
+    pool = _FakePool(intervals)
+    entry = SimpleNamespace(
+        data={"home_id": "home_1", "currency": "EUR"},
+        runtime_data=SimpleNamespace(interval_pool=pool),
+    )
+    coordinator = SimpleNamespace(
+        api=object(),
+        _cached_user_data={"viewer": {"homes": [{"id": "home_1", "timeZone": "UTC"}]}},
+        time=SimpleNamespace(now=lambda: datetime(2026, 1, 1, 0, 0, tzinfo=UTC)),
+        headless=False,
+    )
+    target = ServiceTarget(
+        entry=entry,
+        subentry=None,
+        coordinator=coordinator,
+        interval_pool=pool,
+        data={"priceInfo": intervals, "pricePeriods": {}},
+    )
+
+    monkeypatch.setattr(arbitrage_module, "resolve_service_target", lambda _hass, _entry_id, _view="": target)
+    monkeypatch.setattr(arbitrage_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        arbitrage_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 2, 0, tzinfo=UTC),
+        ),
+    )
+    monkeypatch.setattr(arbitrage_module, "get_display_unit_factor", lambda _entry: 100)
+    monkeypatch.setattr(arbitrage_module, "get_display_unit_string", lambda _entry, _currency: "ct/kWh")
+
+
+@pytest.mark.asyncio
+async def test_plan_arbitrage_returns_charge_and_discharge_segments(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Service should charge in the cheap block, discharge in the expensive block and report the profit."""
+    _patch_target(monkeypatch, _make_intervals([0.30, 0.10, 0.10, 0.40, 0.50, 0.50, 0.20]))
+
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "battery_capacity_kwh": 2.0,
+            "current_soc_percent": 0.0,
+            "max_charge_power_w": 4000,
+            "charging_efficiency": 1.0,
+            "discharging_efficiency": 1.0,
+        },
+    )
+
+    response = cast("dict[str, Any]", await handle_plan_arbitrage(cast("ServiceCall", call)))
+
+    assert response["intervals_found"] is True
+    assert response["price_unit"] == "ct/kWh"
+    assert response["battery"]["final_soc_met"] is True
+    arbitrage = response["arbitrage"]
+    assert arbitrage["charged_energy_kwh"] == 2.0
+    assert arbitrage["discharged_energy_kwh"] == 2.0
+    assert arbitrage["profit"] == 80.0
+
+    segments = cast("list[dict[str, Any]]", arbitrage["schedule"]["segments"])
+    assert [segment["action"] for segment in segments] == ["charge", "discharge"]
+    assert [iv["price"] for iv in segments[0]["intervals"]] == [10.0, 10.0]
+    assert [iv["price"] for iv in segments[1]["intervals"]] == [50.0, 50.0]
+    assert segments[0]["intervals"][-1]["soc_after_percent"] == 100.0
+
+
+@pytest.mark.asyncio
+async def test_plan_arbitrage_reports_no_profitable_arbitrage(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Flat prices leave nothing to gain after losses."""
+    _patch_target(monkeypatch, _make_intervals([0.20, 0.20, 0.21, 0.20]))
+
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "battery_capacity_kwh": 10.0,
+            "current_soc_percent": 50.0,
+            "max_charge_power_w": 4000,
+            "charging_efficiency": 0.9,
+            "discharging_efficiency": 0.9,
+        },
+    )
+
+    response = cast("dict[str, Any]", await handle_plan_arbitrage(cast("ServiceCall", call)))
+
+    assert response["intervals_found"] is False
+    assert response["reason"] == "no_profitable_arbitrage"
+    assert response["arbitrage"] is None
+
+
+@pytest.mark.asyncio
+async def test_plan_arbitrage_rejects_inverted_soc_limits() -> None:
+    """Service should reject a minimum SoC at or above the maximum SoC."""
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "battery_capacity_kwh": 10.0,
+            "current_soc_percent": 50.0,
+            "min_soc_percent": 80.0,
+            "max_soc_percent": 20.0,
+            "max_charge_power_w": 4000,
+        },
+    )
+
+    with pytest.raises(ServiceValidationError):
+        await handle_plan_arbitrage(cast("ServiceCall", call))
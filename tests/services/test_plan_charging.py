@@ -13,7 +13,7 @@ import pytest
 
 from custom_components.tibber_prices.services import plan_charging as charging_module
 from custom_components.tibber_prices.services.helpers import ServiceTarget
-from custom_components.tibber_prices.services.plan_charging import handle_plan_charging
+from custom_components.tibber_prices.services.plan_charging import handle_plan_charging, handle_plan_charging_batch
 from homeassistant.exceptions import ServiceValidationError
 
 
@@ -388,3 +388,206 @@ async def test_plan_charging_respects_max_cycles_per_day(monkeypatch: pytest.Mon
     scheduled = cast("list[dict[str, Any]]", response["charging"]["schedule"]["intervals"])
     assert [interval["price"] for interval in scheduled] == [0.1, 0.8, 0.11]
     assert response["warnings"] is None
+
+
+@pytest.mark.asyncio
+async def test_plan_charging_plans_min_charge_duration_jointly(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A cheap block beats extending a lone cheap interval into its expensive neighbours."""
+    intervals = _make_intervals([0.05, 0.90, 0.90, 0.90, 0.30, 0.30, 0.30, 0.90])
+    fake_target = _build_fake_entry_and_coordinator(intervals)
+
+    monkeypatch.setattr(charging_module, "resolve_service_target", lambda _hass, _entry_id, _view="": fake_target)
+    monkeypatch.setattr(charging_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        charging_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 2, 0, tzinfo=UTC),
+        ),
+    )
+    monkeypatch.setattr(charging_module, "get_display_unit_factor", lambda _entry: 1)
+    monkeypatch.setattr(charging_module, "get_display_unit_string", lambda _entry, _currency: "EUR/kWh")
+
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "battery_capacity_kwh": 10.0,
+            "current_soc_percent": 20.0,
+            "target_soc_percent": 40.0,
+            "max_charge_power_w": 4000,
+            "min_charge_duration_minutes": 45,
+            "charging_efficiency": 1.0,
+            "smooth_outliers": False,
+            "use_base_unit": True,
+            "allow_relaxation": False,
+        },
+    )
+
+    response = cast("dict[str, Any]", await handle_plan_charging(cast("ServiceCall", call)))
+
+    assert response["intervals_found"] is True
+    assert response["charging"]["schedule"]["segment_count"] == 1
+    # Greedy allocation with repair would charge 0.05, 0.90, 0.90 and 0.30 x 3 (cost 2.75)
+    scheduled = cast("list[dict[str, Any]]", response["charging"]["schedule"]["intervals"])
+    assert [interval["price"] for interval in scheduled] == [0.3, 0.3, 0.3]
+    assert response["charging"]["total_cost"] == 0.9
+    assert response["warnings"] is None
+
+
+@pytest.mark.asyncio
+async def test_plan_charging_batch_respects_shared_grid_import_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Devices are planned in list order and later devices avoid intervals the limit no longer covers."""
+    intervals = _make_intervals([0.10, 0.11, 0.30, 0.40, 0.50, 0.60])
+    fake_target = _build_fake_entry_and_coordinator(intervals)
+
+    monkeypatch.setattr(charging_module, "resolve_service_target", lambda _hass, _entry_id, _view="": fake_target)
+    monkeypatch.setattr(charging_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        charging_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 1, 30, tzinfo=UTC),
+        ),
+    )
+    monkeypatch.setattr(charging_module, "get_display_unit_factor", lambda _entry: 1)
+    monkeypatch.setattr(charging_module, "get_display_unit_string", lambda _entry, _currency: "EUR/kWh")
+
+    device = {
+        "battery_capacity_kwh": 10.0,
+        "current_soc_percent": 20.0,
+        "target_soc_percent": 40.0,
+        "max_charge_power_w": 4000,
+        "charging_efficiency": 1.0,
+        "smooth_outliers": False,
+        "allow_relaxation": False,
+    }
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "devices": [{"name": "car", **device}, {"name": "home_battery", **device}, {"name": "full", **device}],
+            "shared_grid_import_limit_w": 6000,
+            "use_base_unit": True,
+        },
+    )
+    call.data["devices"][2]["current_soc_percent"] = 50.0
+
+    response = cast("dict[str, Any]", await handle_plan_charging_batch(cast("ServiceCall", call)))
+
+    assert response["success"] is True
+    assert response["device_count"] == 3
+    assert response["devices_planned"] == 2
+    car, home_battery, full = response["devices"]
+    assert [iv["price"] for iv in car["charging"]["schedule"]["intervals"]] == [0.1, 0.11]
+    assert [iv["price"] for iv in home_battery["charging"]["schedule"]["intervals"]] == [0.3, 0.4]
+    assert full["reason"] == "already_at_target"
+    assert response["shared_grid_import"] == {"limit_w": 6000, "peak_w": 4000}
+
+
+@pytest.mark.asyncio
+async def test_plan_charging_batch_rejects_duplicate_device_names() -> None:
+    """Device names identify the results and must be unique."""
+    device = {"battery_capacity_kwh": 10.0, "current_soc_percent": 20.0, "max_charge_power_w": 4000}
+    call = SimpleNamespace(
+        hass=object(),
+        data={"devices": [{"name": "car", **device}, {"name": "car", **device}]},
+    )
+
+    with pytest.raises(ServiceValidationError):
+        await handle_plan_charging_batch(cast("ServiceCall", call))
+
+
+@pytest.mark.asyncio
+async def test_plan_charging_shares_one_solver_budget_across_attempts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Relaxation attempts draw on one solver budget; once it is used up the greedy plan is kept."""
+    intervals = _make_intervals([0.30, 0.31, 0.32, 0.33, 0.34, 0.35, 0.36, 0.37])
+    fake_target = _build_fake_entry_and_coordinator(intervals)
+    clock = [100.0]
+    budgets: list[float] = []
+
+    def fake_solve(*_args: object, **kwargs: Any) -> None:
+        budgets.append(kwargs["time_budget"])
+        clock[0] += 1.0
+
+    monkeypatch.setattr(charging_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(charging_module, "solve_charge_schedule", fake_solve)
+    monkeypatch.setattr(charging_module, "resolve_service_target", lambda _hass, _entry_id, _view="": fake_target)
+    monkeypatch.setattr(charging_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        charging_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 2, 0, tzinfo=UTC),
+        ),
+    )
+    monkeypatch.setattr(charging_module, "get_display_unit_factor", lambda _entry: 1)
+    monkeypatch.setattr(charging_module, "get_display_unit_string", lambda _entry, _currency: "EUR/kWh")
+
+    call = SimpleNamespace(
+        hass=object(),
+        data={
+            "battery_capacity_kwh": 10.0,
+            "current_soc_percent": 20.0,
+            "target_soc_percent": 40.0,
+            "max_charge_power_w": 4000,
+            "min_charge_duration_minutes": 30,
+            "min_distance_from_avg": 50.0,
+            "charging_efficiency": 1.0,
+            "smooth_outliers": False,
+            "use_base_unit": True,
+        },
+    )
+
+    await handle_plan_charging(cast("ServiceCall", call))
+
+    assert budgets == [pytest.approx(charging_module.CHARGE_SOLVER_TIME_BUDGET_SECONDS)]
+
+
+@pytest.mark.asyncio
+async def test_plan_charging_batch_shares_one_solver_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """All devices of a batch draw on one solver budget, not one per device."""
+    intervals = _make_intervals([0.30, 0.10, 0.40, 0.11, 0.50, 0.60, 0.70, 0.80])
+    fake_target = _build_fake_entry_and_coordinator(intervals)
+    clock = [100.0]
+    budgets: list[float] = []
+
+    def fake_solve(*_args: object, **kwargs: Any) -> None:
+        budgets.append(kwargs["time_budget"])
+        clock[0] += 1.0
+
+    monkeypatch.setattr(charging_module, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(charging_module, "solve_charge_schedule", fake_solve)
+    monkeypatch.setattr(charging_module, "resolve_service_target", lambda _hass, _entry_id, _view="": fake_target)
+    monkeypatch.setattr(charging_module, "resolve_home_timezone", lambda _coord, _home_id: "UTC")
+    monkeypatch.setattr(
+        charging_module,
+        "resolve_search_range",
+        lambda _call_data, _now, _home_tz: (
+            datetime(2026, 1, 1, 0, 0, tzinfo=UTC),
+            datetime(2026, 1, 1, 2, 0, tzinfo=UTC),
+        ),
+    )
+    monkeypatch.setattr(charging_module, "get_display_unit_factor", lambda _entry: 1)
+    monkeypatch.setattr(charging_module, "get_display_unit_string", lambda _entry, _currency: "EUR/kWh")
+
+    device = {
+        "battery_capacity_kwh": 10.0,
+        "current_soc_percent": 20.0,
+        "target_soc_percent": 40.0,
+        "max_charge_power_w": 4000,
+        "max_cycles_per_day": 1,
+        "charging_efficiency": 1.0,
+        "smooth_outliers": False,
+        "allow_relaxation": False,
+    }
+    call = SimpleNamespace(
+        hass=object(),
+        data={"devices": [{"name": "car", **device}, {"name": "home_battery", **device}], "use_base_unit": True},
+    )
+
+    response = cast("dict[str, Any]", await handle_plan_charging_batch(cast("ServiceCall", call)))
+
+    assert response["devices_planned"] == 2
+    assert budgets == [pytest.approx(charging_module.CHARGE_SOLVER_TIME_BUDGET_SECONDS)]
@@ -0,0 +1,172 @@
+"""Tests for the response cache of read-only services."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.response_cache import TibberPricesResponseCache
+from custom_components.tibber_prices.services import response_cache as response_cache_module
+from custom_components.tibber_prices.services.helpers import ServiceTarget
+from custom_components.tibber_prices.services.response_cache import cache_service_response, refresh_block_countdown
+
+
+class _Clock:
+    """Adjustable TimeService stand-in."""
+
+    def __init__(self, now: datetime) -> None:
+        self.value = now
+
+    def now(self) -> datetime:
+        return self.value
+
+
+def _setup(monkeypatch: pytest.MonkeyPatch, now: datetime) -> tuple[SimpleNamespace, _Clock]:
+    """Route the wrapper to a coordinator with a response cache and an adjustable clock."""
+    clock = _Clock(now)
+    coordinator = SimpleNamespace(
+        data={"priceInfo": []},
+        time=clock,
+        response_cache=TibberPricesResponseCache(),
+        _cached_user_data={"viewer": {"homes": [{"id": "home_123", "timeZone": "UTC"}]}},
+    )
+    target = ServiceTarget(
+        entry=SimpleNamespace(data={"home_id": "home_123"}),
+        subentry=None,
+        coordinator=coordinator,
+        interval_pool=None,
+        data={},
+    )
+    monkeypatch.setattr(response_cache_module, "resolve_service_target", lambda _hass, _entry_id, _view="": target)
+    return coordinator, clock
+
+
+def _counting_handler(response: dict[str, Any]) -> tuple[Any, list[dict[str, Any]]]:
+    calls: list[dict[str, Any]] = []
+
+    async def handler(call: Any) -> dict[str, Any]:
+        calls.append(dict(call.data))
+        return response
+
+    return handler, calls
+
+
+def _call(**data: Any) -> ServiceCall:
+    return cast("ServiceCall", SimpleNamespace(hass=object(), data=data))
+
+
+@pytest.mark.asyncio
+async def test_identical_calls_are_answered_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The second identical call does not reach the handler; different arguments do."""
+    coordinator, _clock = _setup(monkeypatch, datetime(2026, 1, 1, 10, 2, tzinfo=UTC))
+    handler, calls = _counting_handler({"success": True, "data": [1, 2]})
+    cached = cache_service_response(handler, service_name="get_chartdata", entity_params={})
+
+    first = await cached(_call(day=["today"], resolution="interval"))
+    second = await cached(_call(resolution="interval", day=["today"]))
+    await cached(_call(day=["tomorrow"], resolution="interval"))
+
+    assert first == second
+    assert len(calls) == 2
+    assert coordinator.response_cache.stats == {"hits": 1, "misses": 2, "hit_rate": 0.333, "entries": 2}
+
+
+@pytest.mark.asyncio
+async def test_new_data_and_next_quarter_hour_invalidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Replaced coordinator data and a new quarter-hour both compute the response again."""
+    coordinator, clock = _setup(monkeypatch, datetime(2026, 1, 1, 10, 2, tzinfo=UTC))
+    handler, calls = _counting_handler({"success": True})
+    cached = cache_service_response(handler, service_name="get_price", entity_params={})
+
+    await cached(_call())
+    clock.value += timedelta(minutes=5)
+    await cached(_call())
+    assert len(calls) == 1
+
+    coordinator.data = {"priceInfo": []}
+    await cached(_call())
+    assert len(calls) == 2
+
+    clock.value = datetime(2026, 1, 1, 10, 15, tzinfo=UTC)
+    await cached(_call())
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_offset_minutes_key_on_the_resolved_search_range(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An offset that snaps to another interval minutes later is a new call, not the cached one."""
+    _coordinator, clock = _setup(monkeypatch, datetime(2026, 1, 1, 10, 2, tzinfo=UTC))
+    handler, calls = _counting_handler({"success": True})
+    cached = cache_service_response(
+        handler, service_name="find_cheapest_block", entity_params={}, key_on_search_range=True
+    )
+    offsets = {"search_start_offset_minutes": 10, "search_end_offset_minutes": 180}
+
+    await cached(_call(**offsets))  # 10:12 -> range starts 10:00
+    clock.value += timedelta(minutes=1)
+    await cached(_call(**offsets))  # 10:13 -> same range, cached
+    assert len(calls) == 1
+
+    clock.value += timedelta(minutes=4)
+    await cached(_call(**offsets))  # 10:17 -> range starts 10:15
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_not_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A success=False response is retried on the next call."""
+    _setup(monkeypatch, datetime(2026, 1, 1, 10, 2, tzinfo=UTC))
+    handler, calls = _counting_handler({"success": False, "reason": "price_data_unavailable"})
+    cached = cache_service_response(handler, service_name="get_price", entity_params={})
+
+    await cached(_call())
+    await cached(_call())
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_block_countdown_is_refreshed_on_hit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """seconds_until_start/end follow the clock while the window itself comes from the cache."""
+    _coordinator, clock = _setup(monkeypatch, datetime(2026, 1, 1, 10, 0, tzinfo=UTC))
+    window = {
+        "start": "2026-01-01T11:00:00+00:00",
+        "end": "2026-01-01T12:00:00+00:00",
+        "seconds_until_start": 3600,
+        "seconds_until_end": 7200,
+    }
+    handler, calls = _counting_handler({"success": True, "window_found": True, "window": window})
+    cached = cache_service_response(
+        handler, service_name="find_cheapest_block", entity_params={}, refresh=refresh_block_countdown
+    )
+
+    await cached(_call(duration=timedelta(hours=1)))
+    clock.value += timedelta(minutes=10)
+    response = await cached(_call(duration=timedelta(hours=1)))
+
+    assert len(calls) == 1
+    assert response["window"]["seconds_until_start"] == 3000
+    assert response["window"]["seconds_until_end"] == 6600
+    assert window["seconds_until_start"] == 3600
+
+
+def test_cache_is_bounded() -> None:
+    """The least recently used entry is dropped beyond max_entries."""
+    cache = TibberPricesResponseCache(max_entries=2)
+    data: dict[str, Any] = {}
+    bucket = datetime(2026, 1, 1, tzinfo=UTC)
+
+    for key in ("a", "b"):
+        cache.get(key, data=data, bucket=bucket)
+        cache.put(key, key, data=data, bucket=bucket)
+    cache.get("a", data=data, bucket=bucket)
+    cache.put("c", "c", data=data, bucket=bucket)
+
+    assert cache.get("a", data=data, bucket=bucket) == "a"
+    assert cache.get("b", data=data, bucket=bucket) is None
@@ -0,0 +1,154 @@
+"""Tests for the optimal multi-task solver used by find_cheapest_schedule."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from custom_components.tibber_prices.services import find_cheapest_schedule
+from custom_components.tibber_prices.services.find_cheapest_schedule import _attempt_schedule, _greedy_window_starts
+from custom_components.tibber_prices.services.schedule_solver import solve_schedule
+
+
+def _make_intervals(prices: list[float], *, skip: set[int] | None = None) -> list[dict[str, Any]]:
+    """Create quarter-hour intervals; indices in `skip` are left out (time gaps)."""
+    base = datetime(2026, 1, 1, 0, 0, tzinfo=UTC)
+    return [
+        {
+            "startsAt": (base + timedelta(minutes=15 * i)).isoformat(),
+            "total": price,
+            "level": "NORMAL",
+        }
+        for i, price in enumerate(prices)
+        if i not in (skip or set())
+    ]
+
+
+def _make_tasks(*specs: tuple[str, int]) -> list[dict[str, Any]]:
+    """Create task dicts from (name, duration_intervals) tuples."""
+    return [
+        {
+            "name": name,
+            "duration_minutes_requested": dur * 15,
+            "duration_minutes": dur * 15,
+            "duration_intervals": dur,
+            "power_profile": None,
+        }
+        for name, dur in specs
+    ]
+
+
+def _total_cost(pool: list[dict[str, Any]], tasks: list[dict[str, Any]], starts: list[int | None]) -> float:
+    return sum(
+        sum(iv["total"] for iv in pool[start : start + task["duration_intervals"]])
+        for task, start in zip(tasks, starts, strict=True)
+        if start is not None
+    )
+
+
+class TestSolveScheduleFreeOrder:
+    """Tasks in any order: lowest total cost wins."""
+
+    def test_beats_greedy_longest_first(self) -> None:
+        """Greedy gives the long task the cheap valley and strands the short task."""
+        pool = _make_intervals([3.0, 1.0, 1.0, 1.0, 3.0, 9.0, 9.0, 4.0, 4.0])
+        tasks = _make_tasks(("long", 3), ("short", 2))
+
+        greedy = _greedy_window_starts(pool, tasks, gap_intervals=0, sequential=False)
+        optimal = solve_schedule(pool, tasks, gap_intervals=0, sequential=False)
+
+        assert optimal is not None
+        assert _total_cost(pool, tasks, greedy) == 11.0
+        assert _total_cost(pool, tasks, optimal) == 9.0
+
+    def test_gap_enforced_in_both_directions(self) -> None:
+        """A task placed before another one still keeps the gap."""
+        pool = _make_intervals([1.0] * 6)
+        tasks = _make_tasks(("a", 2), ("b", 2))
+
+        starts = solve_schedule(pool, tasks, gap_intervals=2, sequential=False)
+
+        assert starts is not None
+        windows = sorted((start, start + 2) for start in starts if start is not None)
+        assert windows == [(0, 2), (4, 6)]
+
+    def test_schedules_most_tasks_before_lowest_cost(self) -> None:
+        """Fitting all tasks beats a cheaper schedule with fewer tasks."""
+        pool = _make_intervals([1.0, 1.0, 50.0, 50.0])
+        tasks = _make_tasks(("a", 2), ("b", 2))
+
+        starts = solve_schedule(pool, tasks, gap_intervals=0, sequential=False)
+
+        assert starts is not None
+        assert sorted(s for s in starts if s is not None) == [0, 2]
+
+    def test_window_never_spans_time_gap(self) -> None:
+        """Windows stay inside contiguous runs."""
+        pool = _make_intervals([1.0, 1.0, 9.0, 1.0, 9.0, 9.0], skip={2})  # gap between index 1 and 2
+
+        starts = solve_schedule(pool, _make_tasks(("a", 3)), gap_intervals=0, sequential=False)
+
+        assert starts == [2]
+
+    def test_exceeded_budget_returns_none(self) -> None:
+        """No result when the time budget is already used up."""
+        pool = _make_intervals([1.0] * 8)
+
+        assert solve_schedule(pool, _make_tasks(("a", 2)), gap_intervals=0, sequential=False, time_budget=-1) is None
+
+
+class TestSolveScheduleSequential:
+    """Tasks in declaration order."""
+
+    def test_beats_greedy_sequential(self) -> None:
+        """Greedy lets the first task take the cheapest pair and pushes the second into expensive slots."""
+        pool = _make_intervals([5.0, 1.0, 1.0, 5.0, 9.0, 9.0])
+        tasks = _make_tasks(("a", 2), ("b", 2))
+
+        greedy = _greedy_window_starts(pool, tasks, gap_intervals=0, sequential=True)
+        optimal = solve_schedule(pool, tasks, gap_intervals=0, sequential=True)
+
+        assert greedy == [1, 3]
+        assert optimal == [0, 2]
+
+    def test_longest_placeable_prefix(self) -> None:
+        """A task that does not fit breaks the chain, like greedy sequential placement."""
+        pool = _make_intervals([10.0] * 6)
+        tasks = _make_tasks(("a", 3), ("b", 3), ("c", 3))
+
+        assert solve_schedule(pool, tasks, gap_intervals=0, sequential=True) == [0, 3, None]
+
+
+class TestAttemptScheduleFallback:
+    """_attempt_schedule falls back to greedy placement."""
+
+    def test_greedy_used_when_solver_gives_up(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A solver timeout yields the greedy schedule."""
+        pool = _make_intervals([3.0, 1.0, 1.0, 1.0, 3.0, 9.0, 9.0, 4.0, 4.0])
+        tasks = _make_tasks(("short", 2), ("long", 3))
+        monkeypatch.setattr(find_cheapest_schedule, "solve_schedule", lambda *_args, **_kwargs: None)
+
+        fallback, unscheduled, _ = _attempt_schedule(
+            pool,
+            max_price_level=None,
+            min_price_level=None,
+            tasks=tasks,
+            gap_intervals=0,
+            smooth_outliers=False,
+        )
+        greedy, _, _ = _attempt_schedule(
+            pool,
+            max_price_level=None,
+            min_price_level=None,
+            tasks=tasks,
+            gap_intervals=0,
+            smooth_outliers=False,
+            optimal=False,
+        )
+
+        assert not unscheduled
+        assert fallback == greedy
+        assert [a["name"] for a in fallback] == ["long", "short"]
+        assert fallback[0]["intervals"] == pool[1:4]
@@ -0,0 +1,185 @@
+"""
+Tests for the calculator set (sensor/calculators/calculator_set.py).
+
+Sensors of one coordinator share the intermediate results of a tick: every
+metric must be computed once per tick, however many sensors read it, while
+the last results the attribute builders read stay per sensor.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Hashable
+from datetime import datetime, timedelta
+import math
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.tick_context import TibberPricesTickContext
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.sensor.calculators import TibberPricesCalculatorSet, TibberPricesSharedCalculators
+from custom_components.tibber_prices.sensor.value_getters import get_value_getter_mapping
+from homeassistant.util import dt as dt_util
+
+# Sensors whose values share intermediate results
+_SENSOR_KEYS = (
+    "current_price_trend",
+    "next_price_trend_change",
+    "next_price_trend_change_in",
+    "price_outlook_3h",
+    "price_trajectory_3h",
+    "today_volatility",
+    "current_interval_price_rank_today",
+    "next_interval_price_rank_today",
+    "lowest_price_today",
+    "highest_price_today",
+    "average_price_today",
+    "today_price_level",
+    "today_price_rating",
+)
+
+
+def _dt(value: str) -> datetime:
+    """Parse a timezone-aware datetime string for tests."""
+    parsed = dt_util.parse_datetime(value)
+    assert parsed is not None
+    return parsed
+
+
+class _Coordinator:
+    """Coordinator stand-in exposing what the calculators read."""
+
+    def __init__(self, data: dict[str, Any], time: TibberPricesTimeService) -> None:
+        self.data = data
+        self.config_entry = Mock(options={})
+        self.hass = None
+        self.time = time
+        self.sensor_calculators: TibberPricesSharedCalculators | None = None
+        self._tick_context: TibberPricesTickContext | None = None
+
+    def get_tick_context(self) -> TibberPricesTickContext:
+        if self._tick_context is None or not self._tick_context.is_valid_for(self.data, self.time):
+            self._tick_context = TibberPricesTickContext(self.data, time=self.time)
+        return self._tick_context
+
+    def get_current_interval(self) -> dict | None:
+        return self.get_tick_context().current_interval
+
+
+@pytest.fixture(scope="module")
+def coordinator_data() -> dict[str, Any]:
+    """Transform yesterday, today and tomorrow with a daily price cycle."""
+    base = _dt("2025-11-21T00:00:00+01:00")
+    intervals = []
+    for i in range(3 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        level = "CHEAP" if price < 0.2 else "EXPENSIVE" if price > 0.33 else "NORMAL"
+        intervals.append(
+            {
+                "startsAt": base + timedelta(minutes=15 * i),
+                "total": price,
+                "energy": price * 0.8,
+                "tax": price * 0.2,
+                "level": level,
+            }
+        )
+
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=_dt("2025-11-22T12:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(config_entry, "[test]")
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[test]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+    )
+    return transformer.transform_data(
+        {"timestamp": base, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+    )
+
+
+@pytest.fixture
+def computations(monkeypatch: pytest.MonkeyPatch) -> Counter[Hashable]:
+    """Count how often each shared result is actually computed."""
+    counter: Counter[Hashable] = Counter()
+    original = TibberPricesSharedCalculators.get_tick_result
+
+    def counting(self: TibberPricesSharedCalculators, key: Hashable, compute: Callable[[], Any]) -> Any:
+        def counted() -> Any:
+            counter[key] += 1
+            return compute()
+
+        return original(self, key, counted)
+
+    monkeypatch.setattr(TibberPricesSharedCalculators, "get_tick_result", counting)
+    return counter
+
+
+def _sensors(coordinator: _Coordinator) -> dict[str, tuple[TibberPricesCalculatorSet, Callable[[], Any]]]:
+    """One calculator set and value getter per sensor, as TibberPricesSensor creates them."""
+    sensors = {}
+    for key in _SENSOR_KEYS:
+        calculators = TibberPricesCalculatorSet(coordinator)  # type: ignore[arg-type]
+        mapping = get_value_getter_mapping(
+            calculators=calculators,
+            get_next_avg_n_hours_value=lambda _hours: None,
+            get_data_timestamp=lambda: None,
+            get_chart_data_export_value=lambda: None,
+            get_chart_metadata_value=lambda: None,
+        )
+        sensors[key] = (calculators, mapping[key])
+    return sensors
+
+
+def test_each_metric_computed_once_per_tick(coordinator_data: dict[str, Any], computations: Counter[Hashable]) -> None:
+    """All sensors of a tick share one computation per metric; the next tick computes again."""
+    coordinator = _Coordinator(coordinator_data, TibberPricesTimeService(_dt("2025-11-22T12:00:00+01:00")))
+    sensors = _sensors(coordinator)
+
+    values = {key: getter() for key, (_calculators, getter) in sensors.items()}
+
+    assert values["current_price_trend"] is not None
+    assert values["lowest_price_today"] is not None
+    assert computations
+    assert set(computations.values()) == {1}, computations
+    assert computations["trend_info"] == 1
+    assert computations[("reference_prices", "today")] == 1
+    assert computations[("day_price_intervals", "today")] == 1
+    assert computations[("day_intervals", "today")] == 1
+
+    # Next tick: everything is computed again, still once (keys may include the new interval start)
+    coordinator.time = TibberPricesTimeService(_dt("2025-11-22T12:15:00+01:00"))
+    for _calculators, getter in sensors.values():
+        getter()
+
+    assert set(computations.values()) <= {1, 2}, computations
+    assert computations["trend_info"] == 2
+    assert computations[("reference_prices", "today")] == 2
+    assert computations[("day_price_intervals", "today")] == 2
+    assert computations[("day_intervals", "today")] == 2
+
+    # New coordinator data invalidates the results of the same tick
+    coordinator.data = dict(coordinator.data)
+    sensors["current_price_trend"][1]()
+    assert computations["trend_info"] == 3
+
+
+def test_last_results_stay_per_sensor(coordinator_data: dict[str, Any]) -> None:
+    """Sensors sharing the day's prices still keep their own extreme interval for attributes."""
+    coordinator = _Coordinator(coordinator_data, TibberPricesTimeService(_dt("2025-11-22T12:00:00+01:00")))
+    sensors = _sensors(coordinator)
+
+    lowest = sensors["lowest_price_today"][1]()
+    highest = sensors["highest_price_today"][1]()
+
+    lowest_interval = sensors["lowest_price_today"][0].daily_stat.get_last_extreme_interval()
+    highest_interval = sensors["highest_price_today"][0].daily_stat.get_last_extreme_interval()
+    assert lowest < highest
+    assert lowest_interval is not None
+    assert highest_interval is not None
+    assert lowest_interval["total"] < highest_interval["total"]
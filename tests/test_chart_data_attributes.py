@@ -0,0 +1,53 @@
+"""Tests for the chart_data_export attributes in compact mode."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.tibber_prices.const import DATA_ATTRIBUTE_BYTE_BUDGET, DOMAIN
+from custom_components.tibber_prices.sensor import chart_data
+from custom_components.tibber_prices.sensor.chart_data import (
+    build_chart_data_attributes,
+    get_budgeted_response_size,
+    get_payload_size,
+)
+
+_LAST_UPDATE = datetime.fromisoformat("2025-11-22T12:00:00+01:00")
+
+
+def test_payload_over_budget_is_omitted() -> None:
+    """A response larger than the byte budget is replaced by its size."""
+    response = {"prices": [{"start_time": f"2025-11-22T{hour:02d}:00:00+01:00", "price": 0.25} for hour in range(24)]}
+    size = get_payload_size(response)
+
+    attributes = build_chart_data_attributes(response, _LAST_UPDATE, None, byte_budget=size - 1, response_bytes=size)
+
+    assert attributes == {"timestamp": _LAST_UPDATE, "data_omitted": True, "data_bytes": size}
+
+
+def test_payload_within_budget_is_kept() -> None:
+    """Responses within the budget, or without a budget, are written as before."""
+    response = {"prices": [{"start_time": "2025-11-22T00:00:00+01:00", "price": 0.25}]}
+    size = get_payload_size(response)
+
+    within = build_chart_data_attributes(response, _LAST_UPDATE, None, byte_budget=size, response_bytes=size)
+    unlimited = build_chart_data_attributes(response, _LAST_UPDATE, None)
+
+    assert within == unlimited == {"timestamp": _LAST_UPDATE, **response}
+
+
+def test_response_is_only_measured_with_a_budget() -> None:
+    """Without attribute_byte_budget the response is not serialized to measure it."""
+    response = {"prices": [{"start_time": "2025-11-22T00:00:00+01:00", "price": 0.25}]}
+    unbudgeted = SimpleNamespace(data={DOMAIN: {DATA_ATTRIBUTE_BYTE_BUDGET: None}})
+    budgeted = SimpleNamespace(data={DOMAIN: {DATA_ATTRIBUTE_BYTE_BUDGET: 1000}})
+
+    with patch.object(chart_data, "json_bytes", wraps=chart_data.json_bytes) as serialize:
+        assert get_budgeted_response_size(unbudgeted, response) is None
+        assert serialize.call_count == 0
+
+        assert get_budgeted_response_size(budgeted, response) == len(chart_data.json_bytes(response))
+        assert get_budgeted_response_size(budgeted, None) is None
+        assert serialize.call_count == 2
@@ -0,0 +1,54 @@
+"""Test coalescing of config override recalculations (number/switch entities)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.core import TibberPricesDataUpdateCoordinator
+
+
+def _create_coordinator() -> TibberPricesDataUpdateCoordinator:
+    """Create a coordinator with a stub debouncer, bypassing __init__."""
+    coordinator = object.__new__(TibberPricesDataUpdateCoordinator)
+    coordinator._override_debouncer = Mock(async_call=AsyncMock())  # noqa: SLF001
+    coordinator._override_update_pending = False  # noqa: SLF001
+    coordinator.override_recomputes_saved = 0
+    coordinator._retransform_after_config_change = Mock()  # noqa: SLF001
+    coordinator._log = lambda *_a, **_kw: None  # noqa: SLF001
+    return coordinator
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_burst_of_overrides_recalculates_once() -> None:
+    """Three overrides set within the debounce window cost one recalculation."""
+    coordinator = _create_coordinator()
+
+    for _ in range(3):
+        await coordinator.async_handle_config_override_update()
+
+    assert coordinator._override_debouncer.async_call.await_count == 3  # noqa: SLF001
+    coordinator._retransform_after_config_change.assert_not_called()  # noqa: SLF001
+
+    # Debounce window ends
+    await coordinator._async_apply_config_overrides()  # noqa: SLF001
+
+    coordinator._retransform_after_config_change.assert_called_once()  # noqa: SLF001
+    assert coordinator.override_recomputes_saved == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_override_after_recalculation_is_not_counted() -> None:
+    """A change after the pending recalculation ran starts a new window."""
+    coordinator = _create_coordinator()
+
+    await coordinator.async_handle_config_override_update()
+    await coordinator._async_apply_config_overrides()  # noqa: SLF001
+    await coordinator.async_handle_config_override_update()
+    await coordinator._async_apply_config_overrides()  # noqa: SLF001
+
+    assert coordinator._retransform_after_config_change.call_count == 2  # noqa: SLF001
+    assert coordinator.override_recomputes_saved == 0
@@ -26,6 +26,7 @@ async def test_coordinator_shutdown_saves_cache() -> None:
     mock_repair_manager = MagicMock()
     mock_repair_manager.clear_all_repairs = AsyncMock()
     coordinator._repair_manager = mock_repair_manager  # noqa: SLF001
+    coordinator._override_debouncer = MagicMock()  # noqa: SLF001
     coordinator._log = lambda *_a, **_kw: None  # noqa: SLF001
 
     # Call shutdown
@@ -57,6 +58,7 @@ async def test_coordinator_shutdown_handles_cache_error() -> None:
     mock_repair_manager = MagicMock()
     mock_repair_manager.clear_all_repairs = AsyncMock()
     coordinator._repair_manager = mock_repair_manager  # noqa: SLF001
+    coordinator._override_debouncer = MagicMock()  # noqa: SLF001
     coordinator._log = lambda *_a, **_kw: None  # noqa: SLF001
 
     # Shutdown should complete without raising
@@ -0,0 +1,62 @@
+"""
+Tests for a DST fall-back day arriving in the interval pool in one response.
+
+On the fall-back day the local hour 02:00-03:00 occurs twice, once with +02:00
+(CEST) and once with +01:00 (CET). The index is keyed by naive local time, so
+both copies share a key and the second one is kept as a DST extra. Two bugs hid
+this hour when a whole fall-back day was fetched at once:
+1. Collisions were only detected against intervals already indexed, so the CET
+   copy of the repeated hour overwrote the CEST copy within the same response.
+2. The coverage check sorted by ISO string, which orders 02:00+01:00 before
+   02:00+02:00, and reported the hour as missing on every call.
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.tibber_prices.interval_pool.manager import TibberPricesIntervalPool
+
+BERLIN = ZoneInfo("Europe/Berlin")
+DAY_START = datetime(2025, 10, 26, tzinfo=BERLIN)
+DAY_END = datetime(2025, 10, 27, tzinfo=BERLIN)
+
+
+def _fall_back_day() -> list[dict[str, Any]]:
+    """Return the 100 quarter-hours of the fall-back day in API order (by instant)."""
+    intervals = []
+    moment = DAY_START.astimezone(UTC)
+    while moment < DAY_END:
+        intervals.append({"startsAt": moment.astimezone(BERLIN).isoformat(), "total": 0.20})
+        moment += timedelta(minutes=15)
+    return intervals
+
+
+@pytest.fixture
+def pool() -> TibberPricesIntervalPool:
+    """Create an empty interval pool."""
+    return TibberPricesIntervalPool(home_id="test_home_id", api=MagicMock())
+
+
+def test_both_copies_of_the_repeated_hour_are_cached(pool: TibberPricesIntervalPool) -> None:
+    """The CEST and CET copies of 02:xx are both kept when they arrive in one response."""
+    intervals = _fall_back_day()
+    pool._add_intervals(intervals, DAY_START.isoformat())  # noqa: SLF001
+
+    cached = pool._get_cached_intervals(DAY_START.isoformat(), DAY_END.isoformat())  # noqa: SLF001
+
+    assert len(cached) == len(intervals) == 100
+    starts = {interval["startsAt"] for interval in cached}
+    assert {"2025-10-26T02:00:00+02:00", "2025-10-26T02:00:00+01:00"} <= starts
+
+
+def test_coverage_check_orders_the_repeated_hour_by_instant(pool: TibberPricesIntervalPool) -> None:
+    """A complete fall-back day is covered, even in ISO string order."""
+    intervals = sorted(_fall_back_day(), key=lambda interval: interval["startsAt"])
+
+    missing = pool._fetcher.check_coverage(intervals, DAY_START.isoformat(), DAY_END.isoformat())  # noqa: SLF001
+
+    assert missing == []
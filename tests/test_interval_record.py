@@ -0,0 +1,62 @@
+"""Tests for the slotted interval record (utils/interval_record.py)."""
+
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from custom_components.tibber_prices.utils.interval_record import TibberPricesIntervalRecord
+
+_INTERVAL = {
+    "startsAt": "2025-11-22T13:15:00+01:00",
+    "total": 0.2531,
+    "energy": 0.2025,
+    "tax": 0.0506,
+    "level": "NORMAL",
+}
+
+
+def test_record_behaves_like_the_interval_dict() -> None:
+    """Item access, get(), 'in', pop() and iteration order match a dict."""
+    record = TibberPricesIntervalRecord(_INTERVAL)
+    record["difference"] = -3.2
+    record["_sort_total"] = 0.25  # not a known field: kept in the overflow dict
+    expected = {**_INTERVAL, "difference": -3.2, "_sort_total": 0.25}
+
+    assert record == expected
+    assert list(record) == list(expected)
+    assert len(record) == len(expected)
+    assert record["total"] == 0.2531
+    assert record.get("rating_level") is None
+    assert record.get("rating_level", "NORMAL") == "NORMAL"
+    assert "rating_level" not in record
+    assert "_sort_total" in record
+    assert {**record} == expected
+    assert record.pop("_original_level", None) is None
+    assert record.pop("difference") == -3.2
+    with pytest.raises(KeyError):
+        record["difference"]
+    with pytest.raises(KeyError):
+        del record["rating_level"]
+
+
+def test_as_dict_is_a_plain_dict() -> None:
+    """The JSON view is a plain dict with the known fields first."""
+    record = TibberPricesIntervalRecord({"_smoothed": True, **_INTERVAL})
+
+    result = record.as_dict()
+
+    assert type(result) is dict
+    assert list(result) == [*_INTERVAL, "_smoothed"]
+
+
+def test_copies_are_independent() -> None:
+    """copy(), copy.copy() and copy.deepcopy() leave the original untouched."""
+    record = TibberPricesIntervalRecord({**_INTERVAL, "_smoothed": True})
+
+    for duplicate in (record.copy(), copy.copy(record), copy.deepcopy(record)):
+        duplicate["level"] = "CHEAP"
+        duplicate["_smoothed"] = False
+        assert record["level"] == "NORMAL"
+        assert record["_smoothed"] is True
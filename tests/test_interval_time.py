@@ -0,0 +1,68 @@
+"""Tests for the interned interval timestamps (utils/interval_time.py)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from custom_components.tibber_prices.coordinator.helpers import parse_all_timestamps
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.utils.interval_time import (
+    get_parse_stats,
+    intern_starts_at,
+    parse_starts_at,
+    starts_at_epoch,
+)
+
+
+def test_epoch_is_comparable_across_dst_offsets() -> None:
+    """The repeated 02:00 of a fall-back night is one hour apart, in order of the instant."""
+    cest = "2025-10-26T02:00:00+02:00"
+    cet = "2025-10-26T02:00:00+01:00"
+
+    assert starts_at_epoch(cet) - starts_at_epoch(cest) == 3600
+    assert starts_at_epoch(cest) == int(datetime(2025, 10, 26, 0, 0, tzinfo=UTC).timestamp())
+
+
+def test_parse_matches_fromisoformat_and_passes_datetimes_through() -> None:
+    """Parsed values equal fromisoformat(); datetimes are returned unchanged."""
+    value = "2025-11-22T13:15:00+01:00"
+    parsed = parse_starts_at(value)
+    as_datetime = datetime.fromisoformat(value)
+
+    assert parsed == as_datetime
+    assert parsed.utcoffset() == as_datetime.utcoffset()
+    assert parse_starts_at(as_datetime) is as_datetime
+    assert starts_at_epoch(as_datetime) == starts_at_epoch(value)
+
+
+def test_each_timestamp_is_parsed_once() -> None:
+    """Interned timestamps are looked up, not parsed again."""
+    intervals = [{"startsAt": f"2030-01-01T{hour:02d}:00:00+01:00"} for hour in range(24)]
+    intervals.append({"startsAt": datetime(2030, 1, 2, tzinfo=UTC)})
+
+    intern_starts_at(intervals)
+    before = get_parse_stats()
+    epochs = [starts_at_epoch(interval["startsAt"]) for interval in intervals[:24]]
+    after = get_parse_stats()
+
+    assert epochs == sorted(epochs)
+    assert after["parses"] == before["parses"]
+    assert after["lookups"] - before["lookups"] == 24
+
+
+def test_malformed_timestamp_leaves_only_its_interval_unparsed() -> None:
+    """One bad startsAt becomes None; the other intervals are still localized."""
+    price_data = {
+        "price_info": [
+            {"startsAt": "2025-11-22T13:00:00+01:00"},
+            {"startsAt": "not a timestamp"},
+            {"startsAt": "2025-11-22T13:30:00+01:00"},
+        ]
+    }
+    time = TibberPricesTimeService(reference_time=datetime(2025, 11, 22, 12, 0, tzinfo=UTC))
+
+    intervals = parse_all_timestamps(price_data, time=time)["price_info"]
+
+    assert intervals[1]["startsAt"] is None
+    assert intervals[0]["startsAt"] == datetime(2025, 11, 22, 12, 0, tzinfo=UTC)
+    assert intervals[2]["startsAt"] == datetime(2025, 11, 22, 12, 30, tzinfo=UTC)
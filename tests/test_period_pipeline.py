@@ -0,0 +1,149 @@
+"""Tests for the best/peak period side jobs (coordinator/period_pipeline.py)."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices.coordinator import period_pipeline, periods as periods_module
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from homeassistant.util import dt as dt_util
+
+
+def _create_two_day_intervals() -> list[dict]:
+    """Create today + tomorrow with a cheap midday valley and an evening peak."""
+    base_time = dt_util.parse_datetime("2025-11-22T00:00:00+01:00")
+    assert base_time is not None
+
+    intervals = []
+    for day in range(2):
+        for quarter in range(96):
+            hour = quarter // 4
+            if 10 <= hour < 15:
+                price, level = 0.18 + day * 0.01, "CHEAP"
+            elif 17 <= hour < 21:
+                price, level = 0.42 - day * 0.01, "EXPENSIVE"
+            else:
+                price, level = 0.28 + (quarter % 4) * 0.002, "NORMAL"
+            intervals.append(
+                {
+                    "startsAt": base_time + timedelta(days=day, minutes=15 * quarter),
+                    "total": price,
+                    "level": level,
+                    "rating_level": "NORMAL",
+                }
+            )
+    return intervals
+
+
+def _create_calculator() -> TibberPricesPeriodCalculator:
+    """Create a period calculator on a deterministic clock."""
+    calculator = TibberPricesPeriodCalculator(Mock(options={}), "[test]")
+    reference_time = dt_util.parse_datetime("2025-11-22T12:00:00+01:00")
+    assert reference_time is not None
+    calculator.time = TibberPricesTimeService(reference_time=reference_time)
+    return calculator
+
+
+@pytest.mark.unit
+class TestPeriodPipeline:
+    """Each side is an independent job; a filtered-out side gets the empty result."""
+
+    def test_side_alone_matches_combined_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Running only one side returns exactly that side of the combined result."""
+        intervals = _create_two_day_intervals()
+        combined = _create_calculator().calculate_periods_for_price_info(intervals)
+
+        run_both = period_pipeline.run_period_side_jobs
+        monkeypatch.setattr(
+            periods_module,
+            "run_period_side_jobs",
+            lambda best_job, _peak_job, **kwargs: run_both(best_job, None, **kwargs),
+        )
+        best_only = _create_calculator().calculate_periods_for_price_info(intervals)
+
+        assert combined["best_price"]["periods"], "fixture must produce best price periods"
+        assert combined["peak_price"]["periods"], "fixture must produce peak price periods"
+        assert best_only["best_price"] == combined["best_price"]
+        assert best_only["peak_price"] == period_pipeline.empty_period_result()
+
+    def test_filtered_side_returns_empty_result(self) -> None:
+        """A side without a job (filtered out) yields the empty result structure."""
+        best, peak = period_pipeline.run_period_side_jobs(None, None)
+
+        assert best == period_pipeline.empty_period_result()
+        assert peak == period_pipeline.empty_period_result()
+        assert best is not peak
+
+    def test_each_side_is_timed(self) -> None:
+        """Both calculated sides are recorded in the calculator's stage timings."""
+        calculator = _create_calculator()
+        calculator.calculate_periods_for_price_info(_create_two_day_intervals())
+
+        stats = calculator.stage_timings.stats
+        assert stats["periods_best_price"]["count"] == 1
+        assert stats["periods_peak_price"]["count"] == 1
+
+    def test_side_jobs_pickle(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Jobs hold plain data only, so they survive a pickle round trip unchanged."""
+        jobs: list[period_pipeline.TibberPricesPeriodSideJob | None] = []
+        run_both = period_pipeline.run_period_side_jobs
+
+        def capture(best_job, peak_job, **kwargs):
+            jobs.extend((best_job, peak_job))
+            return run_both(best_job, peak_job, **kwargs)
+
+        monkeypatch.setattr(periods_module, "run_period_side_jobs", capture)
+        _create_calculator().calculate_periods_for_price_info(_create_two_day_intervals())
+
+        assert all(job is not None for job in jobs)
+        for job in jobs:
+            restored = pickle.loads(pickle.dumps(job))
+            assert period_pipeline.run_period_side_job(restored) == period_pipeline.run_period_side_job(job)
+
+    def test_worker_process_matches_in_process_result(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The peak side calculated in the worker process equals the in-process result."""
+        # The worker is skipped on single-core hosts; the result must not depend on the host
+        monkeypatch.setattr(period_pipeline.os, "cpu_count", lambda: 2)
+        intervals = _create_two_day_intervals()
+        expected = _create_calculator().calculate_periods_for_price_info(intervals)
+
+        worker = period_pipeline.TibberPricesPeriodSideWorker()
+        try:
+            calculator = _create_calculator()
+            calculator.side_worker = worker
+            # The first calculation starts the process and runs in-process meanwhile
+            assert calculator.calculate_periods_for_price_info(intervals) == expected
+            worker._warm_up.result(timeout=120)  # noqa: SLF001 - wait for the process to start
+            assert worker.is_ready
+
+            calculator.invalidate_config_cache()
+            assert calculator.calculate_periods_for_price_info(intervals) == expected
+            assert calculator.stage_timings.stats["periods_peak_price"]["count"] == 2
+        finally:
+            worker.shutdown()
+
+    def test_unavailable_worker_falls_back_to_in_process(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A worker that cannot start is given up on, and both sides run in-process."""
+
+        def no_processes(*_args: object, **_kwargs: object) -> None:
+            msg = "no process support"
+            raise OSError(msg)
+
+        monkeypatch.setattr(period_pipeline.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(period_pipeline, "ProcessPoolExecutor", no_processes)
+        intervals = _create_two_day_intervals()
+        expected = _create_calculator().calculate_periods_for_price_info(intervals)
+
+        worker = period_pipeline.TibberPricesPeriodSideWorker()
+        calculator = _create_calculator()
+        calculator.side_worker = worker
+        for _ in range(2):
+            calculator.invalidate_config_cache()
+            assert calculator.calculate_periods_for_price_info(intervals) == expected
+        assert not worker.is_ready
+        assert worker._unavailable  # noqa: SLF001 - not retried on every update
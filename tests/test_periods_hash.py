@@ -9,7 +9,7 @@ from unittest.mock import Mock
 import pytest
 
 from custom_components.tibber_prices import const as _const
-from custom_components.tibber_prices.coordinator import periods as periods_module
+from custom_components.tibber_prices.coordinator import period_pipeline
 from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
 from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
 from homeassistant.util import dt as dt_util
@@ -158,7 +158,6 @@ class TestPeriodConfigNormalization:
             max_relaxation_attempts: int,
             should_show_callback: Any,
             time: Any,
-            config_entry: Any,
             day_patterns_by_date: Any,
         ) -> dict[str, Any]:
             captured_calls.append(
@@ -186,7 +185,7 @@ class TestPeriodConfigNormalization:
             }
 
         monkeypatch.setattr(
-            periods_module, "calculate_periods_with_relaxation", _fake_calculate_periods_with_relaxation
+            period_pipeline, "calculate_periods_with_relaxation", _fake_calculate_periods_with_relaxation
         )
 
         calculator = _create_calculator(
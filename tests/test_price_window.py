@@ -12,11 +12,18 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
+from custom_components.tibber_prices.utils import price_window
 from custom_components.tibber_prices.utils.price_window import (
+    TibberPricesPreparedRange,
+    calculate_window_scores,
     calculate_window_statistics,
     find_cheapest_contiguous_window,
     find_cheapest_n_intervals,
+    find_contiguous_runs,
     group_intervals_into_segments,
+    select_best_window_start,
 )
 
 # =============================================================================
@@ -252,6 +259,112 @@ class TestFindCheapestContiguousWindowWithPowerProfile:
         assert find_cheapest_contiguous_window(intervals, 3, power_profile=[3000, 500, 500]) is None
 
 
+# =============================================================================
+# calculate_window_scores — weighted sliding dot product engine
+# =============================================================================
+
+
+def _direct_scores(prices: list[float], duration: int, weights: list[float] | None) -> list[float]:
+    """Score every window position by direct summation (reference implementation)."""
+    weights = weights or [1] * duration
+    return [sum(prices[i + k] * weights[k] for k in range(duration)) for i in range(len(prices) - duration + 1)]
+
+
+class TestCalculateWindowScores:
+    """Tests for the weighted window scoring engine."""
+
+    def test_plain_window_sums(self) -> None:
+        """Without weights every score is the window sum."""
+        assert calculate_window_scores([1.0, 2.0, 3.0, 4.0], 2) == pytest.approx([3.0, 5.0, 7.0])
+
+    def test_weighted_matches_direct_scoring(self) -> None:
+        """Run-length compressed scoring equals the direct dot product."""
+        prices = [0.31, 0.12, -0.05, 0.44, 0.27, 0.27, 0.18, 0.09, 0.51, 0.33]
+        weights = [2000, 2000, 300, 300, 300, 0, 2000]
+
+        assert calculate_window_scores(prices, 7, weights) == pytest.approx(_direct_scores(prices, 7, weights))
+
+    def test_numpy_engine_matches_pure_python(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Forcing the pure-Python path yields the same scores as the default engine."""
+        prices = [((i * 37) % 23) / 10 for i in range(672)]
+        weights = [2000] * 8 + [300] * 32 + [2000] * 8
+
+        default_scores = calculate_window_scores(prices, 48, weights)
+        monkeypatch.setattr(price_window, "np", None)
+        fallback_scores = calculate_window_scores(prices, 48, weights)
+
+        assert fallback_scores == pytest.approx(default_scores)
+        assert fallback_scores == pytest.approx(_direct_scores(prices, 48, weights))
+
+    def test_series_shorter_than_window(self) -> None:
+        """No window fits: empty result."""
+        assert calculate_window_scores([1.0, 2.0], 3, [1, 1, 1]) == []
+
+    def test_select_prefers_earliest_tie(self) -> None:
+        """Rounding noise between equal windows does not move the selection."""
+        assert select_best_window_start([1.27, 1.2699999999999998, 2.0]) == 0
+        assert select_best_window_start([3.0, 5.0000000000000001, 5.0], reverse=True) == 1
+
+
+# =============================================================================
+# TibberPricesPreparedRange — contiguity data shared across one service call
+# =============================================================================
+
+
+class TestPreparedRange:
+    """Tests for the prepared search range."""
+
+    def test_precomputed_fields(self) -> None:
+        """Offsets, contiguity bitmap and runs describe the range."""
+        intervals = _make_intervals([1.0, 2.0, 3.0, 4.0, 5.0], gap_after={1})
+        prepared = TibberPricesPreparedRange(intervals)
+
+        offsets = prepared.offsets_of(intervals)
+        assert offsets[1] - offsets[0] == 900
+        assert list(prepared.contiguous) == [0, 1, 0, 1, 1]
+        assert prepared.runs == [(0, 2), (2, 5)]
+
+    def test_filtered_copies_reuse_offsets(self) -> None:
+        """A filtered subset made of copies is split where the removed interval was."""
+        intervals = _make_intervals([1.0, 2.0, 3.0, 4.0, 5.0])
+        prepared = TibberPricesPreparedRange(intervals)
+        subset = [dict(iv) for i, iv in enumerate(intervals) if i != 2]
+
+        assert prepared.runs_of(subset) == [(0, 2), (2, 4)]
+        assert prepared.runs_of(subset, [True, False, True, True]) == [(0, 1), (2, 4)]
+        assert group_intervals_into_segments(subset, prepared=prepared) == group_intervals_into_segments(subset)
+
+    def test_unknown_timestamps_are_parsed(self) -> None:
+        """Intervals outside the prepared range still get correct offsets."""
+        prepared = TibberPricesPreparedRange(_make_intervals([1.0, 2.0]))
+        later = _make_intervals([3.0, 4.0], start=datetime(2026, 1, 2, tzinfo=UTC))
+
+        assert find_contiguous_runs(later, prepared=prepared) == [(0, 2)]
+
+    def test_runs_split_at_gaps_and_unavailable_slots(self) -> None:
+        """Both a missing quarter-hour and an unavailable slot end a run."""
+        intervals = _make_intervals([1.0] * 7, gap_after={2})
+
+        assert find_contiguous_runs(intervals) == [(0, 3), (3, 7)]
+        assert find_contiguous_runs(intervals, [True, True, True, True, False, True, True]) == [
+            (0, 3),
+            (3, 4),
+            (5, 7),
+        ]
+
+    def test_algorithms_match_unprepared_results(self) -> None:
+        """Passing a prepared range never changes the selection."""
+        intervals = _make_intervals([0.3, 0.1, 0.2, 0.5, 0.1, 0.1, 0.4, 0.2], gap_after={3})
+        prepared = TibberPricesPreparedRange(intervals)
+
+        assert find_cheapest_contiguous_window(intervals, 2, prepared=prepared) == find_cheapest_contiguous_window(
+            intervals, 2
+        )
+        assert find_cheapest_n_intervals(intervals, 4, 2, prepared=prepared) == find_cheapest_n_intervals(
+            intervals, 4, 2
+        )
+
+
 # =============================================================================
 # find_cheapest_n_intervals
 # =============================================================================
@@ -366,6 +479,32 @@ class TestFindCheapestNIntervals:
         intervals = _make_intervals([1.0, 2.0, 3.0, 4.0], gap_after={0, 1, 2})
         assert find_cheapest_n_intervals(intervals, 2, min_segment_intervals=2) is None
 
+    def test_min_segment_equal_cost_keeps_first_found_selection(self) -> None:
+        """Equal-cost selections resolve to the one a forward scan reaches first."""
+        # Runs [0], [1..7], [8..11], [12..14]; [3..7]+[12..14] and [4..11] both cost 15
+        prices = [3.0, 3.0, 3.0, 2.0, 1.0, 3.0, 3.0, 1.0, 2.0, 2.0, 1.0, 2.0, 1.0, 2.0, 2.0]
+        intervals = _make_intervals(prices, gap_after={0, 7, 11})
+
+        result = find_cheapest_n_intervals(intervals, 8, min_segment_intervals=3)
+
+        assert result is not None
+        assert result["intervals"] == intervals[4:12]
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_min_segment_numpy_engine_matches_pure_python(self, monkeypatch: pytest.MonkeyPatch, reverse: bool) -> None:
+        """Both DP engines return the same selection, ties included."""
+        prices = [float((i * 7) % 5) for i in range(672)]  # repeating values produce many equal-cost selections
+        intervals = _make_intervals(prices, gap_after={95, 200, 201, 500})
+
+        monkeypatch.setattr(price_window, "_NUMPY_MIN_SEGMENT_STATES", 0)
+        numpy_result = find_cheapest_n_intervals(intervals, 60, min_segment_intervals=4, reverse=reverse)
+        monkeypatch.setattr(price_window, "np", None)
+        python_result = find_cheapest_n_intervals(intervals, 60, min_segment_intervals=4, reverse=reverse)
+
+        assert python_result is not None
+        assert numpy_result == python_result
+        assert all(segment["interval_count"] >= 4 for segment in python_result["segments"])
+
 
 # =============================================================================
 # group_intervals_into_segments
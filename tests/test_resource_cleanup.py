@@ -7,6 +7,7 @@ import pytest
 from custom_components.tibber_prices.binary_sensor.core import TibberPricesBinarySensor
 from custom_components.tibber_prices.coordinator.core import TibberPricesDataUpdateCoordinator
 from custom_components.tibber_prices.coordinator.listeners import TibberPricesListenerManager
+from custom_components.tibber_prices.coordinator.wakeup import TibberPricesWakeupScheduler
 from custom_components.tibber_prices.sensor.core import TibberPricesSensor
 
 
@@ -40,7 +41,10 @@ class TestListenerCleanup:
         """Test that minute-update listeners can be removed."""
         # Create listener manager
         manager = object.__new__(TibberPricesListenerManager)
-        manager._minute_update_listeners = []  # noqa: SLF001
+        manager._minute_update_listeners = {}  # noqa: SLF001
+        manager._minute_wakeups = TibberPricesWakeupScheduler()  # noqa: SLF001
+        manager._minute_handler = None  # noqa: SLF001
+        manager._minute_timer_cancel = None  # noqa: SLF001
         manager._log = lambda *_a, **_kw: None  # noqa: SLF001
 
         # Add a listener
@@ -57,6 +61,7 @@ class TestListenerCleanup:
         # Verify listener was removed
         assert callback not in manager._minute_update_listeners  # noqa: SLF001
         assert len(manager._minute_update_listeners) == 0  # noqa: SLF001
+        assert len(manager._minute_wakeups) == 0  # noqa: SLF001
 
     @pytest.mark.asyncio
     async def test_sensor_cleanup_pattern_exists(self) -> None:
@@ -0,0 +1,55 @@
+"""Tests for the update pipeline stage timings (stage_timing.py)."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.tibber_prices.stage_timing import TibberPricesStageTimings, timed_stage
+
+
+class _Client:
+    """Object with an async method timed through its stage_timings attribute."""
+
+    def __init__(self, timings: TibberPricesStageTimings | None) -> None:
+        self.stage_timings = timings
+
+    @timed_stage("request")
+    async def request(self, value: int) -> int:
+        return value * 2
+
+
+@pytest.mark.unit
+class TestStageTimings:
+    """Rolling statistics and the ways spans are recorded."""
+
+    def test_percentiles_cover_the_rolling_window(self) -> None:
+        """p50/p95/max come from the last window samples, count from all of them."""
+        timings = TibberPricesStageTimings(window=20)
+        for millis in range(1, 31):
+            timings.record("enrich_price_info", millis / 1000)
+
+        stats = timings.stats["enrich_price_info"]
+
+        assert stats == {"count": 30, "last_ms": 30.0, "p50_ms": 20.0, "p95_ms": 29.0, "max_ms": 30.0}
+
+    def test_measure_records_failed_blocks(self) -> None:
+        """A raising block is recorded like a successful one."""
+        timings = TibberPricesStageTimings()
+
+        with pytest.raises(ValueError, match="boom"), timings.measure("detect_day_patterns"):
+            raise ValueError("boom")
+
+        assert timings.stats["detect_day_patterns"]["count"] == 1
+
+    def test_stats_are_empty_before_the_first_span(self) -> None:
+        """Nothing is reported for stages that never ran."""
+        assert TibberPricesStageTimings().stats == {}
+
+    @pytest.mark.asyncio
+    async def test_timed_stage_uses_instance_timings(self) -> None:
+        """The decorator records on the instance's timings and is a no-op without them."""
+        timings = TibberPricesStageTimings()
+
+        assert await _Client(timings).request(2) == 4
+        assert await _Client(None).request(3) == 6
+        assert timings.stats["request"]["count"] == 1
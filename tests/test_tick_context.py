@@ -0,0 +1,179 @@
+"""
+Tests for the per-tick computation context (coordinator/tick_context.py).
+
+Every fact the context shares must equal what the per-entity lookups it
+replaces return for the same data and TimeService.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices.binary_sensor.attributes import get_price_intervals_attributes
+from custom_components.tibber_prices.const import CONF_CURRENCY_DISPLAY_MODE, DISPLAY_MODE_BASE
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.helpers import get_intervals_for_day_offsets
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.tick_context import TibberPricesTickContext
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.entity_utils import find_rolling_hour_center_index
+from custom_components.tibber_prices.utils.average import (
+    calculate_current_leading_max,
+    calculate_current_leading_mean,
+    calculate_current_leading_min,
+    calculate_current_trailing_max,
+    calculate_current_trailing_mean,
+    calculate_current_trailing_min,
+)
+from custom_components.tibber_prices.utils.price import find_price_data_for_interval
+from homeassistant.util import dt as dt_util
+
+# Boundary, scheduling jitter on both sides, mid-interval and both day edges
+_TICK_TIMES = [
+    "2025-11-22T12:00:00+01:00",
+    "2025-11-22T12:15:00.005000+01:00",
+    "2025-11-22T12:29:59.999000+01:00",
+    "2025-11-22T14:37:23+01:00",
+    "2025-11-22T00:00:00+01:00",
+    "2025-11-22T23:50:00+01:00",
+]
+
+
+def _dt(value: str) -> datetime:
+    """Parse a timezone-aware datetime string for tests."""
+    parsed = dt_util.parse_datetime(value)
+    assert parsed is not None
+    return parsed
+
+
+@pytest.fixture(scope="module")
+def coordinator_data() -> dict[str, Any]:
+    """Transform yesterday, today and tomorrow with a daily price cycle."""
+    base = _dt("2025-11-21T00:00:00+01:00")
+    intervals = []
+    for i in range(3 * 96):
+        price = round(0.25 + 0.1 * math.sin(i / 96 * 2 * math.pi) + (i * 7919 % 97) / 1000, 4)
+        level = "CHEAP" if price < 0.2 else "EXPENSIVE" if price > 0.33 else "NORMAL"
+        intervals.append(
+            {
+                "startsAt": base + timedelta(minutes=15 * i),
+                "total": price,
+                "energy": price * 0.8,
+                "tax": price * 0.2,
+                "level": level,
+            }
+        )
+
+    config_entry = Mock(options={})
+    time = TibberPricesTimeService(reference_time=_dt("2025-11-22T12:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(config_entry, "[test]")
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[test]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+    )
+    return transformer.transform_data(
+        {"timestamp": base, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+    )
+
+
+def _legacy_rolling_window(data: dict[str, Any], hour_offset: int, time: TibberPricesTimeService) -> list[dict] | None:
+    """Reproduce the per-entity rolling hour window lookup."""
+    all_prices = get_intervals_for_day_offsets(data, [-1, 0, 1])
+    center_idx = find_rolling_hour_center_index(all_prices, time.now(), hour_offset, time=time)
+    if center_idx is None:
+        return None
+    window = [all_prices[center_idx + o] for o in range(-2, 3) if 0 <= center_idx + o < len(all_prices)]
+    return window or None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("tick_time", _TICK_TIMES)
+class TestTickContextMatchesPerEntityLookups:
+    """Shared results equal the per-entity lookups they replace."""
+
+    def test_intervals(self, coordinator_data: dict[str, Any], tick_time: str) -> None:
+        """Current interval and neighbours match find_price_data_for_interval()."""
+        time = TibberPricesTimeService(reference_time=_dt(tick_time))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+
+        for offset in (-200, -1, 0, 1, 4, 200):
+            expected = find_price_data_for_interval(coordinator_data, time.get_interval_offset_time(offset), time=time)
+            assert context.interval_at(offset) is expected
+        assert context.current_interval is find_price_data_for_interval(coordinator_data, time.now(), time=time)
+
+    def test_rolling_hour_windows(self, coordinator_data: dict[str, Any], tick_time: str) -> None:
+        """Rolling hour windows match the center-index lookup, including clipped edges."""
+        time = TibberPricesTimeService(reference_time=_dt(tick_time))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+
+        for hour_offset in (-30, -1, 0, 1, 30):
+            assert context.rolling_hour_window(hour_offset) == _legacy_rolling_window(
+                coordinator_data, hour_offset, time
+            )
+
+    def test_24h_window_stats(self, coordinator_data: dict[str, Any], tick_time: str) -> None:
+        """Trailing and leading statistics match the average utilities."""
+        time = TibberPricesTimeService(reference_time=_dt(tick_time))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+        trailing = context.trailing_24h_stats
+        leading = context.leading_24h_stats
+
+        assert (trailing.mean, trailing.median) == calculate_current_trailing_mean(coordinator_data, time=time)
+        assert trailing.min == calculate_current_trailing_min(coordinator_data, time=time)
+        assert trailing.max == calculate_current_trailing_max(coordinator_data, time=time)
+        assert (leading.mean, leading.median) == calculate_current_leading_mean(coordinator_data, time=time)
+        assert leading.min == calculate_current_leading_min(coordinator_data, time=time)
+        assert leading.max == calculate_current_leading_max(coordinator_data, time=time)
+
+    def test_period_bounds(self, coordinator_data: dict[str, Any], tick_time: str) -> None:
+        """The selected period matches the one shown in the period sensor attributes."""
+        time = TibberPricesTimeService(reference_time=_dt(tick_time))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+        config_entry = Mock(options={CONF_CURRENCY_DISPLAY_MODE: DISPLAY_MODE_BASE})
+
+        for reverse_sort in (False, True):
+            attrs = get_price_intervals_attributes(
+                coordinator_data, time=time, reverse_sort=reverse_sort, config_entry=config_entry
+            )
+            expected = (attrs["start"], attrs["end"]) if attrs.get("start") and attrs.get("end") else None
+            assert context.period_bounds(reverse_sort=reverse_sort) == expected
+
+
+@pytest.mark.unit
+class TestTickContextSharing:
+    """Results are computed once per tick and tied to their data and TimeService."""
+
+    def test_results_are_computed_once(self, coordinator_data: dict[str, Any]) -> None:
+        """Repeated access returns the same objects."""
+        time = TibberPricesTimeService(reference_time=_dt(_TICK_TIMES[0]))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+
+        assert context.all_intervals is context.all_intervals
+        assert context.trailing_24h_stats is context.trailing_24h_stats
+        assert context.rolling_hour_window(0) is context.rolling_hour_window(0)
+
+    def test_validity_requires_same_data_and_time(self, coordinator_data: dict[str, Any]) -> None:
+        """A new TimeService or a replaced data dict invalidates the context."""
+        time = TibberPricesTimeService(reference_time=_dt(_TICK_TIMES[0]))
+        context = TibberPricesTickContext(coordinator_data, time=time)
+
+        assert context.is_valid_for(coordinator_data, time)
+        assert not context.is_valid_for(dict(coordinator_data), time)
+        assert not context.is_valid_for(coordinator_data, TibberPricesTimeService(reference_time=time.now()))
+
+    def test_no_data(self) -> None:
+        """Without data every lookup is empty."""
+        context = TibberPricesTickContext(None, time=TibberPricesTimeService(reference_time=_dt(_TICK_TIMES[0])))
+
+        assert context.current_interval is None
+        assert context.rolling_hour_window(0) is None
+        assert context.trailing_24h_stats is None
+        assert context.period_bounds(reverse_sort=False) is None
@@ -4,12 +4,12 @@ Test timer scheduling for entity updates at correct intervals.
 This tests the three-timer architecture:
 - Timer #1: API polling (15 min, random offset) - tested in test_next_api_poll.py
 - Timer #2: Quarter-hour entity refresh (:00, :15, :30, :45)
-- Timer #3: Timing sensors refresh (:00, :30 every minute)
+- Timer #3: Timing sensors refresh (event-driven, on the :00/:30 second grid)
 
 See docs/development/timer-architecture.md for architecture overview.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -17,8 +17,11 @@ import pytest
 
 from custom_components.tibber_prices.coordinator.constants import QUARTER_HOUR_BOUNDARIES
 from custom_components.tibber_prices.coordinator.listeners import TibberPricesListenerManager
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
 from homeassistant.core import HomeAssistant
 
+_CALL_LATER = "custom_components.tibber_prices.coordinator.listeners.async_call_later"
+
 
 @pytest.fixture
 def hass_mock() -> HomeAssistant:
@@ -88,28 +91,22 @@ def test_schedule_minute_refresh_registers_timer(
     listener_manager: TibberPricesListenerManager,
 ) -> None:
     """
-    Test that minute refresh registers timer with correct 30-second boundaries.
+    Test that minute refresh arms one timer for the earliest listener wakeup.
 
-    Timer #3 should trigger at :XX:00 and :XX:30 every minute.
+    Timer #3 fires right away for a new listener, whose first update
+    calculates its real deadline.
     """
     handler = MagicMock()
 
-    with patch("custom_components.tibber_prices.coordinator.listeners.async_track_utc_time_change") as mock_track:
-        mock_track.return_value = MagicMock()  # Simulated cancel callback
+    with patch(_CALL_LATER) as mock_call_later:
+        mock_call_later.return_value = MagicMock()  # Simulated cancel callback
 
         listener_manager.schedule_minute_refresh(handler)
+        mock_call_later.assert_not_called()  # Nothing to wake yet
 
-        # Verify async_track_utc_time_change was called with correct parameters
-        mock_track.assert_called_once()
-        args, kwargs = mock_track.call_args
+        listener_manager.async_add_minute_update_listener(MagicMock())
 
-        # Check positional arguments
-        assert args[0] == listener_manager.hass  # hass instance
-        assert args[1] == handler  # callback function
-
-        # Check keyword arguments
-        assert "second" in kwargs
-        assert kwargs["second"] == [0, 30]  # Every 30 seconds
+        mock_call_later.assert_called_once_with(listener_manager.hass, 0.0, handler)
 
 
 def test_schedule_minute_refresh_cancels_existing_timer(
@@ -119,11 +116,12 @@ def test_schedule_minute_refresh_cancels_existing_timer(
     handler = MagicMock()
     cancel_mock = MagicMock()
 
-    with patch("custom_components.tibber_prices.coordinator.listeners.async_track_utc_time_change") as mock_track:
-        mock_track.return_value = cancel_mock
+    with patch(_CALL_LATER) as mock_call_later:
+        mock_call_later.return_value = cancel_mock
 
         # Schedule first timer
         listener_manager.schedule_minute_refresh(handler)
+        listener_manager.async_add_minute_update_listener(MagicMock())
         first_cancel = listener_manager._minute_timer_cancel  # noqa: SLF001  # type: ignore[attr-defined]
         assert first_cancel is not None
 
@@ -134,6 +132,38 @@ def test_schedule_minute_refresh_cancels_existing_timer(
         cancel_mock.assert_called_once()
 
 
+def test_minute_listeners_rearm_for_earliest_deadline(
+    listener_manager: TibberPricesListenerManager,
+) -> None:
+    """
+    Test that only due listeners are updated and the timer follows the earliest deadline.
+
+    A listener without next_update_fn keeps the 30-second cadence.
+    """
+    now = datetime(2025, 11, 22, 14, 23, 0, 100000, tzinfo=UTC)
+    time_service = TibberPricesTimeService(reference_time=now)
+    countdown = MagicMock()
+    idle = MagicMock()
+    fixed = MagicMock()
+
+    with patch(_CALL_LATER) as mock_call_later:
+        mock_call_later.return_value = MagicMock()
+        listener_manager.schedule_minute_refresh(MagicMock())
+        listener_manager.async_add_minute_update_listener(countdown, lambda _ts: now + timedelta(seconds=29.9))
+        listener_manager.async_add_minute_update_listener(idle, lambda _ts: now + timedelta(minutes=6, seconds=59.9))
+        listener_manager.async_add_minute_update_listener(fixed)
+
+        # First wakeup: every new listener is due
+        listener_manager.async_update_minute_listeners(time_service)
+        assert (countdown.call_count, idle.call_count, fixed.call_count) == (1, 1, 1)
+        assert mock_call_later.call_args.args[1] == pytest.approx(29.9)
+
+        # At :30 only the two 30-second listeners are due
+        later = TibberPricesTimeService(reference_time=now + timedelta(seconds=29.9))
+        listener_manager.async_update_minute_listeners(later)
+        assert (countdown.call_count, idle.call_count, fixed.call_count) == (2, 1, 2)
+
+
 def test_quarter_hour_timer_boundaries_match_constants(
     listener_manager: TibberPricesListenerManager,
 ) -> None:
@@ -201,7 +231,7 @@ async def test_minute_callback_execution(
     """
     Test that minute timer callback is executed when scheduled time arrives.
 
-    This simulates Home Assistant triggering the callback at 30-second boundary.
+    This simulates Home Assistant triggering the callback at the listener deadline.
     """
     callback_executed = False
     callback_time = None
@@ -211,18 +241,19 @@ async def test_minute_callback_execution(
         callback_executed = True
         callback_time = now
 
-    with patch("custom_components.tibber_prices.coordinator.listeners.async_track_utc_time_change") as mock_track:
+    with patch(_CALL_LATER) as mock_call_later:
         # Capture the callback that would be registered
         registered_callback = None
 
-        def capture_callback(_hass: Any, callback: Any, **_kwargs: Any) -> Any:
+        def capture_callback(_hass: Any, _delay: float, callback: Any) -> Any:
             nonlocal registered_callback
             registered_callback = callback
             return MagicMock()  # Cancel function
 
-        mock_track.side_effect = capture_callback
+        mock_call_later.side_effect = capture_callback
 
         listener_manager.schedule_minute_refresh(test_callback)
+        listener_manager.async_add_minute_update_listener(MagicMock())
 
         # Simulate Home Assistant triggering the callback at :30 seconds
         assert registered_callback is not None
@@ -245,12 +276,17 @@ def test_multiple_timer_independence(
     quarter_handler = MagicMock()
     minute_handler = MagicMock()
 
-    with patch("custom_components.tibber_prices.coordinator.listeners.async_track_utc_time_change") as mock_track:
+    with (
+        patch("custom_components.tibber_prices.coordinator.listeners.async_track_utc_time_change") as mock_track,
+        patch(_CALL_LATER) as mock_call_later,
+    ):
         mock_track.return_value = MagicMock()
+        mock_call_later.return_value = MagicMock()
 
         # Schedule both timers
         listener_manager.schedule_quarter_hour_refresh(quarter_handler)
         listener_manager.schedule_minute_refresh(minute_handler)
+        listener_manager.async_add_minute_update_listener(MagicMock())
 
         # Verify both were registered (implementation detail check)
         assert hasattr(listener_manager, "_quarter_hour_timer_cancel")
@@ -258,5 +294,40 @@ def test_multiple_timer_independence(
         assert listener_manager._quarter_hour_timer_cancel is not None  # noqa: SLF001  # type: ignore[attr-defined]
         assert listener_manager._minute_timer_cancel is not None  # noqa: SLF001  # type: ignore[attr-defined]
 
-        # Verify async_track_utc_time_change was called twice
-        assert mock_track.call_count == 2
+        # Quarter-hour timer uses the fixed grid, minute timer a one-shot deadline
+        assert mock_track.call_count == 1
+        assert mock_call_later.call_count == 1
+
+
+def test_quarter_hour_tick_batches_state_writes(
+    listener_manager: TibberPricesListenerManager,
+) -> None:
+    """
+    Test that Timer #2 evaluates every listener before writing any state.
+
+    Only changed entities are written; the tick records evaluated vs. written.
+    """
+    events: list[str] = []
+
+    def make_listener(name: str, *, changed: bool) -> Any:
+        def listener(_time_service: TibberPricesTimeService) -> None:
+            events.append(f"evaluate {name}")
+            write = (lambda: events.append(f"write {name}")) if changed else None
+            listener_manager.async_submit_state_write(write)
+
+        return listener
+
+    listener_manager.async_add_time_sensitive_listener(make_listener("a", changed=True))
+    listener_manager.async_add_time_sensitive_listener(make_listener("b", changed=False))
+    listener_manager.async_add_time_sensitive_listener(make_listener("c", changed=True))
+
+    listener_manager.async_update_time_sensitive_listeners(TibberPricesTimeService())
+
+    assert events == ["evaluate a", "evaluate b", "evaluate c", "write a", "write c"]
+    assert listener_manager.last_tick_writes == (3, 2)
+    assert (listener_manager.entities_evaluated_total, listener_manager.entities_written_total) == (3, 2)
+
+    # Outside of a tick a submitted write runs immediately and is not counted
+    listener_manager.async_submit_state_write(lambda: events.append("write now"))
+    assert events[-1] == "write now"
+    assert listener_manager.entities_written_total == 2
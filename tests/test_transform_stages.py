@@ -0,0 +1,244 @@
+"""Tests for dependency-aware partial retransformation (coordinator/transform_stages.py)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.tibber_prices import const as _const
+from custom_components.tibber_prices.coordinator import data_transformation, period_pipeline
+from custom_components.tibber_prices.coordinator.data_transformation import TibberPricesDataTransformer
+from custom_components.tibber_prices.coordinator.periods import TibberPricesPeriodCalculator
+from custom_components.tibber_prices.coordinator.time_service import TibberPricesTimeService
+from custom_components.tibber_prices.coordinator.transform_stages import (
+    ALL_STAGES,
+    PERIOD_STAGES,
+    STAGE_BEST_PERIODS,
+    STAGE_PEAK_PERIODS,
+    flatten_effective_config,
+    stages_affected_by,
+)
+from homeassistant.util import dt as dt_util
+
+
+def _create_raw_data() -> dict[str, Any]:
+    """Create today + tomorrow with a cheap midday valley and an evening peak."""
+    base_time = dt_util.parse_datetime("2025-11-22T00:00:00+01:00")
+    assert base_time is not None
+
+    intervals = []
+    for day in range(2):
+        for quarter in range(96):
+            hour = quarter // 4
+            if 10 <= hour < 15:
+                price, level = 0.18 + day * 0.01, "CHEAP"
+            elif 17 <= hour < 21:
+                price, level = 0.42 - day * 0.01, "EXPENSIVE"
+            else:
+                price, level = 0.28 + (quarter % 4) * 0.002, "NORMAL"
+            intervals.append(
+                {
+                    "startsAt": base_time + timedelta(days=day, minutes=15 * quarter),
+                    "total": price,
+                    "energy": price * 0.8,
+                    "tax": price * 0.2,
+                    "level": level,
+                }
+            )
+    return {"timestamp": base_time, "home_id": "home_123", "price_info": intervals, "currency": "EUR"}
+
+
+def _create_pipeline(
+    options: dict[str, Any], overrides: dict[str, dict[str, Any]]
+) -> tuple[TibberPricesPeriodCalculator, TibberPricesDataTransformer]:
+    """Create a period calculator and transformer wired like the coordinator does."""
+    config_entry = Mock(options=options)
+    time = TibberPricesTimeService(reference_time=dt_util.parse_datetime("2025-11-22T12:00:00+01:00"))
+    calculator = TibberPricesPeriodCalculator(
+        config_entry,
+        "[test]",
+        get_config_override_fn=lambda key, section: overrides.get(section, {}).get(key),
+    )
+    calculator.time = time
+    transformer = TibberPricesDataTransformer(
+        config_entry=config_entry,
+        log_prefix="[test]",
+        calculate_periods_fn=calculator.calculate_periods_for_price_info,
+        time=time,
+        get_active_overrides_fn=lambda: overrides,
+    )
+    return calculator, transformer
+
+
+def _recording(ran: list[str], func: Callable[..., Any], label: Callable[..., str]) -> Callable[..., Any]:
+    """Wrap func so every call appends its stage label to `ran`."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        ran.append(label(**kwargs))
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@pytest.mark.unit
+class TestStageGraph:
+    """Config keys select the stages to rerun."""
+
+    def test_peak_only_key_reruns_peak_stage(self) -> None:
+        """A peak setting touches nothing upstream and not the best side."""
+        assert stages_affected_by({_const.CONF_PEAK_PRICE_FLEX}) == {STAGE_PEAK_PERIODS}
+        assert stages_affected_by({_const.CONF_MIN_PERIODS_BEST}) == {STAGE_BEST_PERIODS}
+
+    def test_shared_period_key_reruns_both_sides(self) -> None:
+        """Volatility thresholds feed both period sides."""
+        assert stages_affected_by({_const.CONF_VOLATILITY_THRESHOLD_HIGH}) == PERIOD_STAGES
+
+    def test_enrichment_key_reruns_everything_downstream(self) -> None:
+        """Enrichment changes propagate to day patterns and both sides."""
+        assert stages_affected_by({_const.CONF_PRICE_RATING_HYSTERESIS}) == ALL_STAGES
+
+    def test_unclaimed_key_reruns_everything(self) -> None:
+        """Keys without a declared stage are treated conservatively."""
+        assert stages_affected_by({_const.CONF_PEAK_PRICE_FLEX, "unknown_option"}) == ALL_STAGES
+        assert stages_affected_by(set()) == frozenset()
+
+    def test_flatten_merges_sections_and_overrides(self) -> None:
+        """Nested sections are flattened and overrides win."""
+        options = {
+            _const.CONF_PRICE_RATING_THRESHOLD_LOW: -10,
+            "flexibility_settings": {_const.CONF_BEST_PRICE_FLEX: 15, _const.CONF_PEAK_PRICE_FLEX: -20},
+        }
+        overrides = {"flexibility_settings": {_const.CONF_PEAK_PRICE_FLEX: -30}}
+
+        assert flatten_effective_config(options, overrides) == {
+            _const.CONF_PRICE_RATING_THRESHOLD_LOW: -10,
+            _const.CONF_BEST_PRICE_FLEX: 15,
+            _const.CONF_PEAK_PRICE_FLEX: -30,
+        }
+
+
+@pytest.mark.unit
+class TestPartialRetransform:
+    """The transformer reruns only the stages a config change affects."""
+
+    def test_peak_override_reruns_only_peak_periods(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Enrichment, day patterns and best periods are reused; the result equals a full run."""
+        overrides: dict[str, dict[str, Any]] = {}
+        calculator, transformer = _create_pipeline({}, overrides)
+        raw_data = _create_raw_data()
+        first = transformer.transform_data(raw_data)
+        assert transformer.last_run_stages == ALL_STAGES
+
+        ran: list[str] = []
+        monkeypatch.setattr(
+            data_transformation,
+            "enrich_price_info_with_differences",
+            _recording(ran, data_transformation.enrich_price_info_with_differences, lambda **_: "enrichment"),
+        )
+        monkeypatch.setattr(
+            data_transformation,
+            "detect_day_patterns",
+            _recording(ran, data_transformation.detect_day_patterns, lambda **_: "day_patterns"),
+        )
+        monkeypatch.setattr(
+            period_pipeline,
+            "calculate_periods_with_relaxation",
+            _recording(
+                ran,
+                period_pipeline.calculate_periods_with_relaxation,
+                lambda **kwargs: "peak" if kwargs["config"].reverse_sort else "best",
+            ),
+        )
+
+        overrides["flexibility_settings"] = {_const.CONF_PEAK_PRICE_FLEX: 30}
+        stages = transformer.get_config_change_stages()
+        assert stages == {STAGE_PEAK_PERIODS}
+
+        transformer.invalidate_config_cache(keep_results=True)
+        calculator.invalidate_config_cache(keep_periods=True)
+        partial = transformer.rerun_period_stages(stages)
+
+        assert partial is not None
+        assert ran == ["peak"]
+        assert transformer.last_run_stages == {STAGE_PEAK_PERIODS}
+        assert partial["priceInfo"] is first["priceInfo"]
+        assert partial["pricePeriods"]["best_price"] is first["pricePeriods"]["best_price"]
+
+        _, fresh_transformer = _create_pipeline({}, overrides)
+        full = fresh_transformer.transform_data(raw_data)
+        assert partial["pricePeriods"] == full["pricePeriods"]
+
+    @pytest.mark.parametrize(
+        ("section", "key", "value", "side"),
+        [
+            ("period_settings", _const.CONF_BEST_PRICE_MAX_LEVEL_GAP_COUNT, 4, "best"),
+            ("relaxation_and_target_periods", _const.CONF_MIN_PERIODS_PEAK, 3, "peak"),
+            ("relaxation_and_target_periods", _const.CONF_ENABLE_MIN_PERIODS_BEST, False, "best"),
+        ],
+    )
+    def test_side_override_is_not_served_from_period_cache(
+        self, monkeypatch: pytest.MonkeyPatch, section: str, key: str, value: Any, side: str
+    ) -> None:
+        """Overrides outside the flex/level settings change the cache key and rerun their side."""
+        overrides: dict[str, dict[str, Any]] = {}
+        calculator, transformer = _create_pipeline({}, overrides)
+        raw_data = _create_raw_data()
+        first = transformer.transform_data(raw_data)
+        first_hash = calculator._compute_periods_hash(first["priceInfo"])  # noqa: SLF001 - cache key check
+
+        ran: list[str] = []
+        monkeypatch.setattr(
+            period_pipeline,
+            "calculate_periods_with_relaxation",
+            _recording(
+                ran,
+                period_pipeline.calculate_periods_with_relaxation,
+                lambda **kwargs: "peak" if kwargs["config"].reverse_sort else "best",
+            ),
+        )
+
+        overrides[section] = {key: value}
+        calculator.invalidate_config_cache(keep_periods=True)
+        assert calculator._compute_periods_hash(first["priceInfo"]) != first_hash  # noqa: SLF001 - cache key check
+
+        transformer.invalidate_config_cache(keep_results=True)
+        partial = transformer.rerun_period_stages(transformer.get_config_change_stages())
+
+        assert partial is not None
+        assert ran == [side]
+
+        _, fresh_transformer = _create_pipeline({}, overrides)
+        full = fresh_transformer.transform_data(raw_data)
+        assert partial["pricePeriods"] == full["pricePeriods"]
+
+    def test_enrichment_option_needs_full_pipeline(self) -> None:
+        """Upstream changes cannot be handled by a period-only rerun."""
+        options: dict[str, Any] = {}
+        _, transformer = _create_pipeline(options, {})
+        transformer.transform_data(_create_raw_data())
+
+        options[_const.CONF_PRICE_RATING_GAP_TOLERANCE] = 3
+        stages = transformer.get_config_change_stages()
+
+        assert stages == ALL_STAGES
+        assert transformer.rerun_period_stages(stages) is None
+
+    def test_unchanged_config_reruns_nothing(self) -> None:
+        """Re-applying the same override value is a no-op."""
+        overrides = {"flexibility_settings": {_const.CONF_BEST_PRICE_FLEX: 20}}
+        _, transformer = _create_pipeline({}, overrides)
+        transformer.transform_data(_create_raw_data())
+
+        overrides["flexibility_settings"][_const.CONF_BEST_PRICE_FLEX] = 20
+
+        assert transformer.get_config_change_stages() == frozenset()
+
+    def test_nothing_cached_reruns_everything(self) -> None:
+        """Without a previous transformation every stage must run."""
+        _, transformer = _create_pipeline({}, {})
+
+        assert transformer.get_config_change_stages() == ALL_STAGES
@@ -0,0 +1,113 @@
+"""Tests for the flattened translation index behind get_translation."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cache
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from custom_components.tibber_prices import const
+from custom_components.tibber_prices.const import (
+    async_load_standard_translations,
+    async_load_translations,
+    get_translation,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+COMPONENT = Path(__file__).parents[1] / "custom_components" / "tibber_prices"
+
+
+@pytest.fixture(autouse=True)
+def _empty_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test without loaded translations."""
+    monkeypatch.setattr(const, "_TRANSLATIONS_CACHE", {})
+    monkeypatch.setattr(const, "_STANDARD_TRANSLATIONS_CACHE", {})
+    monkeypatch.setattr(const, "_TRANSLATION_INDEX", {})
+
+
+def _hass() -> HomeAssistant:
+    return cast("HomeAssistant", SimpleNamespace(data={}))
+
+
+async def _load(hass: HomeAssistant, *languages: str) -> None:
+    for language in languages:
+        await async_load_translations(hass, language)
+        await async_load_standard_translations(hass, language)
+
+
+@cache
+def _read(folder: str, language: str) -> dict:
+    return json.loads((COMPONENT / folder / f"{language}.json").read_text("utf-8"))
+
+
+def _navigate(translations: dict, path: Sequence[str]) -> Any:
+    """Nested lookup as get_translation did before the index."""
+    current: Any = translations
+    for key in path:
+        if not isinstance(current, dict) or key not in current:
+            return None
+        current = current[key]
+    return current
+
+
+def _paths(translations: dict, prefix: tuple[str, ...] = ()) -> list[tuple[str, ...]]:
+    paths = []
+    for key, value in translations.items():
+        paths.append((*prefix, key))
+        if isinstance(value, dict):
+            paths.extend(_paths(value, (*prefix, key)))
+    return paths
+
+
+def _nested_lookup(path: Sequence[str], language: str) -> Any:
+    for folder in ("translations", "custom_translations"):
+        for source in (language, "en"):
+            result = _navigate(_read(folder, source), path)
+            if result is not None:
+                return result
+    return None
+
+
+async def test_index_matches_nested_lookup() -> None:
+    """Every path of both translation folders resolves as with the nested lookup, fallbacks included."""
+    await _load(_hass(), "en", "de")
+
+    paths = set()
+    for folder in ("translations", "custom_translations"):
+        for source in ("en", "de"):
+            paths.update(_paths(_read(folder, source)))
+
+    assert paths
+    for path in paths:
+        assert get_translation(path, "de") == _nested_lookup(path, "de"), path
+    assert get_translation(["sensor", "no_such_sensor"], "de") is None
+
+
+async def test_only_loaded_languages_are_indexed() -> None:
+    """Languages that were not loaded fall back to English."""
+    await _load(_hass(), "en")
+
+    assert set(const._TRANSLATION_INDEX) == {"en"}  # noqa: SLF001
+    assert get_translation(["attribution"], "sv") == get_translation(["attribution"], "en")
+
+
+async def test_reloading_english_updates_fallbacks() -> None:
+    """English loaded after another language still serves that language's fallbacks."""
+    hass = _hass()
+    await _load(hass, "de")
+    const._STANDARD_TRANSLATIONS_CACHE["de"] = {}  # noqa: SLF001
+    const._build_translation_index("de")  # noqa: SLF001
+    assert get_translation(["selector", "day", "options", "today"], "de") is None
+
+    await _load(hass, "en")
+
+    assert get_translation(["selector", "day", "options", "today"], "de") == _nested_lookup(
+        ["selector", "day", "options", "today"], "en"
+    )
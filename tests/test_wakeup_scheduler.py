@@ -0,0 +1,165 @@
+"""
+Tests for the event-driven Timer #3 wakeups (coordinator/wakeup.py).
+
+A simulated day compares the fixed 30-second refresh with the heap-ordered
+wakeups: same sensor values at every old tick, far fewer callbacks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import math
+
+import pytest
+
+from custom_components.tibber_prices.coordinator.wakeup import (
+    TibberPricesWakeupScheduler,
+    next_grid_time,
+    next_timing_value_change,
+)
+
+_DAY_START = datetime(2025, 11, 22, 0, 0, tzinfo=UTC)
+_JITTER = timedelta(milliseconds=5)  # HA fires timers slightly after the requested instant
+
+# (start, end) of the periods of the simulated day
+_PERIODS = [
+    (_DAY_START + timedelta(hours=13), _DAY_START + timedelta(hours=15)),
+    (_DAY_START + timedelta(hours=18), _DAY_START + timedelta(hours=19, minutes=30)),
+]
+
+
+def _minutes_until_rounded(now: datetime, target: datetime) -> int:
+    """Mirror TimeService.minutes_until_rounded()."""
+    return math.floor((target - now).total_seconds() / 60 + 0.5)
+
+
+def _remaining_minutes(now: datetime) -> int:
+    """Mirror the *_remaining_minutes sensors: countdown to the active period's end, else 0."""
+    for start, end in _PERIODS:
+        if start <= now < end:
+            return _minutes_until_rounded(now, end)
+    return 0
+
+
+def _progress(now: datetime) -> float:
+    """Mirror the *_progress sensors including the 60-second grace period at 100%."""
+    for start, end in _PERIODS:
+        if start <= now < end:
+            return (now - start).total_seconds() / (end - start).total_seconds() * 100
+        if 0 <= (now - end).total_seconds() <= 60:
+            return 100
+    return 0
+
+
+def _next_in_minutes(now: datetime) -> int | None:
+    """Mirror the *_next_in_minutes sensors: countdown to the next period start."""
+    future = [start for start, _ in _PERIODS if start > now]
+    return _minutes_until_rounded(now, future[0]) if future else None
+
+
+_SENSORS: dict[str, tuple[Callable[[datetime], object], bool]] = {
+    "remaining_minutes": (_remaining_minutes, False),
+    "progress": (_progress, True),
+    "next_in_minutes": (_next_in_minutes, False),
+}
+
+
+def _fixed_ticks() -> list[datetime]:
+    """Return the firing times of the previous fixed 30-second timer for one day."""
+    return [_DAY_START + timedelta(seconds=30 * tick) + _JITTER for tick in range(24 * 120)]
+
+
+@pytest.mark.unit
+class TestSimulatedDay:
+    """Event-driven wakeups against the fixed 30-second grid."""
+
+    def test_same_values_with_fewer_callbacks(self) -> None:
+        """Every old tick sees the same values while most callbacks are skipped."""
+        scheduler: TibberPricesWakeupScheduler[str] = TibberPricesWakeupScheduler()
+        written: dict[str, object] = {}
+        callbacks = dict.fromkeys(_SENSORS, 0)
+        for key in _SENSORS:
+            scheduler.schedule(key, _DAY_START)
+
+        ticks = _fixed_ticks()
+        for now in ticks:
+            for key in scheduler.pop_due(now):
+                value_fn, continuous = _SENSORS[key]
+                written[key] = value_fn(now)
+                callbacks[key] += 1
+                scheduler.schedule(key, next_timing_value_change(written[key], now, continuous=continuous))
+
+            for key, (value_fn, _) in _SENSORS.items():
+                assert written[key] == value_fn(now), f"{key} stale at {now}"
+
+        before = len(ticks) * len(_SENSORS)
+        assert before == 3 * 2880
+        # Countdown: one callback per minute while counting, quarter-hours when idle
+        assert callbacks["remaining_minutes"] == 306
+        # Progress keeps the 30-second cadence only while a period runs
+        assert callbacks["progress"] == 506
+        assert callbacks["next_in_minutes"] == 1176
+        assert sum(callbacks.values()) < before / 4
+
+
+@pytest.mark.unit
+class TestNextTimingValueChange:
+    """Deadline calculation from the current value."""
+
+    def test_idle_value_waits_for_quarter_hour(self) -> None:
+        """0 and None only change when a period or phase starts."""
+        now = datetime(2025, 11, 22, 14, 3, 12, tzinfo=UTC)
+
+        assert next_timing_value_change(0, now, continuous=False) == datetime(2025, 11, 22, 14, 15, tzinfo=UTC)
+        assert next_timing_value_change(None, now, continuous=True) == datetime(2025, 11, 22, 14, 15, tzinfo=UTC)
+
+    def test_countdown_changes_at_half_minute(self) -> None:
+        """Rounded minutes to a quarter-hour target change at :30 seconds."""
+        now = datetime(2025, 11, 22, 14, 3, 30, 5000, tzinfo=UTC)
+
+        assert next_timing_value_change(42, now, continuous=False) == datetime(2025, 11, 22, 14, 4, 30, tzinfo=UTC)
+
+    def test_countdown_wakes_at_boundary_before_half_minute(self) -> None:
+        """A target switch at a quarter-hour boundary is not delayed to :30."""
+        now = datetime(2025, 11, 22, 14, 14, 45, tzinfo=UTC)
+
+        assert next_timing_value_change(16, now, continuous=False) == datetime(2025, 11, 22, 14, 15, tzinfo=UTC)
+
+    def test_active_progress_keeps_30_second_cadence(self) -> None:
+        """Progress is continuous while a period runs."""
+        now = datetime(2025, 11, 22, 14, 3, 0, 5000, tzinfo=UTC)
+
+        assert next_timing_value_change(37.5, now, continuous=True) == datetime(2025, 11, 22, 14, 3, 30, tzinfo=UTC)
+
+    def test_grid_is_strictly_after_now(self) -> None:
+        """A reference time on the grid yields the next grid instant."""
+        now = datetime(2025, 11, 22, 14, 15, tzinfo=UTC)
+
+        assert next_grid_time(now, 900) == datetime(2025, 11, 22, 14, 30, tzinfo=UTC)
+
+
+@pytest.mark.unit
+class TestWakeupScheduler:
+    """Heap bookkeeping."""
+
+    def test_reschedule_replaces_pending_deadline(self) -> None:
+        """Only the latest deadline of an item counts."""
+        scheduler: TibberPricesWakeupScheduler[str] = TibberPricesWakeupScheduler()
+        scheduler.schedule("a", _DAY_START + timedelta(minutes=1))
+        scheduler.schedule("b", _DAY_START + timedelta(minutes=2))
+        scheduler.schedule("a", _DAY_START + timedelta(minutes=3))
+
+        assert scheduler.next_deadline() == _DAY_START + timedelta(minutes=2)
+        assert scheduler.pop_due(_DAY_START + timedelta(minutes=2)) == ["b"]
+        assert scheduler.pop_due(_DAY_START + timedelta(minutes=3)) == ["a"]
+        assert scheduler.next_deadline() is None
+
+    def test_removed_item_is_never_due(self) -> None:
+        """Removing an item drops its pending wakeup."""
+        scheduler: TibberPricesWakeupScheduler[str] = TibberPricesWakeupScheduler()
+        scheduler.schedule("a", _DAY_START)
+        scheduler.remove("a")
+
+        assert len(scheduler) == 0
+        assert scheduler.pop_due(_DAY_START + timedelta(days=1)) == []